@@ -8,6 +8,7 @@ from datetime import datetime
 from pathlib import Path
 
 from ..logging_config import get_logger
+from ..models.validation_engine import parse_yaml
 
 logger = get_logger("backup_utils", "cli")
 
@@ -91,14 +92,12 @@ def verify_backup(original_path: Path, backup_path: Path) -> bool:
             raise BackupVerificationError(f"Backup size mismatch: original={original_size}, backup={backup_size}")
         
         # Validate backup YAML format
-        with backup_path.open('r', encoding='utf-8') as f:
-            content = f.read().strip()
-            if not content:
-                raise BackupVerificationError("Backup file is empty")
-            
-            # Parse YAML
-            f.seek(0)
-            yaml.safe_load(f)
+        content = backup_path.read_text(encoding='utf-8')
+        if not content.strip():
+            raise BackupVerificationError("Backup file is empty")
+        
+        # Parse YAML
+        parse_yaml(content)
         
         logger.info(f"Backup verification successful: {backup_path}")
         return True
@@ -0,0 +1,558 @@
+"""Bulk creation and update of trade plans from CSV or JSON plan specs."""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import re
+import shutil
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+from rich.console import Console
+from rich.table import Table
+
+from ..logging_config import get_logger
+from ..models import TemplateManager, TradePlan, TradePlanLoader, ValidationEngine
+from ..models.validation_engine import parse_yaml
+from ..risk_management import RiskManager
+from .backup_utils import (
+    BackupCreationError,
+    BackupVerificationError,
+    create_plan_backup,
+    verify_backup,
+)
+from .management_utils import FileSystemError, PlanManagementError
+from .risk_utils import calculate_batch_plan_risks, get_portfolio_risk_summary
+
+console = Console()
+logger = get_logger("bulk_utils", "cli")
+
+# libyaml's C dumper when PyYAML was built with it; plan dumps are plain types
+YamlSafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# How new plans are grouped into files
+GROUP_BY_CHOICES = ("symbol", "plan")
+
+# Spec keys that steer the bulk operation and are not plan fields
+TEMPLATE_KEY = "template"
+FILE_KEY = "file"
+
+_NUMBER_PATTERN = re.compile(r"^-?\d+(\.\d+)?$")
+
+
+class BulkPlanError(PlanManagementError):
+    """Raised when plan specs cannot be read or a bulk operation is rejected."""
+    pass
+
+
+@dataclass
+class BulkPlanResult:
+    """Outcome of a bulk create or update."""
+
+    plans: List[TradePlan] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    # Target file -> plans written to it
+    files: Dict[Path, List[TradePlan]] = field(default_factory=dict)
+    backups: List[Path] = field(default_factory=list)
+    risk_results: List[Dict[str, Any]] = field(default_factory=list)
+    portfolio_summary: Dict[str, Any] = field(default_factory=dict)
+    written: bool = False
+    # Current portfolio risk plus the risk of every plan, percent of account
+    total_portfolio_risk: Decimal = Decimal("0")
+    # Valid plans not written because some failed the risk checks or
+    # together they exceed the portfolio risk limit
+    blocked_by_risk: bool = False
+    elapsed_seconds: float = 0.0
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether every spec produced a valid plan."""
+        return not self.errors
+
+    @property
+    def risk_failures(self) -> List[str]:
+        """Get IDs of plans failing the risk checks."""
+        return [result["plan_id"] for result in self.risk_results if not result["is_valid"]]
+
+    @property
+    def exceeds_portfolio_limit(self) -> bool:
+        """Whether the plans together would take portfolio risk over the limit."""
+        if not self.portfolio_summary:
+            return False
+        return self.total_portfolio_risk > self.portfolio_summary["max_risk_percent"]
+
+    @property
+    def plans_per_second(self) -> float:
+        """Get throughput of the whole operation."""
+        return len(self.plans) / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+def read_plan_specs(spec_file: Path) -> List[Dict[str, Any]]:
+    """
+    Read plan specs from a CSV or JSON file.
+
+    JSON files hold a list of objects. CSV columns are field names, with
+    dotted names for nested fields (e.g. ``entry_function.parameters.threshold``);
+    empty cells are left out.
+
+    Args:
+        spec_file: CSV or JSON file
+
+    Returns:
+        One dict per spec, in file order
+
+    Raises:
+        BulkPlanError: If the file cannot be read or has an unsupported format
+    """
+    suffix = spec_file.suffix.lower()
+    try:
+        if suffix == ".json":
+            specs = json.loads(spec_file.read_text(encoding="utf-8"))
+            if not isinstance(specs, list) or not all(isinstance(s, dict) for s in specs):
+                raise BulkPlanError("JSON plan specs must be a list of objects")
+            return specs
+        if suffix == ".csv":
+            with spec_file.open(newline="", encoding="utf-8") as f:
+                return [_spec_from_row(row) for row in csv.DictReader(f)]
+    except (OSError, json.JSONDecodeError, csv.Error) as e:
+        raise BulkPlanError(f"Failed to read plan specs from {spec_file}: {e}")
+    raise BulkPlanError(f"Unsupported plan spec format: {spec_file.suffix} (use .csv or .json)")
+
+
+def _spec_from_row(row: Dict[str, Optional[str]]) -> Dict[str, Any]:
+    """Turn a CSV row into a nested spec."""
+    spec: Dict[str, Any] = {}
+    for column, value in row.items():
+        if column is None or value is None or not value.strip():
+            continue
+        value = value.strip()
+        # Prices stay strings for exact Decimal parsing; function
+        # parameters are free-form and get their YAML number types
+        if ".parameters." in column and _NUMBER_PATTERN.match(value):
+            value = float(value) if "." in value else int(value)
+        _set_field(spec, column.strip(), value)
+    return spec
+
+
+def _set_field(data: Dict[str, Any], dotted_key: str, value: Any) -> None:
+    """Set a possibly nested field by dotted path."""
+    *parents, key = dotted_key.split(".")
+    for parent in parents:
+        child = data.get(parent)
+        if not isinstance(child, dict):
+            child = data[parent] = {}
+        data = child
+    data[key] = value
+
+
+def _merge_fields(data: Dict[str, Any], updates: Dict[str, Any]) -> None:
+    """Apply field updates, merging nested dicts and dotted keys into existing ones."""
+    for key, value in updates.items():
+        if "." in key:
+            _set_field(data, key, value)
+        elif isinstance(value, dict) and isinstance(data.get(key), dict):
+            _merge_fields(data[key], value)
+        else:
+            data[key] = value
+
+
+def prepare_bulk_create(
+    specs: List[Dict[str, Any]],
+    loader: TradePlanLoader,
+    plans_dir: Path,
+    group_by: str = "symbol",
+    template_manager: Optional[TemplateManager] = None,
+) -> BulkPlanResult:
+    """
+    Build and validate new plans from specs in one pass.
+
+    A spec is either complete plan data, or a ``template`` name with the
+    values to fill in (and optionally other fields to set). An optional
+    ``file`` names the plans file to add the plan to.
+
+    Args:
+        specs: Plan specs, in order
+        loader: Loader that has loaded the existing plans; every plan ID its
+                validation saw counts as taken, including IDs in invalid files
+        plans_dir: Directory new plan files are created in
+        group_by: "symbol" writes one file per symbol, "plan" one per plan
+        template_manager: Template manager for template specs
+
+    Returns:
+        Result with the built plans and their target files, or the
+        errors of every invalid spec
+    """
+    if group_by not in GROUP_BY_CHOICES:
+        raise BulkPlanError(f"group_by must be one of: {', '.join(GROUP_BY_CHOICES)}")
+
+    result = BulkPlanResult()
+    plans_data: List[Dict[str, Any]] = []
+    target_files: List[Optional[str]] = []
+
+    for row, spec in enumerate(specs, start=1):
+        spec = dict(spec)
+        target_files.append(spec.pop(FILE_KEY, None))
+        template_name = spec.pop(TEMPLATE_KEY, None)
+        if template_name is None:
+            plans_data.append(spec)
+            continue
+        try:
+            template_manager = template_manager or TemplateManager()
+            compiled = template_manager.get_compiled_template(template_name)
+            plan_data = compiled.build_data(spec)
+        except (FileNotFoundError, ValueError) as e:
+            result.errors.append(f"Plan {row}: {e}")
+            continue
+        _merge_fields(plan_data, {k: v for k, v in spec.items() if k not in compiled.value_slots})
+        plans_data.append(plan_data)
+
+    if result.errors:
+        return result
+
+    validation_engine = ValidationEngine()
+    validation_engine.claim_plan_ids(loader.validation_engine.get_loaded_plan_ids())
+    loaded = validation_engine.load_plan_data(plans_data)
+    result.errors.extend(str(error) for error in loaded.result.errors)
+    if result.errors:
+        return result
+
+    result.plans = loaded.plans
+    for plan, target in zip(result.plans, target_files):
+        if target:
+            path = plans_dir / Path(target).name
+        else:
+            path = plans_dir / f"{plan.symbol if group_by == 'symbol' else plan.plan_id}.yaml"
+        result.files.setdefault(path, []).append(plan)
+    return result
+
+
+def prepare_bulk_update(
+    specs: List[Dict[str, Any]],
+    loader: TradePlanLoader,
+) -> BulkPlanResult:
+    """
+    Apply field updates to loaded plans and validate them in one pass.
+
+    Each spec names a ``plan_id`` and the fields to change; nested fields
+    may be given as nested objects or dotted keys.
+
+    Args:
+        specs: Update specs, in order
+        loader: Loader holding the plans to update
+
+    Returns:
+        Result with the updated plans grouped by the file they were
+        loaded from, or the errors of every invalid spec
+    """
+    result = BulkPlanResult()
+    plans_data: List[Dict[str, Any]] = []
+    plan_files: List[Optional[Path]] = []
+
+    for row, spec in enumerate(specs, start=1):
+        updates = dict(spec)
+        plan_id = updates.pop("plan_id", None)
+        plan = loader.get_plan(plan_id) if plan_id else None
+        if plan is None:
+            result.errors.append(f"Plan {row}: Plan '{plan_id}' not found")
+            continue
+        # JSON mode: prices as strings, as read from plan files
+        plan_data = plan.model_dump(mode="json")
+        _merge_fields(plan_data, updates)
+        plans_data.append(plan_data)
+        plan_files.append(loader.get_plan_file(plan_id))
+
+    if result.errors:
+        return result
+    loaded = ValidationEngine().load_plan_data(plans_data)
+    result.errors.extend(str(error) for error in loaded.result.errors)
+    if result.errors:
+        return result
+
+    result.plans = loaded.plans
+    for plan, path in zip(result.plans, plan_files):
+        result.files.setdefault(path, []).append(plan)
+    return result
+
+
+def assess_bulk_risk(result: BulkPlanResult, risk_manager: RiskManager) -> None:
+    """
+    Calculate risk for all plans of a bulk operation at once.
+
+    Each plan is checked against the portfolio on its own; the total
+    portfolio risk adds every plan's risk to the current risk, so the
+    batch as a whole can be checked against the limit.
+
+    Args:
+        result: Validated bulk result; risk results, the portfolio
+                summary and the total portfolio risk are stored on it
+        risk_manager: Risk manager for calculations
+    """
+    result.risk_results = calculate_batch_plan_risks(result.plans, risk_manager)
+    result.portfolio_summary = get_portfolio_risk_summary(
+        result.risk_results, risk_manager.portfolio_tracker
+    )
+    result.total_portfolio_risk = result.portfolio_summary["current_risk_percent"] + sum(
+        (Decimal(str(risk["risk_percent"])) for risk in result.risk_results), Decimal("0")
+    )
+
+
+def write_plan_files(
+    files: Dict[Path, List[TradePlan]], backup_dir: Path
+) -> List[Path]:
+    """
+    Write plans into their files as one all-or-nothing change.
+
+    Each existing file is backed up once, then every file's new content is
+    staged in a temporary file; only when all are staged are they renamed
+    into place. Plans replace entries with the same ``plan_id`` and are
+    otherwise appended. If a rename fails, files already replaced are
+    restored from their backups and new files removed.
+
+    Args:
+        files: Target file -> plans to write to it
+        backup_dir: Directory for backups
+
+    Returns:
+        Paths of the backups created
+
+    Raises:
+        FileSystemError: If backing up or writing fails; no plan file is
+                         left changed
+    """
+    backups: Dict[Path, Path] = {}
+    staged: List[Tuple[Path, Path]] = []
+
+    try:
+        for path, plans in files.items():
+            if path.exists():
+                backup_path = create_plan_backup(path, backup_dir)
+                backups[path] = backup_path
+                verify_backup(path, backup_path)
+            staged.append((path, _stage_file(path, plans)))
+    except (BackupCreationError, BackupVerificationError, OSError, yaml.YAMLError) as e:
+        for _, temp_path in staged:
+            temp_path.unlink(missing_ok=True)
+        raise FileSystemError(f"Bulk write cancelled, no plan files changed: {e}")
+
+    replaced: List[Path] = []
+    try:
+        for path, temp_path in staged:
+            temp_path.replace(path)
+            replaced.append(path)
+    except OSError as e:
+        for path in replaced:
+            if path in backups:
+                shutil.copy2(backups[path], path)
+            else:
+                path.unlink(missing_ok=True)
+        for path, temp_path in staged[len(replaced):]:
+            temp_path.unlink(missing_ok=True)
+        raise FileSystemError(f"Bulk write failed and was rolled back: {e}")
+
+    return list(backups.values())
+
+
+def _stage_file(path: Path, plans: List[TradePlan]) -> Path:
+    """Write a file's merged content to a temporary file next to it."""
+    entries: List[Any] = []
+    if path.exists():
+        existing = parse_yaml(path.read_text(encoding="utf-8"))
+        if isinstance(existing, dict):
+            entries = [existing]
+        elif isinstance(existing, list):
+            entries = existing
+
+    positions = {
+        entry.get("plan_id"): index
+        for index, entry in enumerate(entries)
+        if isinstance(entry, dict)
+    }
+    for plan in plans:
+        plan_data = plan.model_dump(mode="json")
+        if plan.plan_id in positions:
+            entries[positions[plan.plan_id]] = plan_data
+        else:
+            positions[plan.plan_id] = len(entries)
+            entries.append(plan_data)
+
+    content = yaml.dump(
+        entries[0] if len(entries) == 1 else entries,
+        Dumper=YamlSafeDumper,
+        default_flow_style=False,
+        sort_keys=False,
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    return temp_path
+
+
+def bulk_create_plans(
+    specs: List[Dict[str, Any]],
+    plans_dir: Path,
+    backup_dir: Path,
+    risk_manager: Optional[RiskManager] = None,
+    group_by: str = "symbol",
+    dry_run: bool = False,
+    template_manager: Optional[TemplateManager] = None,
+    force: bool = False,
+) -> BulkPlanResult:
+    """
+    Create plans from specs: validate all, assess risk for all, write grouped files.
+
+    Nothing is written unless every spec is valid and, without force,
+    every plan passes the risk checks.
+
+    Args:
+        specs: Plan specs (see prepare_bulk_create)
+        plans_dir: Plans directory
+        backup_dir: Directory for backups of files that gain plans
+        risk_manager: Risk manager; risk is not assessed without one
+        group_by: "symbol" or "plan" file grouping
+        dry_run: Validate and assess risk without writing
+        template_manager: Template manager for template specs
+        force: Write plans even if some fail the risk checks
+
+    Returns:
+        Result of the operation
+    """
+    start = time.perf_counter()
+    loader = TradePlanLoader(plans_dir)
+    loader.load_all_plans()
+
+    result = prepare_bulk_create(specs, loader, plans_dir, group_by, template_manager)
+    return _finish_bulk(result, "create", backup_dir, risk_manager, dry_run, force, start)
+
+
+def bulk_update_plans(
+    specs: List[Dict[str, Any]],
+    plans_dir: Path,
+    backup_dir: Path,
+    risk_manager: Optional[RiskManager] = None,
+    dry_run: bool = False,
+    force: bool = False,
+) -> BulkPlanResult:
+    """
+    Update plans from specs: validate all, assess risk for all, rewrite each file once.
+
+    Nothing is written unless every spec is valid and, without force,
+    every plan passes the risk checks.
+
+    Args:
+        specs: Update specs (see prepare_bulk_update)
+        plans_dir: Plans directory
+        backup_dir: Directory for one backup per rewritten file
+        risk_manager: Risk manager; risk is not assessed without one
+        dry_run: Validate and assess risk without writing
+        force: Write plans even if some fail the risk checks
+
+    Returns:
+        Result of the operation
+    """
+    start = time.perf_counter()
+    loader = TradePlanLoader(plans_dir)
+    loader.load_all_plans(validate=False)
+
+    result = prepare_bulk_update(specs, loader)
+    return _finish_bulk(result, "update", backup_dir, risk_manager, dry_run, force, start)
+
+
+def _finish_bulk(
+    result: BulkPlanResult,
+    operation: str,
+    backup_dir: Path,
+    risk_manager: Optional[RiskManager],
+    dry_run: bool,
+    force: bool,
+    start: float,
+) -> BulkPlanResult:
+    """Assess risk and write a validated bulk result unless risk checks block it."""
+    if result.is_valid:
+        if risk_manager is not None:
+            assess_bulk_risk(result, risk_manager)
+        result.blocked_by_risk = (
+            bool(result.risk_failures) or result.exceeds_portfolio_limit
+        ) and not force
+        if not dry_run and not result.blocked_by_risk:
+            result.backups = write_plan_files(result.files, backup_dir)
+            result.written = True
+    result.elapsed_seconds = time.perf_counter() - start
+
+    logger.info(
+        f"Bulk plan {operation} completed",
+        plans=len(result.plans),
+        files=len(result.files),
+        backups=len(result.backups),
+        errors=len(result.errors),
+        risk_failures=len(result.risk_failures),
+        total_portfolio_risk=float(result.total_portfolio_risk),
+        written=result.written,
+        plans_per_second=round(result.plans_per_second, 1),
+    )
+    return result
+
+
+def display_bulk_result(result: BulkPlanResult, operation: str) -> None:
+    """
+    Display the outcome of a bulk operation.
+
+    Args:
+        result: Bulk operation result
+        operation: "create" or "update"
+    """
+    if not result.is_valid:
+        console.print(f"❌ Bulk {operation} rejected, no plans written", style="bold red")
+        for error in result.errors:
+            console.print(f"  • {error}", style="red")
+        return
+
+    table = Table(title=f"Bulk Plan {operation.title()}")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", justify="right")
+    table.add_row("Plans", str(len(result.plans)))
+    table.add_row("Files", str(len(result.files)))
+    table.add_row("Backups", str(len(result.backups)))
+    if result.risk_results:
+        table.add_row("Risk check failures", str(len(result.risk_failures)))
+        table.add_row(
+            "New risk amount", f"${result.portfolio_summary['total_new_risk_amount']:,.2f}"
+        )
+        table.add_row(
+            "Portfolio risk with plans",
+            f"{result.total_portfolio_risk:.1f}% of "
+            f"{result.portfolio_summary['max_risk_percent']:.1f}%",
+        )
+    table.add_row("Throughput", f"{result.plans_per_second:,.0f} plans/s")
+    console.print(table)
+
+    if result.blocked_by_risk:
+        if result.risk_failures:
+            console.print(
+                f"❌ Plans failing risk checks: {', '.join(result.risk_failures)}",
+                style="bold red",
+            )
+        if result.exceeds_portfolio_limit:
+            console.print(
+                f"❌ Plans together take portfolio risk to {result.total_portfolio_risk:.1f}%, "
+                f"over the {result.portfolio_summary['max_risk_percent']:.1f}% limit",
+                style="bold red",
+            )
+        console.print("No plans written; use --force to write them anyway", style="red")
+        return
+    if result.risk_failures:
+        console.print(
+            f"⚠️ Plans failing risk checks: {', '.join(result.risk_failures)}", style="yellow"
+        )
+    if result.written:
+        console.print(f"✅ {len(result.plans)} plans written", style="bold green")
+    else:
+        console.print("Dry run - no files written", style="dim")
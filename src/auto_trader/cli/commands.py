@@ -5,13 +5,13 @@ import click
 # Import command groups from separate modules
 from .config_commands import validate_config, setup
 from .plan_commands import validate_plans, list_plans, create_plan, create_plan_interactive
-from .management_commands import list_plans_enhanced, validate_config as validate_config_enhanced, update_plan, archive_plans, plan_stats
+from .management_commands import list_plans_enhanced, validate_config as validate_config_enhanced, update_plan, archive_plans, plan_stats, bulk_plans
 from .template_commands import list_templates
 from .schema_commands import show_schema
 from .monitor_commands import monitor, summary, history
 from .diagnostic_commands import doctor
 from .help_commands import help_system
-from .risk_commands import calculate_position_size, portfolio_risk_summary
+from .risk_commands import calculate_position_size, portfolio_risk_summary, position_size_grid
 
 
 @click.group()
@@ -32,6 +32,7 @@ cli.add_command(create_plan_interactive)
 cli.add_command(list_plans_enhanced, name="list-plans-enhanced")
 cli.add_command(validate_config_enhanced, name="validate-config-enhanced") 
 cli.add_command(update_plan, name="update-plan")
+cli.add_command(bulk_plans, name="bulk-plans")
 cli.add_command(archive_plans, name="archive-plans")
 cli.add_command(plan_stats, name="plan-stats")
 cli.add_command(list_templates)
@@ -42,6 +43,7 @@ cli.add_command(history)
 cli.add_command(doctor)
 cli.add_command(help_system)
 cli.add_command(calculate_position_size)
+cli.add_command(position_size_grid)
 cli.add_command(portfolio_risk_summary)
 
 
@@ -1,5 +1,7 @@
 """Diagnostic and troubleshooting CLI commands for Auto-Trader application."""
 
+from typing import Optional
+
 import click
 from rich.console import Console
 from rich.panel import Panel
@@ -24,7 +26,10 @@ logger = get_logger("cli", "cli")
 @click.option("--plans", is_flag=True, help="Check trade plans directory and files")
 @click.option("--permissions", is_flag=True, help="Check file and directory permissions")
 @click.option("--export-debug", is_flag=True, help="Export debug information to file")
-def doctor(config: bool, plans: bool, permissions: bool, export_debug: bool) -> None:
+@click.option("--workers", type=click.IntRange(min=1), help="Processes used to parse plan files [default: one per CPU]")
+def doctor(
+    config: bool, plans: bool, permissions: bool, export_debug: bool, workers: Optional[int]
+) -> None:
     """Run diagnostic checks and provide troubleshooting information."""
     logger.info("Diagnostic checks started")
     
@@ -53,7 +58,7 @@ def doctor(config: bool, plans: bool, permissions: bool, export_debug: bool) ->
         # Plans directory checks
         if plans:
             console.print("[blue]📄 Checking trade plans...[/blue]")
-            plans_results = check_trade_plans()
+            plans_results = check_trade_plans(workers=workers)
             diagnostic_results.extend(plans_results)
             
         # Permission checks
@@ -2,7 +2,7 @@
 
 import time
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 
 from rich.console import Console
@@ -87,8 +87,13 @@ def check_configuration() -> List[dict]:
     return results
 
 
-def check_trade_plans() -> List[dict]:
-    """Check trade plans directory and files."""
+def check_trade_plans(workers: Optional[int] = 1) -> List[dict]:
+    """
+    Check trade plans directory and files.
+    
+    Args:
+        workers: Processes used to parse plan files (None for one per CPU)
+    """
     results = []
     
     try:
@@ -121,7 +126,7 @@ def check_trade_plans() -> List[dict]:
             })
             
         # Try to load plans
-        plans = loader.load_all_plans(validate=True)
+        plans = loader.load_all_plans(validate=True, workers=workers)
         if plans:
             results.append({
                 "check": "Plan loading",
@@ -1,6 +1,6 @@
 """Display utilities for CLI commands."""
 
-from typing import Optional
+from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
 
 from rich.console import Console
@@ -9,7 +9,8 @@ from rich.panel import Panel
 from rich.layout import Layout
 
 from config import ConfigLoader
-from ..models import TradePlanLoader
+from ..models import TradePlanLoader, TradePlanStatus
+from ..models.execution import ExecutionLogEntry
 
 
 console = Console()
@@ -239,79 +240,174 @@ def display_trade_history(symbol: Optional[str], days: int) -> None:
     )
 
 
-def generate_monitor_layout(loader: TradePlanLoader) -> Layout:
-    """Generate the live monitor layout."""
+def display_execution_history(entries: List[ExecutionLogEntry], days: int) -> None:
+    """Display execution signals and errors from the audit store."""
+    history_table = Table(title=f"Execution History - Last {days} Days")
+    history_table.add_column("Time", style="white")
+    history_table.add_column("Symbol", style="cyan")
+    history_table.add_column("Timeframe", style="white")
+    history_table.add_column("Function", style="blue")
+    history_table.add_column("Action", style="yellow")
+    history_table.add_column("Confidence", style="white")
+    history_table.add_column("Details", style="white")
+
+    for entry in entries:
+        if entry.error:
+            action = "[red]ERROR[/red]"
+            details = f"[red]{entry.error}[/red]"
+        else:
+            action = entry.signal.action.value
+            details = entry.signal.reasoning
+        history_table.add_row(
+            entry.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+            entry.symbol,
+            entry.timeframe.value,
+            entry.function_name,
+            action,
+            f"{entry.signal.confidence:.0%}",
+            details,
+        )
+
+    console.print(history_table)
+
+    if not entries:
+        console.print("[yellow]No execution signals recorded in this period.[/yellow]")
+
+
+def display_function_summary(
+    period: str,
+    current_date: str,
+    stats: Dict[str, Dict[str, Any]],
+    action_counts: Dict[str, int],
+) -> None:
+    """Display execution function statistics from the audit store."""
+    summary_table = Table(title=f"{period.title()} Execution Summary - {current_date}")
+    summary_table.add_column("Function", style="cyan")
+    summary_table.add_column("Evaluations", style="white")
+    summary_table.add_column("Signals", style="green")
+    summary_table.add_column("Signal Rate", style="white")
+    summary_table.add_column("Errors", style="red")
+    summary_table.add_column("Avg ms", style="yellow")
+    summary_table.add_column("Max ms", style="yellow")
+
+    for function_name, function_stats in stats.items():
+        summary_table.add_row(
+            function_name,
+            str(function_stats["evaluations"]),
+            str(function_stats["signals"]),
+            f"{function_stats['signal_rate']:.1%}",
+            str(function_stats["errors"]),
+            f"{function_stats['avg_duration_ms']:.2f}",
+            f"{function_stats['max_duration_ms']:.2f}",
+        )
+
+    console.print(summary_table)
+
+    if action_counts:
+        actions = " | ".join(
+            f"{action}: {count}" for action, count in sorted(action_counts.items())
+        )
+        console.print(f"[dim]Actions - {actions}[/dim]")
+    else:
+        console.print("[yellow]No evaluations recorded in this period.[/yellow]")
+
+
+MONITOR_ACTIVE_PLAN_ROWS = 5
+
+
+def build_monitor_header(current_time: str) -> Panel:
+    """Build the live monitor system status panel."""
+    return Panel(
+        f"[bold]AUTO-TRADER LIVE MONITOR - {current_time}[/bold]\n\n"
+        "🔌 IBKR: [red]Disconnected[/red] | Discord: [yellow]Unknown[/yellow] | Mode: [green]SIMULATION[/green]\n"
+        "🛡️  Portfolio Risk: [green]0.0% / 10.0%[/green] | Available: [blue]$10,000[/blue]",
+        title="System Status",
+        border_style="blue"
+    )
+
+
+def build_monitor_body(loader: TradePlanLoader) -> Union[Table, Panel]:
+    """
+    Build the live monitor active plans panel from already loaded plans.
+    
+    Reads the loader's status indexes, so the cost depends on the number of
+    rows shown rather than the number of plans loaded.
+    """
+    stats = loader.get_stats()
+    if not stats["total_plans"]:
+        return Panel(
+            "[red]No trade plans loaded[/red]\n\n"
+            "Use 'auto-trader list-plans' to check for available plans",
+            title="No Plans Found"
+        )
+    
+    active_plans = []
+    for status in (TradePlanStatus.AWAITING_ENTRY, TradePlanStatus.POSITION_OPEN):
+        active_plans.extend(
+            (plan, status.value)
+            for plan in loader.get_plans_by_status(status)[:MONITOR_ACTIVE_PLAN_ROWS - len(active_plans)]
+        )
+    
+    if not active_plans:
+        return Panel(
+            "[yellow]No active plans to monitor[/yellow]\n\n"
+            f"Total plans loaded: {stats['total_plans']}\n"
+            f"Files processed: {stats['files_loaded']}",
+            title="Plan Status"
+        )
+    
+    monitoring_table = Table(title="Active Plan Monitoring")
+    monitoring_table.add_column("Symbol", style="cyan")
+    monitoring_table.add_column("Timeframe", style="white")
+    monitoring_table.add_column("Last Price", style="yellow")
+    monitoring_table.add_column("Entry Target", style="green")
+    monitoring_table.add_column("Status", style="white")
+    monitoring_table.add_column("Risk", style="red")
+    
+    for plan, status in active_plans:
+        status_icon = "↗️" if status == "awaiting_entry" else "✅"
+        monitoring_table.add_row(
+            plan.symbol,
+            plan.entry_function.timeframe,
+            f"${plan.entry_level:.2f}",  # Placeholder - real system would have live prices
+            f"${plan.entry_level:.2f}",
+            f"{status_icon} {status}",
+            plan.risk_category
+        )
+    
+    return monitoring_table
+
+
+def build_monitor_footer(refresh_rate: float, last_update: str) -> Panel:
+    """Build the live monitor controls panel."""
+    return Panel(
+        f"[dim]Press Ctrl+C to quit | Refresh rate: {refresh_rate:g}s | Last update: {last_update}[/dim]",
+        border_style="dim"
+    )
+
+
+def create_monitor_layout() -> Layout:
+    """Create the empty live monitor layout."""
+    layout = Layout()
+    layout.split_column(
+        Layout(name="header", size=6),
+        Layout(name="body"),
+        Layout(name="footer", size=3)
+    )
+    return layout
+
+
+def generate_monitor_layout(loader: TradePlanLoader, refresh_rate: float = 5) -> Layout:
+    """Generate the live monitor layout after reloading plans from disk."""
     try:
         # Load current plans
-        plans = loader.load_all_plans(validate=False)
-        stats = loader.get_stats()
-        
-        # Create layout
-        layout = Layout()
-        layout.split_column(
-            Layout(name="header", size=6),
-            Layout(name="body"),
-            Layout(name="footer", size=3)
-        )
+        loader.load_all_plans(validate=False)
         
-        # Header with system status
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S EST")
-        header_content = Panel(
-            f"[bold]AUTO-TRADER LIVE MONITOR - {current_time}[/bold]\n\n"
-            "🔌 IBKR: [red]Disconnected[/red] | Discord: [yellow]Unknown[/yellow] | Mode: [green]SIMULATION[/green]\n"
-            "🛡️  Portfolio Risk: [green]0.0% / 10.0%[/green] | Available: [blue]$10,000[/blue]",
-            title="System Status",
-            border_style="blue"
-        )
-        layout["header"].update(header_content)
-        
-        # Body with active plans monitoring
-        if plans:
-            active_plans = [p for p in plans.values() if p.status.value in ["awaiting_entry", "position_open"]]
-            
-            if active_plans:
-                monitoring_table = Table(title="Active Plan Monitoring")
-                monitoring_table.add_column("Symbol", style="cyan")
-                monitoring_table.add_column("Timeframe", style="white")
-                monitoring_table.add_column("Last Price", style="yellow")
-                monitoring_table.add_column("Entry Target", style="green")
-                monitoring_table.add_column("Status", style="white")
-                monitoring_table.add_column("Risk", style="red")
-                
-                for plan in active_plans[:5]:  # Show max 5 active plans
-                    status_icon = "↗️" if plan.status.value == "awaiting_entry" else "✅"
-                    monitoring_table.add_row(
-                        plan.symbol,
-                        plan.entry_function.timeframe,
-                        f"${plan.entry_level:.2f}",  # Placeholder - real system would have live prices
-                        f"${plan.entry_level:.2f}",
-                        f"{status_icon} {plan.status.value}",
-                        plan.risk_category
-                    )
-                
-                body_content = monitoring_table
-            else:
-                body_content = Panel(
-                    "[yellow]No active plans to monitor[/yellow]\n\n"
-                    f"Total plans loaded: {stats['total_plans']}\n"
-                    f"Files processed: {stats['files_loaded']}",
-                    title="Plan Status"
-                )
-        else:
-            body_content = Panel(
-                "[red]No trade plans loaded[/red]\n\n"
-                "Use 'auto-trader list-plans' to check for available plans",
-                title="No Plans Found"
-            )
-        
-        layout["body"].update(body_content)
-        
-        # Footer with controls
-        footer_content = Panel(
-            "[dim]Press Ctrl+C to quit | Refresh rate: 5s | Last update: " + current_time + "[/dim]",
-            border_style="dim"
-        )
-        layout["footer"].update(footer_content)
+        layout = create_monitor_layout()
+        layout["header"].update(build_monitor_header(current_time))
+        layout["body"].update(build_monitor_body(loader))
+        layout["footer"].update(build_monitor_footer(refresh_rate, current_time))
         
         return layout
         
@@ -1,7 +1,8 @@
 """File creation utilities for CLI setup wizard."""
 
+import csv
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 from decimal import Decimal
 
 import click
@@ -9,6 +10,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 
+from ..models.execution import ExecutionLogEntry
 from .wizard_constants import RISK_CATEGORY_CHOICES, DEFAULT_RISK_CATEGORY
 
 
@@ -229,4 +231,44 @@ def export_trade_history_csv(symbol: str | None, days: int) -> None:
     filter_suffix = f"_{symbol}" if symbol else ""
     csv_filename = f"trade_history_{days}days{filter_suffix}.csv"
     console.print(f"[green]✓ Trade history exported to {csv_filename}[/green]")
-    console.print("[yellow]Note: This is a placeholder. Real implementation would create actual CSV file.[/yellow]")
\ No newline at end of file
+    console.print("[yellow]Note: This is a placeholder. Real implementation would create actual CSV file.[/yellow]")
+
+
+def export_execution_history_csv(
+    entries: List[ExecutionLogEntry], symbol: str | None, days: int
+) -> None:
+    """Export execution history from the audit store to CSV."""
+    filter_suffix = f"_{symbol}" if symbol else ""
+    csv_filename = f"execution_history_{days}days{filter_suffix}.csv"
+
+    with open(csv_filename, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(
+            ["timestamp", "symbol", "timeframe", "function", "action",
+             "confidence", "duration_ms", "error", "reasoning"]
+        )
+        for entry in entries:
+            writer.writerow(
+                [entry.timestamp.isoformat(), entry.symbol, entry.timeframe.value,
+                 entry.function_name, entry.signal.action.value, entry.signal.confidence,
+                 entry.duration_ms, entry.error or "", entry.signal.reasoning]
+            )
+
+    console.print(f"[green]✓ Execution history exported to {csv_filename} ({len(entries)} rows)[/green]")
+
+
+def export_function_summary_csv(
+    period: str, current_date: str, stats: Dict[str, Dict[str, Any]]
+) -> None:
+    """Export execution function statistics from the audit store to CSV."""
+    csv_filename = f"execution_summary_{period}_{current_date}.csv"
+    columns = ["function", "evaluations", "signals", "signal_rate", "errors",
+               "error_rate", "avg_duration_ms", "max_duration_ms", "min_duration_ms"]
+
+    with open(csv_filename, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for function_stats in stats.values():
+            writer.writerow({column: function_stats[column] for column in columns})
+
+    console.print(f"[green]✓ Execution summary exported to {csv_filename}[/green]")
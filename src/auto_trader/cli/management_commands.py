@@ -48,6 +48,14 @@ from .management_utils import (
     _perform_plan_update,
     _display_update_success,
 )
+from .bulk_utils import (
+    GROUP_BY_CHOICES,
+    BulkPlanError,
+    bulk_create_plans,
+    bulk_update_plans,
+    display_bulk_result,
+    read_plan_specs,
+)
 from .backup_utils import (
     create_plan_backup,
     verify_backup,
@@ -118,7 +126,7 @@ def list_plans_enhanced(
             plans_dir = Path("data/trade_plans")
         
         # Initialize components and load plans
-        loader = TradePlanLoader(plans_dir)
+        loader = TradePlanLoader(plans_dir, persist_cache=True)
         risk_manager = _get_risk_manager()
         plans = _load_and_filter_plans(loader, status)
         
@@ -323,6 +331,78 @@ def update_plan(
         raise click.ClickException("Plan update operation failed")
 
 
+@click.command()
+@click.argument("operation", type=click.Choice(["create", "update"]))
+@click.argument("spec_file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--plans-dir",
+    type=click.Path(exists=True, path_type=Path),
+    help="Directory containing trade plan YAML files",
+)
+@click.option("--backup-dir", type=click.Path(path_type=Path), help="Backup directory")
+@click.option(
+    "--group-by",
+    type=click.Choice(GROUP_BY_CHOICES),
+    default="symbol",
+    help="File grouping for created plans (one file per symbol or per plan)",
+)
+@click.option("--dry-run", is_flag=True, help="Validate and assess risk without writing files")
+@click.option("--force", is_flag=True, help="Write plans even if some fail risk checks")
+def bulk_plans(
+    operation: str,
+    spec_file: Path,
+    plans_dir: Optional[Path],
+    backup_dir: Optional[Path],
+    group_by: str,
+    dry_run: bool,
+    force: bool,
+) -> None:
+    """Create or update many trade plans from a CSV or JSON spec file."""
+    logger.info("Bulk plan operation started", operation=operation, spec_file=str(spec_file))
+    
+    try:
+        plans_dir, backup_dir = _setup_update_directories(plans_dir, backup_dir)
+        specs = read_plan_specs(spec_file)
+        risk_manager = _get_risk_manager()
+        
+        if operation == "create":
+            result = bulk_create_plans(
+                specs, plans_dir, backup_dir, risk_manager,
+                group_by=group_by, dry_run=dry_run, force=force,
+            )
+        else:
+            result = bulk_update_plans(
+                specs, plans_dir, backup_dir, risk_manager, dry_run=dry_run, force=force
+            )
+        
+        display_bulk_result(result, operation)
+        if not result.is_valid:
+            raise click.ClickException(f"{len(result.errors)} invalid plan specs")
+        if result.blocked_by_risk:
+            raise click.ClickException(
+                f"{len(result.risk_failures)} plans fail risk checks"
+                if result.risk_failures
+                else "Plans together exceed the portfolio risk limit"
+            )
+        
+    except (IOError, OSError, PermissionError) as e:
+        console.print(f"[red]File system error: {e}[/red]")
+        logger.error("Bulk plan operation failed - file system error", error=str(e))
+        raise click.ClickException("Failed to access plan files")
+    except BulkPlanError as e:
+        console.print(f"[red]Plan spec error: {e}[/red]")
+        logger.error("Bulk plan operation failed - plan specs", error=str(e))
+        raise click.ClickException("Failed to read plan specs")
+    except FileSystemError as e:
+        console.print(f"[red]Bulk write error: {e}[/red]")
+        logger.error("Bulk plan operation failed - file write", error=str(e))
+        raise click.ClickException("Failed to write plan files")
+    except PlanManagementError as e:
+        console.print(f"[red]Plan management error: {e}[/red]")
+        logger.error("Bulk plan operation failed - management error", error=str(e))
+        raise click.ClickException("Bulk plan operation failed")
+
+
 @click.command()
 @click.option(
     "--plans-dir",
@@ -408,7 +488,7 @@ def plan_stats(plans_dir: Optional[Path]) -> None:
         if plans_dir is None:
             plans_dir = Path("data/trade_plans")
         
-        loader = TradePlanLoader(plans_dir)
+        loader = TradePlanLoader(plans_dir, persist_cache=True)
         risk_manager = _get_risk_manager()
         
         all_plans_dict = loader.load_all_plans()
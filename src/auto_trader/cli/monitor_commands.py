@@ -1,9 +1,9 @@
 """Monitoring and analysis CLI commands for Auto-Trader application."""
 
-import time
+import asyncio
 from pathlib import Path
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta, UTC
 
 import click
 from rich.console import Console
@@ -12,18 +12,39 @@ from rich.live import Live
 
 from ..logging_config import get_logger
 from ..models import TradePlanLoader
+from ..trade_engine.execution_audit_store import (
+    DEFAULT_AUDIT_DB_PATH,
+    ExecutionAuditStore,
+)
 from .display_utils import (
+    display_execution_history,
+    display_function_summary,
     display_performance_summary,
     display_trade_history,
-    generate_monitor_layout,
 )
-from .file_utils import export_performance_csv, export_trade_history_csv
+from .file_utils import (
+    export_execution_history_csv,
+    export_function_summary_csv,
+    export_performance_csv,
+    export_trade_history_csv,
+)
 from .error_utils import handle_generic_error
+from .monitor_view import MonitorViewModel
 
 
 console = Console()
 logger = get_logger("cli", "cli")
 
+PERIOD_DAYS = {"day": 1, "week": 7, "month": 30}
+
+AUDIT_DB_OPTION = click.option(
+    "--audit-db",
+    type=click.Path(path_type=Path),
+    default=DEFAULT_AUDIT_DB_PATH,
+    show_default=True,
+    help="Execution audit database; placeholder data is shown if it does not exist",
+)
+
 
 @click.command()
 @click.option(
@@ -31,8 +52,13 @@ logger = get_logger("cli", "cli")
     type=click.Path(exists=True, path_type=Path),
     help="Directory containing trade plan YAML files",
 )
-@click.option("--refresh-rate", default=5, help="Refresh rate in seconds")
-def monitor(plans_dir: Optional[Path], refresh_rate: int) -> None:
+@click.option(
+    "--refresh-rate",
+    default=5.0,
+    type=click.FloatRange(min=0.05),
+    help="Clock refresh rate in seconds; plan changes are shown as they happen",
+)
+def monitor(plans_dir: Optional[Path], refresh_rate: float) -> None:
     """Live system monitor dashboard showing real-time status."""
     logger.info("Live system monitor started")
     
@@ -49,22 +75,51 @@ def monitor(plans_dir: Optional[Path], refresh_rate: int) -> None:
             )
         )
         
-        with Live(generate_monitor_layout(loader), refresh_per_second=1/refresh_rate, screen=True) as live:
-            try:
-                while True:
-                    live.update(generate_monitor_layout(loader))
-                    time.sleep(refresh_rate)
-            except KeyboardInterrupt:
-                console.print("\n[yellow]Monitor stopped by user[/yellow]")
+        try:
+            asyncio.run(_run_live_monitor(loader, refresh_rate))
+        except KeyboardInterrupt:
+            console.print("\n[yellow]Monitor stopped by user[/yellow]")
                 
     except Exception as e:
         handle_generic_error("live monitor", e)
 
 
+async def _run_live_monitor(loader: TradePlanLoader, refresh_rate: float) -> None:
+    """
+    Run the live monitor until cancelled.
+    
+    Plans are loaded once and then kept current by the loader's file
+    watching. The screen is redrawn when plans change or the clock moves,
+    and only the panels whose data changed are rebuilt.
+    """
+    loader.load_all_plans()
+    view = MonitorViewModel(loader, refresh_rate)
+    changed = asyncio.Event()
+    loader.add_change_listener(changed.set)
+    loader.start_file_watching()
+    
+    try:
+        view.update()
+        with Live(view.layout, auto_refresh=False, screen=True) as live:
+            live.refresh()
+            while True:
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=refresh_rate)
+                except asyncio.TimeoutError:
+                    pass
+                changed.clear()
+                if view.update():
+                    live.refresh()
+    finally:
+        loader.stop_file_watching()
+        loader.remove_change_listener(changed.set)
+
+
 @click.command()
 @click.option("--period", default="week", type=click.Choice(["day", "week", "month"]), help="Summary period")
 @click.option("--format", "output_format", default="console", type=click.Choice(["console", "csv"]), help="Output format")
-def summary(period: str, output_format: str) -> None:
+@AUDIT_DB_OPTION
+def summary(period: str, output_format: str, audit_db: Path) -> None:
     """Generate performance summary for the specified period."""
     logger.info("Performance summary started", period=period)
     
@@ -77,10 +132,22 @@ def summary(period: str, output_format: str) -> None:
             )
         )
         
-        # This is a placeholder implementation - in real system would analyze trade history
         current_date = datetime.now().strftime("%Y-%m-%d")
-        
-        if output_format == "console":
+
+        if audit_db.exists():
+            since = datetime.now(UTC) - timedelta(days=PERIOD_DAYS[period])
+            store = ExecutionAuditStore(audit_db, read_only=True)
+            try:
+                stats = store.function_statistics(since=since)
+                action_counts = store.action_counts(since=since)
+            finally:
+                store.close()
+
+            if output_format == "console":
+                display_function_summary(period, current_date, stats, action_counts)
+            else:
+                export_function_summary_csv(period, current_date, stats)
+        elif output_format == "console":
             display_performance_summary(period, current_date)
         else:
             export_performance_csv(period, current_date)
@@ -95,7 +162,11 @@ def summary(period: str, output_format: str) -> None:
 @click.option("--symbol", help="Filter by trading symbol")
 @click.option("--days", default=30, help="Number of days to look back")
 @click.option("--format", "output_format", default="console", type=click.Choice(["console", "csv"]), help="Output format")
-def history(symbol: Optional[str], days: int, output_format: str) -> None:
+@click.option("--limit", default=100, help="Maximum number of entries to show")
+@AUDIT_DB_OPTION
+def history(
+    symbol: Optional[str], days: int, output_format: str, limit: int, audit_db: Path
+) -> None:
     """Display trade history with optional filtering."""
     logger.info("Trade history requested", symbol=symbol, days=days)
     
@@ -108,8 +179,23 @@ def history(symbol: Optional[str], days: int, output_format: str) -> None:
             )
         )
         
-        # This is a placeholder implementation - in real system would load from CSV files
-        if output_format == "console":
+        if audit_db.exists():
+            store = ExecutionAuditStore(audit_db, read_only=True)
+            try:
+                entries = store.query_entries(
+                    symbol=symbol.upper() if symbol else None,
+                    since=datetime.now(UTC) - timedelta(days=days),
+                    actions_only=True,
+                    limit=limit,
+                )
+            finally:
+                store.close()
+
+            if output_format == "console":
+                display_execution_history(entries, days)
+            else:
+                export_execution_history_csv(entries, symbol, days)
+        elif output_format == "console":
             display_trade_history(symbol, days)
         else:
             export_trade_history_csv(symbol, days)
@@ -0,0 +1,80 @@
+"""View model for the event-driven live monitor."""
+
+from datetime import datetime
+from typing import Dict, Optional, Set
+
+from rich.layout import Layout
+
+from ..models import TradePlanLoader
+from .display_utils import (
+    build_monitor_body,
+    build_monitor_footer,
+    build_monitor_header,
+    create_monitor_layout,
+)
+
+
+class MonitorViewModel:
+    """
+    In-memory state behind the live monitor layout.
+
+    Each panel is rebuilt only when the data it shows changes: the header
+    when the displayed clock changes, the plans body when the loader's
+    plans version changes, and the footer when the last update time does.
+    Plans are never reloaded here; the loader is kept current by file
+    watching, so an update with no plan changes costs the same however many
+    plans are loaded.
+    """
+
+    TIME_FORMAT = "%Y-%m-%d %H:%M:%S EST"
+
+    def __init__(self, loader: TradePlanLoader, refresh_rate: float) -> None:
+        """
+        Initialize view model.
+
+        Args:
+            loader: Loader holding the current plans
+            refresh_rate: Seconds between clock refreshes, shown in the footer
+        """
+        self.loader = loader
+        self.refresh_rate = refresh_rate
+        self.layout: Layout = create_monitor_layout()
+
+        self._plans_version: Optional[int] = None
+        self._shown_time: Optional[str] = None
+
+        # Metrics
+        self.panel_builds: Dict[str, int] = {"header": 0, "body": 0, "footer": 0}
+
+    def update(self, now: Optional[datetime] = None) -> Set[str]:
+        """
+        Rebuild panels whose data changed since the last update.
+
+        Args:
+            now: Current time (defaults to the local clock)
+
+        Returns:
+            Names of the panels rebuilt; empty if nothing needs redrawing
+        """
+        current_time = (now or datetime.now()).strftime(self.TIME_FORMAT)
+        changed: Set[str] = set()
+
+        if current_time != self._shown_time:
+            self._shown_time = current_time
+            self._set_panel("header", build_monitor_header(current_time), changed)
+
+        plans_version = self.loader.plans_version
+        if plans_version != self._plans_version:
+            self._plans_version = plans_version
+            self._set_panel("body", build_monitor_body(self.loader), changed)
+            self._set_panel(
+                "footer", build_monitor_footer(self.refresh_rate, current_time), changed
+            )
+
+        return changed
+
+    def _set_panel(self, name: str, renderable, changed: Set[str]) -> None:
+        """Replace one panel and record the rebuild."""
+        self.layout[name].update(renderable)
+        self.panel_builds[name] += 1
+        changed.add(name)
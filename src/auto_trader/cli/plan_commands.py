@@ -44,7 +44,10 @@ logger = get_logger("cli", "cli")
 )
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed validation results")
 @click.option("--watch", "-w", is_flag=True, help="Watch for file changes and validate automatically")
-def validate_plans(plans_dir: Optional[Path], verbose: bool, watch: bool) -> None:
+@click.option("--workers", type=click.IntRange(min=1), help="Processes used to parse plan files [default: one per CPU]")
+def validate_plans(
+    plans_dir: Optional[Path], verbose: bool, watch: bool, workers: Optional[int]
+) -> None:
     """Validate all trade plan YAML files in the plans directory."""
     logger.info("Trade plan validation started")
     
@@ -61,7 +64,7 @@ def validate_plans(plans_dir: Optional[Path], verbose: bool, watch: bool) -> Non
         )
         
         # Load and validate all plans
-        plans = loader.load_all_plans(validate=True)
+        plans = loader.load_all_plans(validate=True, workers=workers)
         
         # Get validation report
         report = loader.get_validation_report()
@@ -126,7 +129,7 @@ def list_plans(
     
     try:
         # Use custom directory or default
-        loader = TradePlanLoader(plans_dir) if plans_dir else TradePlanLoader()
+        loader = TradePlanLoader(plans_dir, persist_cache=True) if plans_dir else TradePlanLoader(persist_cache=True)
         
         # Load all plans
         plans = loader.load_all_plans(validate=True)
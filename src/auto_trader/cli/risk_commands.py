@@ -1,8 +1,9 @@
 """Risk management CLI commands for Auto-Trader application."""
 
-from decimal import Decimal
+import sys
+from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import click
 from rich.console import Console
@@ -131,6 +132,161 @@ def calculate_position_size(
         handle_generic_error(e, "calculating position size")
 
 
+@click.command("position-size-grid")
+@click.option(
+    "--entry",
+    "entries",
+    multiple=True,
+    required=True,
+    help="Symbol and entry price as SYMBOL=PRICE (repeatable, e.g. AAPL=180.50)",
+)
+@click.option(
+    "--stop-pct",
+    required=True,
+    help="Stop distances below entry in percent: list (1,1.5,2) or range (0.5:5:0.25)",
+)
+@click.option(
+    "--risk",
+    "risks",
+    type=click.Choice(RISK_CATEGORY_CHOICES, case_sensitive=False),
+    multiple=True,
+    help="Risk categories to include (repeatable, defaults to all)",
+)
+@click.option(
+    "--account-value",
+    help="Account values: list or range, as for --stop-pct (defaults to config)",
+)
+@click.option(
+    "--state-file",
+    type=click.Path(path_type=Path),
+    help="Portfolio state file path for committed risk (defaults to config)",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["csv", "json"]),
+    default="csv",
+    help="Output format",
+)
+@click.option(
+    "--output",
+    type=click.Path(path_type=Path, dir_okay=False),
+    help="Write the table to this file instead of stdout",
+)
+@click.option(
+    "--feasible-only",
+    is_flag=True,
+    help="Only output scenarios within the portfolio limit and account value",
+)
+def position_size_grid(
+    entries: Tuple[str, ...],
+    stop_pct: str,
+    risks: Tuple[str, ...],
+    account_value: Optional[str],
+    state_file: Optional[Path],
+    output_format: str,
+    output: Optional[Path],
+    feasible_only: bool,
+) -> None:
+    """Sweep position sizes over symbols, stops, risk categories and account values.
+    
+    Every combination is sized and checked against the portfolio risk limit
+    (including open positions) and the account value.
+    
+    Examples:
+        auto-trader position-size-grid --entry AAPL=180.50 --entry MSFT=420 --stop-pct 1,2,3
+        auto-trader position-size-grid --entry AAPL=180.50 --stop-pct 0.5:5:0.25 --account-value 10000:100000:10000 --format json --output grid.json
+    """
+    try:
+        entry_prices = _parse_entries(entries)
+        stop_percents = _parse_decimal_values(stop_pct, "--stop-pct")
+        
+        if account_value is None:
+            config_loader = ConfigLoader()
+            account_value = str(config_loader.user_preferences.default_account_value)
+        account_values = _parse_decimal_values(account_value, "--account-value")
+        
+        if state_file is None:
+            state_file = Path("data/state/portfolio_registry.json")
+        
+        risk_manager = RiskManager(account_value=account_values[0], state_file=state_file)
+        tracker = risk_manager.portfolio_tracker
+        
+        grid = risk_manager.position_sizer.preview_position_size_grid(
+            entry_prices=entry_prices,
+            stop_percents=stop_percents,
+            account_values=account_values,
+            risk_categories=[risk.lower() for risk in risks] or None,
+            committed_risk=tracker.get_total_dollar_risk(),
+            max_portfolio_risk=tracker.MAX_PORTFOLIO_RISK,
+        )
+        
+        if output is None:
+            row_count = _write_grid(grid, sys.stdout, output_format, feasible_only)
+        else:
+            with open(output, "w", newline="") as stream:
+                row_count = _write_grid(grid, stream, output_format, feasible_only)
+            console.print(
+                f"✅ {grid.cell_count:,} scenarios ({int(grid.feasible.sum()):,} feasible), "
+                f"{row_count:,} rows written to {output}"
+            )
+        
+        logger.info(
+            "Position size grid written",
+            cell_count=grid.cell_count,
+            row_count=row_count,
+            output_format=output_format,
+            output=str(output) if output else "stdout",
+        )
+        
+    except InvalidPositionSizeError as e:
+        logger.error("Position size grid failed", error=str(e))
+        raise click.ClickException(str(e))
+        
+    except click.ClickException:
+        raise
+        
+    except Exception as e:
+        handle_generic_error("generating position size grid", e)
+
+
+def _parse_entries(entries: Tuple[str, ...]) -> Dict[str, Decimal]:
+    """Parse SYMBOL=PRICE options into entry prices by symbol."""
+    entry_prices: Dict[str, Decimal] = {}
+    for entry in entries:
+        symbol, separator, price = entry.partition("=")
+        if not separator or not symbol.strip():
+            raise click.BadParameter(f"'{entry}' is not SYMBOL=PRICE", param_hint="--entry")
+        try:
+            entry_prices[symbol.strip().upper()] = Decimal(price.strip())
+        except InvalidOperation:
+            raise click.BadParameter(f"'{price}' is not a price", param_hint="--entry")
+    return entry_prices
+
+
+def _parse_decimal_values(text: str, option: str) -> List[Decimal]:
+    """Parse a comma-separated list or an inclusive start:end:step range."""
+    try:
+        if ":" in text:
+            start, end, step = (Decimal(part) for part in text.split(":"))
+            if step <= 0 or end < start:
+                raise click.BadParameter(
+                    f"Range '{text}' needs start <= end and a positive step", param_hint=option
+                )
+            count = int((end - start) / step) + 1
+            return [start + step * index for index in range(count)]
+        return [Decimal(part) for part in text.split(",") if part.strip()]
+    except (InvalidOperation, ValueError):
+        raise click.BadParameter(f"'{text}' is not a list or start:end:step range", param_hint=option)
+
+
+def _write_grid(grid, stream, output_format: str, feasible_only: bool) -> int:
+    """Write a scenario grid table in the requested format."""
+    if output_format == "json":
+        return grid.write_json(stream, feasible_only)
+    return grid.write_csv(stream, feasible_only)
+
+
 @click.command("portfolio-risk-summary")
 @click.option(
     "--state-file",
@@ -9,7 +9,8 @@ Main API:
 - get_portfolio_risk_summary(): Portfolio-wide risk summary generation
 
 The module uses a modular design where:
-1. Individual plans are processed with caching for performance
+1. Plans are validated in one vectorized RiskManager pass, or individually
+   with caching when no RiskManager batch API is available
 2. Results are aggregated into portfolio-wide summaries
 3. Additional metadata (cache stats, performance) is provided
 4. Status-based filtering ensures only active plans contribute to risk totals
@@ -268,6 +269,28 @@ def _get_cache_statistics(plans: List[TradePlan], use_cache: bool) -> Dict[str,
     }
 
 
+def _validate_plan_batch(plans: List[TradePlan], risk_manager: RiskManager) -> Optional[List[Any]]:
+    """
+    Validate all plans in one vectorized pass when the risk manager supports it.
+    
+    Args:
+        plans: Trade plans to validate
+        risk_manager: Risk manager for calculations
+        
+    Returns:
+        Validation result per plan, or None to validate plans one at a time
+        (risk manager stand-ins, or a batch that failed as a whole)
+    """
+    if not isinstance(risk_manager, RiskManager):
+        return None
+    
+    try:
+        return risk_manager.validate_trade_plans(plans)
+    except Exception as e:
+        logger.warning(f"Batch risk validation failed, validating plans individually: {e}")
+        return None
+
+
 def calculate_batch_plan_risks(plans: List[TradePlan], risk_manager: RiskManager,
                               use_cache: bool = True) -> List[Dict[str, Any]]:
     """
@@ -282,17 +305,22 @@ def calculate_batch_plan_risks(plans: List[TradePlan], risk_manager: RiskManager
         List of risk calculation results
     """
     cache = RiskCalculationCache() if use_cache else None
+    batch_results = _validate_plan_batch(plans, risk_manager)
     results = []
     
-    for plan in plans:
+    for index, plan in enumerate(plans):
         try:
-            validation_result = calculate_single_plan_risk(plan, risk_manager, cache)
+            if batch_results is not None:
+                validation_result = batch_results[index]
+            else:
+                validation_result = calculate_single_plan_risk(plan, risk_manager, cache)
             
             # Get attributes from nested position_size_result if available
-            if validation_result.passed and hasattr(validation_result, 'position_size_result'):
-                position_size = getattr(validation_result.position_size_result, 'position_size', 0)
-                risk_amount = getattr(validation_result.position_size_result, 'risk_amount_dollars', Decimal('0'))
-                risk_percent = getattr(validation_result.position_size_result, 'risk_amount_percent', Decimal('0'))
+            sizing = getattr(validation_result, 'position_size_result', None)
+            if validation_result.passed and sizing is not None:
+                position_size = sizing.position_size
+                risk_amount = sizing.dollar_risk
+                risk_percent = sizing.portfolio_risk_percentage
             else:
                 # Fallback to direct attributes if available
                 position_size = getattr(validation_result, 'position_size', 0) if validation_result.passed else 0
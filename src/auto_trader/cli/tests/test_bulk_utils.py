@@ -0,0 +1,394 @@
+"""Tests for bulk plan creation and update."""
+
+import json
+import time
+from decimal import Decimal
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from ..bulk_utils import (
+    BulkPlanError,
+    bulk_create_plans,
+    bulk_update_plans,
+    read_plan_specs,
+    write_plan_files,
+)
+from ..management_commands import bulk_plans
+from ..management_utils import FileSystemError, _perform_plan_update
+from ..wizard_plan_utils import save_plan_to_yaml
+from ...models import TradePlan, TradePlanLoader
+from ...risk_management import RiskManager
+
+
+def plan_spec(index, symbol="AAPL"):
+    """Template spec for a close_above plan."""
+    return {
+        "template": "close_above",
+        "plan_id": f"{symbol}_20250815_{index:03d}",
+        "symbol": symbol,
+        "entry_level": "180.50",
+        "stop_loss": "178.00",
+        "take_profit": "185.00",
+        "threshold": 180.50,
+    }
+
+
+def plan_data(index, symbol="AAPL"):
+    """Complete plan data."""
+    return {
+        "plan_id": f"{symbol}_20250815_{index:03d}",
+        "symbol": symbol,
+        "entry_level": "180.50",
+        "stop_loss": "178.00",
+        "take_profit": "185.00",
+        "risk_category": "normal",
+        "entry_function": {
+            "function_type": "close_above",
+            "timeframe": "15min",
+            "parameters": {"threshold": 180.50},
+        },
+        "exit_function": {
+            "function_type": "stop_loss_take_profit",
+            "timeframe": "1min",
+            "parameters": {},
+        },
+    }
+
+
+@pytest.fixture
+def plans_dir(tmp_path):
+    """Provide an empty plans directory."""
+    path = tmp_path / "plans"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def backup_dir(tmp_path):
+    """Provide the backup directory."""
+    return tmp_path / "backups"
+
+
+@pytest.fixture
+def risk_manager(tmp_path):
+    """Provide risk manager with isolated state."""
+    return RiskManager(account_value=Decimal("100000"), state_file=tmp_path / "state.json")
+
+
+@pytest.fixture
+def committed_risk_manager(tmp_path):
+    """Provide risk manager whose open positions leave no room for a normal plan."""
+    manager = RiskManager(account_value=Decimal("10000"), state_file=tmp_path / "committed.json")
+    manager.portfolio_tracker.add_position("POS_001", "MSFT", Decimal("950.00"), "MSFT_001")
+    return manager
+
+
+def write_plans(path, plans):
+    """Write plan data as one YAML file."""
+    path.write_text(yaml.dump([TradePlan(**data).model_dump(mode="json") for data in plans]))
+
+
+class TestReadPlanSpecs:
+    """Test reading CSV and JSON spec files."""
+
+    def test_csv_nested_columns(self, tmp_path):
+        """Test dotted columns become nested fields and empty cells are skipped."""
+        spec_file = tmp_path / "specs.csv"
+        spec_file.write_text(
+            "plan_id,entry_level,risk_category,entry_function.parameters.threshold\n"
+            "AAPL_20250815_001,181.25,,181.5\n"
+        )
+
+        assert read_plan_specs(spec_file) == [
+            {
+                "plan_id": "AAPL_20250815_001",
+                "entry_level": "181.25",
+                "entry_function": {"parameters": {"threshold": 181.5}},
+            }
+        ]
+
+    def test_json_and_unsupported(self, tmp_path):
+        """Test JSON lists are read as-is and other formats rejected."""
+        spec_file = tmp_path / "specs.json"
+        spec_file.write_text(json.dumps([plan_spec(1)]))
+        assert read_plan_specs(spec_file) == [plan_spec(1)]
+
+        spec_file.write_text(json.dumps({"plan_id": "AAPL_20250815_001"}))
+        with pytest.raises(BulkPlanError, match="list of objects"):
+            read_plan_specs(spec_file)
+        with pytest.raises(BulkPlanError, match="Unsupported"):
+            read_plan_specs(tmp_path / "specs.txt")
+
+
+class TestBulkCreate:
+    """Test bulk plan creation."""
+
+    def test_plans_grouped_by_symbol(self, plans_dir, backup_dir, risk_manager):
+        """Test template specs are written one file per symbol and load back."""
+        specs = [plan_spec(i) for i in range(1, 4)] + [plan_spec(1, "MSFT")]
+
+        result = bulk_create_plans(specs, plans_dir, backup_dir, risk_manager)
+
+        assert result.is_valid and result.written
+        assert sorted(path.name for path in result.files) == ["AAPL.yaml", "MSFT.yaml"]
+        assert result.backups == []
+        assert len(result.risk_results) == 4
+        loaded = TradePlanLoader(plans_dir).load_all_plans()
+        assert sorted(loaded) == sorted(spec["plan_id"] for spec in specs)
+        assert loaded["AAPL_20250815_002"].entry_function.parameters == {"threshold": 180.5}
+
+    def test_existing_file_backed_up_once_and_appended(self, plans_dir, backup_dir):
+        """Test adding plans to an existing file keeps its plans and backs it up once."""
+        write_plans(plans_dir / "AAPL.yaml", [plan_data(1)])
+
+        result = bulk_create_plans(
+            [plan_spec(2), plan_spec(3)], plans_dir, backup_dir
+        )
+
+        assert len(result.backups) == 1
+        assert sorted(TradePlanLoader(plans_dir).load_all_plans()) == [
+            "AAPL_20250815_001", "AAPL_20250815_002", "AAPL_20250815_003"
+        ]
+
+    def test_invalid_spec_rejects_batch(self, plans_dir, backup_dir):
+        """Test one invalid or duplicate spec writes nothing and reports every error."""
+        write_plans(plans_dir / "AAPL.yaml", [plan_data(1)])
+        before = (plans_dir / "AAPL.yaml").read_text()
+        bad_stop = dict(plan_spec(3), stop_loss="-1")
+
+        result = bulk_create_plans(
+            [plan_spec(1), plan_spec(2), bad_stop], plans_dir, backup_dir
+        )
+
+        assert not result.written
+        assert any("Plan 1: Duplicate plan_id" in error for error in result.errors)
+        assert any("Plan 3: stop_loss must be positive" in error for error in result.errors)
+        assert (plans_dir / "AAPL.yaml").read_text() == before
+        assert sorted(p.name for p in plans_dir.iterdir()) == ["AAPL.yaml"]
+
+    def test_plans_together_over_portfolio_limit_blocked(self, plans_dir, backup_dir, tmp_path):
+        """Test plans passing risk checks alone are blocked when together over the limit."""
+        risk_manager = RiskManager(account_value=Decimal("10000"), state_file=tmp_path / "s.json")
+        specs = [dict(plan_spec(i), risk_category="large") for i in range(1, 5)]
+
+        result = bulk_create_plans(specs, plans_dir, backup_dir, risk_manager)
+
+        assert result.risk_failures == []
+        assert [risk["risk_amount"] for risk in result.risk_results] == [Decimal("300.00")] * 4
+        assert result.total_portfolio_risk == Decimal("12.0")
+        assert result.exceeds_portfolio_limit and result.blocked_by_risk
+        assert not result.written
+        assert list(plans_dir.iterdir()) == []
+
+        result = bulk_create_plans(specs, plans_dir, backup_dir, risk_manager, force=True)
+
+        assert result.written
+        assert len(TradePlanLoader(plans_dir).load_all_plans()) == 4
+
+    def test_duplicate_of_plan_in_invalid_file_rejected(self, plans_dir, backup_dir):
+        """Test plan IDs of files failing validation still count as taken."""
+        (plans_dir / "broken.yaml").write_text(
+            yaml.dump([dict(plan_data(1), stop_loss="-1")])
+        )
+
+        result = bulk_create_plans([plan_spec(1)], plans_dir, backup_dir)
+
+        assert not result.written
+        assert any("Plan 1: Duplicate plan_id" in error for error in result.errors)
+
+    def test_risk_failures_block_write_unless_forced(
+        self, plans_dir, backup_dir, committed_risk_manager
+    ):
+        """Test plans failing risk checks are only written with force."""
+        result = bulk_create_plans([plan_spec(1)], plans_dir, backup_dir, committed_risk_manager)
+
+        assert result.is_valid and result.blocked_by_risk
+        assert result.risk_failures == ["AAPL_20250815_001"]
+        assert not result.written
+        assert list(plans_dir.iterdir()) == []
+
+        result = bulk_create_plans(
+            [plan_spec(1)], plans_dir, backup_dir, committed_risk_manager, force=True
+        )
+
+        assert result.written and not result.blocked_by_risk
+        assert sorted(TradePlanLoader(plans_dir).load_all_plans()) == ["AAPL_20250815_001"]
+
+
+class TestBulkUpdate:
+    """Test bulk plan updates."""
+
+    def test_updates_rewrite_each_file_once(self, plans_dir, backup_dir, risk_manager):
+        """Test updates to several plans of one file make one backup and keep other plans."""
+        write_plans(plans_dir / "morning.yaml", [plan_data(i) for i in range(1, 5)])
+        specs = [
+            {"plan_id": "AAPL_20250815_001", "entry_level": "181.00"},
+            {"plan_id": "AAPL_20250815_003", "entry_function.parameters.threshold": 181.0},
+        ]
+
+        result = bulk_update_plans(specs, plans_dir, backup_dir, risk_manager)
+
+        assert result.written
+        assert len(result.backups) == 1
+        assert list(result.files) == [plans_dir / "morning.yaml"]
+        loaded = TradePlanLoader(plans_dir).load_all_plans()
+        assert len(loaded) == 4
+        assert loaded["AAPL_20250815_001"].entry_level == Decimal("181.00")
+        assert loaded["AAPL_20250815_003"].entry_function.parameters == {"threshold": 181.0}
+        assert loaded["AAPL_20250815_002"] == TradePlan(**plan_data(2)).model_copy(
+            update={"created_at": loaded["AAPL_20250815_002"].created_at,
+                    "updated_at": loaded["AAPL_20250815_002"].updated_at}
+        )
+
+    def test_unknown_plan_rejected(self, plans_dir, backup_dir):
+        """Test an update naming a missing plan writes nothing."""
+        write_plans(plans_dir / "morning.yaml", [plan_data(1)])
+
+        result = bulk_update_plans(
+            [{"plan_id": "AAPL_20250815_001", "entry_level": "181.00"},
+             {"plan_id": "MSFT_20250815_001", "entry_level": "401.00"}],
+            plans_dir,
+            backup_dir,
+        )
+
+        assert result.errors == ["Plan 2: Plan 'MSFT_20250815_001' not found"]
+        assert not backup_dir.exists()
+
+    def test_failed_rename_rolls_back(self, plans_dir, backup_dir):
+        """Test a write failing midway restores the files already replaced."""
+        write_plans(plans_dir / "a.yaml", [plan_data(1)])
+        original = (plans_dir / "a.yaml").read_text()
+        files = {
+            plans_dir / "a.yaml": [TradePlan(**dict(plan_data(1), entry_level="181.00"))],
+            plans_dir / "b.yaml": [TradePlan(**plan_data(2))],
+        }
+        real_replace = Path.replace
+
+        def failing_replace(self, target):
+            if Path(target).name == "b.yaml":
+                raise OSError("disk full")
+            return real_replace(self, target)
+
+        with patch.object(Path, "replace", failing_replace):
+            with pytest.raises(FileSystemError, match="rolled back"):
+                write_plan_files(files, backup_dir)
+
+        assert (plans_dir / "a.yaml").read_text() == original
+        assert sorted(p.name for p in plans_dir.iterdir()) == ["a.yaml"]
+
+
+class TestBulkPlansCommand:
+    """Test the bulk-plans CLI command."""
+
+    def test_create_from_csv(self, plans_dir, backup_dir, risk_manager, tmp_path):
+        """Test creating plans from a CSV spec file."""
+        spec_file = tmp_path / "specs.csv"
+        spec_file.write_text(
+            "template,plan_id,symbol,entry_level,stop_loss,take_profit,threshold\n"
+            "close_above,AAPL_20250815_001,AAPL,180.50,178.00,185.00,180.50\n"
+            "close_below,MSFT_20250815_001,MSFT,400.00,405.00,390.00,400.00\n"
+        )
+
+        with patch("auto_trader.cli.management_commands._get_risk_manager", return_value=risk_manager):
+            result = CliRunner().invoke(
+                bulk_plans,
+                ["create", str(spec_file), "--plans-dir", str(plans_dir),
+                 "--backup-dir", str(backup_dir), "--group-by", "plan"],
+            )
+
+        assert result.exit_code == 0, result.output
+        assert "2 plans written" in result.output
+        assert sorted(p.name for p in plans_dir.glob("*.yaml")) == [
+            "AAPL_20250815_001.yaml", "MSFT_20250815_001.yaml"
+        ]
+
+    def test_risk_failures_need_force(
+        self, plans_dir, backup_dir, committed_risk_manager, tmp_path
+    ):
+        """Test plans failing risk checks fail the command unless --force is given."""
+        spec_file = tmp_path / "specs.json"
+        spec_file.write_text(json.dumps([plan_spec(1)]))
+        args = ["create", str(spec_file), "--plans-dir", str(plans_dir),
+                "--backup-dir", str(backup_dir)]
+
+        with patch(
+            "auto_trader.cli.management_commands._get_risk_manager",
+            return_value=committed_risk_manager,
+        ):
+            blocked = CliRunner().invoke(bulk_plans, args)
+            forced = CliRunner().invoke(bulk_plans, args + ["--force"])
+
+        assert blocked.exit_code != 0
+        assert "use --force" in blocked.output
+        assert forced.exit_code == 0, forced.output
+        assert "1 plans written" in forced.output
+
+    def test_invalid_specs_fail(self, plans_dir, backup_dir, risk_manager, tmp_path):
+        """Test invalid specs are listed and the command fails."""
+        spec_file = tmp_path / "specs.json"
+        spec_file.write_text(json.dumps([{"plan_id": "AAPL_20250815_001", "entry_level": "1"}]))
+
+        with patch("auto_trader.cli.management_commands._get_risk_manager", return_value=risk_manager):
+            result = CliRunner().invoke(
+                bulk_plans,
+                ["update", str(spec_file), "--plans-dir", str(plans_dir),
+                 "--backup-dir", str(backup_dir)],
+            )
+
+        assert result.exit_code != 0
+        assert "not found" in result.output
+
+
+class TestBulkThroughput:
+    """Benchmark bulk operations against the per-plan paths."""
+
+    PLAN_COUNT = 300
+
+    def test_create_and_update_throughput(self, tmp_path, risk_manager):
+        """Compare plans/sec of bulk create and update with one-plan-at-a-time saves."""
+        single_dir = tmp_path / "single"
+        bulk_dir = tmp_path / "bulk"
+        single_dir.mkdir()
+        bulk_dir.mkdir()
+        datas = [plan_data(i % 1000, "S" + chr(65 + i // 1000)) for i in range(self.PLAN_COUNT)]
+
+        start = time.perf_counter()
+        for data in datas:
+            save_plan_to_yaml(data, single_dir)
+            risk_manager.validate_trade_plan(TradePlan(**data))
+        single_create = self.PLAN_COUNT / (time.perf_counter() - start)
+
+        # Far over the portfolio risk limit together; measured with force
+        created = bulk_create_plans(
+            datas, bulk_dir, tmp_path / "bulk_backups", risk_manager, force=True
+        )
+        assert created.written and len(created.plans) == self.PLAN_COUNT
+
+        loader = TradePlanLoader(single_dir)
+        loader.load_all_plans()
+        start = time.perf_counter()
+        for data in datas:
+            updated = loader.get_plan(data["plan_id"]).model_copy(update={"take_profit": Decimal("186.00")})
+            risk_manager.validate_trade_plan(updated)
+            _perform_plan_update(data["plan_id"], updated, single_dir, tmp_path / "single_backups")
+        single_update = self.PLAN_COUNT / (time.perf_counter() - start)
+
+        updated = bulk_update_plans(
+            [{"plan_id": data["plan_id"], "take_profit": "186.00"} for data in datas],
+            bulk_dir,
+            tmp_path / "bulk_backups",
+            risk_manager,
+            force=True,
+        )
+        assert updated.written and len(updated.backups) == 1
+
+        print(
+            f"{self.PLAN_COUNT} plans - create: per-plan {single_create:,.0f}/s, "
+            f"bulk {created.plans_per_second:,.0f}/s; update: per-plan {single_update:,.0f}/s, "
+            f"bulk {updated.plans_per_second:,.0f}/s"
+        )
+        assert created.plans_per_second > single_create
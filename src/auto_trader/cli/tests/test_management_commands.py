@@ -67,8 +67,8 @@ def mock_risk_manager():
     mock_validation.passed = True
     mock_validation.position_size_result = Mock()
     mock_validation.position_size_result.position_size = 100
-    mock_validation.position_size_result.risk_amount_percent = Decimal("2.1")
-    mock_validation.position_size_result.risk_amount_dollars = Decimal("250.00")
+    mock_validation.position_size_result.portfolio_risk_percentage = Decimal("2.1")
+    mock_validation.position_size_result.dollar_risk = Decimal("250.00")
     
     mock_rm.validate_trade_plan.return_value = mock_validation
     mock_rm.portfolio_tracker.get_current_portfolio_risk.return_value = Decimal("5.2")
@@ -27,6 +27,7 @@ from ..backup_utils import (
 from ..risk_utils import (
     get_portfolio_risk_summary,
     calculate_all_plan_risks,
+    calculate_batch_plan_risks,
     format_risk_indicator,
     create_portfolio_summary_panel,
 )
@@ -719,17 +720,17 @@ class TestCalculateAllPlanRisks:
             validation_result.position_size_result = Mock()
             
             if plan.plan_id == "AAPL_20250825_001":
-                validation_result.position_size_result.risk_amount_percent = Decimal("2.5")
+                validation_result.position_size_result.portfolio_risk_percentage = Decimal("2.5")
                 validation_result.position_size_result.position_size = 100
-                validation_result.position_size_result.risk_amount_dollars = Decimal("250.0")
+                validation_result.position_size_result.dollar_risk = Decimal("250.0")
             elif plan.plan_id == "MSFT_20250825_002":
-                validation_result.position_size_result.risk_amount_percent = Decimal("1.8")
+                validation_result.position_size_result.portfolio_risk_percentage = Decimal("1.8")
                 validation_result.position_size_result.position_size = 75
-                validation_result.position_size_result.risk_amount_dollars = Decimal("180.0")
+                validation_result.position_size_result.dollar_risk = Decimal("180.0")
             else:  # TSLA - completed, should still validate but not count in active risks
-                validation_result.position_size_result.risk_amount_percent = Decimal("1.2")
+                validation_result.position_size_result.portfolio_risk_percentage = Decimal("1.2")
                 validation_result.position_size_result.position_size = 50
-                validation_result.position_size_result.risk_amount_dollars = Decimal("120.0")
+                validation_result.position_size_result.dollar_risk = Decimal("120.0")
             
             return validation_result
         
@@ -846,9 +847,9 @@ class TestCalculateAllPlanRisks:
         validation_result = Mock()
         validation_result.passed = True
         validation_result.position_size_result = Mock()
-        validation_result.position_size_result.risk_amount_percent = Decimal("2.0")
+        validation_result.position_size_result.portfolio_risk_percentage = Decimal("2.0")
         validation_result.position_size_result.position_size = 50
-        validation_result.position_size_result.risk_amount_dollars = Decimal("100.0")
+        validation_result.position_size_result.dollar_risk = Decimal("100.0")
         mock_risk_manager.validate_trade_plan.return_value = validation_result
         
         # Test with cache enabled
@@ -893,6 +894,33 @@ class TestCalculateAllPlanRisks:
             assert performance["calculations_per_second"] == 0
 
 
+class TestCalculateBatchPlanRisks:
+    """Test risk figures of batched and per-plan validation."""
+
+    def test_batched_risk_amounts_match_single_plan_path(self, sample_plan, temp_dir):
+        """Test batched validation reports the same non-zero risk as per-plan validation."""
+        from ...risk_management import RiskManager
+
+        risk_manager = RiskManager(
+            account_value=Decimal("10000.00"), state_file=Path(temp_dir) / "state.json"
+        )
+        plans = [
+            sample_plan.model_copy(update={"plan_id": f"AAPL_20250822_00{i}", "risk_category": category})
+            for i, category in enumerate(("small", "normal", "large"), start=1)
+        ]
+
+        batched = calculate_batch_plan_risks(plans, risk_manager, use_cache=False)
+        with patch("auto_trader.cli.risk_utils._validate_plan_batch", return_value=None):
+            single = calculate_batch_plan_risks(plans, risk_manager, use_cache=False)
+
+        fields = ("position_size", "risk_amount", "risk_percent")
+        assert [[r[f] for f in fields] for r in batched] == [[r[f] for f in fields] for r in single]
+        assert [r["risk_amount"] for r in batched] == [
+            Decimal("100.00"), Decimal("200.00"), Decimal("300.00")
+        ]
+        assert [r["risk_percent"] for r in batched] == [Decimal("1.0"), Decimal("2.0"), Decimal("3.0")]
+
+
 class TestSpecificExceptionTypes:
     """Test that specific exception types are raised appropriately."""
     
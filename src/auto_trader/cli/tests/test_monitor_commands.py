@@ -1,12 +1,39 @@
 """Tests for monitor_commands module."""
 
+import asyncio
 import tempfile
+import time
+from datetime import datetime, UTC
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
+import pytest
 from click.testing import CliRunner
 
-from auto_trader.cli.monitor_commands import monitor, summary, history
+from auto_trader.cli.monitor_commands import _run_live_monitor, monitor, summary, history
+from auto_trader.models import TradePlanLoader
+from auto_trader.models.enums import ExecutionAction, Timeframe
+from auto_trader.models.execution import ExecutionLogEntry, ExecutionSignal
+from auto_trader.trade_engine.execution_audit_store import ExecutionAuditStore
+
+
+PLAN_YAML = """
+- plan_id: "{plan_id}"
+  symbol: "AAPL"
+  entry_level: 180.50
+  stop_loss: 178.00
+  take_profit: 185.00
+  risk_category: "normal"
+  entry_function:
+    function_type: "close_above"
+    timeframe: "15min"
+    parameters:
+      threshold: 180.50
+  exit_function:
+    function_type: "stop_loss_take_profit"
+    timeframe: "1min"
+    parameters: {{}}
+"""
 
 
 class TestMonitor:
@@ -17,24 +44,20 @@ class TestMonitor:
         runner = CliRunner()
 
         with patch("auto_trader.cli.monitor_commands.TradePlanLoader") as mock_loader_class, \
-             patch("auto_trader.cli.monitor_commands.Live") as mock_live, \
-             patch("auto_trader.cli.monitor_commands.generate_monitor_layout") as mock_layout:
+             patch(
+                 "auto_trader.cli.monitor_commands._run_live_monitor",
+                 new_callable=AsyncMock,
+                 side_effect=KeyboardInterrupt,
+             ) as mock_run:
 
             mock_loader = MagicMock()
             mock_loader_class.return_value = mock_loader
-            mock_layout.return_value = MagicMock()
 
-            # Mock Live context manager to immediately exit
-            mock_live_instance = MagicMock()
-            mock_live_instance.__enter__ = MagicMock(return_value=mock_live_instance)
-            mock_live_instance.__exit__ = MagicMock(return_value=True)
-            mock_live.return_value = mock_live_instance
-
-            # Simulate KeyboardInterrupt to exit the loop
-            with patch("auto_trader.cli.monitor_commands.time.sleep", side_effect=KeyboardInterrupt):
-                result = runner.invoke(monitor)
+            result = runner.invoke(monitor)
 
             assert result.exit_code == 0
+            assert "Monitor stopped by user" in result.output
+            mock_run.assert_awaited_once_with(mock_loader, 5.0)
 
     def test_monitor_custom_directory(self):
         """Test monitor with custom plans directory."""
@@ -42,47 +65,40 @@ class TestMonitor:
 
         with tempfile.TemporaryDirectory() as temp_dir:
             with patch("auto_trader.cli.monitor_commands.TradePlanLoader") as mock_loader_class, \
-                 patch("auto_trader.cli.monitor_commands.Live") as mock_live, \
-                 patch("auto_trader.cli.monitor_commands.generate_monitor_layout") as mock_layout:
+                 patch(
+                     "auto_trader.cli.monitor_commands._run_live_monitor",
+                     new_callable=AsyncMock,
+                     side_effect=KeyboardInterrupt,
+                 ):
 
-                mock_loader = MagicMock()
-                mock_loader_class.return_value = mock_loader
-                mock_layout.return_value = MagicMock()
+                mock_loader_class.return_value = MagicMock()
 
-                # Mock Live context manager
-                mock_live_instance = MagicMock()
-                mock_live_instance.__enter__ = MagicMock(return_value=mock_live_instance)
-                mock_live_instance.__exit__ = MagicMock(return_value=True)
-                mock_live.return_value = mock_live_instance
-
-                with patch("auto_trader.cli.monitor_commands.time.sleep", side_effect=KeyboardInterrupt):
-                    result = runner.invoke(monitor, ["--plans-dir", temp_dir])
+                result = runner.invoke(monitor, ["--plans-dir", temp_dir])
 
                 assert result.exit_code == 0
                 mock_loader_class.assert_called_with(Path(temp_dir))
 
     def test_monitor_custom_refresh_rate(self):
-        """Test monitor with custom refresh rate."""
+        """Test monitor with custom and sub-second refresh rates."""
         runner = CliRunner()
 
         with patch("auto_trader.cli.monitor_commands.TradePlanLoader") as mock_loader_class, \
-             patch("auto_trader.cli.monitor_commands.Live") as mock_live, \
-             patch("auto_trader.cli.monitor_commands.generate_monitor_layout") as mock_layout:
+             patch(
+                 "auto_trader.cli.monitor_commands._run_live_monitor",
+                 new_callable=AsyncMock,
+                 side_effect=KeyboardInterrupt,
+             ) as mock_run:
 
             mock_loader = MagicMock()
             mock_loader_class.return_value = mock_loader
-            mock_layout.return_value = MagicMock()
-
-            # Mock Live context manager
-            mock_live_instance = MagicMock()
-            mock_live_instance.__enter__ = MagicMock(return_value=mock_live_instance)  
-            mock_live_instance.__exit__ = MagicMock(return_value=True)
-            mock_live.return_value = mock_live_instance
 
-            with patch("auto_trader.cli.monitor_commands.time.sleep", side_effect=KeyboardInterrupt):
-                result = runner.invoke(monitor, ["--refresh-rate", "10"])
+            result = runner.invoke(monitor, ["--refresh-rate", "10"])
+            assert result.exit_code == 0
+            mock_run.assert_awaited_with(mock_loader, 10.0)
 
+            result = runner.invoke(monitor, ["--refresh-rate", "0.25"])
             assert result.exit_code == 0
+            mock_run.assert_awaited_with(mock_loader, 0.25)
 
     def test_monitor_exception_handling(self):
         """Test exception handling in monitor."""
@@ -93,6 +109,54 @@ class TestMonitor:
             assert result.exit_code == 1  # Error handler calls sys.exit(1)
             assert "Error during live monitor" in result.output
 
+    async def test_live_monitor_redraws_on_plan_file_change(self, tmp_path):
+        """Test an edited plan file is shown without reloading other files."""
+        plan_file = tmp_path / "plans.yaml"
+        plan_file.write_text(PLAN_YAML.format(plan_id="AAPL_20250815_001"))
+        loader = TradePlanLoader(tmp_path)
+        redraws = []
+
+        with patch("auto_trader.cli.monitor_commands.Live") as mock_live:
+            live = mock_live.return_value.__enter__.return_value
+            live.refresh.side_effect = lambda: redraws.append(loader.plans_version)
+
+            task = asyncio.create_task(_run_live_monitor(loader, refresh_rate=0.05))
+            await asyncio.sleep(0.3)
+            plan_file.write_text(
+                PLAN_YAML.format(plan_id="AAPL_20250815_001")
+                + PLAN_YAML.format(plan_id="AAPL_20250815_002")
+            )
+            for _ in range(100):
+                if "AAPL_20250815_002" in loader.get_loaded_plan_ids():
+                    break
+                await asyncio.sleep(0.05)
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert "AAPL_20250815_002" in loader.get_loaded_plan_ids()
+        assert redraws[-1] == loader.plans_version
+        assert not loader._watching
+
+    async def test_live_monitor_validates_initial_load(self, tmp_path):
+        """Test plan files failing validation are skipped at startup, as on reload."""
+        (tmp_path / "invalid.yaml").write_text(
+            PLAN_YAML.format(plan_id="AAPL_20250815_001")
+            + PLAN_YAML.format(plan_id="not a plan id")
+        )
+        (tmp_path / "valid.yaml").write_text(PLAN_YAML.format(plan_id="AAPL_20250815_002"))
+        loader = TradePlanLoader(tmp_path)
+
+        with patch("auto_trader.cli.monitor_commands.Live"):
+            task = asyncio.create_task(_run_live_monitor(loader, refresh_rate=0.05))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert loader.get_loaded_plan_ids() == {"AAPL_20250815_002"}
+
 
 class TestSummary:
     """Test summary command."""
@@ -203,4 +267,73 @@ class TestHistory:
         with patch("auto_trader.cli.monitor_commands.display_trade_history", side_effect=Exception("Test error")):
             result = runner.invoke(history)
             assert result.exit_code == 1  # Error handler calls sys.exit(1)
-            assert "Error during loading history" in result.output
\ No newline at end of file
+            assert "Error during loading history" in result.output
+
+def _create_audit_db(db_path: Path) -> None:
+    """Populate an audit database with a signal, an error and a no-action record."""
+    store = ExecutionAuditStore(db_path)
+    for action, error in [(ExecutionAction.ENTER_LONG, None), (ExecutionAction.NONE, "boom")]:
+        store.add(
+            ExecutionLogEntry(
+                timestamp=datetime.now(UTC),
+                function_name="close_above",
+                symbol="AAPL",
+                timeframe=Timeframe.ONE_MIN,
+                signal=ExecutionSignal(action=action, confidence=0.8, reasoning="Close above"),
+                duration_ms=10.0,
+                error=error,
+            )
+        )
+    store.add_compact(time.time(), "close_above", "MSFT", Timeframe.ONE_MIN, 2.0)
+    store.close()
+
+
+class TestAuditStoreCommands:
+    """Test history and summary answered from the execution audit store."""
+
+    def test_history_from_audit_db(self):
+        """Test history lists signals and errors from the audit database."""
+        runner = CliRunner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "audit.db"
+            _create_audit_db(db_path)
+
+            with patch("auto_trader.cli.monitor_commands.display_execution_history") as mock_display:
+                result = runner.invoke(history, ["--audit-db", str(db_path), "--symbol", "aapl"])
+
+            assert result.exit_code == 0
+            entries, days = mock_display.call_args[0]
+            assert days == 30
+            assert len(entries) == 2
+            assert {e.symbol for e in entries} == {"AAPL"}
+
+    def test_history_csv_from_audit_db(self, monkeypatch):
+        """Test history CSV export writes stored entries."""
+        runner = CliRunner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "audit.db"
+            _create_audit_db(db_path)
+            monkeypatch.chdir(temp_dir)
+
+            result = runner.invoke(history, ["--audit-db", str(db_path), "--format", "csv"])
+            csv_lines = (Path(temp_dir) / "execution_history_30days.csv").read_text().splitlines()
+
+            assert result.exit_code == 0
+            assert csv_lines[0].startswith("timestamp,symbol")
+            assert len(csv_lines) == 3
+
+    def test_summary_from_audit_db(self):
+        """Test summary aggregates function statistics from the audit database."""
+        runner = CliRunner()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "audit.db"
+            _create_audit_db(db_path)
+
+            result = runner.invoke(summary, ["--audit-db", str(db_path), "--period", "day"])
+
+            assert result.exit_code == 0
+            assert "close_above" in result.output
+            assert "ENTER_LONG: 1" in result.output
@@ -0,0 +1,116 @@
+"""Tests for the live monitor view model."""
+
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from rich.panel import Panel
+from rich.table import Table
+
+from auto_trader.cli.monitor_view import MonitorViewModel
+from auto_trader.models import TradePlanLoader, TradePlanStatus
+
+
+PLAN_YAML = """
+- plan_id: "{plan_id}"
+  symbol: "{symbol}"
+  entry_level: 180.50
+  stop_loss: 178.00
+  take_profit: 185.00
+  risk_category: "normal"
+  entry_function:
+    function_type: "close_above"
+    timeframe: "15min"
+    parameters:
+      threshold: 180.50
+  exit_function:
+    function_type: "stop_loss_take_profit"
+    timeframe: "1min"
+    parameters: {{}}
+  status: "{status}"
+"""
+
+NOW = datetime(2025, 8, 28, 10, 30, 0)
+
+
+def make_loader(plans_dir, file_count, status="completed"):
+    """Write plan files with ten plans each and load them."""
+    for file_index in range(file_count):
+        (plans_dir / f"plans_{file_index:04d}.yaml").write_text(
+            "".join(
+                PLAN_YAML.format(
+                    plan_id=f"P{file_index}_{plan_index}",
+                    symbol="S" + chr(65 + file_index % 26),
+                    status=status,
+                )
+                for plan_index in range(10)
+            )
+        )
+    loader = TradePlanLoader(plans_dir)
+    loader.load_all_plans(validate=False)
+    return loader
+
+
+class TestMonitorViewModel:
+    """Test per-panel change detection."""
+
+    @pytest.fixture
+    def loader(self, tmp_path):
+        """Provide loader with 20 completed plans."""
+        return make_loader(tmp_path, file_count=2)
+
+    def test_first_update_builds_all_panels(self, loader):
+        """Test the initial update renders every panel."""
+        view = MonitorViewModel(loader, refresh_rate=0.5)
+
+        assert view.update(NOW) == {"header", "body", "footer"}
+        assert isinstance(view.layout["body"].renderable, Panel)
+        assert "No active plans" in view.layout["body"].renderable.renderable
+
+    def test_unchanged_data_rebuilds_nothing(self, loader):
+        """Test an update with the same clock and plans is a no-op."""
+        view = MonitorViewModel(loader, refresh_rate=0.5)
+        view.update(NOW)
+
+        assert view.update(NOW) == set()
+        assert view.update(NOW + timedelta(seconds=1)) == {"header"}
+        assert view.panel_builds == {"header": 2, "body": 1, "footer": 1}
+
+    def test_plan_change_rebuilds_body_and_footer(self, loader):
+        """Test a status update is shown in the plans panel."""
+        view = MonitorViewModel(loader, refresh_rate=0.5)
+        view.update(NOW)
+
+        loader.update_plan_status("P0_3", TradePlanStatus.POSITION_OPEN)
+
+        assert view.update(NOW) == {"body", "footer"}
+        body = view.layout["body"].renderable
+        assert isinstance(body, Table)
+        assert body.row_count == 1
+
+    def test_idle_update_cost_independent_of_plan_count(self, tmp_path):
+        """Test idle refreshes never query plans, however many are loaded."""
+        small_dir = tmp_path / "small"
+        large_dir = tmp_path / "large"
+        small_dir.mkdir()
+        large_dir.mkdir()
+        timings = {}
+        for name, loader in (
+            ("small", make_loader(small_dir, file_count=1, status="awaiting_entry")),
+            ("large", make_loader(large_dir, file_count=300, status="awaiting_entry")),
+        ):
+            view = MonitorViewModel(loader, refresh_rate=0.1)
+            view.update(NOW)
+            with patch.object(loader, "get_plans_by_status") as query:
+                start = time.perf_counter()
+                for second in range(1, 1001):
+                    view.update(NOW + timedelta(seconds=second))
+                timings[name] = (time.perf_counter() - start) * 1000
+            query.assert_not_called()
+
+        print(
+            f"1000 idle monitor updates: 10 plans {timings['small']:.1f}ms, "
+            f"3000 plans {timings['large']:.1f}ms"
+        )
+        assert timings["large"] < timings["small"] * 3 + 50
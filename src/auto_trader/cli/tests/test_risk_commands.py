@@ -1,5 +1,8 @@
 """Tests for risk_commands module."""
 
+import csv
+import io
+import json
 import tempfile
 from decimal import Decimal
 from pathlib import Path
@@ -7,8 +10,13 @@ from unittest.mock import patch, MagicMock
 
 from click.testing import CliRunner
 
-from auto_trader.cli.risk_commands import calculate_position_size, portfolio_risk_summary
+from auto_trader.cli.risk_commands import (
+    calculate_position_size,
+    portfolio_risk_summary,
+    position_size_grid,
+)
 from auto_trader.risk_management import (
+    PortfolioTracker,
     PositionSizeResult,
     RiskCheck,
     InvalidPositionSizeError,
@@ -181,6 +189,82 @@ class TestCalculatePositionSize:
                 assert call_args[1]["state_file"] == temp_path
 
 
+class TestPositionSizeGrid:
+    """Test position-size-grid command."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.runner = CliRunner()
+
+    def test_csv_to_stdout(self, tmp_path):
+        """Test ranges and lists expand into a CSV row per scenario."""
+        result = self.runner.invoke(position_size_grid, [
+            "--entry", "AAPL=180.50",
+            "--entry", "msft=420",
+            "--stop-pct", "1:2:0.5",
+            "--risk", "small",
+            "--risk", "large",
+            "--account-value", "10000,50000",
+            "--state-file", str(tmp_path / "state.json"),
+        ])
+
+        assert result.exit_code == 0, result.output
+        rows = list(csv.DictReader(io.StringIO(result.output)))
+        assert len(rows) == 2 * 3 * 2 * 2
+        assert {row["symbol"] for row in rows} == {"AAPL", "MSFT"}
+        assert rows[0]["stop_loss"] == "178.695"
+        assert rows[0]["position_size"] == "55"
+
+    def test_json_file_with_committed_risk(self, tmp_path):
+        """Test open positions count against the limit and feasible rows are filtered."""
+        state_file = tmp_path / "state.json"
+        PortfolioTracker(state_file=state_file, account_value=Decimal("100000")).add_position(
+            "POS_001", "NVDA", Decimal("8500.00"), "NVDA_20250815_001"
+        )
+        output = tmp_path / "grid.json"
+
+        result = self.runner.invoke(position_size_grid, [
+            "--entry", "AAPL=100",
+            "--stop-pct", "5",
+            "--account-value", "100000",
+            "--state-file", str(state_file),
+            "--format", "json",
+            "--output", str(output),
+            "--feasible-only",
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "3 scenarios (1 feasible), 1 rows written" in result.output
+        table = json.loads(output.read_text())
+        assert [row[table["columns"].index("risk_category")] for row in table["rows"]] == ["small"]
+
+    def test_invalid_arguments(self, tmp_path):
+        """Test malformed entries and invalid stops fail the command."""
+        result = self.runner.invoke(position_size_grid, [
+            "--entry", "AAPL", "--stop-pct", "1", "--account-value", "10000",
+        ])
+        assert result.exit_code != 0
+        assert "SYMBOL=PRICE" in result.output
+
+        result = self.runner.invoke(position_size_grid, [
+            "--entry", "AAPL=180", "--stop-pct", "150", "--account-value", "10000",
+            "--state-file", str(tmp_path / "state.json"),
+        ])
+        assert result.exit_code != 0
+        assert "between 0 and 100" in result.output
+
+    def test_unexpected_error(self, tmp_path):
+        """Test unexpected errors are reported and exit non-zero."""
+        with patch("auto_trader.cli.risk_commands.RiskManager", side_effect=OSError("disk gone")):
+            result = self.runner.invoke(position_size_grid, [
+                "--entry", "AAPL=180", "--stop-pct", "1", "--account-value", "10000",
+                "--state-file", str(tmp_path / "state.json"),
+            ])
+
+        assert result.exit_code == 1
+        assert "disk gone" in result.output
+
+
 class TestPortfolioRiskSummary:
     """Test portfolio-risk-summary command."""
 
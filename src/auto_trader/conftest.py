@@ -0,0 +1,36 @@
+"""Shared pytest fixtures for tests across auto_trader packages."""
+
+from decimal import Decimal
+
+import pytest
+
+from auto_trader.models.trade_plan import TradePlan
+
+
+@pytest.fixture
+def make_plan():
+    """Provide a factory creating valid trade plans, overriding top-level fields."""
+
+    def make(plan_id="AAPL_20250815_001", symbol="AAPL", **overrides):
+        data = {
+            "plan_id": plan_id,
+            "symbol": symbol,
+            "entry_level": Decimal("180.50"),
+            "stop_loss": Decimal("178.00"),
+            "take_profit": Decimal("185.00"),
+            "risk_category": "normal",
+            "entry_function": {
+                "function_type": "close_above",
+                "timeframe": "15min",
+                "parameters": {"threshold": 180.50},
+            },
+            "exit_function": {
+                "function_type": "stop_loss_take_profit",
+                "timeframe": "1min",
+                "parameters": {},
+            },
+        }
+        data.update(overrides)
+        return TradePlan(**data)
+
+    return make
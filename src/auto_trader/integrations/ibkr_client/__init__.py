@@ -17,6 +17,7 @@ from .order_manager import (
     OrderNotFoundError,
     OrderAlreadyExistsError,
 )
+from .order_journal import OrderJournal
 from .state_manager import OrderStateManager, OrderStateSnapshot
 
 __all__ = [
@@ -35,6 +36,7 @@ __all__ = [
     "OrderExecutionError",
     "OrderNotFoundError",
     "OrderAlreadyExistsError",
+    "OrderJournal",
     "OrderStateManager",
     "OrderStateSnapshot",
 ]
@@ -5,11 +5,14 @@ import json
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 from loguru import logger
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from auto_trader.persistence.write_behind import WriteBehindScheduler
+
 
 class CircuitState(Enum):
     """Circuit breaker state enumeration."""
@@ -48,7 +51,8 @@ class CircuitBreaker:
         self,
         failure_threshold: int = 5,
         reset_timeout: int = 60,
-        state_file: Optional[Path] = None
+        state_file: Optional[Path] = None,
+        persistence_scheduler: Optional["WriteBehindScheduler"] = None,
     ):
         """
         Initialize circuit breaker.
@@ -57,6 +61,9 @@ class CircuitBreaker:
             failure_threshold: Max failures before opening circuit
             reset_timeout: Seconds to wait before attempting recovery
             state_file: Optional file path for state persistence
+            persistence_scheduler: Optional write-behind scheduler; failure
+                counts are coalesced while open/close transitions are flushed
+                immediately
         """
         self._failure_threshold = failure_threshold
         self._reset_timeout = reset_timeout
@@ -64,6 +71,13 @@ class CircuitBreaker:
         
         # Load persisted state or initialize
         self._state = self._load_state()
+        
+        self._persistence_scheduler = persistence_scheduler
+        self._persistence_key = f"circuit_breaker:{self._state_file}"
+        if persistence_scheduler is not None:
+            persistence_scheduler.register(
+                self._persistence_key, self._serialize_state, self._write_state
+            )
 
     def calculate_backoff_delay(self, attempt: int, base_delay: int = 1) -> int:
         """
@@ -135,8 +149,10 @@ class CircuitBreaker:
         """
         self._state.failure_count += 1
         self._state.last_failure_time = datetime.now()
+        opened = False
 
         if self._state.failure_count >= self._failure_threshold:
+            opened = self._state.state != CircuitState.OPEN
             self._state.state = CircuitState.OPEN
             self._state.next_attempt_time = (
                 datetime.now() + timedelta(seconds=self._reset_timeout)
@@ -155,13 +171,14 @@ class CircuitBreaker:
                 threshold=self._failure_threshold
             )
 
-        self._save_state()
+        self._save_state(force=opened)
 
     def record_success(self) -> None:
         """
         Reset circuit breaker on successful connection.
         """
         previous_failures = self._state.failure_count
+        was_closed = self._state.state == CircuitState.CLOSED
         
         self._state.state = CircuitState.CLOSED
         self._state.failure_count = 0
@@ -174,7 +191,7 @@ class CircuitBreaker:
                 previous_failures=previous_failures
             )
 
-        self._save_state()
+        self._save_state(force=not was_closed)
 
     def get_state(self) -> CircuitBreakerState:
         """
@@ -254,28 +271,52 @@ class CircuitBreaker:
         # Return default state on load failure
         return CircuitBreakerState(reset_timeout=self._reset_timeout)
 
-    def _save_state(self) -> None:
+    def _save_state(self, force: bool = False) -> None:
         """
         Save circuit breaker state to file.
+        
+        Args:
+            force: Write immediately even when a write-behind scheduler is set
         """
+        if self._persistence_scheduler is not None:
+            self._persistence_scheduler.mark_dirty(self._persistence_key, force=force)
+            return
+        
         try:
-            # Convert to dict with ISO datetime strings
-            state_dict = self._state.model_dump()
-            
-            # Convert enum to string value
-            if 'state' in state_dict and hasattr(state_dict['state'], 'value'):
-                state_dict['state'] = state_dict['state'].value
-            
-            # Convert datetime objects to ISO strings
-            if self._state.last_failure_time:
-                state_dict['last_failure_time'] = self._state.last_failure_time.isoformat()
-            if self._state.next_attempt_time:
-                state_dict['next_attempt_time'] = self._state.next_attempt_time.isoformat()
-
-            self._state_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._state_file, 'w') as f:
-                json.dump(state_dict, f, indent=2)
-                
-            logger.debug("Circuit breaker state saved")
+            self._write_state(self._serialize_state())
         except Exception as e:
-            logger.warning("Failed to save circuit breaker state", error=str(e))
\ No newline at end of file
+            logger.warning("Failed to save circuit breaker state", error=str(e))
+
+    def _serialize_state(self) -> dict:
+        """
+        Convert state to a JSON-ready dict with ISO datetime strings.
+        
+        Returns:
+            Serialized circuit breaker state
+        """
+        state_dict = self._state.model_dump()
+        
+        # Convert enum to string value
+        if 'state' in state_dict and hasattr(state_dict['state'], 'value'):
+            state_dict['state'] = state_dict['state'].value
+        
+        # Convert datetime objects to ISO strings
+        if self._state.last_failure_time:
+            state_dict['last_failure_time'] = self._state.last_failure_time.isoformat()
+        if self._state.next_attempt_time:
+            state_dict['next_attempt_time'] = self._state.next_attempt_time.isoformat()
+        
+        return state_dict
+
+    def _write_state(self, state_dict: dict) -> None:
+        """
+        Write serialized state to file.
+        
+        Args:
+            state_dict: Serialized circuit breaker state
+        """
+        self._state_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._state_file, 'w') as f:
+            json.dump(state_dict, f, indent=2)
+            
+        logger.debug("Circuit breaker state saved")
@@ -3,7 +3,7 @@
 import asyncio
 import signal
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from loguru import logger
 
@@ -11,6 +11,9 @@ from .circuit_breaker import CircuitBreaker, CircuitBreakerError, CircuitBreaker
 from .client import ConnectionState, IBKRClient, ConnectionStatus
 from config import Settings
 
+if TYPE_CHECKING:
+    from auto_trader.persistence.write_behind import WriteBehindScheduler
+
 
 class ConnectionManager:
     """
@@ -23,7 +26,8 @@ class ConnectionManager:
     def __init__(
         self,
         settings: Optional[Settings] = None,
-        state_dir: Optional[Path] = None
+        state_dir: Optional[Path] = None,
+        persistence_scheduler: Optional["WriteBehindScheduler"] = None,
     ):
         """
         Initialize connection manager.
@@ -31,6 +35,8 @@ class ConnectionManager:
         Args:
             settings: Optional settings instance
             state_dir: Optional directory for state persistence
+            persistence_scheduler: Optional write-behind scheduler for
+                circuit breaker state
         """
         self._settings = settings or Settings()
         self._state_dir = state_dir or Path("state")
@@ -39,8 +45,10 @@ class ConnectionManager:
         self._circuit_breaker = CircuitBreaker(
             failure_threshold=5,
             reset_timeout=60,
-            state_file=self._state_dir / "circuit_breaker_state.json"
+            state_file=self._state_dir / "circuit_breaker_state.json",
+            persistence_scheduler=persistence_scheduler,
         )
+        self._persistence_scheduler = persistence_scheduler
         
         self._shutdown_initiated = False
         self._reconnection_task: Optional[asyncio.Task] = None
@@ -191,6 +199,9 @@ class ConnectionManager:
             # Disconnect from IBKR
             await self.disconnect()
             
+            if self._persistence_scheduler is not None:
+                await self._persistence_scheduler.flush()
+            
             logger.info("Graceful shutdown completed")
             
         except Exception as e:
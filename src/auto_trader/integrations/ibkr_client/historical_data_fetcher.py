@@ -2,41 +2,73 @@
 
 from datetime import datetime, timedelta, UTC
 from decimal import Decimal
-from typing import List, Dict, Optional, Tuple, Any
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple, Any
 
 from ib_async import IB, Stock, Contract, BarData as IBBarData
 from loguru import logger
 
+from auto_trader.io_executor import IOExecutor, get_io_executor
 from auto_trader.models.market_data import (
-    BarData, BarSizeType, BAR_SIZE_MAPPING,
+    BarData, BarSizeType, BAR_SIZE_MAPPING, BAR_SIZE_SECONDS,
     MarketDataError
 )
 from auto_trader.models.trade_plan import TradePlan
 
+if TYPE_CHECKING:
+    from auto_trader.persistence.bar_store import BarStore
+
+
+# Contract fields persisted so stored contracts need no re-qualification
+CONTRACT_FIELDS = (
+    "conId", "symbol", "secType", "exchange", "primaryExchange",
+    "currency", "localSymbol", "tradingClass",
+)
+
+# IB duration units to calendar spans; days count trading (week) days
+DURATION_UNITS = {
+    "S": timedelta(seconds=1),
+    "W": timedelta(weeks=1),
+    "M": timedelta(days=30),
+    "Y": timedelta(days=365),
+}
+
 
 class HistoricalDataFetcher:
     """
     Fetches historical market data for startup context establishment.
     
     Provides historical bar fetching, gap detection, and position
-    calculation relative to trade plan levels.
+    calculation relative to trade plan levels. With a local bar store,
+    requests are served from disk and only ranges never fetched before go
+    to IBKR; fetched bars and qualified contracts are written through.
     """
     
-    def __init__(self, ib_client: IB):
+    def __init__(
+        self,
+        ib_client: IB,
+        bar_store: Optional["BarStore"] = None,
+        io_executor: Optional[IOExecutor] = None,
+    ):
         """
         Initialize historical data fetcher.
         
         Args:
             ib_client: Connected IB client instance
+            bar_store: Optional local bar store consulted before IBKR
+            io_executor: Executor for bar store I/O (defaults to the shared one)
         """
         self._ib = ib_client
+        self._bar_store = bar_store
+        self._io = io_executor or get_io_executor()
         self._contracts: Dict[str, Contract] = {}
         
         # Statistics
         self._stats = {
             "bars_fetched": 0,
             "fetch_errors": 0,
-            "gaps_detected": 0
+            "gaps_detected": 0,
+            "bars_from_store": 0,
+            "ranges_requested": 0
         }
         
         logger.info("HistoricalDataFetcher initialized")
@@ -45,7 +77,8 @@ class HistoricalDataFetcher:
         self,
         symbols: List[str],
         bar_size: BarSizeType = "5min",
-        duration: str = "1 D"
+        duration: str = "1 D",
+        since: Optional[Dict[str, datetime]] = None
     ) -> Dict[str, List[BarData]]:
         """
         Fetch historical context for system startup.
@@ -54,17 +87,25 @@ class HistoricalDataFetcher:
             symbols: List of trading symbols
             bar_size: Bar timeframe
             duration: Historical duration (IB format: "1 D", "1 W", etc.)
+            since: Latest bar already held per symbol (e.g. from a warm-restart
+                snapshot); only bars after it are fetched and returned
             
         Returns:
             Dictionary mapping symbols to historical bars
         """
         context_data = {}
+        since = since or {}
         
         for symbol in symbols:
             try:
+                last_held = since.get(symbol)
                 bars = await self.fetch_historical_bars(
-                    symbol, bar_size, duration
+                    symbol,
+                    bar_size,
+                    self._gap_duration(last_held) if last_held else duration
                 )
+                if last_held:
+                    bars = [bar for bar in bars if bar.timestamp > last_held]
                 context_data[symbol] = bars
                 
                 logger.info(
@@ -109,55 +150,21 @@ class HistoricalDataFetcher:
             MarketDataError: If fetch fails
         """
         try:
-            # Get or create contract
-            if symbol not in self._contracts:
-                contract = Stock(symbol, "SMART", "USD")
-                await self._ib.qualifyContractsAsync(contract)
-                self._contracts[symbol] = contract
+            contract = await self._get_contract(symbol)
             
             # Convert bar size to IB format
             ib_bar_size = BAR_SIZE_MAPPING.get(bar_size)
             if not ib_bar_size:
                 raise MarketDataError(f"Unsupported bar size: {bar_size}")
             
-            # Fetch historical data
-            ib_bars = await self._ib.reqHistoricalDataAsync(
-                self._contracts[symbol],
-                endDateTime=end_datetime or "",
-                durationStr=duration,
-                barSizeSetting=ib_bar_size,
-                whatToShow="TRADES",
-                useRTH=True,  # Regular trading hours only
-                formatDate=2,  # UTC timestamps
-                keepUpToDate=False
-            )
-            
-            if not ib_bars:
-                logger.warning(
-                    "No historical data returned",
-                    symbol=symbol,
-                    bar_size=bar_size,
-                    duration=duration
+            if self._bar_store is None:
+                bars = await self._request_bars(
+                    contract, symbol, bar_size, duration, end_datetime
                 )
-                return []
-            
-            # Convert IB bars to our format
-            bars = []
-            for ib_bar in ib_bars:
-                bar = BarData(
-                    symbol=symbol,
-                    timestamp=ib_bar.date if isinstance(ib_bar.date, datetime) 
-                              else datetime.fromisoformat(str(ib_bar.date)).replace(tzinfo=UTC),
-                    open_price=Decimal(str(ib_bar.open)),
-                    high_price=Decimal(str(ib_bar.high)),
-                    low_price=Decimal(str(ib_bar.low)),
-                    close_price=Decimal(str(ib_bar.close)),
-                    volume=int(ib_bar.volume),
-                    bar_size=bar_size
+            else:
+                bars = await self._fetch_through_store(
+                    contract, symbol, bar_size, duration, end_datetime
                 )
-                bars.append(bar)
-            
-            self._stats["bars_fetched"] += len(bars)
             
             logger.debug(
                 "Historical bars fetched",
@@ -174,6 +181,157 @@ class HistoricalDataFetcher:
                 f"Failed to fetch historical data for {symbol}: {str(e)}"
             )
     
+    async def _get_contract(self, symbol: str) -> Contract:
+        """
+        Get a qualified contract, from memory, the bar store or IBKR.
+        
+        Args:
+            symbol: Trading symbol
+            
+        Returns:
+            Qualified contract
+        """
+        if symbol in self._contracts:
+            return self._contracts[symbol]
+        
+        details = None
+        if self._bar_store is not None:
+            details = await self._io.run(
+                "historical_data.get_contract", self._bar_store.get_contract, symbol
+            )
+        if details:
+            contract = Contract(**details)
+        else:
+            contract = Stock(symbol, "SMART", "USD")
+            await self._ib.qualifyContractsAsync(contract)
+            if self._bar_store is not None and contract.conId:
+                await self._io.run(
+                    "historical_data.save_contract",
+                    self._bar_store.save_contract,
+                    symbol,
+                    {field: getattr(contract, field) for field in CONTRACT_FIELDS}
+                )
+        
+        self._contracts[symbol] = contract
+        return contract
+    
+    async def _fetch_through_store(
+        self,
+        contract: Contract,
+        symbol: str,
+        bar_size: BarSizeType,
+        duration: str,
+        end_datetime: Optional[datetime]
+    ) -> List[BarData]:
+        """
+        Serve a request from the bar store, fetching only missing ranges.
+        
+        Args:
+            contract: Qualified contract
+            symbol: Trading symbol
+            bar_size: Bar timeframe
+            duration: IB duration string, interpreted as a window ending at
+                end_datetime (days count weekdays)
+            end_datetime: Window end (defaults to now)
+            
+        Returns:
+            Bars in the window, in chronological order
+        """
+        now = datetime.now(UTC)
+        end = end_datetime or now
+        start = self._window_start(end, duration)
+        # The bar still forming is never marked as fetched
+        complete_until = now - timedelta(seconds=BAR_SIZE_SECONDS[bar_size])
+        
+        store = self._bar_store
+        missing = store.missing_ranges(symbol, bar_size, start, end)
+        for gap_start, gap_end in missing:
+            fetched = await self._request_bars(
+                contract,
+                symbol,
+                bar_size,
+                self._duration_between(gap_start, gap_end),
+                gap_end if gap_end < now else None
+            )
+            await self._io.run(
+                "historical_data.append_bars", store.append_bars, symbol, bar_size, fetched
+            )
+            await self._io.run(
+                "historical_data.mark_covered",
+                store.mark_covered,
+                symbol,
+                bar_size,
+                gap_start,
+                min(gap_end, complete_until)
+            )
+        
+        bars = await self._io.run(
+            "historical_data.read_bars", store.read_bars, symbol, bar_size, start, end
+        )
+        self._stats["ranges_requested"] += len(missing)
+        self._stats["bars_from_store"] += len(bars)
+        return bars
+    
+    async def _request_bars(
+        self,
+        contract: Contract,
+        symbol: str,
+        bar_size: BarSizeType,
+        duration: str,
+        end_datetime: Optional[datetime]
+    ) -> List[BarData]:
+        """
+        Request historical bars from IBKR.
+        
+        Args:
+            contract: Qualified contract
+            symbol: Trading symbol
+            bar_size: Bar timeframe
+            duration: IB duration string
+            end_datetime: End time (None for now)
+            
+        Returns:
+            Bars in chronological order
+        """
+        ib_bars = await self._ib.reqHistoricalDataAsync(
+            contract,
+            endDateTime=end_datetime or "",
+            durationStr=duration,
+            barSizeSetting=BAR_SIZE_MAPPING[bar_size],
+            whatToShow="TRADES",
+            useRTH=True,  # Regular trading hours only
+            formatDate=2,  # UTC timestamps
+            keepUpToDate=False
+        )
+        
+        if not ib_bars:
+            logger.warning(
+                "No historical data returned",
+                symbol=symbol,
+                bar_size=bar_size,
+                duration=duration
+            )
+            return []
+        
+        # Convert IB bars to our format
+        bars = []
+        for ib_bar in ib_bars:
+            bar = BarData(
+                symbol=symbol,
+                timestamp=ib_bar.date if isinstance(ib_bar.date, datetime) 
+                          else datetime.fromisoformat(str(ib_bar.date)).replace(tzinfo=UTC),
+                open_price=Decimal(str(ib_bar.open)),
+                high_price=Decimal(str(ib_bar.high)),
+                low_price=Decimal(str(ib_bar.low)),
+                close_price=Decimal(str(ib_bar.close)),
+                volume=int(ib_bar.volume),
+                bar_size=bar_size
+            )
+            bars.append(bar)
+        
+        self._stats["bars_fetched"] += len(bars)
+        return bars
+    
     def detect_data_gaps(
         self,
         bars: List[BarData],
@@ -336,6 +494,68 @@ class HistoricalDataFetcher:
         return (market_open <= start_hour <= market_close and
                 market_open <= end_hour <= market_close)
     
+    @classmethod
+    def _gap_duration(cls, last_held: datetime) -> str:
+        """
+        Get the IB duration covering the time since a held bar.
+        
+        Args:
+            last_held: Timestamp of the newest bar already held
+            
+        Returns:
+            IB duration string
+        """
+        return cls._duration_between(last_held, datetime.now(UTC))
+    
+    @staticmethod
+    def _duration_between(start: datetime, end: datetime) -> str:
+        """
+        Get the smallest IB duration covering a time range.
+        
+        Args:
+            start: Range start
+            end: Range end
+            
+        Returns:
+            IB duration string in seconds (up to a day) or whole days
+        """
+        seconds = max(60, int((end - start).total_seconds()) + 1)
+        if seconds <= 86400:
+            return f"{seconds} S"
+        return f"{-(-seconds // 86400)} D"
+    
+    @staticmethod
+    def _window_start(end: datetime, duration: str) -> datetime:
+        """
+        Get the start of the window an IB duration covers.
+        
+        Args:
+            end: Window end
+            duration: IB duration string (e.g. "1 D", "2 W", "3600 S")
+            
+        Returns:
+            Window start; day durations skip weekends like trading days
+            
+        Raises:
+            MarketDataError: If the duration cannot be parsed
+        """
+        try:
+            count_str, unit = duration.split()
+            count = int(count_str)
+        except ValueError:
+            raise MarketDataError(f"Unsupported duration: {duration}")
+        
+        if unit == "D":
+            start = end
+            while count > 0:
+                start -= timedelta(days=1)
+                if start.weekday() < 5:
+                    count -= 1
+            return start
+        if unit not in DURATION_UNITS:
+            raise MarketDataError(f"Unsupported duration: {duration}")
+        return end - DURATION_UNITS[unit] * count
+    
     def get_stats(self) -> Dict[str, int]:
         """Get fetcher statistics."""
         return self._stats.copy()
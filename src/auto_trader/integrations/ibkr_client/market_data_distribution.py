@@ -3,9 +3,13 @@
 from typing import List, Dict, Callable
 from loguru import logger
 
+from auto_trader.logging_config import HotPathLogger
 from auto_trader.models.market_data import BarData
 
 
+_distribution_log = HotPathLogger("DEBUG", sample_every=100)
+
+
 class MarketDataDistributor:
     """
     Handles distribution of market data to subscribers.
@@ -80,7 +84,7 @@ class MarketDataDistributor:
         self._distribution_errors += errors
         
         if distribution_count > 0:
-            logger.debug(
+            _distribution_log.log(
                 "Market data distributed",
                 symbol=bar_data.symbol,
                 bar_size=bar_data.bar_size,
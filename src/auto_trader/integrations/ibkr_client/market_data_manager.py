@@ -6,14 +6,20 @@ from typing import Dict, List, Set, Optional, Callable
 from ib_async import IB, RealTimeBar
 from loguru import logger
 
+from auto_trader.logging_config import HotPathLogger
 from auto_trader.models.market_data import BarData, BarSizeType
 from auto_trader.models.market_data_cache import MarketDataCache
+from auto_trader.models.plan_diff import PlanDiff
+from auto_trader.models.plan_loader import TradePlanLoader
 from .market_data_distribution import MarketDataDistributor
 from .subscription_manager import SubscriptionManager
 from .bar_converter import BarConverter
 from .market_data_orchestrator import MarketDataOrchestrator
 
 
+_bar_update_log = HotPathLogger("DEBUG", sample_every=100)
+
+
 class MarketDataManager:
     """
     Manages real-time market data subscriptions and distribution.
@@ -119,6 +125,36 @@ class MarketDataManager:
             required_symbols, self._create_bar_callback
         )
     
+    async def apply_plan_diff(self, diff: PlanDiff) -> Dict[str, List[str]]:
+        """
+        Update subscriptions for a change to the loaded trade plans.
+        
+        Args:
+            diff: Plan diff from TradePlanLoader diff listeners
+            
+        Returns:
+            Lists of subscribed, unsubscribed and failed symbol:bar_size keys
+        """
+        return await self._orchestrator.orchestrate_plan_diff(
+            diff, self._create_bar_callback
+        )
+    
+    def attach_plan_loader(self, loader: TradePlanLoader) -> None:
+        """
+        Keep subscriptions in step with a plan loader's plans.
+        
+        Subscribes for the currently loaded plans, then applies each plan
+        diff on the event loop. Call from the running loop.
+        
+        Args:
+            loader: Plan loader whose changes drive subscriptions
+        """
+        loader.add_diff_listener(self.apply_plan_diff, replay=True)
+    
+    def detach_plan_loader(self, loader: TradePlanLoader) -> None:
+        """Stop following a plan loader; existing subscriptions are kept."""
+        loader.remove_diff_listener(self.apply_plan_diff)
+    
     async def _on_bar_update(
         self,
         bars: RealTimeBar,
@@ -148,12 +184,12 @@ class MarketDataManager:
             # Distribute to all subscribers
             await self._distributor.distribute_bar_data(bar_data)
             
-            logger.debug(
+            _bar_update_log.log(
                 "Bar update processed",
                 symbol=symbol,
                 bar_size=bar_size,
-                close=str(bar_data.close_price),
-                volume=bar_data.volume
+                close=lambda: str(bar_data.close_price),
+                volume=bar_data.volume,
             )
             
         except Exception as e:
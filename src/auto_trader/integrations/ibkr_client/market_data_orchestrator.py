@@ -1,10 +1,12 @@
 """Market data subscription orchestration for IBKR integration."""
 
+import asyncio
 from typing import Dict, List, Set, Optional
 from loguru import logger
 
 from auto_trader.models.market_data import BarSizeType
 from auto_trader.models.market_data_cache import MarketDataCache
+from auto_trader.models.plan_diff import PlanDiff, PlanKeyIndex
 from .subscription_manager import SubscriptionManager
 
 
@@ -27,6 +29,10 @@ class MarketDataOrchestrator:
         """
         self._subscription_manager = subscription_manager
         self._cache = cache
+        
+        # Market data keys needed by plans, maintained from plan diffs
+        self._plan_keys = PlanKeyIndex()
+        self._plan_diff_lock = asyncio.Lock()
     
     async def orchestrate_subscriptions(
         self,
@@ -118,6 +124,51 @@ class MarketDataOrchestrator:
         await self._handle_symbol_additions(symbols_to_add, callback_factory, default_bar_sizes)
         await self._handle_symbol_removals(symbols_to_remove)
     
+    async def orchestrate_plan_diff(
+        self,
+        diff: PlanDiff,
+        callback_factory
+    ) -> Dict[str, List[str]]:
+        """
+        Update subscriptions for one change to the loaded trade plans.
+        
+        Only symbol/timeframe subscriptions that the diff makes newly needed
+        or no longer needed are touched; plans whose prices, parameters or
+        other fields changed without altering their market data needs cost
+        nothing. Diffs are applied one at a time, in call order.
+        
+        Args:
+            diff: Plan diff from the trade plan loader
+            callback_factory: Function to create callbacks for new subscriptions
+            
+        Returns:
+            Lists of subscribed, unsubscribed and failed symbol:bar_size keys
+        """
+        async with self._plan_diff_lock:
+            acquired, released = self._plan_keys.apply(diff)
+            results: Dict[str, List[str]] = {"subscribed": [], "unsubscribed": [], "failed": []}
+            
+            for symbol, bar_size in sorted(released):
+                if await self._subscription_manager.remove_subscription(symbol, bar_size):
+                    results["unsubscribed"].append(f"{symbol}:{bar_size}")
+                if symbol not in self._subscription_manager.get_active_symbols():
+                    self._cache.remove_subscription(symbol)
+            
+            for symbol, bar_size in sorted(acquired):
+                key = f"{symbol}:{bar_size}"
+                success = await self._subscription_manager.create_subscription(
+                    symbol, bar_size, callback_factory(symbol, bar_size)
+                )
+                if success:
+                    self._cache.add_subscription(symbol)
+                    results["subscribed"].append(key)
+                else:
+                    results["failed"].append(key)
+            
+            if acquired or released:
+                logger.info("Applied plan changes to market data subscriptions", **results)
+            return results
+    
     async def _handle_symbol_additions(
         self, 
         symbols_to_add: Set[str], 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from decimal import Decimal
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from typing import TYPE_CHECKING, Dict, List, Optional, Callable, Tuple
 
 from ...logging_config import get_logger
 from ...models.order import (
@@ -16,7 +16,8 @@ from ...models.order import (
     OrderEvent,
     OrderModification,
 )
-from ...models.enums import OrderStatus, OrderType
+from ...models.enums import OrderJournalEvent, OrderStatus, OrderType
+from ...persistence.write_behind import WriteBehindScheduler
 from ...risk_management import OrderRiskValidator
 from .client import IBKRClient, IBKRError
 from .state_manager import OrderStateManager
@@ -24,6 +25,9 @@ from .order_simulation_engine import OrderSimulationEngine
 from .ibkr_order_adapter import IBKROrderAdapter
 from .order_event_manager import OrderEventManager
 
+if TYPE_CHECKING:
+    from ...persistence.backup_store import BackupStore
+
 logger = get_logger("order_execution_manager", "trades")
 
 
@@ -57,6 +61,8 @@ class OrderExecutionManager:
         simulation_mode: bool = True,
         state_dir: Optional[Path] = None,
         discord_notifier: Optional[object] = None,
+        persistence_scheduler: Optional[WriteBehindScheduler] = None,
+        backup_store: Optional[BackupStore] = None,
     ) -> None:
         """
         Initialize order execution manager.
@@ -67,6 +73,9 @@ class OrderExecutionManager:
             simulation_mode: Whether to run in simulation mode
             state_dir: Directory for persistent state (defaults to data/orders)
             discord_notifier: Optional Discord notifier for order events
+            persistence_scheduler: Write-behind scheduler coalescing order snapshot
+                saves (a private one is created if omitted)
+            backup_store: Optional deduplicating backup store for order snapshots
         """
         self.ibkr_client = ibkr_client
         self.risk_validator = risk_validator
@@ -74,11 +83,20 @@ class OrderExecutionManager:
         
         # Order tracking
         self._active_orders: Dict[str, Order] = {}
+        # Working entry order ID -> (trade plan ID, dollar risk) of the pinned
+        # risk reservation awaiting the fill
+        self._entry_reservations: Dict[str, Tuple[str, Decimal]] = {}
         
         # State persistence
         if state_dir is None:
             state_dir = Path("data/orders")
-        self.state_manager = OrderStateManager(state_dir)
+        if persistence_scheduler is None:
+            persistence_scheduler = WriteBehindScheduler()
+        self.state_manager = OrderStateManager(
+            state_dir,
+            persistence_scheduler=persistence_scheduler,
+            backup_store=backup_store,
+        )
         
         # Initialize execution engines
         self.simulation_engine = OrderSimulationEngine()
@@ -108,6 +126,8 @@ class OrderExecutionManager:
     async def start_state_management(self) -> None:
         """Start state management and setup event handlers."""
         await self._recover_orders()
+        # Compact the replayed journal into a fresh snapshot
+        await self._save_state("recovery", force=True)
         await self.state_manager.start_periodic_backup()
         
         # Setup IBKR event handlers if not in simulation mode
@@ -118,8 +138,9 @@ class OrderExecutionManager:
     
     async def stop_state_management(self) -> None:
         """Stop state management and save current state."""
-        await self._save_state("shutdown")
+        await self._save_state("shutdown", force=True)
         await self.state_manager.stop_periodic_backup()
+        await self.state_manager.close()
         logger.info("State management stopped")
     
     async def place_market_order(self, order_request: OrderRequest) -> OrderResult:
@@ -141,17 +162,24 @@ class OrderExecutionManager:
             order = self._create_order_from_request(order_request, OrderType.MARKET)
             
             # Execute order
-            if self.simulation_mode:
-                result = await self.simulation_engine.place_market_order(order)
-            else:
-                if self.ibkr_adapter is None:
-                    raise OrderExecutionError("IBKR adapter not available in live mode")
-                result = await self.ibkr_adapter.place_market_order(order)
+            try:
+                if self.simulation_mode:
+                    result = await self.simulation_engine.place_market_order(order)
+                else:
+                    if self.ibkr_adapter is None:
+                        raise OrderExecutionError("IBKR adapter not available in live mode")
+                    result = await self.ibkr_adapter.place_market_order(order)
+            except Exception:
+                self.risk_validator.release_reservation(order_request.trade_plan_id)
+                raise
             
+            self._settle_entry_reservation(
+                result, order, risk_validation.position_size_result.dollar_risk
+            )
             if result.success and result.order_id:
                 self._active_orders[result.order_id] = order
                 await self.event_manager.emit_order_submitted(order, risk_validation)
-                asyncio.create_task(self._save_state("order_placed"))
+                await self._journal_event(OrderJournalEvent.SUBMIT, order, result.order_id)
             
             return result
             
@@ -172,28 +200,39 @@ class OrderExecutionManager:
             if not risk_validation.is_valid:
                 return await self._handle_risk_rejection(entry_request, risk_validation)
             
-            # Create bracket order
-            bracket = await self._create_bracket_order(entry_request, stop_loss_price, take_profit_price)
-            
-            # Execute bracket order
-            if self.simulation_mode:
-                result = await self.simulation_engine.place_bracket_order(bracket)
-            else:
-                if self.ibkr_adapter is None:
-                    raise OrderExecutionError("IBKR adapter not available in live mode")
-                result = await self.ibkr_adapter.place_bracket_order(bracket)
+            # Create and execute bracket order
+            try:
+                bracket = await self._create_bracket_order(
+                    entry_request, stop_loss_price, take_profit_price
+                )
+                if self.simulation_mode:
+                    result = await self.simulation_engine.place_bracket_order(bracket)
+                else:
+                    if self.ibkr_adapter is None:
+                        raise OrderExecutionError("IBKR adapter not available in live mode")
+                    result = await self.ibkr_adapter.place_bracket_order(bracket)
+            except Exception:
+                self.risk_validator.release_reservation(entry_request.trade_plan_id)
+                raise
             
+            self._settle_entry_reservation(
+                result, bracket.parent_order, risk_validation.position_size_result.dollar_risk
+            )
             if result.success and result.order_id:
                 # Track all orders
-                if bracket.parent_order.order_id:
-                    self._active_orders[bracket.parent_order.order_id] = bracket.parent_order
-                if bracket.stop_loss_order.order_id:
-                    self._active_orders[bracket.stop_loss_order.order_id] = bracket.stop_loss_order
-                if bracket.take_profit_order.order_id:
-                    self._active_orders[bracket.take_profit_order.order_id] = bracket.take_profit_order
+                bracket_orders = (
+                    bracket.parent_order,
+                    bracket.stop_loss_order,
+                    bracket.take_profit_order,
+                )
+                for bracket_order in bracket_orders:
+                    if bracket_order.order_id:
+                        self._active_orders[bracket_order.order_id] = bracket_order
                 
                 await self.event_manager.emit_bracket_order_placed(bracket, risk_validation)
-                asyncio.create_task(self._save_state("bracket_order_placed"))
+                for bracket_order in bracket_orders:
+                    if bracket_order.order_id:
+                        await self._journal_event(OrderJournalEvent.SUBMIT, bracket_order)
             
             return result
             
@@ -218,6 +257,7 @@ class OrderExecutionManager:
             
             if result.success:
                 await self.event_manager.emit_order_modified(order, modification)
+                await self._journal_event(OrderJournalEvent.MODIFY, order, modification.order_id)
             
             return result
             
@@ -244,8 +284,12 @@ class OrderExecutionManager:
             
             if result.success:
                 del self._active_orders[order_id]
+                if order_id in self._entry_reservations:
+                    trade_plan_id, _ = self._entry_reservations.pop(order_id)
+                    self.risk_validator.release_reservation(trade_plan_id)
                 await self.event_manager.emit_order_cancelled(order)
-                asyncio.create_task(self._save_state("order_cancelled"))
+                await self._journal_event(OrderJournalEvent.CANCEL, order, order_id)
+                self._request_save()
             
             return result
             
@@ -290,14 +334,53 @@ class OrderExecutionManager:
         except Exception as e:
             logger.error("Failed to recover orders", error=str(e))
     
-    async def _save_state(self, reason: str = "periodic") -> None:
-        """Save current order state."""
+    async def _journal_event(
+        self, event: OrderJournalEvent, order: Order, order_id: Optional[str] = None
+    ) -> None:
+        """Record an order event in the state journal."""
+        try:
+            await self.state_manager.record_event(event, order, order_id)
+        except Exception as e:
+            logger.error("Failed to journal order event", event=event.value, error=str(e))
+    
+    async def _save_state(self, reason: str = "periodic", force: bool = False) -> None:
+        """
+        Save current order state through the write-behind scheduler.
+        
+        Args:
+            reason: Why the snapshot is taken (for logging)
+            force: Write now and wait for it instead of coalescing
+        """
         try:
-            await self.state_manager.save_state(self._active_orders)
-            logger.debug("Order state saved", reason=reason)
+            self.state_manager.request_save(self._active_orders, force=force)
+            if force:
+                await self.state_manager.flush_saves()
+            logger.debug("Order state save requested", reason=reason, forced=force)
         except Exception as e:
             logger.error("Failed to save order state", error=str(e))
     
+    def _request_save(self) -> None:
+        """Coalesce a snapshot save after orders leave the active set."""
+        try:
+            self.state_manager.request_save(self._active_orders)
+        except Exception as e:
+            logger.error("Failed to request order state save", error=str(e))
+    
+    def _settle_entry_reservation(
+        self, result: OrderResult, order: Order, dollar_risk: Decimal
+    ) -> None:
+        """Commit, release or pin the risk reservation of a placed entry order."""
+        if not (result.success and result.order_id):
+            self.risk_validator.release_reservation(order.trade_plan_id)
+        elif order.status == OrderStatus.FILLED:
+            self.risk_validator.commit_reservation(
+                order.trade_plan_id, result.order_id, symbol=order.symbol, risk_amount=dollar_risk
+            )
+        else:
+            # A resting entry may wait longer than the reservation TTL
+            self.risk_validator.pin_reservation(order.trade_plan_id)
+            self._entry_reservations[result.order_id] = (order.trade_plan_id, dollar_risk)
+    
     def _create_order_from_request(self, request: OrderRequest, order_type: OrderType) -> Order:
         """Create Order object from OrderRequest."""
         return Order(
@@ -493,6 +576,24 @@ class OrderExecutionManager:
             order = self._active_orders[order_id]
             order.status = new_status
             
+            if order_id in self._entry_reservations:
+                if new_status == OrderStatus.FILLED:
+                    trade_plan_id, dollar_risk = self._entry_reservations.pop(order_id)
+                    self.risk_validator.commit_reservation(
+                        trade_plan_id, order_id, symbol=order.symbol, risk_amount=dollar_risk
+                    )
+                elif new_status in (OrderStatus.CANCELLED, OrderStatus.REJECTED):
+                    trade_plan_id, _ = self._entry_reservations.pop(order_id)
+                    self.risk_validator.release_reservation(trade_plan_id)
+            
             asyncio.create_task(
                 self.event_manager.emit_status_update(order, old_status, new_status)
-            )
\ No newline at end of file
+            )
+            event = (
+                OrderJournalEvent.FILL
+                if new_status in (OrderStatus.FILLED, OrderStatus.PARTIALLY_FILLED)
+                else OrderJournalEvent.STATUS_CHANGE
+            )
+            asyncio.create_task(self._journal_event(event, order, order_id))
+            if new_status in (OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.REJECTED):
+                self._request_save()
\ No newline at end of file
@@ -0,0 +1,281 @@
+"""Append-only order event journal with group commit."""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+from auto_trader.io_executor import IOExecutor, get_io_executor
+from auto_trader.models.enums import OrderJournalEvent
+
+
+class OrderJournal:
+    """
+    Append-only journal of order events with group commit.
+
+    Every event carries the full serialized order, so applying an event is an
+    idempotent upsert (or removal for cancels) and appending costs O(1)
+    regardless of how many orders are open. Events are buffered and written
+    in groups: one write and one fsync per commit window, so a crash loses at
+    most the last uncommitted group.
+
+    The journal is split into segments named by their first sequence number.
+    ``rotate`` closes the current segment and returns a consistent view of
+    all orders up to that point, which the caller persists as a snapshot
+    before calling ``discard_segments`` to drop the replayed history.
+    """
+
+    SEGMENT_PREFIX = "order_journal_"
+
+    def __init__(
+        self,
+        journal_dir: Path,
+        commit_interval: float = 0.05,
+        max_group_size: int = 256,
+        io_executor: Optional[IOExecutor] = None,
+    ):
+        """
+        Initialize order journal.
+
+        Args:
+            journal_dir: Directory holding journal segment files
+            commit_interval: Seconds to collect events into one commit group
+            max_group_size: Commit immediately once this many events are pending
+            io_executor: Executor for file I/O (defaults to the shared one)
+        """
+        self.journal_dir = Path(journal_dir)
+        self.commit_interval = commit_interval
+        self.max_group_size = max_group_size
+        self._io = io_executor or get_io_executor()
+        self.journal_dir.mkdir(parents=True, exist_ok=True)
+
+        # Materialized view of journaled orders: order_id -> serialized Order
+        self.orders: Dict[str, dict] = {}
+
+        self._seq = self._last_recorded_seq()
+        # Each process appends to a fresh segment so a torn trailing line in
+        # a previous segment never merges with new records
+        self._segment_path = self._segment_for(self._seq + 1)
+        self._pending: List[str] = []
+        self._commit_lock = asyncio.Lock()
+        self._wake: Optional[asyncio.Event] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.events_appended = 0
+        self.events_committed = 0
+        self.groups_committed = 0
+
+    @property
+    def last_seq(self) -> int:
+        """Sequence number of the most recently appended event."""
+        return self._seq
+
+    @property
+    def pending_count(self) -> int:
+        """Number of appended events not yet committed."""
+        return len(self._pending)
+
+    def append(
+        self, event: OrderJournalEvent, order_id: str, order_data: Optional[dict]
+    ) -> int:
+        """
+        Append an order event to the pending commit group.
+
+        Args:
+            event: Order lifecycle event
+            order_id: Order identifier
+            order_data: Serialized order (ignored for cancel events)
+
+        Returns:
+            Sequence number assigned to the event
+        """
+        self._seq += 1
+        record = {"seq": self._seq, "event": event.value, "order_id": order_id}
+        if event == OrderJournalEvent.CANCEL:
+            self.orders.pop(order_id, None)
+        else:
+            record["order"] = order_data
+            self.orders[order_id] = order_data
+
+        self._pending.append(json.dumps(record, default=str))
+        self.events_appended += 1
+        self._ensure_writer()
+        return self._seq
+
+    async def commit(self) -> int:
+        """
+        Write all pending events as one group.
+
+        Returns:
+            Number of events committed
+        """
+        async with self._commit_lock:
+            return await self._commit_locked()
+
+    async def rotate(self) -> Tuple[int, Dict[str, dict]]:
+        """
+        Commit pending events and start a new segment.
+
+        Returns:
+            Tuple of (last sequence number, copy of the orders view at that point)
+        """
+        async with self._commit_lock:
+            await self._commit_locked()
+            seq = self._seq
+            view = dict(self.orders)
+            self._segment_path = self._segment_for(seq + 1)
+            # Create the new segment so its name records the sequence base
+            await self._io.run("order_journal.rotate", self._segment_path.touch)
+        return seq, view
+
+    async def discard_segments(self) -> int:
+        """
+        Delete all segments before the current one.
+
+        Returns:
+            Number of segments deleted
+        """
+        segments = await self._io.run("order_journal.discard_segments", self._segments)
+        old_segments = [p for p in segments if p != self._segment_path]
+        await self._io.run("order_journal.discard_segments", self._unlink_all, old_segments)
+        return len(old_segments)
+
+    def reset(self, orders: Dict[str, dict], seq: int) -> None:
+        """
+        Replace the orders view after an external snapshot or recovery.
+
+        Args:
+            orders: Serialized orders by order_id
+            seq: Sequence number the view corresponds to
+        """
+        self.orders = dict(orders)
+        self._seq = max(self._seq, seq)
+
+    def replay(self, after_seq: int = 0) -> Iterator[dict]:
+        """
+        Iterate committed journal records newer than a sequence number.
+
+        Args:
+            after_seq: Skip records with seq at or below this value
+
+        Yields:
+            Journal records in sequence order
+        """
+        for segment in self._segments():
+            for record in self._read_segment(segment):
+                if record["seq"] > after_seq:
+                    yield record
+
+    @staticmethod
+    def apply(orders: Dict[str, dict], record: dict) -> None:
+        """Apply a journal record to a serialized orders view."""
+        if record["event"] == OrderJournalEvent.CANCEL.value:
+            orders.pop(record["order_id"], None)
+        else:
+            orders[record["order_id"]] = record["order"]
+
+    async def close(self) -> None:
+        """Stop the writer task and commit remaining events."""
+        if self._writer_task and not self._writer_task.done():
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+        self._writer_task = None
+        await self.commit()
+
+    def _ensure_writer(self) -> None:
+        """Start the group commit task and signal pending events."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        if self._writer_task is None or self._writer_task.done():
+            self._wake = asyncio.Event()
+            self._writer_task = loop.create_task(self._writer_loop())
+        self._wake.set()
+
+    async def _writer_loop(self) -> None:
+        """Commit pending events once per commit window."""
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            if len(self._pending) < self.max_group_size:
+                await asyncio.sleep(self.commit_interval)
+            try:
+                await self.commit()
+            except Exception as e:
+                logger.error("Failed to commit order journal group", error=str(e))
+
+    async def _commit_locked(self) -> int:
+        """Write pending events; caller holds the commit lock."""
+        if not self._pending:
+            return 0
+
+        lines, self._pending = self._pending, []
+        try:
+            await self._io.run(
+                "order_journal.commit", self._write_group, self._segment_path, lines
+            )
+        except Exception:
+            # Keep the accepted events, ahead of newer ones, for the next
+            # commit; replaying a partly written group again is harmless
+            self._pending = lines + self._pending
+            raise
+
+        self.events_committed += len(lines)
+        self.groups_committed += 1
+        return len(lines)
+
+    @staticmethod
+    def _write_group(segment: Path, lines: List[str]) -> None:
+        """Append one commit group and make it durable."""
+        with open(segment, "a") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    @staticmethod
+    def _unlink_all(paths: List[Path]) -> None:
+        """Delete files, ignoring ones already removed."""
+        for path in paths:
+            path.unlink(missing_ok=True)
+
+    def _segment_for(self, first_seq: int) -> Path:
+        """Path of the segment starting at a sequence number."""
+        return self.journal_dir / f"{self.SEGMENT_PREFIX}{first_seq:012d}.jsonl"
+
+    def _segments(self) -> List[Path]:
+        """Existing segment files in sequence order."""
+        return sorted(self.journal_dir.glob(f"{self.SEGMENT_PREFIX}*.jsonl"))
+
+    def _last_recorded_seq(self) -> int:
+        """Highest sequence number recorded on disk."""
+        segments = self._segments()
+        if not segments:
+            return 0
+
+        last = segments[-1]
+        seq = int(last.stem[len(self.SEGMENT_PREFIX):]) - 1
+        for record in self._read_segment(last):
+            seq = max(seq, record["seq"])
+        return seq
+
+    @staticmethod
+    def _read_segment(segment: Path) -> Iterator[dict]:
+        """Readable records of one segment."""
+        with open(segment, "r") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn write from a crash mid-group
+                    logger.warning(
+                        "Skipping unreadable journal record", segment=str(segment)
+                    )
@@ -5,12 +5,19 @@ import json
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from loguru import logger
 from pydantic import BaseModel, ConfigDict
 
+from auto_trader.io_executor import IOExecutor, get_io_executor
+from auto_trader.models.enums import OrderJournalEvent
 from auto_trader.models.order import Order, OrderStatus
+from auto_trader.persistence.backup_store import BackupStore, stream_name
+from .order_journal import OrderJournal
+
+if TYPE_CHECKING:
+    from auto_trader.persistence.write_behind import WriteBehindScheduler
 
 
 class OrderStateSnapshot(BaseModel):
@@ -26,7 +33,8 @@ class OrderStateManager:
     Manages persistent storage and recovery of order state.
     
     Features:
-    - JSON-based storage with atomic writes
+    - Append-only event journal with group commit (O(1) per order event)
+    - JSON snapshots every N events with atomic writes
     - Automatic backups with rotation
     - Recovery mechanism for system restarts
     - Integration with OrderExecutionManager
@@ -37,6 +45,11 @@ class OrderStateManager:
         state_dir: Path,
         max_backups: int = 10,
         backup_interval: int = 300,  # 5 minutes
+        snapshot_every: int = 1000,
+        commit_interval: float = 0.05,
+        persistence_scheduler: Optional["WriteBehindScheduler"] = None,
+        backup_store: Optional[BackupStore] = None,
+        io_executor: Optional[IOExecutor] = None,
     ):
         """
         Initialize order state manager.
@@ -45,20 +58,51 @@ class OrderStateManager:
             state_dir: Directory for state files
             max_backups: Maximum number of backup files to retain
             backup_interval: Backup interval in seconds
+            snapshot_every: Journal events between compacting snapshots
+            commit_interval: Journal group commit window in seconds
+            persistence_scheduler: Optional write-behind scheduler used by
+                request_save to coalesce full snapshot saves
+            backup_store: Optional content-addressed backup store; replaces
+                the timestamped backup directory and skips unchanged state
+            io_executor: Executor for file I/O (defaults to the shared one)
         """
         self.state_dir = Path(state_dir)
         self.max_backups = max_backups
         self.backup_interval = backup_interval
+        self.snapshot_every = snapshot_every
         
         # File paths
         self.state_file = self.state_dir / "order_state.json"
         self.backup_dir = self.state_dir / "backups"
         self.temp_file = self.state_dir / "order_state.tmp"
+        self.journal_dir = self.state_dir / "journal"
+        self.backup_store = backup_store
+        self.backup_stream = stream_name(self.state_file)
+        self._io = io_executor or get_io_executor()
         
         # Create directories
         self.state_dir.mkdir(parents=True, exist_ok=True)
         self.backup_dir.mkdir(parents=True, exist_ok=True)
         
+        # Order event journal
+        self.journal = OrderJournal(
+            self.journal_dir, commit_interval=commit_interval, io_executor=self._io
+        )
+        self._events_since_snapshot = 0
+        # Serializes snapshot writes with the segment discards that follow them
+        self._snapshot_lock = asyncio.Lock()
+        
+        # Write-behind snapshot saves
+        self._persistence_scheduler = persistence_scheduler
+        self._persistence_key = f"orders:{self.state_file}"
+        self._requested_orders: Dict[str, Order] = {}
+        if persistence_scheduler is not None:
+            persistence_scheduler.register(
+                self._persistence_key,
+                lambda: dict(self._requested_orders),
+                self.save_state,
+            )
+        
         # State tracking
         self._last_backup = datetime.now(timezone.utc)
         self._backup_task: Optional[asyncio.Task] = None
@@ -70,42 +114,130 @@ class OrderStateManager:
             backup_interval=backup_interval,
         )
     
+    async def record_event(
+        self,
+        event: OrderJournalEvent,
+        order: Order,
+        order_id: Optional[str] = None,
+    ) -> int:
+        """
+        Journal a single order event.
+        
+        The event is committed with the next group; a compacting snapshot is
+        taken once snapshot_every events have accumulated.
+        
+        Args:
+            event: Order lifecycle event
+            order: Order after the event was applied
+            order_id: Tracking key (defaults to order.order_id)
+            
+        Returns:
+            Sequence number assigned to the event
+        """
+        key = order_id or order.order_id
+        if key is None:
+            raise ValueError("Cannot journal an order without an order_id")
+        
+        order_data = None if event == OrderJournalEvent.CANCEL else order.model_dump(mode="json")
+        seq = self.journal.append(event, key, order_data)
+        
+        self._events_since_snapshot += 1
+        if self._events_since_snapshot >= self.snapshot_every:
+            await self.compact()
+        
+        return seq
+    
+    async def compact(self) -> None:
+        """Write a snapshot of the journaled orders and drop replayed segments."""
+        self._events_since_snapshot = 0
+        async with self._snapshot_lock:
+            seq, orders = await self.journal.rotate()
+            
+            try:
+                await self._io.run(
+                    "order_state.compact", self._write_snapshot, orders, "journal_compaction", seq
+                )
+            except Exception as e:
+                logger.error("Failed to write compacting order snapshot", error=str(e))
+                return
+            
+            await self.journal.discard_segments()
+        logger.debug("Order journal compacted", journal_seq=seq, active_orders=len(orders))
+    
+    async def flush(self) -> None:
+        """Commit any pending journal events."""
+        await self.journal.commit()
+    
+    def request_save(self, active_orders: Dict[str, Order], force: bool = False) -> None:
+        """
+        Request a full snapshot save, coalesced with other requests.
+        
+        Without a write-behind scheduler the save is scheduled immediately.
+        
+        Args:
+            active_orders: Dictionary of active orders by order_id
+            force: Skip the coalescing window (safety-critical changes)
+        """
+        self._requested_orders = active_orders
+        if self._persistence_scheduler is not None:
+            self._persistence_scheduler.mark_dirty(self._persistence_key, force=force)
+        else:
+            asyncio.create_task(self.save_state(dict(active_orders)))
+    
+    async def flush_saves(self) -> None:
+        """Write a requested snapshot save now and wait for it."""
+        if self._persistence_scheduler is not None:
+            await self._persistence_scheduler.flush(self._persistence_key)
+    
+    async def close(self) -> None:
+        """Flush requested saves, stop the journal writer and commit pending events."""
+        await self.flush_saves()
+        await self.journal.close()
+    
     async def save_state(self, active_orders: Dict[str, Order]) -> None:
         """
         Save current order state to persistent storage.
         
+        Writes a full snapshot and resets the journal to it, so journaled
+        events up to this point are no longer replayed. Events journaled
+        while the journal rotates are folded into the snapshot before the
+        old segments are discarded.
+        
         Args:
             active_orders: Dictionary of active orders by order_id
         """
         try:
             # Create snapshot
             serialized_orders = {}
-            for order_id, order in active_orders.items():
-                try:
-                    serialized_orders[order_id] = order.model_dump()
-                except Exception as e:
-                    logger.error(
-                        "Failed to serialize order",
-                        order_id=order_id,
-                        error=str(e),
-                    )
-                    continue
-            
-            snapshot = OrderStateSnapshot(
-                timestamp=datetime.now(timezone.utc),
-                active_orders=serialized_orders,
-                metadata={
-                    "total_orders": str(len(active_orders)),
-                    "save_reason": "periodic_save",
-                },
-            )
-            
-            # Atomic write (write to temp file, then rename)
-            with open(self.temp_file, 'w') as f:
-                json.dump(snapshot.model_dump(), f, indent=2, default=str)
+            with self._io.blocking("order_state.serialize"):
+                for order_id, order in active_orders.items():
+                    try:
+                        serialized_orders[order_id] = order.model_dump(mode="json")
+                    except Exception as e:
+                        logger.error(
+                            "Failed to serialize order",
+                            order_id=order_id,
+                            error=str(e),
+                        )
+                        continue
+            # No await since serializing, so the snapshot covers exactly this seq
+            base_seq = self.journal.last_seq
             
-            # Atomic rename
-            shutil.move(str(self.temp_file), str(self.state_file))
+            async with self._snapshot_lock:
+                seq, _ = await self.journal.rotate()
+                if seq > base_seq:
+                    await self._io.run(
+                        "order_state.save_state",
+                        self._apply_journal_window, serialized_orders, base_seq, seq
+                    )
+                self.journal.reset(serialized_orders, seq)
+                self._events_since_snapshot = 0
+                
+                await self._io.run(
+                    "order_state.save_state",
+                    self._write_snapshot, serialized_orders, "periodic_save", seq
+                )
+                await self.journal.discard_segments()
             
             logger.debug(
                 "Order state saved",
@@ -119,13 +251,36 @@ class OrderStateManager:
         except Exception as e:
             logger.error("Failed to save order state", error=str(e))
             # Clean up temp file if it exists
-            if self.temp_file.exists():
-                self.temp_file.unlink()
+            self.temp_file.unlink(missing_ok=True)
+    
+    def _write_snapshot(
+        self, serialized_orders: Dict[str, dict], reason: str, journal_seq: int
+    ) -> None:
+        """Atomically write a snapshot covering journal events up to journal_seq."""
+        snapshot = OrderStateSnapshot(
+            timestamp=datetime.now(timezone.utc),
+            active_orders=serialized_orders,
+            metadata={
+                "total_orders": str(len(serialized_orders)),
+                "save_reason": reason,
+                "journal_seq": str(journal_seq),
+            },
+        )
+        
+        # Atomic write (write to temp file, then rename)
+        with open(self.temp_file, 'w') as f:
+            json.dump(snapshot.model_dump(), f, default=str)
+        
+        # Atomic rename
+        shutil.move(str(self.temp_file), str(self.state_file))
     
     async def load_state(self) -> Dict[str, Order]:
         """
         Load order state from persistent storage.
         
+        Recovery loads the latest snapshot and replays journal events
+        recorded after it.
+        
         Returns:
             Dictionary of active orders by order_id
             
@@ -134,33 +289,34 @@ class OrderStateManager:
             ValueError: If state file is corrupted
         """
         try:
-            if not self.state_file.exists():
-                logger.info("No existing state file found")
-                return {}
+            await self.journal.commit()
             
-            with open(self.state_file, 'r') as f:
-                data = json.load(f)
+            serialized_orders: Dict[str, dict] = {}
+            snapshot_age = None
+            journal_seq = 0
+            snapshot = await self._io.run(
+                "order_state.load_state", self._read_snapshot_if_exists, self.state_file
+            )
+            if snapshot is not None:
+                snapshot, journal_seq = snapshot
+                serialized_orders = dict(snapshot.active_orders)
+                snapshot_age = (datetime.now(timezone.utc) - snapshot.timestamp).total_seconds()
             
-            snapshot = OrderStateSnapshot(**data)
+            replayed = await self._io.run(
+                "order_state.replay_journal",
+                self._replay_journal, serialized_orders, journal_seq
+            )
+            if snapshot_age is None and not replayed:
+                logger.info("No existing state file found")
+                return {}
             
-            # Deserialize orders
-            active_orders = {}
-            for order_id, order_data in snapshot.active_orders.items():
-                try:
-                    order = Order(**order_data)
-                    active_orders[order_id] = order
-                except Exception as e:
-                    logger.error(
-                        "Failed to deserialize order",
-                        order_id=order_id,
-                        error=str(e),
-                    )
-                    continue
+            active_orders = self._deserialize_orders(serialized_orders, "Failed to deserialize order")
             
             logger.info(
                 "Order state loaded",
                 total_orders=len(active_orders),
-                snapshot_age=(datetime.now(timezone.utc) - snapshot.timestamp).total_seconds(),
+                snapshot_age=snapshot_age,
+                journal_events_replayed=replayed,
             )
             
             return active_orders
@@ -174,12 +330,79 @@ class OrderStateManager:
     async def clear_state(self) -> None:
         """Clear all persisted state (for testing/reset)."""
         try:
-            if self.state_file.exists():
-                self.state_file.unlink()
+            if await self._io.run("order_state.clear_state", self._unlink_if_exists, self.state_file):
                 logger.info("Order state file cleared")
+            async with self._snapshot_lock:
+                await self.journal.rotate()
+                await self.journal.discard_segments()
+                self.journal.reset({}, self.journal.last_seq)
+            self._events_since_snapshot = 0
         except Exception as e:
             logger.error("Failed to clear state file", error=str(e))
     
+    def _read_snapshot(self, path: Path) -> Tuple[OrderStateSnapshot, int]:
+        """Read a snapshot file and the journal sequence it covers."""
+        with open(path, 'r') as f:
+            data = json.load(f)
+        
+        snapshot = OrderStateSnapshot(**data)
+        return snapshot, int(snapshot.metadata.get("journal_seq", 0))
+    
+    def _read_snapshot_if_exists(self, path: Path) -> Optional[Tuple[OrderStateSnapshot, int]]:
+        """Read a snapshot file, or None if it does not exist."""
+        if not path.exists():
+            return None
+        return self._read_snapshot(path)
+    
+    @staticmethod
+    def _unlink_if_exists(path: Path) -> bool:
+        """Delete a file, returning whether it existed."""
+        try:
+            path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+    
+    def _replay_journal(self, serialized_orders: Dict[str, dict], after_seq: int) -> int:
+        """Apply journal events newer than after_seq and sync the journal view."""
+        replayed = 0
+        last_seq = after_seq
+        for record in self.journal.replay(after_seq):
+            OrderJournal.apply(serialized_orders, record)
+            last_seq = record["seq"]
+            replayed += 1
+        
+        self.journal.reset(serialized_orders, last_seq)
+        return replayed
+    
+    def _apply_journal_window(
+        self, serialized_orders: Dict[str, dict], after_seq: int, up_to_seq: int
+    ) -> int:
+        """Apply committed journal events in (after_seq, up_to_seq] to a snapshot."""
+        applied = 0
+        for record in self.journal.replay(after_seq):
+            if record["seq"] > up_to_seq:
+                break
+            OrderJournal.apply(serialized_orders, record)
+            applied += 1
+        return applied
+    
+    @staticmethod
+    def _deserialize_orders(serialized_orders: Dict[str, dict], error_message: str) -> Dict[str, Order]:
+        """Deserialize orders, skipping entries that fail validation."""
+        active_orders = {}
+        for order_id, order_data in serialized_orders.items():
+            try:
+                active_orders[order_id] = Order(**order_data)
+            except Exception as e:
+                logger.error(
+                    error_message,
+                    order_id=order_id,
+                    error=str(e),
+                )
+                continue
+        return active_orders
+    
     async def create_backup(self, reason: str = "manual") -> str:
         """
         Create a backup of the current state.
@@ -190,15 +413,21 @@ class OrderStateManager:
         Returns:
             Path to created backup file
         """
-        if not self.state_file.exists():
+        if not await self._io.run("order_state.create_backup", self.state_file.exists):
             logger.warning("No state file to backup")
             return ""
         
+        if self.backup_store is not None:
+            return await self._create_store_backup(reason)
+        
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         backup_file = self.backup_dir / f"order_state_{timestamp}_{reason}.json"
         
         try:
-            shutil.copy2(str(self.state_file), str(backup_file))
+            await self._io.run(
+                "order_state.create_backup",
+                shutil.copy2, str(self.state_file), str(backup_file)
+            )
             
             logger.info(
                 "State backup created",
@@ -215,6 +444,71 @@ class OrderStateManager:
             logger.error("Failed to create backup", error=str(e))
             return ""
     
+    async def _create_store_backup(self, reason: str) -> str:
+        """Back up to the content-addressed store, skipping unchanged state."""
+        try:
+            version = await self._io.run(
+                "order_state.create_backup",
+                self.backup_store.backup_file, self.backup_stream, self.state_file, reason
+            )
+            if version is None:
+                version = self.backup_store.latest(self.backup_stream)
+            else:
+                logger.info(
+                    "State backup created",
+                    backup_version=version.version,
+                    reason=reason,
+                )
+            return str(self.backup_store.blob_path(version)) if version else ""
+        except Exception as e:
+            logger.error("Failed to create backup", error=str(e))
+            return ""
+    
+    async def restore_backup(
+        self,
+        version: Optional[int] = None,
+        at: Optional[datetime] = None,
+    ) -> Dict[str, Order]:
+        """
+        Restore order state from a retained backup version.
+        
+        The restored snapshot replaces the current state; journal events
+        recorded after it are discarded rather than replayed.
+        
+        Args:
+            version: Backup version number (defaults to latest)
+            at: Restore the state as of this time (naive values are UTC)
+            
+        Returns:
+            Dictionary of active orders by order_id
+            
+        Raises:
+            ValueError: If no backup store is configured
+            FileNotFoundError: If no matching version is retained
+        """
+        if self.backup_store is None:
+            raise ValueError("Point-in-time restore requires a backup store")
+        
+        found = self.backup_store.find_version(self.backup_stream, version=version, at=at)
+        if found is None:
+            raise FileNotFoundError(f"No matching backup for {self.backup_stream}")
+        
+        snapshot, _ = await self._io.run(
+            "order_state.restore_backup",
+            self._read_snapshot, self.backup_store.blob_path(found)
+        )
+        active_orders = self._deserialize_orders(
+            dict(snapshot.active_orders), "Failed to deserialize order from backup"
+        )
+        await self.save_state(active_orders)
+        
+        logger.info(
+            "Order state restored from backup",
+            backup_version=found.version,
+            total_orders=len(active_orders),
+        )
+        return active_orders
+    
     async def start_periodic_backup(self) -> None:
         """Start periodic backup task."""
         if self._backup_task and not self._backup_task.done():
@@ -246,35 +540,36 @@ class OrderStateManager:
     async def _load_from_backup(self) -> Dict[str, Order]:
         """Try to load state from most recent backup."""
         try:
-            backup_files = list(self.backup_dir.glob("order_state_*.json"))
-            if not backup_files:
-                logger.warning("No backup files found")
-                return {}
-            
-            # Sort by modification time (most recent first)
-            backup_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+            if self.backup_store is not None:
+                latest = self.backup_store.latest(self.backup_stream)
+                if latest is None:
+                    logger.warning("No backup files found")
+                    return {}
+                most_recent = self.backup_store.blob_path(latest)
+            else:
+                # Sorted by modification time (oldest first)
+                backup_files = await self._io.run(
+                    "order_state.load_backup", self._list_backup_files
+                )
+                if not backup_files:
+                    logger.warning("No backup files found")
+                    return {}
+                most_recent = backup_files[-1]
             
-            most_recent = backup_files[0]
             logger.info("Loading from backup", backup_file=str(most_recent))
             
-            with open(most_recent, 'r') as f:
-                data = json.load(f)
-            
-            snapshot = OrderStateSnapshot(**data)
+            snapshot, journal_seq = await self._io.run(
+                "order_state.load_backup", self._read_snapshot, most_recent
+            )
+            serialized_orders = dict(snapshot.active_orders)
+            await self._io.run(
+                "order_state.replay_journal",
+                self._replay_journal, serialized_orders, journal_seq
+            )
             
-            # Deserialize orders
-            active_orders = {}
-            for order_id, order_data in snapshot.active_orders.items():
-                try:
-                    order = Order(**order_data)
-                    active_orders[order_id] = order
-                except Exception as e:
-                    logger.error(
-                        "Failed to deserialize order from backup",
-                        order_id=order_id,
-                        error=str(e),
-                    )
-                    continue
+            active_orders = self._deserialize_orders(
+                serialized_orders, "Failed to deserialize order from backup"
+            )
             
             logger.info(
                 "State loaded from backup",
@@ -293,7 +588,7 @@ class OrderStateManager:
         try:
             while True:
                 await asyncio.sleep(self.backup_interval)
-                if self.state_file.exists():
+                if await self._io.run("order_state.create_backup", self.state_file.exists):
                     await self.create_backup("periodic")
                     self._last_backup = datetime.now(timezone.utc)
         except asyncio.CancelledError:
@@ -304,18 +599,17 @@ class OrderStateManager:
     async def _cleanup_old_backups(self) -> None:
         """Clean up old backup files beyond max_backups limit."""
         try:
-            backup_files = list(self.backup_dir.glob("order_state_*.json"))
+            backup_files = await self._io.run(
+                "order_state.cleanup_backups", self._list_backup_files
+            )
             if len(backup_files) <= self.max_backups:
                 return
             
-            # Sort by modification time (oldest first)
-            backup_files.sort(key=lambda f: f.stat().st_mtime)
-            
             # Remove oldest files beyond limit
             files_to_remove = backup_files[:len(backup_files) - self.max_backups]
-            for file_to_remove in files_to_remove:
-                file_to_remove.unlink()
-                logger.debug("Removed old backup", file=str(file_to_remove))
+            await self._io.run(
+                "order_state.cleanup_backups", self._unlink_files, files_to_remove
+            )
             
             logger.info(
                 "Cleaned up old backups",
@@ -324,4 +618,17 @@ class OrderStateManager:
             )
             
         except Exception as e:
-            logger.error("Failed to cleanup old backups", error=str(e))
\ No newline at end of file
+            logger.error("Failed to cleanup old backups", error=str(e))
+    
+    def _list_backup_files(self) -> List[Path]:
+        """Timestamped backup files sorted by modification time (oldest first)."""
+        backup_files = list(self.backup_dir.glob("order_state_*.json"))
+        backup_files.sort(key=lambda f: f.stat().st_mtime)
+        return backup_files
+    
+    @staticmethod
+    def _unlink_files(paths: List[Path]) -> None:
+        """Delete files."""
+        for path in paths:
+            path.unlink()
+            logger.debug("Removed old backup", file=str(path))
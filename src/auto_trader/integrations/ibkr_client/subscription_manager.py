@@ -135,6 +135,35 @@ class SubscriptionManager:
             if symbol in self._contracts:
                 del self._contracts[symbol]
     
+    async def remove_subscription(self, symbol: str, bar_size: BarSizeType) -> bool:
+        """
+        Remove a single market data subscription.
+        
+        The symbol's contract is dropped with its last subscription.
+        
+        Args:
+            symbol: Trading symbol
+            bar_size: Bar timeframe
+            
+        Returns:
+            True if a subscription was cancelled, False otherwise
+        """
+        key = f"{symbol}:{bar_size}"
+        subscription = self._subscriptions.pop(key, None)
+        if subscription is None:
+            return False
+        
+        try:
+            self._ib.cancelRealTimeBars(subscription)
+            logger.info("Market data subscription cancelled", key=key)
+        except Exception as e:
+            logger.error("Error cancelling subscription", key=key, error=str(e))
+        
+        if not any(k.startswith(f"{symbol}:") for k in self._subscriptions):
+            self._active_symbols.discard(symbol)
+            self._contracts.pop(symbol, None)
+        return True
+    
     async def _get_or_create_contract(self, symbol: str) -> Contract:
         """
         Get existing contract or create and qualify new one.
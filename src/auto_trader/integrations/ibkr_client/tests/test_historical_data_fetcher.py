@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+import tempfile
 from datetime import datetime, timedelta, UTC
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -9,6 +10,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from auto_trader.integrations.ibkr_client.historical_data_fetcher import HistoricalDataFetcher
 from auto_trader.models.market_data import BarData, MarketDataError
 from auto_trader.models.trade_plan import TradePlan, ExecutionFunction
+from auto_trader.persistence.bar_store import BarStore
 
 
 @pytest.fixture
@@ -127,6 +129,31 @@ class TestHistoricalDataFetcher:
         assert len(context["AAPL"]) == 10
         assert fetcher._stats["bars_fetched"] == 30  # 10 bars * 3 symbols
     
+    @pytest.mark.asyncio
+    async def test_fetch_startup_context_backfills_only_gap(
+        self, fetcher, mock_ib_client, sample_ib_bars
+    ):
+        """Test symbols with held bars only fetch and return the gap."""
+        mock_ib_client.reqHistoricalDataAsync.return_value = sample_ib_bars
+        last_held = sample_ib_bars[6].date
+        
+        context = await fetcher.fetch_startup_context(
+            ["AAPL", "MSFT"], "5min", "1 D", since={"AAPL": last_held}
+        )
+        
+        assert [bar.timestamp for bar in context["AAPL"]] == [
+            bar.date for bar in sample_ib_bars[7:]
+        ]
+        assert len(context["MSFT"]) == 10
+        
+        durations = [
+            call.kwargs["durationStr"]
+            for call in mock_ib_client.reqHistoricalDataAsync.call_args_list
+        ]
+        assert durations[0].endswith(" S")
+        assert int(durations[0].split()[0]) < 3600
+        assert durations[1] == "1 D"
+    
     @pytest.mark.asyncio
     async def test_fetch_startup_context_with_errors(self, fetcher, mock_ib_client, sample_ib_bars):
         """Test startup context fetch with some symbols failing."""
@@ -343,4 +370,96 @@ class TestHistoricalDataFetcher:
         
         assert stats["bars_fetched"] == 100
         assert stats["fetch_errors"] == 2
-        assert stats["gaps_detected"] == 5
\ No newline at end of file
+        assert stats["gaps_detected"] == 5
+
+@pytest.fixture
+def bar_store():
+    """Create a local bar store in a temporary directory."""
+    with tempfile.TemporaryDirectory() as directory:
+        yield BarStore(directory)
+
+
+def ib_bars_for_request(contract, endDateTime, durationStr, **kwargs):
+    """Generate 5-minute IB bars covering the requested window."""
+    end = endDateTime or datetime.now(UTC)
+    count, unit = durationStr.split()
+    assert unit == "S"
+    start = end - timedelta(seconds=int(count))
+    start = start.replace(second=0, microsecond=0)
+    start += timedelta(minutes=-start.minute % 5)
+    bars = []
+    while start < end:
+        bar = MagicMock()
+        bar.date = start
+        bar.open = bar.high = bar.low = bar.close = 180.0
+        bar.volume = 1000
+        bars.append(bar)
+        start += timedelta(minutes=5)
+    return bars
+
+
+class TestHistoricalDataFetcherBarStore:
+    """Test fetching through the local bar store."""
+    
+    END = datetime(2025, 8, 27, 18, 0, tzinfo=UTC)
+    
+    @pytest.mark.asyncio
+    async def test_repeat_fetch_served_from_store(self, mock_ib_client, bar_store):
+        """Test a window already fetched does not go to IBKR again."""
+        mock_ib_client.reqHistoricalDataAsync.side_effect = ib_bars_for_request
+        fetcher = HistoricalDataFetcher(mock_ib_client, bar_store=bar_store)
+        
+        first = await fetcher.fetch_historical_bars("AAPL", "5min", "3600 S", self.END)
+        second = await fetcher.fetch_historical_bars("AAPL", "5min", "3600 S", self.END)
+        
+        assert len(first) == 12
+        assert second == first
+        assert mock_ib_client.reqHistoricalDataAsync.call_count == 1
+        assert fetcher.get_stats()["ranges_requested"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_only_missing_range_is_requested(self, mock_ib_client, bar_store):
+        """Test extending a stored window requests just the new part."""
+        mock_ib_client.reqHistoricalDataAsync.side_effect = ib_bars_for_request
+        fetcher = HistoricalDataFetcher(mock_ib_client, bar_store=bar_store)
+        
+        await fetcher.fetch_historical_bars("AAPL", "5min", "3600 S", self.END)
+        bars = await fetcher.fetch_historical_bars(
+            "AAPL", "5min", "7200 S", self.END + timedelta(hours=1)
+        )
+        
+        assert len(bars) == 24
+        assert [bar.timestamp for bar in bars] == sorted(bar.timestamp for bar in bars)
+        second_call = mock_ib_client.reqHistoricalDataAsync.call_args_list[1]
+        assert second_call.kwargs["endDateTime"] == self.END + timedelta(hours=1)
+        assert second_call.kwargs["durationStr"] == "3601 S"
+    
+    @pytest.mark.asyncio
+    async def test_contract_is_persisted(self, mock_ib_client, bar_store):
+        """Test qualified contracts are reused by a new fetcher."""
+        mock_ib_client.reqHistoricalDataAsync.side_effect = ib_bars_for_request
+        
+        async def qualify(contract):
+            contract.conId = 265598
+            contract.primaryExchange = "NASDAQ"
+        
+        mock_ib_client.qualifyContractsAsync.side_effect = qualify
+        await HistoricalDataFetcher(mock_ib_client, bar_store=bar_store).fetch_historical_bars(
+            "AAPL", "5min", "3600 S", self.END
+        )
+        
+        fetcher = HistoricalDataFetcher(mock_ib_client, bar_store=bar_store)
+        await fetcher.fetch_historical_bars("AAPL", "5min", "3600 S", self.END)
+        
+        assert mock_ib_client.qualifyContractsAsync.call_count == 1
+        assert fetcher._contracts["AAPL"].conId == 265598
+        assert fetcher._contracts["AAPL"].primaryExchange == "NASDAQ"
+    
+    def test_window_start_skips_weekends(self):
+        """Test day durations count weekdays back from the window end."""
+        monday = datetime(2025, 8, 25, 15, 0, tzinfo=UTC)
+        
+        assert HistoricalDataFetcher._window_start(monday, "1 D") == monday - timedelta(days=3)
+        assert HistoricalDataFetcher._window_start(monday, "2 W") == monday - timedelta(weeks=2)
+        with pytest.raises(MarketDataError):
+            HistoricalDataFetcher._window_start(monday, "soon")
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch, call
 from auto_trader.integrations.ibkr_client.market_data_manager import MarketDataManager
 from auto_trader.models.market_data import BarData, SubscriptionError
 from auto_trader.models.market_data_cache import MarketDataCache
+from auto_trader.models.plan_diff import diff_plans
 
 
 @pytest.fixture
@@ -144,6 +145,41 @@ class TestMarketDataManager:
         assert "GOOGL" in active_subs
         assert "MSFT" not in active_subs
     
+    @pytest.mark.asyncio
+    async def test_apply_plan_diff_touches_affected_subscriptions(
+        self, manager, mock_ib_client, mock_cache, make_plan
+    ):
+        """Test plan diffs change only the subscriptions whose plans changed."""
+        mock_subscription = MagicMock()
+        mock_subscription.updateEvent = MagicMock()
+        mock_ib_client.reqRealTimeBars.return_value = mock_subscription
+        aapl = make_plan("AAPL_20250815_001", "AAPL")
+        msft = make_plan("MSFT_20250815_001", "MSFT")
+        
+        results = await manager.apply_plan_diff(
+            diff_plans({}, {aapl.plan_id: aapl, msft.plan_id: msft})
+        )
+        assert results["subscribed"] == ["AAPL:15min", "AAPL:1min", "MSFT:15min", "MSFT:1min"]
+        
+        # A price change needs the same data: nothing is touched
+        mock_ib_client.reqRealTimeBars.reset_mock()
+        repriced = make_plan("AAPL_20250815_001", "AAPL", take_profit=Decimal("190.00"))
+        results = await manager.apply_plan_diff(
+            diff_plans({aapl.plan_id: aapl}, {aapl.plan_id: repriced})
+        )
+        assert results == {"subscribed": [], "unsubscribed": [], "failed": []}
+        mock_ib_client.reqRealTimeBars.assert_not_called()
+        
+        # Completing MSFT drops only its subscriptions
+        completed = make_plan("MSFT_20250815_001", "MSFT", status="completed")
+        results = await manager.apply_plan_diff(
+            diff_plans({msft.plan_id: msft}, {msft.plan_id: completed})
+        )
+        assert results["unsubscribed"] == ["MSFT:15min", "MSFT:1min"]
+        assert mock_ib_client.cancelRealTimeBars.call_count == 2
+        assert manager.get_active_subscriptions() == {"AAPL": ["15min", "1min"]}
+        mock_cache.remove_subscription.assert_called_with("MSFT")
+    
     @pytest.mark.asyncio
     async def test_bar_update_processing(self, manager, mock_cache):
         """Test processing of bar updates."""
@@ -20,6 +20,7 @@ from auto_trader.risk_management import (
     PositionSizeResult,
     RiskCheck,
 )
+from auto_trader.persistence import WriteBehindScheduler
 from auto_trader.integrations.ibkr_client import (
     IBKRClient,
     OrderExecutionManager, 
@@ -384,6 +385,67 @@ class TestOrderExecutionManager:
         assert result.success is False
         assert result.order_status == OrderStatus.REJECTED
         assert "IBKR execution failed" in result.error_message
+        mock_risk_validator.release_reservation.assert_called_once_with(
+            sample_order_request.trade_plan_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_filled_entry_commits_reservation(
+        self, order_manager, mock_risk_validator, sample_order_request
+    ):
+        """Test an entry order that fills commits its risk reservation."""
+        result = await order_manager.place_market_order(sample_order_request)
+
+        mock_risk_validator.commit_reservation.assert_called_once_with(
+            sample_order_request.trade_plan_id,
+            result.order_id,
+            symbol="AAPL",
+            risk_amount=Decimal("2000.00"),
+        )
+        mock_risk_validator.release_reservation.assert_not_called()
+
+    def test_working_entry_pins_reservation(
+        self, order_manager, mock_risk_validator, sample_order_request
+    ):
+        """Test an entry still working after placement keeps its reservation past the TTL."""
+        order = order_manager._create_order_from_request(sample_order_request, OrderType.LIMIT)
+        order.status = OrderStatus.SUBMITTED
+        result = Mock(success=True, order_id="ORDER_1")
+
+        order_manager._settle_entry_reservation(result, order, Decimal("2000.00"))
+
+        mock_risk_validator.pin_reservation.assert_called_once_with("AAPL_20250827_001")
+        assert order_manager._entry_reservations == {
+            "ORDER_1": ("AAPL_20250827_001", Decimal("2000.00"))
+        }
+
+    @pytest.mark.asyncio
+    async def test_pending_entry_settled_by_status_update(
+        self, order_manager, mock_risk_validator, sample_order_request
+    ):
+        """Test a working entry pins its reservation until it fills or is cancelled."""
+        filled = await order_manager.place_bracket_order(
+            sample_order_request, Decimal("178.00"), Decimal("185.00")
+        )
+        cancelled = await order_manager.place_bracket_order(
+            sample_order_request, Decimal("178.00"), Decimal("185.00")
+        )
+        mock_risk_validator.commit_reservation.reset_mock()
+        order_manager._entry_reservations = {
+            filled.order_id: ("PLAN_FILLED", Decimal("2000.00")),
+            cancelled.order_id: ("PLAN_CANCELLED", Decimal("2000.00")),
+        }
+
+        order_manager._on_order_status_update(
+            filled.order_id, OrderStatus.SUBMITTED, OrderStatus.FILLED
+        )
+        await order_manager.cancel_order(cancelled.order_id)
+
+        mock_risk_validator.commit_reservation.assert_called_once_with(
+            "PLAN_FILLED", filled.order_id, symbol="AAPL", risk_amount=Decimal("2000.00")
+        )
+        mock_risk_validator.release_reservation.assert_called_once_with("PLAN_CANCELLED")
+        assert order_manager._entry_reservations == {}
 
     def test_create_order_from_request(self, order_manager, sample_order_request):
         """Test creating Order object from OrderRequest."""
@@ -487,6 +549,39 @@ class TestOrderExecutionManager:
         # Stop state management
         await order_manager.stop_state_management()
 
+    @pytest.mark.asyncio
+    async def test_snapshot_saves_go_through_write_behind(
+        self, mock_ibkr_client, mock_risk_validator, sample_order_request, tmp_path
+    ):
+        """Test forced saves on start/stop and coalesced saves when orders leave."""
+        scheduler = WriteBehindScheduler(window_seconds=10)
+        order_manager = OrderExecutionManager(
+            ibkr_client=mock_ibkr_client,
+            risk_validator=mock_risk_validator,
+            simulation_mode=True,
+            state_dir=tmp_path / "test_orders",
+            persistence_scheduler=scheduler,
+        )
+        state_manager = order_manager.state_manager
+        await order_manager.start_state_management()
+        metrics = scheduler.get_metrics()[state_manager._persistence_key]
+        assert metrics["forced_writes"] == 1
+        assert metrics["writes"] == 1
+        assert state_manager.state_file.exists()
+        
+        for _ in range(3):
+            result = await order_manager.place_market_order(sample_order_request)
+            await order_manager.cancel_order(result.order_id)
+        
+        # Cancellations within the window are coalesced into one pending save
+        assert scheduler.is_dirty(state_manager._persistence_key)
+        await order_manager.stop_state_management()
+        
+        metrics = scheduler.get_metrics()[state_manager._persistence_key]
+        assert metrics["marks"] == 5
+        assert metrics["writes"] == 2
+        assert not scheduler.is_dirty(state_manager._persistence_key)
+
     @pytest.mark.asyncio
     async def test_bracket_order_state_persistence(self, order_manager, sample_order_request):
         """Test state persistence for bracket orders."""
@@ -4,12 +4,14 @@ import pytest
 import asyncio
 import json
 import tempfile
+import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from decimal import Decimal
 
-from auto_trader.models import Order, OrderSide, OrderType, OrderStatus
+from auto_trader.models import Order, OrderJournalEvent, OrderSide, OrderType, OrderStatus
 from auto_trader.integrations.ibkr_client import OrderStateManager, OrderStateSnapshot
+from auto_trader.persistence import WriteBehindScheduler
 
 
 @pytest.fixture
@@ -359,4 +361,200 @@ class TestOrderStateManager:
         backup_path = await state_manager.create_backup("no_state")
         
         # Should return empty string and log warning
-        assert backup_path == ""
\ No newline at end of file
+        assert backup_path == ""
+
+def make_order(order_id: str, status: OrderStatus = OrderStatus.SUBMITTED) -> Order:
+    """Create a limit order for journal tests."""
+    return Order(
+        order_id=order_id,
+        trade_plan_id="AAPL_20250827_001",
+        symbol="AAPL",
+        side=OrderSide.BUY,
+        order_type=OrderType.LIMIT,
+        quantity=100,
+        status=status,
+        price=Decimal("180.50"),
+    )
+
+
+class TestOrderJournal:
+    """Test suite for journaled order state."""
+
+    @pytest.mark.asyncio
+    async def test_recover_from_journal_without_snapshot(self, temp_state_dir):
+        """Test committed events are recovered by a new manager instance."""
+        manager = OrderStateManager(temp_state_dir)
+        await manager.record_event(OrderJournalEvent.SUBMIT, make_order("SIM_001"))
+        await manager.record_event(OrderJournalEvent.SUBMIT, make_order("SIM_002"))
+        await manager.record_event(
+            OrderJournalEvent.FILL, make_order("SIM_001", OrderStatus.FILLED)
+        )
+        await manager.record_event(OrderJournalEvent.CANCEL, make_order("SIM_002"))
+        await manager.close()
+
+        assert not manager.state_file.exists()
+
+        recovered = await OrderStateManager(temp_state_dir).load_state()
+
+        assert list(recovered) == ["SIM_001"]
+        assert recovered["SIM_001"].status == OrderStatus.FILLED
+
+    @pytest.mark.asyncio
+    async def test_events_are_group_committed(self, temp_state_dir):
+        """Test a burst of events is written in a single commit group."""
+        manager = OrderStateManager(temp_state_dir, commit_interval=0.05)
+        for i in range(20):
+            await manager.record_event(OrderJournalEvent.SUBMIT, make_order(f"SIM_{i:03d}"))
+
+        assert manager.journal.pending_count == 20
+        await asyncio.sleep(0.2)
+
+        assert manager.journal.pending_count == 0
+        assert manager.journal.events_committed == 20
+        assert manager.journal.groups_committed == 1
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_every_n_events(self, temp_state_dir):
+        """Test compaction writes a snapshot and replays only the tail."""
+        manager = OrderStateManager(temp_state_dir, snapshot_every=5)
+        for i in range(7):
+            await manager.record_event(OrderJournalEvent.SUBMIT, make_order(f"SIM_{i:03d}"))
+        await manager.close()
+
+        with open(manager.state_file) as f:
+            snapshot = json.load(f)
+        assert snapshot["metadata"]["journal_seq"] == "5"
+        assert len(snapshot["active_orders"]) == 5
+
+        journal_records = list(manager.journal.replay())
+        assert [record["seq"] for record in journal_records] == [6, 7]
+
+        recovered = await OrderStateManager(temp_state_dir).load_state()
+        assert len(recovered) == 7
+
+    @pytest.mark.asyncio
+    async def test_save_state_resets_journal(self, state_manager, sample_orders):
+        """Test a full snapshot supersedes previously journaled events."""
+        await state_manager.record_event(OrderJournalEvent.SUBMIT, make_order("SIM_009"))
+        await state_manager.save_state(sample_orders)
+
+        assert list(state_manager.journal.replay()) == []
+        loaded_orders = await state_manager.load_state()
+        assert set(loaded_orders) == {"SIM_001", "SIM_002"}
+
+    @pytest.mark.asyncio
+    async def test_save_state_keeps_events_journaled_during_rotate(
+        self, state_manager, sample_orders
+    ):
+        """Test events journaled while save_state awaits the rotation are not lost."""
+        rotate = state_manager.journal.rotate
+
+        async def rotate_with_concurrent_event():
+            await state_manager.record_event(OrderJournalEvent.SUBMIT, make_order("SIM_010"))
+            return await rotate()
+
+        state_manager.journal.rotate = rotate_with_concurrent_event
+        await state_manager.save_state(sample_orders)
+
+        assert "SIM_010" in state_manager.journal.orders
+        loaded_orders = await OrderStateManager(state_manager.state_dir).load_state()
+        assert set(loaded_orders) == {"SIM_001", "SIM_002", "SIM_010"}
+
+    @pytest.mark.asyncio
+    async def test_torn_journal_record_is_skipped(self, temp_state_dir):
+        """Test a partially written trailing record does not break recovery."""
+        manager = OrderStateManager(temp_state_dir)
+        await manager.record_event(OrderJournalEvent.SUBMIT, make_order("SIM_001"))
+        await manager.close()
+
+        segment = next(manager.journal_dir.glob("order_journal_*.jsonl"))
+        with open(segment, "a") as f:
+            f.write('{"seq": 2, "event": "submit", "order_id": "SIM_0')
+
+        restarted = OrderStateManager(temp_state_dir)
+        await restarted.record_event(OrderJournalEvent.SUBMIT, make_order("SIM_002"))
+        await restarted.close()
+
+        recovered = await OrderStateManager(temp_state_dir).load_state()
+        assert set(recovered) == {"SIM_001", "SIM_002"}
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_keeps_group_for_next_commit(self, temp_state_dir):
+        """Test a group whose write fails is persisted by the next commit."""
+        manager = OrderStateManager(temp_state_dir, commit_interval=60)
+        journal = manager.journal
+        write_group = journal._write_group
+        calls = []
+
+        def fail_first_write(segment, lines):
+            calls.append(len(lines))
+            if len(calls) == 1:
+                raise OSError("disk full")
+            write_group(segment, lines)
+
+        journal._write_group = fail_first_write
+        await manager.record_event(OrderJournalEvent.SUBMIT, make_order("SIM_001"))
+        await manager.record_event(OrderJournalEvent.SUBMIT, make_order("SIM_002"))
+
+        with pytest.raises(OSError):
+            await journal.commit()
+        assert journal.pending_count == 2
+        assert journal.events_committed == 0
+
+        await manager.record_event(OrderJournalEvent.SUBMIT, make_order("SIM_003"))
+        assert await journal.commit() == 3
+        assert [record["seq"] for record in journal.replay()] == [1, 2, 3]
+        await manager.close()
+
+        recovered = await OrderStateManager(temp_state_dir).load_state()
+        assert set(recovered) == {"SIM_001", "SIM_002", "SIM_003"}
+
+    @pytest.mark.asyncio
+    async def test_record_event_requires_order_id(self, state_manager):
+        """Test orders without an identifier are rejected."""
+        with pytest.raises(ValueError):
+            await state_manager.record_event(OrderJournalEvent.SUBMIT, make_order(None))
+
+    @pytest.mark.asyncio
+    async def test_request_save_is_coalesced(self, temp_state_dir, sample_orders):
+        """Test repeated save requests produce one write-behind snapshot."""
+        scheduler = WriteBehindScheduler(window_seconds=0.05)
+        manager = OrderStateManager(temp_state_dir, persistence_scheduler=scheduler)
+
+        for _ in range(10):
+            manager.request_save(sample_orders)
+        assert not manager.state_file.exists()
+
+        await manager.close()
+
+        loaded_orders = await manager.load_state()
+        assert set(loaded_orders) == set(sample_orders)
+        assert next(iter(scheduler.get_metrics().values()))["writes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_event_cost_independent_of_open_orders(self, temp_state_dir):
+        """Benchmark per-event persistence cost against full snapshot saves."""
+        open_orders = {f"SIM_{i:04d}": make_order(f"SIM_{i:04d}") for i in range(1000)}
+        events = 200
+
+        snapshot_manager = OrderStateManager(temp_state_dir / "snapshot")
+        start = time.perf_counter()
+        for _ in range(20):
+            await snapshot_manager.save_state(open_orders)
+        snapshot_ms = (time.perf_counter() - start) * 1000 / 20
+
+        journal_manager = OrderStateManager(temp_state_dir / "journal")
+        await journal_manager.save_state(open_orders)
+        order = make_order("SIM_0001")
+        start = time.perf_counter()
+        for _ in range(events):
+            await journal_manager.record_event(OrderJournalEvent.STATUS_CHANGE, order)
+        await journal_manager.flush()
+        journal_ms = (time.perf_counter() - start) * 1000 / events
+        await journal_manager.close()
+
+        print(f"Full snapshot with {len(open_orders)} orders: {snapshot_ms:.2f}ms/save")
+        print(f"Journal append with {len(open_orders)} orders: {journal_ms:.3f}ms/event")
+
+        assert journal_ms < snapshot_ms
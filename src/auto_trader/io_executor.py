@@ -0,0 +1,238 @@
+"""Bounded executor for blocking file I/O issued from coroutines."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
+
+from loguru import logger
+
+T = TypeVar("T")
+
+# Called with (call_site, loop_blocked_ms, queue_wait_ms, io_ms)
+BlockingHook = Callable[[str, float, float, float], None]
+
+
+@dataclass
+class CallSiteStats:
+    """Accumulated timings of one call site."""
+
+    calls: int = 0
+    failures: int = 0
+    loop_blocked_ms: float = 0.0
+    max_loop_blocked_ms: float = 0.0
+    queue_wait_ms: float = 0.0
+    io_ms: float = 0.0
+    max_io_ms: float = 0.0
+
+
+class IOExecutor:
+    """
+    Dedicated thread pool for blocking disk I/O.
+
+    Coroutines hand file reads, writes, fsyncs and directory scans to
+    ``run`` instead of performing them on the event loop. The pool size
+    bounds how many I/O operations run at once; further calls queue in the
+    pool without occupying the loop.
+
+    Every call is attributed to a call site name. Per call site the executor
+    records time the event loop was blocked (submission plus any work
+    measured with ``blocking``), time spent queued behind other I/O, and
+    time spent doing the I/O itself. Hooks registered with
+    ``add_blocking_hook`` receive each measurement, e.g. to export metrics
+    or flag slow sites.
+    """
+
+    def __init__(self, max_workers: int = 4, slow_call_ms: float = 250.0) -> None:
+        """
+        Initialize I/O executor.
+
+        Args:
+            max_workers: Maximum concurrent I/O operations
+            slow_call_ms: I/O duration above which a call is logged as slow
+        """
+        self.max_workers = max_workers
+        self.slow_call_ms = slow_call_ms
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="auto-trader-io"
+        )
+        self._stats: Dict[str, CallSiteStats] = {}
+        self._stats_lock = threading.Lock()
+        self._hooks: List[BlockingHook] = []
+
+    async def run(
+        self, call_site: str, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Run a blocking function on the I/O pool.
+
+        Args:
+            call_site: Name the timings are attributed to
+            func: Blocking function
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The function's return value
+
+        Raises:
+            Exception: Whatever func raises
+        """
+        loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+        timings: Dict[str, float] = {}
+
+        def invoke() -> T:
+            started = time.perf_counter()
+            timings["queue_wait_ms"] = (started - submitted) * 1000
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings["io_ms"] = (time.perf_counter() - started) * 1000
+
+        future = loop.run_in_executor(self._pool, invoke)
+        loop_blocked_ms = (time.perf_counter() - submitted) * 1000
+        failed = False
+        try:
+            return await future
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._record(
+                call_site,
+                loop_blocked_ms,
+                timings.get("queue_wait_ms", 0.0),
+                timings.get("io_ms", 0.0),
+                failed,
+            )
+
+    @contextmanager
+    def blocking(self, call_site: str) -> Iterator[None]:
+        """
+        Attribute work done directly on the event loop to a call site.
+
+        Use around code that must stay on the loop (e.g. serializing state
+        before handing it to ``run``) so its blocking time is reported.
+
+        Args:
+            call_site: Name the timing is attributed to
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(call_site, (time.perf_counter() - started) * 1000, 0.0, 0.0)
+
+    def add_blocking_hook(self, hook: BlockingHook) -> None:
+        """
+        Register a hook receiving every timing measurement.
+
+        Args:
+            hook: Called with (call_site, loop_blocked_ms, queue_wait_ms, io_ms)
+        """
+        self._hooks.append(hook)
+
+    def remove_blocking_hook(self, hook: BlockingHook) -> None:
+        """Unregister a timing hook."""
+        if hook in self._hooks:
+            self._hooks.remove(hook)
+
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get timings per call site.
+
+        Returns:
+            Mapping of call site to call counts, failures and total, average
+            and maximum loop-blocked, queue-wait and I/O milliseconds
+        """
+        with self._stats_lock:
+            return {
+                site: {
+                    "calls": stats.calls,
+                    "failures": stats.failures,
+                    "loop_blocked_ms": stats.loop_blocked_ms,
+                    "avg_loop_blocked_ms": stats.loop_blocked_ms / stats.calls,
+                    "max_loop_blocked_ms": stats.max_loop_blocked_ms,
+                    "queue_wait_ms": stats.queue_wait_ms,
+                    "io_ms": stats.io_ms,
+                    "avg_io_ms": stats.io_ms / stats.calls,
+                    "max_io_ms": stats.max_io_ms,
+                }
+                for site, stats in self._stats.items()
+            }
+
+    def reset_metrics(self) -> None:
+        """Clear accumulated timings."""
+        with self._stats_lock:
+            self._stats.clear()
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the worker threads.
+
+        Args:
+            wait: Wait for queued I/O to finish
+        """
+        self._pool.shutdown(wait=wait)
+
+    def _record(
+        self,
+        call_site: str,
+        loop_blocked_ms: float,
+        queue_wait_ms: float,
+        io_ms: float,
+        failed: bool = False,
+    ) -> None:
+        """Accumulate one measurement and notify hooks."""
+        with self._stats_lock:
+            stats = self._stats.setdefault(call_site, CallSiteStats())
+            stats.calls += 1
+            stats.failures += int(failed)
+            stats.loop_blocked_ms += loop_blocked_ms
+            stats.max_loop_blocked_ms = max(stats.max_loop_blocked_ms, loop_blocked_ms)
+            stats.queue_wait_ms += queue_wait_ms
+            stats.io_ms += io_ms
+            stats.max_io_ms = max(stats.max_io_ms, io_ms)
+
+        if io_ms > self.slow_call_ms:
+            logger.warning(
+                "Slow file I/O",
+                call_site=call_site,
+                io_ms=round(io_ms, 1),
+                queue_wait_ms=round(queue_wait_ms, 1),
+            )
+
+        for hook in self._hooks:
+            try:
+                hook(call_site, loop_blocked_ms, queue_wait_ms, io_ms)
+            except Exception as e:
+                logger.error("I/O timing hook failed", call_site=call_site, error=str(e))
+
+
+_default_executor: Optional[IOExecutor] = None
+_default_lock = threading.Lock()
+
+
+def get_io_executor() -> IOExecutor:
+    """Get the process-wide I/O executor, creating it on first use."""
+    global _default_executor
+    with _default_lock:
+        if _default_executor is None:
+            _default_executor = IOExecutor()
+        return _default_executor
+
+
+def set_io_executor(executor: IOExecutor) -> None:
+    """
+    Replace the process-wide I/O executor (e.g. to change its pool size).
+
+    Args:
+        executor: Executor used by components not given one explicitly
+    """
+    global _default_executor
+    with _default_lock:
+        _default_executor = executor
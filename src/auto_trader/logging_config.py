@@ -1,6 +1,7 @@
 """Enhanced logging configuration with loguru."""
 
 import sys
+import time
 import uuid
 from contextvars import ContextVar
 from pathlib import Path
@@ -13,14 +14,32 @@ correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default
 service_context: ContextVar[Optional[str]] = ContextVar("service_context", default=None)
 trade_context: ContextVar[Optional[str]] = ContextVar("trade_context", default=None)
 
+# Handler id -> level number for sinks added with add_sink()
+_sink_levels: Dict[int, int] = {}
+# Lowest level across _sink_levels, None when no sink is tracked
+_min_sink_level: Optional[int] = None
+
 
 class LoggerConfig:
     """Enhanced logging configuration manager."""
 
-    def __init__(self, logs_dir: Path = Path("logs"), log_level: str = "INFO"):
-        """Initialize logger configuration."""
+    def __init__(
+        self,
+        logs_dir: Path = Path("logs"),
+        log_level: str = "INFO",
+        enqueue: bool = True,
+    ):
+        """Initialize logger configuration.
+
+        Args:
+            logs_dir: Directory for log files
+            log_level: Minimum level for console and system logs
+            enqueue: Hand file sink records to a background writer instead of
+                writing them on the calling thread (call flush_logs() on shutdown)
+        """
         self.logs_dir = logs_dir
         self.log_level = log_level
+        self.enqueue = enqueue
         self._configured = False
 
     def configure_logging(self) -> None:
@@ -33,9 +52,11 @@ class LoggerConfig:
 
         # Remove default handler
         logger.remove()
+        _sink_levels.clear()
+        _update_min_sink_level()
 
         # Console handler for development
-        logger.add(
+        add_sink(
             sys.stderr,
             level=self.log_level,
             format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
@@ -47,7 +68,7 @@ class LoggerConfig:
         )
 
         # System log - general application events
-        logger.add(
+        add_sink(
             self.logs_dir / "system.log",
             level=self.log_level,
             rotation="1 day",
@@ -55,6 +76,7 @@ class LoggerConfig:
             compression="gz",
             format=self._json_format,
             serialize=True,
+            enqueue=self.enqueue,
             filter=lambda record: not any(
                 tag in record["extra"].get("category", "")
                 for tag in ["trade", "risk", "cli"]
@@ -62,7 +84,7 @@ class LoggerConfig:
         )
 
         # Trade log - all trading-related events
-        logger.add(
+        add_sink(
             self.logs_dir / "trades.log",
             level="INFO",
             rotation="1 day",
@@ -70,11 +92,12 @@ class LoggerConfig:
             compression="gz",
             format=self._json_format,
             serialize=True,
+            enqueue=self.enqueue,
             filter=lambda record: record["extra"].get("category") == "trade",
         )
 
         # Risk log - risk management and validation events
-        logger.add(
+        add_sink(
             self.logs_dir / "risk.log",
             level="INFO",
             rotation="1 day",
@@ -82,11 +105,12 @@ class LoggerConfig:
             compression="gz",
             format=self._json_format,
             serialize=True,
+            enqueue=self.enqueue,
             filter=lambda record: record["extra"].get("category") == "risk",
         )
 
         # CLI log - command-line interface events
-        logger.add(
+        add_sink(
             self.logs_dir / "cli.log",
             level="INFO",
             rotation="1 day",
@@ -94,6 +118,7 @@ class LoggerConfig:
             compression="gz",
             format=self._json_format,
             serialize=True,
+            enqueue=self.enqueue,
             filter=lambda record: record["extra"].get("category") == "cli",
         )
 
@@ -102,17 +127,18 @@ class LoggerConfig:
 
     def _add_context_filter(self, record: Dict[str, Any]) -> bool:
         """Add context information to log records."""
-        # Add correlation ID if available
-        if correlation_id.get():
-            record["extra"]["correlation_id"] = correlation_id.get()
+        # Read each context variable once; this runs for every console record
+        correlation = correlation_id.get()
+        if correlation:
+            record["extra"]["correlation_id"] = correlation
 
-        # Add service context if available
-        if service_context.get():
-            record["extra"]["service_context"] = service_context.get()
+        service = service_context.get()
+        if service:
+            record["extra"]["service_context"] = service
 
-        # Add trade context if available
-        if trade_context.get():
-            record["extra"]["trade_context"] = trade_context.get()
+        trade = trade_context.get()
+        if trade:
+            record["extra"]["trade_context"] = trade
 
         return True
 
@@ -156,6 +182,89 @@ class ContextualLogger:
         self.logger.critical(message, **kwargs)
 
 
+class HotPathLogger:
+    """Level-guarded, rate-limited logger for a single hot-path call site.
+
+    Create one instance per call site (typically at module level). Calls return
+    immediately when no sink added with add_sink() accepts the level. Messages use loguru's
+    ``{field}`` placeholders and field values may be zero-argument callables,
+    so formatting and expensive conversions only happen for emitted records.
+    Suppressed calls are counted and reported on the next emitted record.
+    """
+
+    def __init__(
+        self,
+        level: str = "DEBUG",
+        sample_every: int = 1,
+        min_interval_seconds: float = 0.0,
+    ):
+        """Initialize hot-path logger.
+
+        Args:
+            level: Log level for emitted records
+            sample_every: Emit one record per this many calls
+            min_interval_seconds: Minimum time between emitted records
+        """
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be >= 1, got {sample_every}")
+        if min_interval_seconds < 0:
+            raise ValueError(
+                f"min_interval_seconds must be >= 0, got {min_interval_seconds}"
+            )
+
+        self.level = level
+        self.level_no = logger.level(level).no
+        self.sample_every = sample_every
+        self.min_interval_seconds = min_interval_seconds
+        self.calls = 0
+        self.suppressed = 0
+        self._last_emit = float("-inf")
+
+    def enabled(self) -> bool:
+        """Check whether any tracked sink would accept records at this level."""
+        return is_level_enabled(self.level_no)
+
+    def log(self, message: str, **fields: Any) -> None:
+        """Log a message if enabled and not rate limited.
+
+        Args:
+            message: Message template using ``{field}`` placeholders
+            **fields: Record fields; callables are evaluated only on emission
+        """
+        if not is_level_enabled(self.level_no):
+            return
+
+        self.calls += 1
+        if self._should_suppress():
+            self.suppressed += 1
+            return
+
+        for key, value in fields.items():
+            if callable(value):
+                fields[key] = value()
+
+        if self.suppressed:
+            fields["suppressed"] = self.suppressed
+            message += " (logged 1 of {sampled}, {suppressed} suppressed)"
+            fields["sampled"] = self.suppressed + 1
+            self.suppressed = 0
+
+        logger.opt(depth=1).log(self.level, message, **fields)
+
+    def _should_suppress(self) -> bool:
+        """Apply sampling and interval limits to the current call."""
+        if self.sample_every > 1 and (self.calls - 1) % self.sample_every:
+            return True
+
+        if self.min_interval_seconds:
+            now = time.monotonic()
+            if now - self._last_emit < self.min_interval_seconds:
+                return True
+            self._last_emit = now
+
+        return False
+
+
 class APIRequestLogger:
     """Logger for external API requests and responses."""
 
@@ -233,6 +342,59 @@ def get_logger(name: str, category: str = "system") -> ContextualLogger:
     return ContextualLogger(name, category)
 
 
+def add_sink(sink: Any, level: "int | str" = "DEBUG", **options: Any) -> int:
+    """Add a loguru handler and record its level for is_level_enabled().
+
+    Args:
+        sink: Any sink accepted by loguru's logger.add()
+        level: Minimum level for the handler
+        **options: Further logger.add() options
+
+    Returns:
+        Handler id for remove_sink()
+    """
+    handler_id = logger.add(sink, level=level, **options)
+    _sink_levels[handler_id] = level if isinstance(level, int) else logger.level(level).no
+    _update_min_sink_level()
+    return handler_id
+
+
+def remove_sink(handler_id: int) -> None:
+    """Remove a handler added with add_sink()."""
+    logger.remove(handler_id)
+    _sink_levels.pop(handler_id, None)
+    _update_min_sink_level()
+
+
+def _update_min_sink_level() -> None:
+    """Recompute the lowest level accepted by the sinks added with add_sink()."""
+    global _min_sink_level
+    _min_sink_level = min(_sink_levels.values(), default=None)
+
+
+def is_level_enabled(level: "int | str") -> bool:
+    """Check whether any sink added with add_sink() accepts the given level.
+
+    Handlers added directly with logger.add() are not tracked; until a sink
+    is added with add_sink() every level counts as enabled.
+
+    Args:
+        level: Level name or number
+
+    Returns:
+        True if a record at this level would reach at least one sink
+    """
+    if _min_sink_level is None:
+        return True
+    level_no = level if isinstance(level, int) else logger.level(level).no
+    return level_no >= _min_sink_level
+
+
+def flush_logs() -> None:
+    """Wait for enqueued log records to be written by their sinks."""
+    logger.complete()
+
+
 def set_correlation_id(request_id: Optional[str] = None) -> str:
     """Set correlation ID for request tracking."""
     if request_id is None:
@@ -4,12 +4,18 @@ import tempfile
 import uuid
 from pathlib import Path
 
+import pytest
 from loguru import logger
 
+from auto_trader import logging_config
 from auto_trader.logging_config import (
     LoggerConfig,
     ContextualLogger,
     APIRequestLogger,
+    HotPathLogger,
+    add_sink,
+    remove_sink,
+    is_level_enabled,
     correlation_id,
     service_context,
     trade_context,
@@ -290,3 +296,97 @@ class TestLoggingIntegration:
 
             # All loggers should work without errors
             # Actual file content verification would require log handler flushing
+
+
+class TestHotPathLogger:
+    """Test level-guarded, rate-limited hot-path logging."""
+
+    @pytest.fixture
+    def capture(self, monkeypatch):
+        """Add capturing sinks tracked apart from any configured ones."""
+        monkeypatch.setattr(logging_config, "_sink_levels", {})
+        monkeypatch.setattr(logging_config, "_min_sink_level", None)
+        handler_ids = []
+
+        def add(level: str = "DEBUG"):
+            messages = []
+            handler_ids.append(add_sink(messages.append, level=level, format="{message}"))
+            return messages
+
+        yield add
+
+        for handler_id in handler_ids:
+            remove_sink(handler_id)
+
+    def test_disabled_level_skips_formatting(self, capture) -> None:
+        """Test lazy fields are not evaluated when the level is disabled."""
+        messages = capture(level="INFO")
+        hot_log = HotPathLogger("DEBUG")
+        evaluated = []
+
+        hot_log.log("Bar {symbol}", symbol=lambda: evaluated.append(1) or "AAPL")
+
+        assert not hot_log.enabled()
+        assert evaluated == []
+        assert messages == []
+        assert hot_log.calls == 0
+
+    def test_lazy_fields_formatted_when_enabled(self, capture) -> None:
+        """Test callable fields are evaluated and formatted on emission."""
+        messages = capture()
+        hot_log = HotPathLogger("DEBUG")
+
+        hot_log.log("Bar {symbol} closed at {close}", symbol="AAPL", close=lambda: "180.50")
+
+        assert len(messages) == 1
+        assert "Bar AAPL closed at 180.50" in messages[0]
+
+    def test_sampling_reports_suppressed_count(self, capture) -> None:
+        """Test sampled call sites report how many calls were suppressed."""
+        messages = capture()
+        hot_log = HotPathLogger("DEBUG", sample_every=5)
+
+        for _ in range(11):
+            hot_log.log("Bar update")
+
+        assert len(messages) == 3
+        assert "suppressed" not in messages[0]
+        assert "logged 1 of 5, 4 suppressed" in messages[1]
+        assert hot_log.suppressed == 0
+
+    def test_min_interval_rate_limit(self, capture) -> None:
+        """Test interval limiting suppresses calls within the window."""
+        messages = capture()
+        hot_log = HotPathLogger("DEBUG", min_interval_seconds=3600)
+
+        for _ in range(3):
+            hot_log.log("Bar update")
+
+        assert len(messages) == 1
+        assert hot_log.suppressed == 2
+
+    def test_invalid_settings(self) -> None:
+        """Test invalid rate limit settings are rejected."""
+        with pytest.raises(ValueError):
+            HotPathLogger("DEBUG", sample_every=0)
+        with pytest.raises(ValueError):
+            HotPathLogger("DEBUG", min_interval_seconds=-1)
+
+    def test_is_level_enabled(self, capture) -> None:
+        """Test level check follows the lowest tracked sink level."""
+        assert is_level_enabled("DEBUG")
+
+        capture(level="WARNING")
+        assert is_level_enabled("ERROR")
+        assert not is_level_enabled("INFO")
+
+        capture(level="INFO")
+        assert is_level_enabled("INFO")
+        assert not is_level_enabled("DEBUG")
+
+    def test_logger_config_enqueue_setting(self) -> None:
+        """Test file sinks can be configured with or without enqueueing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = LoggerConfig(logs_dir=Path(temp_dir) / "logs", enqueue=False)
+            assert config.enqueue is False
+            assert LoggerConfig().enqueue is True
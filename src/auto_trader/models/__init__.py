@@ -25,13 +25,15 @@ from .error_reporting import (
     ValidationReporter,
     ErrorCodeGenerator,
 )
-from .template_manager import TemplateManager
+from .template_manager import TemplateManager, CompiledTemplate
 from .plan_loader import TradePlanLoader, TradePlanFileWatcher
+from .plan_diff import PlanDiff, PlanModification, diff_plans
 from .enums import (
     OrderType,
     OrderSide,
     OrderStatus,
     OrderAction,
+    OrderJournalEvent,
     BracketOrderType,
     TimeInForce,
 )
@@ -65,13 +67,18 @@ __all__ = [
     "ValidationReporter",
     "ErrorCodeGenerator",
     "TemplateManager",
+    "CompiledTemplate",
     "TradePlanLoader",
     "TradePlanFileWatcher",
+    "PlanDiff",
+    "PlanModification",
+    "diff_plans",
     # Order models
     "OrderType",
     "OrderSide",
     "OrderStatus",
     "OrderAction",
+    "OrderJournalEvent",
     "BracketOrderType",
     "TimeInForce",
     "Order",
@@ -32,6 +32,15 @@ class OrderStatus(str, Enum):
     INACTIVE = "Inactive"
 
 
+class OrderJournalEvent(str, Enum):
+    """Order lifecycle events recorded in the order state journal."""
+    SUBMIT = "submit"
+    STATUS_CHANGE = "status_change"
+    FILL = "fill"
+    MODIFY = "modify"
+    CANCEL = "cancel"
+
+
 class OrderAction(str, Enum):
     """Order management actions."""
     NEW = "NEW"
@@ -82,4 +91,10 @@ class TimeInForce(str, Enum):
     DAY = "DAY"
     GTC = "GTC"  # Good Till Cancelled
     IOC = "IOC"  # Immediate or Cancel
-    FOK = "FOK"  # Fill or Kill
\ No newline at end of file
+    FOK = "FOK"  # Fill or Kill
+
+
+class ExecutionLogTier(str, Enum):
+    """Detail level for execution evaluation logging."""
+    FULL = "full"  # Every evaluation stored as a full log entry
+    COMPACT = "compact"  # No-action evaluations stored as compact records
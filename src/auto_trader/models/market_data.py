@@ -7,6 +7,12 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 from pydantic import ConfigDict
 from loguru import logger
 
+from auto_trader.logging_config import HotPathLogger
+
+
+# Per-bar debug logging is sampled to keep ingestion cheap
+_bar_added_log = HotPathLogger("DEBUG", sample_every=100)
+
 
 # Supported bar sizes mapping to ib-async format
 BAR_SIZE_MAPPING = {
@@ -132,12 +138,12 @@ class MarketData(BaseModel):
         
         self.last_updated = datetime.now(UTC)
         
-        logger.debug(
+        _bar_added_log.log(
             "Bar added",
             symbol=bar.symbol,
             bar_size=bar.bar_size,
-            timestamp=bar.timestamp.isoformat(),
-            close=str(bar.close_price)
+            timestamp=bar.timestamp.isoformat,
+            close=lambda: str(bar.close_price),
         )
     
     def get_latest_bar(
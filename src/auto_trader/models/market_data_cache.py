@@ -6,11 +6,15 @@ from typing import Dict, List, Optional, Set, Any
 from threading import RLock
 from loguru import logger
 
+from auto_trader.logging_config import HotPathLogger
 from auto_trader.models.market_data import (
     BarData, MarketData, BarSizeType, StaleDataError
 )
 
 
+_trim_log = HotPathLogger("DEBUG", sample_every=100)
+
+
 class MarketDataCache:
     """Thread-safe in-memory cache for market data with memory management."""
     
@@ -69,7 +73,7 @@ class MarketDataCache:
                     self._cache.bars[key] = self._cache.bars[key][-self.max_bars_per_symbol:]
                     self._stats["bars_removed"] += excess
                     
-                    logger.debug(
+                    _trim_log.log(
                         "Trimmed excess bars",
                         symbol=bar.symbol,
                         bar_size=bar.bar_size,
@@ -274,6 +278,38 @@ class MarketDataCache:
                 bars_removed=bars_removed
             )
     
+    def export_bars(self) -> Dict[str, List[BarData]]:
+        """Copy all cached bars for snapshotting.
+        
+        Returns:
+            Bars keyed by 'symbol:bar_size'
+        """
+        with self._lock:
+            return {key: list(bars) for key, bars in self._cache.bars.items()}
+    
+    def restore_bars(self, bars_by_key: Dict[str, List[BarData]]) -> int:
+        """Restore cached bars from a snapshot.
+        
+        Restored series replace any bars already cached under the same key
+        and are trimmed to the per-symbol limit.
+        
+        Args:
+            bars_by_key: Bars keyed by 'symbol:bar_size'
+            
+        Returns:
+            Number of bars restored
+        """
+        restored = 0
+        with self._lock:
+            for key, bars in bars_by_key.items():
+                kept = bars[-self.max_bars_per_symbol:]
+                self._cache.bars[key] = list(kept)
+                restored += len(kept)
+            self._stats["bars_added"] += restored
+        
+        logger.debug("Cache restored", series=len(bars_by_key), bars=restored)
+        return restored
+    
     def get_cache_summary(self) -> Dict[str, Any]:
         """Get summary of cache contents.
         
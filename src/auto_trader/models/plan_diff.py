@@ -0,0 +1,236 @@
+"""Structured differences between successive versions of loaded trade plans."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Set, Tuple
+
+from .trade_plan import TradePlan, TradePlanStatus
+
+# Bookkeeping fields that differ between two parses of the same plan
+DIFF_IGNORED_FIELDS = {"created_at", "updated_at"}
+
+# Plans in these states need market data for their symbol and timeframes
+MARKET_DATA_STATUSES = {
+    TradePlanStatus.AWAITING_ENTRY.value,
+    TradePlanStatus.POSITION_OPEN.value,
+}
+
+# Plan timeframe spellings of the market data bar sizes
+PLAN_TIMEFRAME_BAR_SIZES = {
+    "60min": "1hour",
+    "1h": "1hour",
+    "240min": "4hour",
+    "4h": "4hour",
+    "1440min": "1day",
+    "1440h": "1day",
+    "1d": "1day",
+}
+
+# (symbol, bar size) a plan needs market data for
+MarketDataKey = Tuple[str, str]
+
+
+@dataclass
+class PlanModification:
+    """One plan present before and after a change, with the fields that differ."""
+
+    old: TradePlan
+    new: TradePlan
+    # Dotted field path (e.g. "entry_function.parameters.threshold") -> (old, new)
+    changes: Dict[str, Tuple[Any, Any]]
+
+    @property
+    def market_data_changed(self) -> bool:
+        """Whether the plan needs different market data than before."""
+        return plan_market_data_keys(self.old) != plan_market_data_keys(self.new)
+
+
+@dataclass
+class PlanDiff:
+    """Plans added, removed and modified by one change to the loaded plans."""
+
+    added: Dict[str, TradePlan] = field(default_factory=dict)
+    removed: Dict[str, TradePlan] = field(default_factory=dict)
+    modified: Dict[str, PlanModification] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether nothing changed."""
+        return not (self.added or self.removed or self.modified)
+
+    def affected_symbols(self) -> Set[str]:
+        """Get symbols of every added, removed or modified plan (old and new)."""
+        symbols = {plan.symbol for plan in self.added.values()}
+        symbols.update(plan.symbol for plan in self.removed.values())
+        for modification in self.modified.values():
+            symbols.add(modification.old.symbol)
+            symbols.add(modification.new.symbol)
+        return symbols
+
+    def summary(self) -> Dict[str, List[str]]:
+        """Get plan IDs per kind of change, for logging."""
+        return {
+            "added": sorted(self.added),
+            "removed": sorted(self.removed),
+            "modified": sorted(self.modified),
+        }
+
+
+def diff_plans(
+    old_plans: Mapping[str, TradePlan], new_plans: Mapping[str, TradePlan]
+) -> PlanDiff:
+    """
+    Compare two sets of plans by plan ID.
+
+    Args:
+        old_plans: Plans before the change, by plan ID
+        new_plans: Plans after the change, by plan ID
+
+    Returns:
+        Added and removed plans, and modified plans with field-level changes
+    """
+    diff = PlanDiff()
+    for plan_id, old_plan in old_plans.items():
+        new_plan = new_plans.get(plan_id)
+        if new_plan is None:
+            diff.removed[plan_id] = old_plan
+        elif new_plan is not old_plan:
+            changes = plan_field_changes(old_plan, new_plan)
+            if changes:
+                diff.modified[plan_id] = PlanModification(old_plan, new_plan, changes)
+    for plan_id, new_plan in new_plans.items():
+        if plan_id not in old_plans:
+            diff.added[plan_id] = new_plan
+    return diff
+
+
+def plan_field_changes(old_plan: TradePlan, new_plan: TradePlan) -> Dict[str, Tuple[Any, Any]]:
+    """
+    Get the fields that differ between two versions of a plan.
+
+    Args:
+        old_plan: Previous version
+        new_plan: Current version
+
+    Returns:
+        Dotted field path -> (old value, new value); nested execution
+        function fields are compared individually
+    """
+    changes: Dict[str, Tuple[Any, Any]] = {}
+    _collect_changes(
+        old_plan.model_dump(exclude=DIFF_IGNORED_FIELDS),
+        new_plan.model_dump(exclude=DIFF_IGNORED_FIELDS),
+        "",
+        changes,
+    )
+    return changes
+
+
+def _collect_changes(
+    old: Dict[str, Any], new: Dict[str, Any], prefix: str, changes: Dict[str, Tuple[Any, Any]]
+) -> None:
+    """Record differing leaves of two nested dicts under dotted paths."""
+    for key in old.keys() | new.keys():
+        old_value = old.get(key)
+        new_value = new.get(key)
+        if old_value == new_value:
+            continue
+        path = f"{prefix}{key}"
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            _collect_changes(old_value, new_value, f"{path}.", changes)
+        else:
+            changes[path] = (old_value, new_value)
+
+
+def plan_market_data_keys(plan: TradePlan) -> Set[MarketDataKey]:
+    """
+    Get the (symbol, bar size) pairs a plan needs market data for.
+
+    Args:
+        plan: Trade plan
+
+    Returns:
+        Pairs for the entry and exit function timeframes, spelled as market
+        data bar sizes; empty for plans that are completed, cancelled or in error
+    """
+    status = getattr(plan.status, "value", plan.status)
+    if status not in MARKET_DATA_STATUSES:
+        return set()
+    return {
+        (plan.symbol, PLAN_TIMEFRAME_BAR_SIZES.get(timeframe, timeframe))
+        for timeframe in (plan.entry_function.timeframe, plan.exit_function.timeframe)
+    }
+
+
+class PlanKeyIndex:
+    """
+    Reference counts of the market data keys needed by plans.
+
+    Consumers of plan diffs (subscriptions, bar close monitors) keep one to
+    learn which keys a diff makes newly needed or no longer needed, without
+    reconciling every plan.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty index."""
+        self._plan_keys: Dict[str, Set[MarketDataKey]] = {}
+        self._key_plans: Dict[MarketDataKey, Set[str]] = {}
+
+    def apply(self, diff: PlanDiff) -> Tuple[Set[MarketDataKey], Set[MarketDataKey]]:
+        """
+        Apply a plan diff.
+
+        Args:
+            diff: Change to the plans
+
+        Returns:
+            Keys that became needed and keys that are no longer needed; a key
+            released and re-acquired within the diff is in neither
+        """
+        before: Dict[MarketDataKey, bool] = {}
+
+        for plan_id in diff.removed:
+            self._set_plan_keys(plan_id, set(), before)
+        for plan_id, modification in diff.modified.items():
+            if plan_id not in self._plan_keys or modification.market_data_changed:
+                self._set_plan_keys(plan_id, plan_market_data_keys(modification.new), before)
+        for plan_id, plan in diff.added.items():
+            self._set_plan_keys(plan_id, plan_market_data_keys(plan), before)
+
+        acquired = {key for key, had in before.items() if not had and key in self._key_plans}
+        released = {key for key, had in before.items() if had and key not in self._key_plans}
+        return acquired, released
+
+    def keys(self) -> Set[MarketDataKey]:
+        """Get all keys needed by at least one plan."""
+        return set(self._key_plans)
+
+    def symbol_keys(self, symbol: str) -> Set[MarketDataKey]:
+        """Get the needed keys of one symbol."""
+        return {key for key in self._key_plans if key[0] == symbol}
+
+    def plans_for(self, key: MarketDataKey) -> Set[str]:
+        """Get the IDs of plans needing a key."""
+        return set(self._key_plans.get(key, ()))
+
+    def _set_plan_keys(
+        self,
+        plan_id: str,
+        keys: Set[MarketDataKey],
+        before: Dict[MarketDataKey, bool],
+    ) -> None:
+        """Replace one plan's keys, remembering whether each touched key was needed before."""
+        old_keys = self._plan_keys.pop(plan_id, set())
+        for key in old_keys | keys:
+            before.setdefault(key, key in self._key_plans)
+
+        for key in old_keys - keys:
+            plans = self._key_plans[key]
+            plans.discard(plan_id)
+            if not plans:
+                del self._key_plans[key]
+        for key in keys:
+            self._key_plans.setdefault(key, set()).add(plan_id)
+        if keys:
+            self._plan_keys[plan_id] = keys
@@ -3,116 +3,281 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import inspect
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Any
-import yaml
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Any
 
+import yaml
 from loguru import logger
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
 
-from .trade_plan import TradePlan, TradePlanStatus
-from .validation_engine import ValidationEngine
+from ..utils.file_event_bridge import FileChange, FileEventBridge, FileWatchEventType
+from ..io_executor import IOExecutor, get_io_executor
+from .plan_diff import PlanDiff, diff_plans
+from .trade_plan import TradePlan, TradePlanStatus, ValidationResult
+from .validation_engine import PlanFileLoad, ValidationEngine, parse_yaml
 from .error_reporting import ValidationReporter
 
+PROJECT_ROOT = Path(__file__).parents[3]  # Go up from src/auto_trader/models/
+
+# Persisted parsed-file caches, one file per plans directory
+DEFAULT_PLAN_CACHE_DIR = PROJECT_ROOT / "data" / "state" / "plan_cache"
+PLAN_CACHE_VERSION = 1
+
+# Diff listeners may be coroutine functions; their coroutines run on the loop
+DiffListener = Callable[[PlanDiff], Optional[Awaitable[None]]]
 
-class TradePlanFileWatcher(FileSystemEventHandler):
-    """File system event handler for watching trade plan file changes."""
+# Below this many files to parse, process start-up costs more than it saves
+PARALLEL_MIN_FILES = 32
+
+
+@dataclass
+class CachedPlanFile:
+    """Plans parsed from a valid file, with the file state they came from."""
     
-    def __init__(self, loader: TradePlanLoader) -> None:
-        """Initialize file watcher with reference to loader."""
-        self.loader = loader
-        super().__init__()
+    mtime_ns: int
+    size: int
+    content_hash: str
+    plan_ids: Set[str]
+    file_load: Optional[PlanFileLoad] = None
+    # Plans as JSON-compatible dicts when restored from the persisted cache;
+    # built into TradePlans on first use
+    plan_dumps: Optional[List[Dict[str, Any]]] = None
+    # Parsed by a pool worker and not yet registered; counted as parsed,
+    # not reused, when first claimed
+    pool_parsed: bool = False
+
+
+@dataclass
+class PlanFileRead:
+    """A plan file read and parsed on the I/O executor, not yet validated."""
     
-    def on_modified(self, event) -> None:
-        """Handle file modification events."""
-        if event.is_directory:
-            return
-        
-        file_path = Path(event.src_path)
-        if file_path.suffix.lower() in {'.yaml', '.yml'}:
-            logger.info(f"Trade plan file modified: {file_path}")
-            # Trigger reload in background
-            asyncio.create_task(self.loader._reload_file(file_path))
+    mtime_ns: int
+    size: int
+    content: bytes
+    parsed_data: Any = None
+    yaml_error: Optional[yaml.YAMLError] = None
+
+
+def plan_cache_path(plans_directory: Path, cache_dir: Path) -> Path:
+    """
+    Get the persisted cache file of a plans directory.
     
-    def on_created(self, event) -> None:
-        """Handle file creation events."""
-        if event.is_directory:
-            return
+    Args:
+        plans_directory: Plans directory the cache describes
+        cache_dir: Directory holding persisted caches
         
-        file_path = Path(event.src_path)
-        if file_path.suffix.lower() in {'.yaml', '.yml'}:
-            logger.info(f"New trade plan file created: {file_path}")
-            asyncio.create_task(self.loader._reload_file(file_path))
+    Returns:
+        Cache file named after the resolved plans directory, so directories
+        sharing a name do not share a cache
+    """
+    key = hashlib.sha256(str(plans_directory.resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{key}.json"
+
+
+def _read_plan_file(file_path: Path) -> Optional[PlanFileRead]:
+    """
+    Read and parse a plan file without touching loader or validation state.
     
-    def on_deleted(self, event) -> None:
-        """Handle file deletion events."""
-        if event.is_directory:
-            return
+    Returns:
+        The file's stat, content and parsed YAML, or None if it cannot be
+        read as UTF-8 text (validation then reports the error)
+    """
+    try:
+        stat = file_path.stat()
+        content = file_path.read_bytes()
+        text = content.decode('utf-8')
+    except (OSError, UnicodeDecodeError):
+        return None
+    
+    file_read = PlanFileRead(stat.st_mtime_ns, stat.st_size, content)
+    try:
+        file_read.parsed_data = parse_yaml(text)
+    except yaml.YAMLError as e:
+        file_read.yaml_error = e
+    return file_read
+
+
+def _parse_file_isolated(file_path: Path) -> Optional[CachedPlanFile]:
+    """
+    Parse and validate one plan file in a worker process.
+    
+    Uses a fresh ValidationEngine, so plan IDs are only checked for
+    duplicates within the file; the parent re-checks them across files.
+    
+    Returns:
+        Cache entry for a valid file, or None if the file is invalid or
+        unreadable and must be loaded by the parent to report its errors
+    """
+    try:
+        stat = file_path.stat()
+        content = file_path.read_bytes()
+        file_load = ValidationEngine().load_yaml_content(content.decode('utf-8'), file_path)
+    except Exception:
+        return None
+    
+    if not file_load.result.is_valid:
+        return None
+    return CachedPlanFile(
+        mtime_ns=stat.st_mtime_ns,
+        size=stat.st_size,
+        content_hash=hashlib.sha256(content).hexdigest(),
+        plan_ids={plan.plan_id for plan in file_load.plans},
+        file_load=file_load,
+    )
+
+
+class TradePlanFileWatcher(FileEventBridge):
+    """File system event handler applying bursts of trade plan file changes to the loader."""
+    
+    def __init__(self, loader: TradePlanLoader, coalesce_window: float = 0.2) -> None:
+        """
+        Initialize file watcher with reference to loader.
         
-        file_path = Path(event.src_path)
-        if file_path.suffix.lower() in {'.yaml', '.yml'}:
-            logger.info(f"Trade plan file deleted: {file_path}")
-            # Remove from loaded plans
-            self.loader._remove_plans_from_file(file_path)
+        Args:
+            loader: Loader the changes are applied to
+            coalesce_window: Quiet period ending a burst of file events (seconds)
+        """
+        self.loader = loader
+        super().__init__(
+            loader._apply_file_changes,
+            coalesce_window=coalesce_window,
+            path_filter=lambda path: path.suffix.lower() in {'.yaml', '.yml'},
+        )
 
 
 class TradePlanLoader:
     """Loads and manages trade plans from YAML files."""
     
-    def __init__(self, plans_directory: Optional[Path] = None) -> None:
+    def __init__(
+        self,
+        plans_directory: Optional[Path] = None,
+        io_executor: Optional[IOExecutor] = None,
+        persist_cache: bool = False,
+        reload_coalesce_window: float = 0.2,
+        cache_dir: Optional[Path] = None,
+    ) -> None:
         """
         Initialize trade plan loader.
         
         Args:
             plans_directory: Directory containing trade plan YAML files.
                            Defaults to data/trade_plans/
+            io_executor: Executor for file reads during reloads (defaults
+                         to the shared one)
+            persist_cache: Keep the parsed-file cache in cache_dir so later
+                          processes reuse it
+            reload_coalesce_window: Quiet period after which watched file
+                                    changes are reloaded together (seconds)
+            cache_dir: Directory for persisted caches (defaults to
+                       data/state/plan_cache/ under the project root)
         """
         if plans_directory is None:
             # Default to project plans directory
-            project_root = Path(__file__).parents[3]  # Go up from src/auto_trader/models/
-            plans_directory = project_root / "data" / "trade_plans"
+            plans_directory = PROJECT_ROOT / "data" / "trade_plans"
         
         self.plans_directory = Path(plans_directory)
         self.validation_engine = ValidationEngine()
         self.reporter = ValidationReporter()
+        self._io = io_executor or get_io_executor()
+        self._reload_lock = asyncio.Lock()
         
         # In-memory storage
         self._loaded_plans: Dict[str, TradePlan] = {}
         self._file_to_plans: Dict[Path, Set[str]] = {}
         self._plan_to_file: Dict[str, Path] = {}
         
+        # Secondary indexes (plan ID -> plan, in load order) kept in step
+        # with _loaded_plans; their sizes are the per-status/symbol counts
+        self._plans_by_status: Dict[str, Dict[str, TradePlan]] = {}
+        self._plans_by_symbol: Dict[str, Dict[str, TradePlan]] = {}
+        
+        # Parsed plans of unchanged files, reused across loads
+        self._file_cache: Dict[Path, CachedPlanFile] = {}
+        self._cache_file = (
+            plan_cache_path(self.plans_directory, cache_dir or DEFAULT_PLAN_CACHE_DIR)
+            if persist_cache else None
+        )
+        self._cache_loaded = False
+        self._cache_dirty = False
+        self.files_parsed = 0
+        self.files_reused = 0
+        
+        # Change notification: version bumps on every change to loaded plans
+        self.plans_version = 0
+        self._change_listeners: List[Callable[[], None]] = []
+        self._notifications_suspended = False
+        
+        # Structured diffs, computed only while someone listens for them
+        self._diff_listeners: List[DiffListener] = []
+        # Latest scheduled run per async diff listener, so its diffs apply in order
+        self._diff_tasks: Dict[DiffListener, asyncio.Task] = {}
+        
         # File watching
         self._observer: Optional[Observer] = None
         self._watcher: Optional[TradePlanFileWatcher] = None
         self._watching = False
+        self.reload_coalesce_window = reload_coalesce_window
     
-    def load_all_plans(self, validate: bool = True) -> Dict[str, TradePlan]:
+    def load_all_plans(
+        self, validate: bool = True, workers: Optional[int] = 1
+    ) -> Dict[str, TradePlan]:
         """
         Load all trade plans from the plans directory.
         
+        Files are loaded in name order, so which file keeps a duplicated plan
+        ID does not depend on directory listing order or worker count.
+        
         Args:
             validate: Whether to validate plans during loading
+            workers: Processes used to parse and validate changed files
+                     (None for one per CPU, 1 to load serially)
             
         Returns:
             Dictionary mapping plan IDs to TradePlan instances
         """
+        previous_plans = dict(self._loaded_plans) if self._diff_listeners else None
+        self._notifications_suspended = True
+        try:
+            return self._load_all_plans(validate, workers)
+        finally:
+            self._notifications_suspended = False
+            self._notify_change()
+            if previous_plans is not None:
+                self._emit_diff(diff_plans(previous_plans, self._loaded_plans))
+    
+    def _load_all_plans(self, validate: bool, workers: Optional[int]) -> Dict[str, TradePlan]:
+        """Load all plans with change notifications suspended."""
         self._clear_loaded_plans()
         
         if not self.plans_directory.exists():
             logger.warning(f"Plans directory not found: {self.plans_directory}")
             return {}
         
-        yaml_files = list(self.plans_directory.glob("*.yaml")) + list(self.plans_directory.glob("*.yml"))
+        yaml_files = sorted(
+            list(self.plans_directory.glob("*.yaml")) + list(self.plans_directory.glob("*.yml"))
+        )
         
         logger.info(f"Loading plans from {len(yaml_files)} files", directory=str(self.plans_directory))
         
+        if self._cache_file and not self._cache_loaded:
+            self._load_persisted_cache()
+        
+        # Skip template files
+        yaml_files = [f for f in yaml_files if "template" not in f.name.lower()]
+        
+        workers = workers or os.cpu_count() or 1
+        if workers > 1:
+            self._parse_in_pool(yaml_files, workers)
+        
         for yaml_file in yaml_files:
-            # Skip template files
-            if "template" in yaml_file.name.lower():
-                continue
-            
             try:
                 self._load_file(yaml_file, validate)
             except Exception as e:
@@ -120,6 +285,14 @@ class TradePlanLoader:
                 # Continue loading other files
                 continue
         
+        # Forget files that no longer exist
+        for stale_file in set(self._file_cache) - set(yaml_files):
+            del self._file_cache[stale_file]
+            self._cache_dirty = True
+        
+        if self._cache_file and self._cache_dirty:
+            self._save_persisted_cache()
+        
         logger.info(
             f"Loaded {len(self._loaded_plans)} trade plans",
             plan_ids=list(self._loaded_plans.keys())
@@ -152,6 +325,18 @@ class TradePlanLoader:
         """
         return self._loaded_plans.get(plan_id)
     
+    def get_plan_file(self, plan_id: str) -> Optional[Path]:
+        """
+        Get the file a loaded plan was read from.
+        
+        Args:
+            plan_id: Unique plan identifier
+            
+        Returns:
+            Path of the plan's file, or None if the plan is not loaded
+        """
+        return self._plan_to_file.get(plan_id)
+    
     def get_plans_by_status(self, status: TradePlanStatus) -> List[TradePlan]:
         """
         Get all plans with a specific status.
@@ -162,7 +347,7 @@ class TradePlanLoader:
         Returns:
             List of plans with the specified status
         """
-        return [plan for plan in self._loaded_plans.values() if plan.status == status]
+        return list(self._plans_by_status.get(self._status_key(status), {}).values())
     
     def get_plans_by_symbol(self, symbol: str) -> List[TradePlan]:
         """
@@ -174,7 +359,7 @@ class TradePlanLoader:
         Returns:
             List of plans for the specified symbol
         """
-        return [plan for plan in self._loaded_plans.values() if plan.symbol == symbol]
+        return list(self._plans_by_symbol.get(symbol, {}).values())
     
     def update_plan_status(self, plan_id: str, new_status: TradePlanStatus) -> bool:
         """
@@ -200,7 +385,14 @@ class TradePlanLoader:
         
         try:
             updated_plan = TradePlan(**plan_data)
+            previous_plan = self._loaded_plans[plan_id]
+            self._reindex_plan(previous_plan, updated_plan)
             self._loaded_plans[plan_id] = updated_plan
+            self._notify_change()
+            if self._diff_listeners:
+                self._emit_diff(
+                    diff_plans({plan_id: previous_plan}, {plan_id: updated_plan})
+                )
             
             logger.info(
                 "Updated plan status",
@@ -218,6 +410,54 @@ class TradePlanLoader:
             logger.error("Failed to update plan status", plan_id=plan_id, error=str(e))
             return False
     
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Register a callback run after loaded plans change.
+        
+        Listeners run on the thread that applied the change (the event loop
+        when file watching was started from one) and must not block.
+        
+        Args:
+            listener: Callback taking no arguments; read plans_version or
+                      query the loader for the new state
+        """
+        self._change_listeners.append(listener)
+    
+    def remove_change_listener(self, listener: Callable[[], None]) -> None:
+        """Unregister a change listener."""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+    
+    def add_diff_listener(self, listener: DiffListener, replay: bool = False) -> None:
+        """
+        Register a callback receiving what each change did to the loaded plans.
+        
+        Called after change listeners, once per full load, reload batch or
+        status update that added, removed or modified plans. Modified plans
+        carry field-level changes, so consumers can act only on what changed.
+        
+        Coroutine functions are scheduled on the running event loop; each
+        listener's coroutines run one at a time, in change order. Changes
+        applied without a running loop are not delivered to them.
+        
+        Args:
+            listener: Callback or coroutine function taking the PlanDiff of one change
+            replay: Also deliver the currently loaded plans as added plans
+        """
+        self._diff_listeners.append(listener)
+        if replay:
+            self._deliver_diff(listener, diff_plans({}, self._loaded_plans))
+    
+    def remove_diff_listener(self, listener: DiffListener) -> None:
+        """Unregister a diff listener."""
+        if listener in self._diff_listeners:
+            self._diff_listeners.remove(listener)
+    
+    async def wait_for_diff_listeners(self) -> None:
+        """Wait until async diff listeners have handled every delivered diff."""
+        while self._diff_tasks:
+            await asyncio.wait(list(self._diff_tasks.values()))
+    
     def get_validation_report(self) -> str:
         """
         Get formatted validation report for all loaded plans.
@@ -228,7 +468,21 @@ class TradePlanLoader:
         return self.reporter.format_summary_report()
     
     def start_file_watching(self) -> None:
-        """Start watching the plans directory for file changes."""
+        """
+        Start watching the plans directory for file changes.
+        
+        Bursts of file events are coalesced and applied as one reload on the
+        running event loop, the same thread every other loader method is
+        called from.
+        
+        Raises:
+            RuntimeError: If called without a running event loop
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise RuntimeError("File watching requires a running event loop") from None
+        
         if self._watching:
             logger.warning("File watching already started")
             return
@@ -237,7 +491,8 @@ class TradePlanLoader:
             logger.warning(f"Cannot watch non-existent directory: {self.plans_directory}")
             return
         
-        self._watcher = TradePlanFileWatcher(self)
+        self._watcher = TradePlanFileWatcher(self, self.reload_coalesce_window)
+        self._watcher.start(loop)
         self._observer = Observer()
         self._observer.schedule(self._watcher, str(self.plans_directory), recursive=False)
         self._observer.start()
@@ -255,11 +510,23 @@ class TradePlanLoader:
             self._observer.join()
             self._observer = None
         
+        if self._watcher:
+            self._watcher.stop()
         self._watcher = None
         self._watching = False
         
         logger.info("Stopped file watching")
     
+    def get_reload_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about reloads triggered by file watching.
+        
+        Returns:
+            Event, batch and latency (first file event to plans applied)
+            metrics, or an empty dict when not watching
+        """
+        return self._watcher.get_metrics() if self._watcher else {}
+    
     def get_loaded_plan_ids(self) -> Set[str]:
         """Get set of all loaded plan IDs."""
         return set(self._loaded_plans.keys())
@@ -271,7 +538,10 @@ class TradePlanLoader:
         Args:
             file_path: Path to file whose cache should be cleared
         """
+        previous_plans = self._plans_from_files([file_path]) if self._diff_listeners else None
         self._remove_plans_from_file(file_path)
+        if previous_plans is not None:
+            self._emit_diff(diff_plans(previous_plans, {}))
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -280,120 +550,365 @@ class TradePlanLoader:
         Returns:
             Dictionary with plan statistics
         """
-        if not self._loaded_plans:
-            return {
-                "total_plans": 0,
-                "by_status": {},
-                "by_symbol": {},
-                "files_loaded": 0,
-            }
-        
-        # Count by status
-        status_counts = {}
-        for plan in self._loaded_plans.values():
-            status = plan.status.value if hasattr(plan.status, 'value') else str(plan.status)
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
-        # Count by symbol
-        symbol_counts = {}
-        for plan in self._loaded_plans.values():
-            symbol = plan.symbol
-            symbol_counts[symbol] = symbol_counts.get(symbol, 0) + 1
-        
         return {
             "total_plans": len(self._loaded_plans),
-            "by_status": status_counts,
-            "by_symbol": symbol_counts,
+            "by_status": {status: len(plans) for status, plans in self._plans_by_status.items()},
+            "by_symbol": {symbol: len(plans) for symbol, plans in self._plans_by_symbol.items()},
             "files_loaded": len(self._file_to_plans),
         }
     
     def _load_file(self, file_path: Path, validate: bool) -> List[TradePlan]:
         """Load plans from a single file."""
         try:
-            # Validate file first
-            result = self.validation_engine.validate_file(file_path)
-            self.reporter.add_result(result, file_path)
+            return self._register_plans(file_path, self._read_file(file_path), validate)
+        except Exception as e:
+            logger.error(f"Failed to load file {file_path}", error=str(e))
+            return []
+    
+    def _read_file(
+        self, file_path: Path, file_read: Optional[PlanFileRead] = None
+    ) -> PlanFileLoad:
+        """
+        Validate a plan file and claim its plan IDs.
+        
+        The file is parsed once; the plans built while validating are the
+        ones registered. Valid files are cached by (path, mtime, size,
+        content hash), and an unchanged file is reused without being parsed
+        as long as none of its plan IDs is already loaded from another file.
+        This updates loader and validation state, so it runs on the loader's
+        thread; reloads pass the file already read and parsed off the loop.
+        
+        Args:
+            file_path: Plan file
+            file_read: The file read by _read_plan_file (read here if omitted)
+        """
+        if file_path.suffix.lower() not in {'.yaml', '.yml'}:
+            return self.validation_engine.load_file(file_path)
+        
+        try:
+            if file_read is None:
+                stat = file_path.stat()
+                mtime_ns, size, content = stat.st_mtime_ns, stat.st_size, None
+            else:
+                mtime_ns, size, content = file_read.mtime_ns, file_read.size, file_read.content
             
-            if not result.is_valid:
-                if validate:
-                    logger.error(
-                        f"Validation failed for {file_path}",
-                        errors=[str(error) for error in result.errors]
-                    )
-                    return []
+            cached = self._file_cache.get(file_path)
+            if cached and (cached.mtime_ns, cached.size) != (mtime_ns, size):
+                # Touched but possibly unchanged; compare content
+                content = content if content is not None else file_path.read_bytes()
+                if hashlib.sha256(content).hexdigest() == cached.content_hash:
+                    cached.mtime_ns, cached.size = mtime_ns, size
+                    self._cache_dirty = True
                 else:
-                    logger.warning(f"Loading file with validation warnings: {file_path}")
+                    cached = None
             
-            # Parse YAML content
-            content = file_path.read_text(encoding='utf-8')
-            parsed_data = yaml.safe_load(content)
+            if cached and self.validation_engine.claim_plan_ids(cached.plan_ids):
+                file_load = self._cached_file_load(file_path, cached)
+                if file_load is not None:
+                    if cached.pool_parsed:
+                        cached.pool_parsed = False
+                        self.files_parsed += 1
+                    else:
+                        self.files_reused += 1
+                    return file_load
+                self.validation_engine.release_plan_ids(cached.plan_ids)
             
-            if parsed_data is None:
-                logger.warning(f"Empty YAML file: {file_path}")
-                return []
-            
-            # Handle single plan or list of plans
-            if isinstance(parsed_data, dict):
-                plans_data = [parsed_data]
-            elif isinstance(parsed_data, list):
-                plans_data = parsed_data
+            if file_read is None:
+                content = content if content is not None else file_path.read_bytes()
+                file_load = self.validation_engine.load_yaml_content(
+                    content.decode('utf-8'), file_path
+                )
+            elif file_read.yaml_error is not None:
+                file_load = self.validation_engine.load_yaml_error(file_read.yaml_error, file_path)
             else:
-                logger.error(f"Invalid YAML structure in {file_path}")
-                return []
-            
-            # Create TradePlan instances
-            loaded_plans = []
-            plan_ids_in_file = set()
-            
-            for plan_data in plans_data:
-                try:
-                    trade_plan = TradePlan(**plan_data)
-                    
-                    # Check for duplicate plan IDs
-                    if trade_plan.plan_id in self._loaded_plans:
-                        logger.warning(
-                            f"Duplicate plan ID '{trade_plan.plan_id}' in {file_path}",
-                            existing_file=str(self._plan_to_file.get(trade_plan.plan_id))
-                        )
-                        continue
-                    
-                    # Store plan
-                    self._loaded_plans[trade_plan.plan_id] = trade_plan
-                    self._plan_to_file[trade_plan.plan_id] = file_path
-                    plan_ids_in_file.add(trade_plan.plan_id)
-                    loaded_plans.append(trade_plan)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to create plan from data in {file_path}", error=str(e))
-                    continue
-            
-            # Track file to plans mapping
-            if plan_ids_in_file:
-                self._file_to_plans[file_path] = plan_ids_in_file
-            
-            logger.info(
-                f"Loaded {len(loaded_plans)} plans from {file_path}",
-                plan_ids=list(plan_ids_in_file)
+                file_load = self.validation_engine.load_plan_data(file_read.parsed_data, file_path)
+        except (OSError, UnicodeDecodeError):
+            # Let the validation engine report the read error
+            self._file_cache.pop(file_path, None)
+            return self.validation_engine.load_file(file_path)
+        
+        self.files_parsed += 1
+        if file_load.result.is_valid:
+            self._file_cache[file_path] = CachedPlanFile(
+                mtime_ns=mtime_ns,
+                size=size,
+                content_hash=hashlib.sha256(content).hexdigest(),
+                plan_ids={plan.plan_id for plan in file_load.plans},
+                file_load=file_load,
             )
-            
-            return loaded_plans
-            
+        else:
+            self._file_cache.pop(file_path, None)
+        self._cache_dirty = True
+        
+        return file_load
+    
+    def _parse_in_pool(self, yaml_files: List[Path], workers: int) -> None:
+        """
+        Parse changed files across worker processes into the file cache.
+        
+        Registration stays serial in the caller: each pre-parsed file is then
+        a cache hit that claims its plan IDs in order, and invalid files or
+        files whose IDs are already taken are validated again in this
+        process, giving the same results and reports as a serial load.
+        """
+        to_parse = []
+        for yaml_file in yaml_files:
+            cached = self._file_cache.get(yaml_file)
+            try:
+                stat = yaml_file.stat()
+            except OSError:
+                continue
+            if cached is None or (cached.mtime_ns, cached.size) != (stat.st_mtime_ns, stat.st_size):
+                to_parse.append(yaml_file)
+        
+        if len(to_parse) < PARALLEL_MIN_FILES:
+            return
+        
+        workers = min(workers, len(to_parse))
+        chunk_size = max(1, len(to_parse) // (workers * 4))
+        try:
+            # Spawn workers: forking would copy the watcher and I/O executor
+            # threads' locks in whatever state they are in
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                entries = list(pool.map(_parse_file_isolated, to_parse, chunksize=chunk_size))
         except Exception as e:
-            logger.error(f"Failed to load file {file_path}", error=str(e))
+            logger.warning("Parallel plan parsing failed; loading serially", error=str(e))
+            return
+        
+        for yaml_file, entry in zip(to_parse, entries):
+            if entry is not None:
+                entry.pool_parsed = True
+                self._file_cache[yaml_file] = entry
+                self._cache_dirty = True
+        
+        logger.info(
+            f"Parsed {len(to_parse)} plan files in {workers} processes",
+            directory=str(self.plans_directory),
+        )
+    
+    def _cached_file_load(self, file_path: Path, cached: CachedPlanFile) -> Optional[PlanFileLoad]:
+        """Get the load result of a cached file, building restored plans on first use."""
+        if cached.file_load is None:
+            try:
+                plans = [TradePlan.model_validate(dump) for dump in cached.plan_dumps or []]
+            except Exception as e:
+                logger.warning(f"Discarding cached plans for {file_path}", error=str(e))
+                del self._file_cache[file_path]
+                return None
+            cached.file_load = PlanFileLoad(
+                ValidationResult(
+                    is_valid=True,
+                    plan_id=plans[0].plan_id if plans else None,
+                ),
+                plans_data=cached.plan_dumps,
+                plans=plans,
+            )
+            cached.plan_dumps = None
+        return cached.file_load
+    
+    def _load_persisted_cache(self) -> None:
+        """Load the parsed-file cache written by an earlier process."""
+        self._cache_loaded = True
+        if not self._cache_file.exists():
+            return
+        
+        try:
+            data = json.loads(self._cache_file.read_text(encoding='utf-8'))
+            if data.get("version") != PLAN_CACHE_VERSION:
+                return
+            for name, entry in data["files"].items():
+                self._file_cache[self.plans_directory / name] = CachedPlanFile(
+                    mtime_ns=entry["mtime_ns"],
+                    size=entry["size"],
+                    content_hash=entry["sha256"],
+                    plan_ids=set(entry["plan_ids"]),
+                    plan_dumps=entry["plans"],
+                )
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable plan cache {self._cache_file}", error=str(e))
+            self._file_cache.clear()
+    
+    def _save_persisted_cache(self) -> None:
+        """Write the parsed-file cache for later processes."""
+        files = {}
+        for file_path, cached in self._file_cache.items():
+            if cached.file_load is not None:
+                plan_dumps = [plan.model_dump(mode="json") for plan in cached.file_load.plans]
+            else:
+                plan_dumps = cached.plan_dumps
+            files[file_path.name] = {
+                "mtime_ns": cached.mtime_ns,
+                "size": cached.size,
+                "sha256": cached.content_hash,
+                "plan_ids": sorted(cached.plan_ids),
+                "plans": plan_dumps,
+            }
+        
+        temp_file = self._cache_file.with_suffix(".tmp")
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file.write_text(
+                json.dumps({"version": PLAN_CACHE_VERSION, "files": files}),
+                encoding='utf-8',
+            )
+            temp_file.replace(self._cache_file)
+            self._cache_dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to write plan cache {self._cache_file}", error=str(e))
+    
+    def _register_plans(
+        self,
+        file_path: Path,
+        file_load: PlanFileLoad,
+        validate: bool,
+    ) -> List[TradePlan]:
+        """Record validation results and store the plans parsed from a file."""
+        result = file_load.result
+        plans_data = file_load.plans_data
+        self.reporter.add_result(result, file_path)
+        
+        if not result.is_valid:
+            if validate:
+                logger.error(
+                    f"Validation failed for {file_path}",
+                    errors=[str(error) for error in result.errors]
+                )
+                return []
+            else:
+                logger.warning(f"Loading file with validation warnings: {file_path}")
+        
+        if plans_data is None:
+            logger.warning(f"Empty YAML file: {file_path}")
+            return []
+        
+        if not isinstance(plans_data, list):
+            logger.error(f"Invalid YAML structure in {file_path}")
             return []
+        
+        # Use the TradePlan instances built during validation
+        loaded_plans = []
+        plan_ids_in_file = set()
+        
+        for index, plan_data in enumerate(plans_data):
+            try:
+                trade_plan = file_load.plans[index] if index < len(file_load.plans) else None
+                if trade_plan is None:
+                    # Plan failed validation and validation is not enforced
+                    trade_plan = TradePlan(**plan_data)
+                
+                # Check for duplicate plan IDs
+                if trade_plan.plan_id in self._loaded_plans:
+                    logger.warning(
+                        f"Duplicate plan ID '{trade_plan.plan_id}' in {file_path}",
+                        existing_file=str(self._plan_to_file.get(trade_plan.plan_id))
+                    )
+                    continue
+                
+                # Store plan
+                self._loaded_plans[trade_plan.plan_id] = trade_plan
+                self._index_plan(trade_plan)
+                self._plan_to_file[trade_plan.plan_id] = file_path
+                plan_ids_in_file.add(trade_plan.plan_id)
+                loaded_plans.append(trade_plan)
+                
+            except Exception as e:
+                logger.error(f"Failed to create plan from data in {file_path}", error=str(e))
+                continue
+        
+        # Track file to plans mapping
+        if plan_ids_in_file:
+            self._file_to_plans[file_path] = plan_ids_in_file
+            self._notify_change()
+        
+        logger.info(
+            f"Loaded {len(loaded_plans)} plans from {file_path}",
+            plan_ids=list(plan_ids_in_file)
+        )
+        
+        return loaded_plans
+    
+    async def _apply_file_changes(self, changes: List[FileChange]) -> None:
+        """Apply a coalesced batch of watched file changes (called by file watcher)."""
+        deleted = [c.path for c in changes if c.event_type == FileWatchEventType.DELETED]
+        changed = [c.path for c in changes if c.event_type != FileWatchEventType.DELETED]
+        logger.info(
+            "Applying trade plan file changes",
+            changed=[str(path) for path in changed],
+            deleted=[str(path) for path in deleted],
+            events=sum(c.event_count for c in changes),
+        )
+        await self._reload_files(changed, deleted)
     
     async def _reload_file(self, file_path: Path) -> None:
-        """Reload a specific file (called by file watcher)."""
-        logger.info(f"Reloading file: {file_path}")
+        """Reload a specific file."""
+        await self._reload_files([file_path], [])
+    
+    async def _reload_files(self, changed: List[Path], deleted: List[Path]) -> None:
+        """
+        Reload changed files and drop deleted ones as one transaction.
         
-        # Remove existing plans from this file
-        self._remove_plans_from_file(file_path)
+        Files are read and parsed off the event loop; change listeners are
+        notified once, after every file of the batch has been applied.
+        """
+        changed = sorted(changed)
         
-        # Reload the file
-        try:
-            self._load_file(file_path, validate=True)
-        except Exception as e:
-            logger.error(f"Failed to reload file {file_path}", error=str(e))
+        # Reloads of the same loader run one at a time so file reads and
+        # plan registration stay in event order
+        async with self._reload_lock:
+            previous_plans = (
+                self._plans_from_files(changed + deleted) if self._diff_listeners else None
+            )
+            self._notifications_suspended = True
+            try:
+                # Remove existing plans first so their IDs are free again
+                for file_path in changed + deleted:
+                    self._remove_plans_from_file(file_path)
+                
+                if not changed:
+                    return
+                try:
+                    file_reads = await self._io.run(
+                        "plan_loader.reload_file", self._read_plan_files, changed
+                    )
+                except Exception as e:
+                    logger.error(
+                        "Failed to reload files", files=[str(p) for p in changed], error=str(e)
+                    )
+                    return
+                
+                # Validation claims plan IDs, so it runs here on the loop
+                for file_path, file_read in zip(changed, file_reads):
+                    try:
+                        if file_read is None:
+                            # Unreadable; let the validation engine report why
+                            self._file_cache.pop(file_path, None)
+                            file_load = self.validation_engine.load_file(file_path)
+                        else:
+                            file_load = self._read_file(file_path, file_read)
+                        self._register_plans(file_path, file_load, validate=True)
+                    except Exception as e:
+                        logger.error(f"Failed to reload file {file_path}", error=str(e))
+            finally:
+                self._notifications_suspended = False
+                self._notify_change()
+                if previous_plans is not None:
+                    self._emit_diff(diff_plans(previous_plans, self._plans_from_files(changed)))
+    
+    def _plans_from_files(self, file_paths: List[Path]) -> Dict[str, TradePlan]:
+        """Get the loaded plans registered from the given files."""
+        return {
+            plan_id: self._loaded_plans[plan_id]
+            for file_path in file_paths
+            for plan_id in self._file_to_plans.get(file_path, ())
+            if plan_id in self._loaded_plans
+        }
+    
+    @staticmethod
+    def _read_plan_files(file_paths: List[Path]) -> List[Optional[PlanFileRead]]:
+        """Read and parse a batch of plan files (runs on the I/O executor)."""
+        return [_read_plan_file(file_path) for file_path in file_paths]
     
     def _remove_plans_from_file(self, file_path: Path) -> None:
         """Remove all plans that came from a specific file."""
@@ -404,11 +919,15 @@ class TradePlanLoader:
         
         for plan_id in plan_ids_to_remove:
             if plan_id in self._loaded_plans:
-                del self._loaded_plans[plan_id]
+                self._unindex_plan(self._loaded_plans.pop(plan_id))
             if plan_id in self._plan_to_file:
                 del self._plan_to_file[plan_id]
         
         del self._file_to_plans[file_path]
+        # Free the IDs for duplicate checks too, or reloading the file would
+        # reject its own plans as duplicates
+        self.validation_engine.release_plan_ids(plan_ids_to_remove)
+        self._notify_change()
         
         logger.info(
             f"Removed {len(plan_ids_to_remove)} plans from {file_path}",
@@ -427,9 +946,110 @@ class TradePlanLoader:
             reason="File persistence not implemented"
         )
     
+    def _notify_change(self) -> None:
+        """Bump the plans version and run change listeners."""
+        self.plans_version += 1
+        if self._notifications_suspended:
+            return
+        for listener in list(self._change_listeners):
+            try:
+                listener()
+            except Exception as e:
+                logger.error("Plan change listener failed", error=str(e))
+    
+    def _emit_diff(self, diff: PlanDiff) -> None:
+        """Hand a non-empty plan diff to diff listeners."""
+        if diff.is_empty:
+            return
+        logger.debug("Trade plans changed", **diff.summary())
+        for listener in list(self._diff_listeners):
+            self._deliver_diff(listener, diff)
+    
+    def _deliver_diff(self, listener: DiffListener, diff: PlanDiff) -> None:
+        """Call one diff listener, scheduling the coroutine of an async one."""
+        if diff.is_empty:
+            return
+        try:
+            result = listener(diff)
+        except Exception as e:
+            logger.error("Plan diff listener failed", error=str(e))
+            return
+        if not inspect.isawaitable(result):
+            return
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            if inspect.iscoroutine(result):
+                result.close()
+            logger.error(
+                "Async plan diff listener needs a running event loop", **diff.summary()
+            )
+            return
+        
+        task = loop.create_task(
+            self._run_diff_listener(self._diff_tasks.get(listener), result)
+        )
+        self._diff_tasks[listener] = task
+        task.add_done_callback(lambda done: self._diff_task_done(listener, done))
+    
+    @staticmethod
+    async def _run_diff_listener(
+        previous: Optional[asyncio.Task], result: Awaitable[None]
+    ) -> None:
+        """Await an async diff listener after its previous diff was handled."""
+        if previous is not None:
+            await asyncio.wait([previous])
+        try:
+            await result
+        except Exception as e:
+            logger.error("Plan diff listener failed", error=str(e))
+    
+    def _diff_task_done(self, listener: DiffListener, task: asyncio.Task) -> None:
+        """Forget a listener's task once its latest diff has been handled."""
+        if self._diff_tasks.get(listener) is task:
+            del self._diff_tasks[listener]
+    
+    @staticmethod
+    def _status_key(status: Any) -> str:
+        """Index key of a plan status."""
+        return status.value if hasattr(status, 'value') else str(status)
+    
+    def _index_plan(self, plan: TradePlan) -> None:
+        """Add a loaded plan to the status and symbol indexes."""
+        self._plans_by_status.setdefault(self._status_key(plan.status), {})[plan.plan_id] = plan
+        self._plans_by_symbol.setdefault(plan.symbol, {})[plan.plan_id] = plan
+    
+    def _unindex_plan(self, plan: TradePlan) -> None:
+        """Remove a plan from the status and symbol indexes, dropping empty buckets."""
+        for index, key in (
+            (self._plans_by_status, self._status_key(plan.status)),
+            (self._plans_by_symbol, plan.symbol),
+        ):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(plan.plan_id, None)
+                if not bucket:
+                    del index[key]
+    
+    def _reindex_plan(self, old_plan: TradePlan, new_plan: TradePlan) -> None:
+        """Replace a plan in the indexes, keeping its position where keys are unchanged."""
+        for index, old_key, new_key in (
+            (self._plans_by_status, self._status_key(old_plan.status), self._status_key(new_plan.status)),
+            (self._plans_by_symbol, old_plan.symbol, new_plan.symbol),
+        ):
+            if old_key != new_key:
+                bucket = index.get(old_key, {})
+                bucket.pop(old_plan.plan_id, None)
+                if not bucket:
+                    index.pop(old_key, None)
+            index.setdefault(new_key, {})[new_plan.plan_id] = new_plan
+    
     def _clear_loaded_plans(self) -> None:
         """Clear all loaded plans and mappings."""
         self._loaded_plans.clear()
+        self._plans_by_status.clear()
+        self._plans_by_symbol.clear()
         self._file_to_plans.clear()
         self._plan_to_file.clear()
         self.validation_engine.reset_plan_ids()
@@ -3,14 +3,189 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import yaml
 
 from loguru import logger
 
 from .trade_plan import TradePlan
-from .validation_engine import ValidationEngine
+from .validation_engine import ValidationEngine, parse_yaml
+
+
+# "key: placeholder" on a template value line; the placeholder values are
+# replaced by the substitution of the same key
+_SLOT_PATTERN = re.compile(
+    r'^(?P<prefix>.*?)(?<![\w])(?P<key>\w+): '
+    r'(?P<placeholder>"SYMBOL_YYYYMMDD_001"|"SYMBOL"|"normal"|0\.00)'
+    r'(?P<suffix>(?![\w.]).*)$'
+)
+# Entry thresholds are replaced whatever their template value
+_THRESHOLD_PATTERN = re.compile(
+    r'^(?P<prefix>.*?)(?<![\w])(?P<key>threshold): (?P<placeholder>[\d.]+)(?P<suffix>.*)$'
+)
+
+# Fields a template must define
+TEMPLATE_REQUIRED_PATTERNS = [
+    r'plan_id:',
+    r'symbol:',
+    r'entry_level:',
+    r'stop_loss:',
+    r'take_profit:',
+    r'risk_category:',
+    r'entry_function:',
+    r'exit_function:',
+]
+
+# Path of a value in the parsed template, as dict keys
+SlotPath = Tuple[str, ...]
+
+
+@dataclass
+class CompiledTemplate:
+    """
+    A template read and parsed once, with its substitution slots located.
+
+    Instantiating from the compiled form touches neither the filesystem nor
+    the YAML parser: ``render`` fills the line slots of the original text,
+    ``build_data`` fills the value slots of a copy of the parsed structure.
+    """
+
+    name: str
+    path: Path
+    mtime_ns: int
+    content: str
+    # Template lines; a slot line is (prefix, key, placeholder, suffix),
+    # others are kept as text
+    lines: List[Any] = field(default_factory=list)
+    # Parsed template, None if it is not valid YAML
+    parsed: Any = None
+    yaml_error: Optional[str] = None
+    # Key -> paths of its placeholder values in the parsed template
+    value_slots: Dict[str, List[SlotPath]] = field(default_factory=dict)
+    missing_fields: List[str] = field(default_factory=list)
+
+    @classmethod
+    def compile(cls, name: str, path: Path, content: str, mtime_ns: int) -> CompiledTemplate:
+        """
+        Compile template text.
+
+        Args:
+            name: Template name
+            path: Template file
+            content: Template text
+            mtime_ns: Modification time the text was read at
+
+        Returns:
+            Compiled template
+        """
+        compiled = cls(name=name, path=path, mtime_ns=mtime_ns, content=content)
+        placeholders: Dict[str, set] = {}
+
+        for line in content.split('\n'):
+            match = None
+            if not line.strip().startswith('#'):
+                match = _SLOT_PATTERN.match(line) or _THRESHOLD_PATTERN.match(line)
+            if match is None:
+                compiled.lines.append(line)
+                continue
+            key = match.group("key")
+            placeholder = match.group("placeholder")
+            compiled.lines.append((match.group("prefix"), key, placeholder, match.group("suffix")))
+            placeholders.setdefault(key, set()).add(parse_yaml(placeholder))
+
+        compiled.missing_fields = [
+            pattern for pattern in TEMPLATE_REQUIRED_PATTERNS if not re.search(pattern, content)
+        ]
+        try:
+            compiled.parsed = parse_yaml(content)
+        except yaml.YAMLError as e:
+            compiled.yaml_error = str(e)
+        else:
+            compiled._locate_value_slots(compiled.parsed, (), placeholders)
+        return compiled
+
+    def _locate_value_slots(
+        self, node: Any, path: SlotPath, placeholders: Dict[str, set]
+    ) -> None:
+        """Record paths of parsed values that came from slot lines."""
+        if not isinstance(node, dict):
+            return
+        for key, value in node.items():
+            if isinstance(value, dict):
+                self._locate_value_slots(value, path + (key,), placeholders)
+            elif key in placeholders and value in placeholders[key]:
+                self.value_slots.setdefault(key, []).append(path + (key,))
+
+    def render(self, substitutions: Dict[str, Any]) -> str:
+        """
+        Fill the template text.
+
+        Args:
+            substitutions: Values by field key; strings are written quoted
+
+        Returns:
+            Template text with each slot of a substituted key replaced
+        """
+        rendered = []
+        for line in self.lines:
+            if isinstance(line, str):
+                rendered.append(line)
+                continue
+            prefix, key, placeholder, suffix = line
+            if key not in substitutions:
+                rendered.append(f"{prefix}{key}: {placeholder}{suffix}")
+                continue
+            value = substitutions[key]
+            if isinstance(value, str):
+                rendered.append(f'{prefix}{key}: "{value}"{suffix}')
+            else:
+                rendered.append(f"{prefix}{key}: {value}{suffix}")
+        return '\n'.join(rendered)
+
+    def build_data(self, substitutions: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fill a copy of the parsed template.
+
+        Args:
+            substitutions: Values by field key
+
+        Returns:
+            Plan data as parsing the rendered text would give
+
+        Raises:
+            ValueError: If the template is not valid YAML
+        """
+        if self.yaml_error is not None or not isinstance(self.parsed, dict):
+            raise ValueError(f"Template '{self.name}' is not a valid plan template")
+        data = _copy_containers(self.parsed)
+        for key, paths in self.value_slots.items():
+            if key not in substitutions:
+                continue
+            value = _yaml_value(substitutions[key])
+            for path in paths:
+                target = data
+                for step in path[:-1]:
+                    target = target[step]
+                target[path[-1]] = value
+        return data
+
+
+def _copy_containers(node: Any) -> Any:
+    """Copy nested dicts and lists, sharing the scalar leaves."""
+    if isinstance(node, dict):
+        return {key: _copy_containers(value) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_copy_containers(value) for value in node]
+    return node
+
+
+def _yaml_value(value: Any) -> Any:
+    """Get the value YAML would read back for a substitution written into the text."""
+    if isinstance(value, (str, bool, int, float)) or value is None:
+        return value
+    return parse_yaml(str(value))
 
 
 class TemplateManager:
@@ -31,6 +206,11 @@ class TemplateManager:
         
         self.templates_dir = Path(templates_dir)
         self._validation_engine = ValidationEngine()
+        
+        # Compiled templates by name, valid while the file keeps its mtime
+        self._compiled: Dict[str, CompiledTemplate] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
     
     def list_available_templates(self) -> Dict[str, Path]:
         """
@@ -70,6 +250,37 @@ class TemplateManager:
             FileNotFoundError: If template doesn't exist
             PermissionError: If template can't be read
         """
+        return self.get_compiled_template(template_name).content
+    
+    def get_compiled_template(self, template_name: str) -> CompiledTemplate:
+        """
+        Get a template compiled for instantiation.
+        
+        A cached template is reused while its file keeps the modification
+        time it was read at, costing one stat; the templates directory is
+        only listed for templates not yet compiled.
+        
+        Args:
+            template_name: Name of template (without extension)
+            
+        Returns:
+            Compiled template
+            
+        Raises:
+            FileNotFoundError: If template doesn't exist
+            PermissionError: If template can't be read
+        """
+        compiled = self._compiled.get(template_name)
+        if compiled is not None:
+            try:
+                mtime_ns = compiled.path.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            if mtime_ns == compiled.mtime_ns:
+                self._cache_hits += 1
+                return compiled
+            del self._compiled[template_name]
+        
         templates = self.list_available_templates()
         
         if template_name not in templates:
@@ -82,12 +293,36 @@ class TemplateManager:
         template_path = templates[template_name]
         
         try:
+            # Stat before reading so a write during the read is seen next time
+            mtime_ns = template_path.stat().st_mtime_ns
             content = template_path.read_text(encoding='utf-8')
-            logger.info(f"Loaded template '{template_name}'", path=str(template_path))
-            return content
         except Exception as e:
             logger.error(f"Failed to load template '{template_name}'", error=str(e))
             raise
+        
+        compiled = CompiledTemplate.compile(template_name, template_path, content, mtime_ns)
+        self._compiled[template_name] = compiled
+        self._cache_misses += 1
+        logger.info(f"Loaded template '{template_name}'", path=str(template_path))
+        return compiled
+    
+    def clear_template_cache(self) -> None:
+        """Drop all compiled templates."""
+        self._compiled.clear()
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        Get compiled template cache statistics.
+        
+        Returns:
+            Cached template count, and lookups served from and compiled into
+            the cache
+        """
+        return {
+            "cached_templates": len(self._compiled),
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+        }
     
     def get_template_documentation(self, template_name: str) -> Dict[str, Any]:
         """
@@ -185,10 +420,10 @@ class TemplateManager:
         Raises:
             ValueError: If validation fails or substitutions are invalid
         """
-        content = self.load_template(template_name)
+        compiled = self.get_compiled_template(template_name)
         
         # Perform substitutions
-        customized_content = self._apply_substitutions(content, substitutions)
+        customized_content = compiled.render(substitutions)
         
         # Validate if requested
         if validate:
@@ -225,67 +460,60 @@ class TemplateManager:
         Raises:
             ValueError: If plan data is invalid
         """
-        # Customize template
-        customized_content = self.customize_template(template_name, plan_data, validate=True)
+        return self._create_plans(self.get_compiled_template(template_name), [plan_data], output_file)[0]
+    
+    def create_plans_from_template(
+        self,
+        template_name: str,
+        plans_data: Iterable[Dict[str, Any]],
+    ) -> List[TradePlan]:
+        """
+        Create many trade plans from one template.
         
-        # Parse the YAML
-        parsed_data = yaml.safe_load(customized_content)
+        The template is compiled (or its cache entry checked) once; each
+        plan is instantiated in memory from the compiled form and all plans
+        are validated together.
+        
+        Args:
+            template_name: Template to use as base
+            plans_data: Data to populate in the template, one dict per plan
+            
+        Returns:
+            Validated TradePlan instances, in input order
+            
+        Raises:
+            ValueError: If any plan's data is invalid; no plans are returned
+        """
+        return self._create_plans(self.get_compiled_template(template_name), plans_data)
+    
+    def _create_plans(
+        self,
+        compiled: CompiledTemplate,
+        plans_data: Iterable[Dict[str, Any]],
+        output_file: Optional[Path] = None,
+    ) -> List[TradePlan]:
+        """Instantiate and validate plans from a compiled template, optionally saving the first."""
+        plans_data = list(plans_data)
+        built = self._validation_engine.load_plan_data(
+            [compiled.build_data(plan_data) for plan_data in plans_data]
+        )
+        if not built.result.is_valid:
+            error_summary = built.result.get_error_summary()
+            raise ValueError(f"Template customization failed validation:\n{error_summary}")
         
-        # Create TradePlan instance
-        trade_plan = TradePlan(**parsed_data)
+        trade_plans = built.plans
         
         # Save to file if requested
         if output_file:
             output_file.parent.mkdir(parents=True, exist_ok=True)
-            output_file.write_text(customized_content, encoding='utf-8')
-            logger.info(f"Saved trade plan to {output_file}", plan_id=trade_plan.plan_id)
-        
-        return trade_plan
-    
-    def _apply_substitutions(self, content: str, substitutions: Dict[str, Any]) -> str:
-        """Apply value substitutions to template content."""
-        lines = content.split('\n')
-        result_lines = []
-        
-        for line in lines:
-            # Skip comment lines
-            if line.strip().startswith('#'):
-                result_lines.append(line)
-                continue
-            
-            # Process YAML value lines
-            processed_line = line
-            for key, value in substitutions.items():
-                # Handle various substitution patterns
-                patterns = [
-                    f'{key}: "SYMBOL_YYYYMMDD_001"',  # plan_id pattern
-                    f'{key}: "SYMBOL"',               # symbol pattern
-                    f'{key}: 0.00',                   # price pattern
-                    f'{key}: "normal"',               # category pattern
-                    'threshold: 0.00',               # parameter pattern
-                ]
-                
-                for pattern in patterns:
-                    if pattern in processed_line:
-                        if isinstance(value, str):
-                            replacement = f'{key}: "{value}"'
-                        else:
-                            replacement = f'{key}: {value}'
-                        
-                        processed_line = processed_line.replace(pattern, replacement)
-                        break
-                
-                # Handle parameter substitutions
-                if 'threshold:' in processed_line and key == 'threshold':
-                    processed_line = re.sub(
-                        r'threshold: [\d.]+',
-                        f'threshold: {value}',
-                        processed_line
-                    )
-            
-            result_lines.append(processed_line)
+            output_file.write_text(compiled.render(plans_data[0]), encoding='utf-8')
+            logger.info(f"Saved trade plan to {output_file}", plan_id=trade_plans[0].plan_id)
         
-        return '\n'.join(result_lines)
+        logger.info(
+            f"Created {len(trade_plans)} plans from template '{compiled.name}'",
+            plan_count=len(trade_plans),
+        )
+        return trade_plans
     
     def validate_template(self, template_name: str) -> bool:
         """
@@ -298,35 +526,21 @@ class TemplateManager:
             True if template is valid, False otherwise
         """
         try:
-            content = self.load_template(template_name)
+            compiled = self.get_compiled_template(template_name)
             
             # Check for required sections
-            required_patterns = [
-                r'plan_id:',
-                r'symbol:',
-                r'entry_level:',
-                r'stop_loss:',
-                r'take_profit:',
-                r'risk_category:',
-                r'entry_function:',
-                r'exit_function:',
-            ]
-            
-            for pattern in required_patterns:
-                if not re.search(pattern, content):
-                    logger.warning(
-                        f"Template '{template_name}' missing required field",
-                        pattern=pattern
-                    )
-                    return False
+            for pattern in compiled.missing_fields:
+                logger.warning(
+                    f"Template '{template_name}' missing required field",
+                    pattern=pattern
+                )
+                return False
             
-            # Try to parse as YAML (with placeholder values)
-            try:
-                yaml.safe_load(content)
-            except yaml.YAMLError as e:
+            # Parsed once when compiled (with placeholder values)
+            if compiled.yaml_error is not None:
                 logger.warning(
                     f"Template '{template_name}' has YAML syntax issues",
-                    error=str(e)
+                    error=compiled.yaml_error
                 )
                 return False
             
@@ -0,0 +1,122 @@
+"""Tests for structured plan diffs and market data key tracking."""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from auto_trader.models.plan_diff import PlanDiff, PlanKeyIndex, diff_plans
+
+
+class TestDiffPlans:
+    """Test plan comparison."""
+
+    def test_added_removed_and_unchanged(self, make_plan):
+        """Test plans are classified by ID and identical plans are skipped."""
+        kept = make_plan("KEEP_20250815_001")
+        old = {"OLD_20250815_001": make_plan("OLD_20250815_001"), kept.plan_id: kept}
+        new = {
+            "NEW_20250815_001": make_plan("NEW_20250815_001", symbol="MSFT"),
+            kept.plan_id: make_plan(
+                "KEEP_20250815_001", created_at=datetime.utcnow() + timedelta(hours=1)
+            ),
+        }
+
+        diff = diff_plans(old, new)
+
+        assert list(diff.added) == ["NEW_20250815_001"]
+        assert list(diff.removed) == ["OLD_20250815_001"]
+        assert diff.modified == {}
+        assert diff.affected_symbols() == {"AAPL", "MSFT"}
+        assert diff_plans(new, new).is_empty
+
+    def test_field_level_changes(self, make_plan):
+        """Test modified plans list changed fields, nested ones by dotted path."""
+        old = make_plan()
+        new = make_plan(
+            take_profit=Decimal("186.00"),
+            entry_function={
+                "function_type": "close_above",
+                "timeframe": "15min",
+                "parameters": {"threshold": 181.00},
+            },
+        )
+
+        modification = diff_plans({old.plan_id: old}, {new.plan_id: new}).modified[old.plan_id]
+
+        assert modification.changes == {
+            "take_profit": (Decimal("185.00"), Decimal("186.00")),
+            "entry_function.parameters.threshold": (180.50, 181.00),
+        }
+        assert modification.market_data_changed is False
+
+
+class TestPlanKeyIndex:
+    """Test reference counting of market data keys."""
+
+    def apply(self, index, old, new):
+        """Apply the diff between two plan lists."""
+        return index.apply(
+            diff_plans({p.plan_id: p for p in old}, {p.plan_id: p for p in new})
+        )
+
+    def test_shared_keys_released_with_last_plan(self, make_plan):
+        """Test a key stays needed while any plan uses it."""
+        index = PlanKeyIndex()
+        first = make_plan("AAPL_20250815_001")
+        second = make_plan("AAPL_20250815_002")
+
+        assert self.apply(index, [], [first, second]) == (
+            {("AAPL", "15min"), ("AAPL", "1min")},
+            set(),
+        )
+        assert self.apply(index, [first, second], [second]) == (set(), set())
+        assert self.apply(index, [second], []) == (
+            set(),
+            {("AAPL", "15min"), ("AAPL", "1min")},
+        )
+        assert index.keys() == set()
+
+    def test_price_change_touches_nothing(self, make_plan):
+        """Test modifications that keep symbol, timeframes and status are free."""
+        index = PlanKeyIndex()
+        plan = make_plan()
+        self.apply(index, [], [plan])
+
+        assert self.apply(index, [plan], [make_plan(stop_loss=Decimal("177.00"))]) == (
+            set(),
+            set(),
+        )
+
+    @pytest.mark.parametrize(
+        "overrides, acquired, released",
+        [
+            (
+                {"exit_function": {"function_type": "stop_loss_take_profit", "timeframe": "1h"}},
+                {("AAPL", "1hour")},
+                {("AAPL", "1min")},
+            ),
+            (
+                {"exit_function": {"function_type": "stop_loss_take_profit", "timeframe": "1440h"}},
+                {("AAPL", "1day")},
+                {("AAPL", "1min")},
+            ),
+            ({"status": "completed"}, set(), {("AAPL", "15min"), ("AAPL", "1min")}),
+            (
+                {"symbol": "MSFT"},
+                {("MSFT", "15min"), ("MSFT", "1min")},
+                {("AAPL", "15min"), ("AAPL", "1min")},
+            ),
+        ],
+    )
+    def test_market_data_changes(self, make_plan, overrides, acquired, released):
+        """Test timeframe, status and symbol changes move only the affected keys."""
+        index = PlanKeyIndex()
+        plan = make_plan()
+        self.apply(index, [], [plan])
+
+        assert self.apply(index, [plan], [make_plan(**overrides)]) == (acquired, released)
+
+    def test_empty_diff(self):
+        """Test an empty diff changes nothing."""
+        assert PlanKeyIndex().apply(PlanDiff()) == (set(), set())
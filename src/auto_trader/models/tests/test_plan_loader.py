@@ -1,12 +1,21 @@
 """Unit tests for trade plan loader."""
 
+import asyncio
+import os
 import pytest
 import tempfile
+import threading
+import time
 from pathlib import Path
 from decimal import Decimal
+from unittest.mock import patch
 
-from auto_trader.models.plan_loader import TradePlanLoader
+import yaml
+
+from auto_trader.io_executor import IOExecutor
+from auto_trader.models.plan_loader import TradePlanLoader, plan_cache_path
 from auto_trader.models.trade_plan import TradePlan, TradePlanStatus
+from auto_trader.models.validation_engine import parse_yaml
 
 
 class TestTradePlanLoader:
@@ -298,6 +307,127 @@ exit_function:
         # The symbol could be either AAPL or TSLA depending on file load order
         assert aapl_plans[0].symbol in ["AAPL", "TSLA"]
     
+    async def test_reload_file_reads_off_loop(self, temp_plans_dir):
+        """Test reloading a modified file replaces its plans via the I/O executor."""
+        executor = IOExecutor(max_workers=1)
+        loader = TradePlanLoader(temp_plans_dir, io_executor=executor)
+        loader.load_all_plans()
+        single_plan_file = temp_plans_dir / "single_plan.yaml"
+        single_plan_file.write_text(
+            single_plan_file.read_text().replace("185.00", "186.00")
+        )
+        
+        validation_threads = []
+        load_plan_data = loader.validation_engine.load_plan_data
+        
+        def record_thread(*args, **kwargs):
+            validation_threads.append(threading.current_thread())
+            return load_plan_data(*args, **kwargs)
+        
+        with patch.object(loader.validation_engine, "load_plan_data", side_effect=record_thread):
+            await loader._reload_file(single_plan_file)
+        
+        assert loader.get_plan("AAPL_20250815_001").take_profit == Decimal("186.00")
+        assert executor.get_metrics()["plan_loader.reload_file"]["calls"] == 1
+        # Only reading and parsing run on the executor; validation claims
+        # plan IDs and stays on the loop thread
+        assert validation_threads == [threading.current_thread()]
+        executor.shutdown()
+    
+    async def test_reload_releases_own_plan_ids(self, temp_plans_dir):
+        """Test a reloaded file keeps its plan IDs while other files still cannot reuse them."""
+        loader = TradePlanLoader(temp_plans_dir)
+        loader.load_all_plans()
+        single_plan_file = temp_plans_dir / "single_plan.yaml"
+        duplicate_file = temp_plans_dir / "duplicate.yaml"
+        duplicate_file.write_text(single_plan_file.read_text())
+        single_plan_file.write_text(
+            single_plan_file.read_text().replace("185.00", "186.00")
+        )
+        
+        await loader._reload_file(single_plan_file)
+        await loader._reload_file(duplicate_file)
+        
+        assert loader.get_plan("AAPL_20250815_001").take_profit == Decimal("186.00")
+        assert loader.get_plan_file("AAPL_20250815_001") == single_plan_file
+        assert duplicate_file not in loader._file_to_plans
+    
+    async def test_diff_listeners_receive_field_changes(self, temp_plans_dir):
+        """Test loads, reloads and status updates report only what changed."""
+        loader = TradePlanLoader(temp_plans_dir)
+        diffs = []
+        loader.add_diff_listener(diffs.append)
+        loader.load_all_plans()
+        assert "AAPL_20250815_001" in diffs[0].added
+        assert not diffs[0].removed and not diffs[0].modified
+        
+        multiple_plans_file = temp_plans_dir / "multiple_plans.yaml"
+        multiple_plans_file.write_text(
+            multiple_plans_file.read_text().replace("310.00", "312.00")
+        )
+        await loader._reload_file(multiple_plans_file)
+        
+        assert not diffs[1].added and not diffs[1].removed
+        assert list(diffs[1].modified) == ["MSFT_20250815_001"]
+        assert diffs[1].modified["MSFT_20250815_001"].changes == {
+            "take_profit": (Decimal("310.00"), Decimal("312.00"))
+        }
+        
+        loader.update_plan_status("AAPL_20250815_001", TradePlanStatus.COMPLETED)
+        assert diffs[2].modified["AAPL_20250815_001"].changes == {
+            "status": ("awaiting_entry", "completed")
+        }
+        
+        # Status updates live in memory only, so a full reload reverts it
+        loader.load_all_plans()
+        assert list(diffs[3].modified) == ["AAPL_20250815_001"]
+        loader.load_all_plans()
+        assert len(diffs) == 4
+        
+        loader.clear_cache_for_file(multiple_plans_file)
+        assert set(diffs[4].removed) == {"MSFT_20250815_001", "GOOGL_20250815_001"}
+    
+    async def test_async_diff_listeners_run_in_order(self, temp_plans_dir):
+        """Test coroutine listeners get a replay, then each diff one at a time."""
+        loader = TradePlanLoader(temp_plans_dir)
+        loader.load_all_plans()
+        handled = []
+        running = []
+        
+        async def listener(diff):
+            running.append(diff)
+            assert len(running) == 1
+            await asyncio.sleep(0.01)
+            handled.append(diff)
+            running.remove(diff)
+        
+        loader.add_diff_listener(listener, replay=True)
+        loader.update_plan_status("AAPL_20250815_001", TradePlanStatus.COMPLETED)
+        loader.update_plan_status("AAPL_20250815_001", TradePlanStatus.CANCELLED)
+        assert handled == []
+        
+        await loader.wait_for_diff_listeners()
+        
+        assert "AAPL_20250815_001" in handled[0].added
+        assert [d.modified["AAPL_20250815_001"].new.status for d in handled[1:]] == [
+            "completed", "cancelled"
+        ]
+        assert loader._diff_tasks == {}
+    
+    def test_async_diff_listener_without_loop_is_skipped(self, temp_plans_dir):
+        """Test coroutine listeners are not run when no event loop is running."""
+        loader = TradePlanLoader(temp_plans_dir)
+        handled = []
+        
+        async def listener(diff):
+            handled.append(diff)
+        
+        loader.add_diff_listener(listener)
+        loader.load_all_plans()
+        
+        assert handled == []
+        assert loader._diff_tasks == {}
+    
     def test_load_empty_directory(self):
         """Test loading from empty directory."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -334,7 +464,7 @@ class TestTradePlanLoaderFileWatching:
         """Provide loader with temporary directory."""
         return TradePlanLoader(temp_plans_dir)
     
-    def test_start_stop_file_watching(self, loader):
+    async def test_start_stop_file_watching(self, loader):
         """Test starting and stopping file watching."""
         # Initially not watching
         assert loader._watching is False
@@ -349,7 +479,7 @@ class TestTradePlanLoaderFileWatching:
         assert loader._watching is False
         assert loader._observer is None
     
-    def test_start_watching_twice(self, loader):
+    async def test_start_watching_twice(self, loader):
         """Test starting file watching twice."""
         loader.start_file_watching()
         assert loader._watching is True
@@ -366,7 +496,7 @@ class TestTradePlanLoaderFileWatching:
         loader.stop_file_watching()
         assert loader._watching is False
     
-    def test_watch_nonexistent_directory(self):
+    async def test_watch_nonexistent_directory(self):
         """Test watching non-existent directory."""
         nonexistent_dir = Path("/nonexistent/directory")
         loader = TradePlanLoader(nonexistent_dir)
@@ -374,6 +504,62 @@ class TestTradePlanLoaderFileWatching:
         # Should not error, but should not start watching
         loader.start_file_watching()
         assert loader._watching is False
+    
+    async def test_multi_file_change_applied_as_one_reload(self, temp_plans_dir):
+        """Test a burst of changes to several files is one reload and one notification."""
+        write_plan_files(temp_plans_dir, file_count=3, plans_per_file=2)
+        loader = TradePlanLoader(temp_plans_dir, reload_coalesce_window=0.2)
+        loader.load_all_plans()
+        notified = asyncio.Event()
+        notifications = []
+        
+        def on_change():
+            notifications.append(len(loader.get_loaded_plan_ids()))
+            notified.set()
+        
+        loader.add_change_listener(on_change)
+        loader.start_file_watching()
+        try:
+            for file_index in (0, 1):
+                plan_file = temp_plans_dir / f"plans_{file_index:04d}.yaml"
+                plan_file.write_text(plan_file.read_text().replace("185.00", "186.00"))
+            (temp_plans_dir / "plans_0002.yaml").unlink()
+            
+            await asyncio.wait_for(notified.wait(), timeout=5.0)
+            await asyncio.sleep(0.4)
+        finally:
+            loader.stop_file_watching()
+        
+        assert notifications == [4]
+        assert loader.get_plan("SYM0_20250815_000").take_profit == Decimal("186.00")
+        assert loader.get_plan("SYM1_20250815_001").take_profit == Decimal("186.00")
+        assert loader.get_plan("SYM2_20250815_000") is None
+    
+    def test_watching_requires_event_loop(self, loader):
+        """Test watching is refused without a loop to apply changes on."""
+        with pytest.raises(RuntimeError, match="running event loop"):
+            loader.start_file_watching()
+        assert loader._watching is False
+    
+    async def test_watching_reports_latency(self, temp_plans_dir):
+        """Test applied changes report their latency while watching."""
+        write_plan_files(temp_plans_dir, file_count=1, plans_per_file=1)
+        loader = TradePlanLoader(temp_plans_dir, reload_coalesce_window=0.05)
+        loader.load_all_plans()
+        loader.start_file_watching()
+        try:
+            write_plan_files(temp_plans_dir, file_count=2, plans_per_file=1)
+            deadline = time.monotonic() + 5.0
+            while loader.get_plan("SYM1_20250815_000") is None and time.monotonic() < deadline:
+                await asyncio.sleep(0.02)
+            stats = loader.get_reload_stats()
+        finally:
+            loader.stop_file_watching()
+        
+        assert loader.get_plan("SYM1_20250815_000") is not None
+        assert stats["batches_delivered"] >= 1
+        assert stats["last_latency_ms"] is not None
+        assert loader.get_reload_stats() == {}
 
 
 class TestTradePlanLoaderWithRealPlans:
@@ -416,4 +602,372 @@ class TestTradePlanLoaderWithRealPlans:
         assert stats["total_plans"] >= 2
         assert stats["files_loaded"] >= 1
         assert len(stats["by_status"]) > 0
-        assert len(stats["by_symbol"]) > 0
\ No newline at end of file
+        assert len(stats["by_symbol"]) > 0
+
+
+PLAN_TEMPLATE = """
+- plan_id: "{plan_id}"
+  symbol: "{symbol}"
+  entry_level: 180.50
+  stop_loss: 178.00
+  take_profit: 185.00
+  risk_category: "normal"
+  entry_function:
+    function_type: "close_above"
+    timeframe: "15min"
+    parameters:
+      threshold: 180.50
+  exit_function:
+    function_type: "stop_loss_take_profit"
+    timeframe: "1min"
+    parameters: {{}}
+  status: "awaiting_entry"
+"""
+
+
+def write_plan_files(plans_dir, file_count, plans_per_file):
+    """Write plan files holding file_count * plans_per_file unique plans."""
+    for file_index in range(file_count):
+        content = "".join(
+            PLAN_TEMPLATE.format(
+                plan_id=f"SYM{file_index}_20250815_{plan_index:03d}",
+                symbol="S" + chr(65 + file_index % 26),
+            )
+            for plan_index in range(plans_per_file)
+        )
+        (plans_dir / f"plans_{file_index:04d}.yaml").write_text(content)
+
+
+class TestTradePlanLoaderPerformance:
+    """Test the single-pass load pipeline."""
+    
+    @pytest.fixture
+    def large_plans_dir(self):
+        """Create a directory of 3,000 plans in 300 files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plans_dir = Path(temp_dir)
+            write_plan_files(plans_dir, file_count=300, plans_per_file=10)
+            yield plans_dir
+    
+    def test_each_file_parsed_once(self, large_plans_dir):
+        """Test loading reads and parses every file exactly once."""
+        loader = TradePlanLoader(large_plans_dir)
+        
+        with patch(
+            "auto_trader.models.validation_engine.parse_yaml", wraps=parse_yaml
+        ) as parse:
+            plans = loader.load_all_plans()
+        
+        assert len(plans) == 3000
+        assert parse.call_count == 300
+    
+    def test_invalid_plans_still_reported(self, large_plans_dir):
+        """Test validation errors reach the reporter from the single pass."""
+        (large_plans_dir / "broken.yaml").write_text(
+            PLAN_TEMPLATE.format(plan_id="bad id", symbol="AAPL")
+        )
+        loader = TradePlanLoader(large_plans_dir)
+        
+        plans = loader.load_all_plans()
+        
+        assert len(plans) == 3000
+        report = loader.get_validation_report()
+        assert "broken.yaml" in report
+        assert "Invalid plan_id format" in report
+    
+    def test_cold_load_benchmark(self, large_plans_dir):
+        """Benchmark cold load against the previous validate-then-reparse pipeline."""
+        def legacy_load():
+            engine = TradePlanLoader(large_plans_dir).validation_engine
+            plans = {}
+            for yaml_file in sorted(large_plans_dir.glob("*.yaml")):
+                if engine.validate_file(yaml_file).is_valid:
+                    for plan_data in yaml.safe_load(yaml_file.read_text(encoding="utf-8")):
+                        plan = TradePlan(**plan_data)
+                        plans[plan.plan_id] = plan
+            return plans
+        
+        start = time.perf_counter()
+        legacy_plans = legacy_load()
+        legacy_seconds = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        plans = TradePlanLoader(large_plans_dir).load_all_plans()
+        single_pass_seconds = time.perf_counter() - start
+        
+        print(
+            f"Cold load of 3000 plans: two-pass {legacy_seconds:.2f}s, "
+            f"single-pass {single_pass_seconds:.2f}s "
+            f"({legacy_seconds / single_pass_seconds:.1f}x)"
+        )
+        
+        assert plans.keys() == legacy_plans.keys()
+        assert single_pass_seconds < legacy_seconds
+
+
+class TestTradePlanLoaderCache:
+    """Test reuse of parsed plans for unchanged files."""
+    
+    @pytest.fixture
+    def plans_dir(self):
+        """Create a directory of 5,000 plans in 500 files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plans_dir = Path(temp_dir)
+            write_plan_files(plans_dir, file_count=500, plans_per_file=10)
+            yield plans_dir
+    
+    def test_reload_with_one_edited_file_parses_one_file(self, plans_dir):
+        """Benchmark a reload of 5,000 plans after editing one file."""
+        loader = TradePlanLoader(plans_dir)
+        start = time.perf_counter()
+        loader.load_all_plans()
+        cold_seconds = time.perf_counter() - start
+        edited_file = plans_dir / "plans_0007.yaml"
+        edited_file.write_text(edited_file.read_text().replace("185.00", "186.00"))
+        
+        start = time.perf_counter()
+        plans = loader.load_all_plans()
+        warm_seconds = time.perf_counter() - start
+        
+        print(
+            f"Load of 5000 plans: cold {cold_seconds * 1000:.0f}ms, "
+            f"one file edited {warm_seconds * 1000:.0f}ms"
+        )
+        assert len(plans) == 5000
+        assert loader.files_parsed == 501
+        assert loader.files_reused == 499
+        assert plans["SYM7_20250815_000"].take_profit == Decimal("186.00")
+        assert warm_seconds < cold_seconds / 2
+    
+    def test_touched_file_reused_by_content_hash(self, plans_dir):
+        """Test a file with a new mtime but the same content is not reparsed."""
+        loader = TradePlanLoader(plans_dir)
+        loader.load_all_plans()
+        touched_file = plans_dir / "plans_0001.yaml"
+        os.utime(touched_file, ns=(0, touched_file.stat().st_mtime_ns + 10**9))
+        
+        loader.load_all_plans()
+        
+        assert loader.files_parsed == 500
+    
+    def test_cached_file_revalidated_on_cross_file_duplicate(self, plans_dir):
+        """Test a reused file still reports plan IDs duplicated in another file."""
+        loader = TradePlanLoader(plans_dir)
+        loader.load_all_plans()
+        (plans_dir / "aaa_duplicate.yaml").write_text(
+            PLAN_TEMPLATE.format(plan_id="SYM3_20250815_000", symbol="AAPL")
+        )
+        
+        plans = loader.load_all_plans()
+        
+        # Files load in name order, so the new file keeps the plan ID and the
+        # unchanged cached file is rejected as a duplicate
+        assert loader._plan_to_file["SYM3_20250815_000"] == plans_dir / "aaa_duplicate.yaml"
+        assert len(plans) == 5000 - 10 + 1
+        assert "Duplicate plan_id 'SYM3_20250815_000'" in loader.get_validation_report()
+    
+    def test_deleted_file_dropped(self, plans_dir):
+        """Test plans of a deleted file disappear on the next load."""
+        loader = TradePlanLoader(plans_dir)
+        loader.load_all_plans()
+        (plans_dir / "plans_0000.yaml").unlink()
+        
+        plans = loader.load_all_plans()
+        
+        assert len(plans) == 4990
+        assert plans_dir / "plans_0000.yaml" not in loader._file_cache
+    
+    def test_persisted_cache_reused_by_new_loader(self, plans_dir, tmp_path):
+        """Test a later process reuses the cache, which stays out of the plans directory."""
+        cache_dir = tmp_path / "cache"
+        first_loader = TradePlanLoader(plans_dir, persist_cache=True, cache_dir=cache_dir)
+        first_plans = first_loader.load_all_plans()
+        assert plan_cache_path(plans_dir, cache_dir).exists()
+        assert not any(path.suffix == ".json" for path in plans_dir.iterdir())
+        
+        loader = TradePlanLoader(plans_dir, persist_cache=True, cache_dir=cache_dir)
+        plans = loader.load_all_plans()
+        
+        assert loader.files_parsed == 0
+        assert loader.files_reused == 500
+        assert plans == first_plans
+    
+    def test_cache_path_keyed_on_resolved_directory(self, tmp_path):
+        """Test plans directories with the same name get separate caches."""
+        cache_dir = tmp_path / "cache"
+        first = plan_cache_path(tmp_path / "a" / "plans", cache_dir)
+        
+        assert first.parent == cache_dir
+        assert first != plan_cache_path(tmp_path / "b" / "plans", cache_dir)
+        assert first == plan_cache_path(tmp_path / "a" / ".." / "a" / "plans", cache_dir)
+    
+    def test_corrupt_persisted_cache_ignored(self, plans_dir, tmp_path):
+        """Test an unreadable cache file falls back to parsing."""
+        cache_file = plan_cache_path(plans_dir, tmp_path)
+        cache_file.write_text("{not json")
+        
+        loader = TradePlanLoader(plans_dir, persist_cache=True, cache_dir=tmp_path)
+        plans = loader.load_all_plans()
+        
+        assert len(plans) == 5000
+        assert loader.files_parsed == 500
+
+
+class TestTradePlanLoaderParallel:
+    """Test parsing plan files across a process pool."""
+    
+    @pytest.fixture
+    def plans_dir(self):
+        """Create 100 plan files, two of which repeat plan IDs from other files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plans_dir = Path(temp_dir)
+            write_plan_files(plans_dir, file_count=100, plans_per_file=5)
+            (plans_dir / "plans_0050.yaml").write_text(
+                PLAN_TEMPLATE.format(plan_id="SYM3_20250815_000", symbol="AAPL")
+            )
+            (plans_dir / "zz_duplicate.yaml").write_text(
+                PLAN_TEMPLATE.format(plan_id="SYM9_20250815_004", symbol="AAPL")
+            )
+            (plans_dir / "broken.yaml").write_text("plan_id: [unclosed")
+            yield plans_dir
+    
+    def test_parallel_load_matches_serial(self, plans_dir):
+        """Test pool loading gives the same plans, owners and report as serial."""
+        serial = TradePlanLoader(plans_dir)
+        serial_plans = serial.load_all_plans(workers=1)
+        
+        parallel = TradePlanLoader(plans_dir)
+        parallel_plans = parallel.load_all_plans(workers=2)
+        
+        assert parallel_plans.keys() == serial_plans.keys()
+        assert parallel._plan_to_file == serial._plan_to_file
+        assert parallel.get_validation_report() == serial.get_validation_report()
+        # Each file is counted once, whether parsed in a worker or again here
+        assert parallel.files_parsed == serial.files_parsed == 102
+        assert parallel.files_reused == 0
+        
+        # Earlier files keep duplicated plan IDs; later duplicates are rejected
+        assert parallel._plan_to_file["SYM3_20250815_000"] == plans_dir / "plans_0003.yaml"
+        assert parallel._plan_to_file["SYM9_20250815_004"] == plans_dir / "plans_0009.yaml"
+        assert len(parallel_plans) == 99 * 5
+        report = parallel.get_validation_report()
+        assert "Duplicate plan_id 'SYM3_20250815_000'" in report
+        assert "Duplicate plan_id 'SYM9_20250815_004'" in report
+        assert "YAML syntax error" in report
+    
+    def test_small_directories_load_serially(self, plans_dir):
+        """Test the pool is not started for a few changed files."""
+        loader = TradePlanLoader(plans_dir)
+        loader.load_all_plans()
+        (plans_dir / "plans_0001.yaml").write_text(
+            PLAN_TEMPLATE.format(plan_id="NEW_20250815_001", symbol="AAPL")
+        )
+        
+        with patch("auto_trader.models.plan_loader.ProcessPoolExecutor") as pool:
+            plans = loader.load_all_plans(workers=4)
+        
+        pool.assert_not_called()
+        assert "NEW_20250815_001" in plans
+    
+    def test_worker_scaling_benchmark(self):
+        """Benchmark files/sec of a cold load for increasing worker counts."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plans_dir = Path(temp_dir)
+            write_plan_files(plans_dir, file_count=400, plans_per_file=5)
+            
+            results = {}
+            for workers in (1, 2, 4):
+                loader = TradePlanLoader(plans_dir)
+                start = time.perf_counter()
+                plans = loader.load_all_plans(workers=workers)
+                elapsed = time.perf_counter() - start
+                results[workers] = plans.keys()
+                print(
+                    f"Cold load of 400 files with {workers} worker(s): "
+                    f"{400 / elapsed:.0f} files/sec (CPUs available: {os.cpu_count()})"
+                )
+            
+            assert results[1] == results[2] == results[4]
+            assert len(results[1]) == 2000
+
+
+class TestTradePlanLoaderIndexes:
+    """Test the status and symbol indexes."""
+    
+    @pytest.fixture
+    def loader(self):
+        """Provide loader with 5,000 plans over 26 symbols."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            plans_dir = Path(temp_dir)
+            write_plan_files(plans_dir, file_count=500, plans_per_file=10)
+            loader = TradePlanLoader(plans_dir)
+            loader.load_all_plans()
+            yield loader
+    
+    def assert_indexes_match_scan(self, loader):
+        """Assert index queries and stats equal a full scan of loaded plans."""
+        plans = list(loader._loaded_plans.values())
+        for symbol in {plan.symbol for plan in plans} | {"MISSING"}:
+            assert loader.get_plans_by_symbol(symbol) == [p for p in plans if p.symbol == symbol]
+        for status in TradePlanStatus:
+            assert sorted(p.plan_id for p in loader.get_plans_by_status(status)) == sorted(
+                p.plan_id for p in plans if p.status == status
+            )
+        stats = loader.get_stats()
+        assert stats["total_plans"] == len(plans)
+        assert sum(stats["by_status"].values()) == len(plans)
+        assert sum(stats["by_symbol"].values()) == len(plans)
+    
+    async def test_indexes_follow_status_updates_and_reloads(self, loader):
+        """Test indexes stay consistent through updates, reloads and removals."""
+        assert loader.update_plan_status("SYM1_20250815_000", TradePlanStatus.POSITION_OPEN)
+        assert [p.plan_id for p in loader.get_plans_by_status(TradePlanStatus.POSITION_OPEN)] == [
+            "SYM1_20250815_000"
+        ]
+        self.assert_indexes_match_scan(loader)
+        
+        edited_file = loader.plans_directory / "plans_0002.yaml"
+        edited_file.write_text(edited_file.read_text().replace('symbol: "SC"', 'symbol: "NEW"'))
+        await loader._reload_file(edited_file)
+        assert len(loader.get_plans_by_symbol("NEW")) == 10
+        self.assert_indexes_match_scan(loader)
+        
+        loader._remove_plans_from_file(loader.plans_directory / "plans_0001.yaml")
+        assert "awaiting_entry" in loader.get_stats()["by_status"]
+        assert "position_open" not in loader.get_stats()["by_status"]
+        self.assert_indexes_match_scan(loader)
+        
+        loader._clear_loaded_plans()
+        assert loader.get_stats() == {
+            "total_plans": 0,
+            "by_status": {},
+            "by_symbol": {},
+            "files_loaded": 0,
+        }
+    
+    def test_query_benchmark(self, loader):
+        """Benchmark symbol/status queries and stats against full scans."""
+        plans = list(loader._loaded_plans.values())
+        
+        start = time.perf_counter()
+        for _ in range(100):
+            [p for p in plans if p.symbol == "SA"]
+            [p for p in plans if p.status == TradePlanStatus.COMPLETED]
+        scan_ms = (time.perf_counter() - start) * 1000 / 100
+        
+        start = time.perf_counter()
+        for _ in range(100):
+            loader.get_plans_by_symbol("SA")
+            loader.get_plans_by_status(TradePlanStatus.COMPLETED)
+        index_ms = (time.perf_counter() - start) * 1000 / 100
+        
+        start = time.perf_counter()
+        for _ in range(100):
+            loader.get_stats()
+        stats_ms = (time.perf_counter() - start) * 1000 / 100
+        
+        print(
+            f"5000 plans: scan {scan_ms:.3f}ms, indexed {index_ms:.3f}ms, "
+            f"stats {stats_ms:.3f}ms per query"
+        )
+        assert index_ms < scan_ms
@@ -1,11 +1,16 @@
 """Unit tests for template manager."""
 
+import os
+import time
 import pytest
 import tempfile
+import yaml
 from pathlib import Path
 from decimal import Decimal
+from unittest.mock import patch
 
 from auto_trader.models.template_manager import TemplateManager
+from auto_trader.models.validation_engine import parse_yaml
 from auto_trader.models.trade_plan import TradePlan
 
 
@@ -284,6 +289,113 @@ symbol: "TEST"
         assert summary["validation_results"]["test_template"] is True
 
 
+
+class TestCompiledTemplates:
+    """Test compiled template caching and in-memory instantiation."""
+    
+    PLAN_DATA = {
+        "plan_id": "AAPL_20250815_001",
+        "symbol": "AAPL",
+        "entry_level": 180.50,
+        "stop_loss": 178.00,
+        "take_profit": 185.00,
+        "threshold": 180.75,
+    }
+    
+    @pytest.fixture
+    def templates_dir(self, tmp_path):
+        """Provide a directory holding the close_above template."""
+        real_template = TemplateManager().list_available_templates()["close_above"]
+        (tmp_path / "close_above.yaml").write_text(real_template.read_text(encoding="utf-8"))
+        return tmp_path
+    
+    def test_cache_hit_skips_listing_and_reading(self, templates_dir):
+        """Test a compiled template is reused without globbing or reading the file."""
+        manager = TemplateManager(templates_dir)
+        compiled = manager.get_compiled_template("close_above")
+        
+        with patch.object(manager, "list_available_templates") as listing, \
+                patch.object(Path, "read_text") as read_text:
+            assert manager.get_compiled_template("close_above") is compiled
+            assert manager.load_template("close_above") == compiled.content
+            assert manager.validate_template("close_above") is True
+        
+        listing.assert_not_called()
+        read_text.assert_not_called()
+        assert manager.get_cache_stats() == {"cached_templates": 1, "hits": 3, "misses": 1}
+    
+    def test_modified_template_recompiled(self, templates_dir):
+        """Test a template whose mtime changed is read again."""
+        manager = TemplateManager(templates_dir)
+        template_path = templates_dir / "close_above.yaml"
+        compiled = manager.get_compiled_template("close_above")
+        
+        template_path.write_text(compiled.content.replace('timeframe: "15min"', 'timeframe: "5min"'))
+        stat = template_path.stat()
+        os.utime(template_path, ns=(stat.st_atime_ns, compiled.mtime_ns + 1_000_000))
+        
+        plan = manager.create_plan_from_template("close_above", self.PLAN_DATA)
+        assert plan.entry_function.timeframe == "5min"
+        assert manager.get_cache_stats()["misses"] == 2
+    
+    def test_build_data_matches_rendered_text(self, templates_dir):
+        """Test filling the parsed template gives what parsing the filled text gives."""
+        compiled = TemplateManager(templates_dir).get_compiled_template("close_above")
+        substitutions = dict(self.PLAN_DATA, entry_level=Decimal("180.50"), risk_category="small")
+        
+        data = compiled.build_data(substitutions)
+        
+        assert data == yaml.safe_load(compiled.render(substitutions))
+        assert data["entry_function"]["parameters"] == {"threshold": 180.75}
+        assert data["entry_level"] == 180.5
+        assert compiled.build_data(substitutions) is not data
+        # Unsubstituted slots keep their placeholders
+        assert 'take_profit: 0.00' in compiled.render({"symbol": "MSFT"})
+    
+    def test_create_plans_from_template(self, templates_dir):
+        """Test plans are created together and an invalid plan rejects the batch."""
+        manager = TemplateManager(templates_dir)
+        plans_data = [
+            dict(self.PLAN_DATA, plan_id=f"AAPL_20250815_{i:03d}") for i in range(1, 4)
+        ]
+        
+        plans = manager.create_plans_from_template("close_above", plans_data)
+        
+        assert [plan.plan_id for plan in plans] == [data["plan_id"] for data in plans_data]
+        assert all(plan.entry_function.parameters == {"threshold": 180.75} for plan in plans)
+        with pytest.raises(ValueError, match="Template customization failed validation"):
+            manager.create_plans_from_template(
+                "close_above",
+                [dict(self.PLAN_DATA, plan_id="MSFT_20250815_001", symbol="MSFT"),
+                 dict(self.PLAN_DATA, plan_id="MSFT_20250815_002", stop_loss=-1.0)],
+            )
+    
+    def test_bulk_instantiation_benchmark(self, templates_dir):
+        """Benchmark creating 10,000 plans from a compiled template."""
+        manager = TemplateManager(templates_dir)
+        compiled = manager.get_compiled_template("close_above")
+        plans_data = [
+            dict(self.PLAN_DATA, plan_id=f"AAPL_20250815_{i:05d}") for i in range(10_000)
+        ]
+        
+        start = time.perf_counter()
+        rendered = [parse_yaml(compiled.render(data)) for data in plans_data[:100]]
+        render_elapsed = (time.perf_counter() - start) * 100
+        
+        start = time.perf_counter()
+        plans = manager.create_plans_from_template("close_above", plans_data)
+        elapsed = time.perf_counter() - start
+        
+        print(
+            f"10000 plans from compiled template: {elapsed * 1000:.0f}ms "
+            f"({len(plans) / elapsed:,.0f} plans/s); "
+            f"text render + parse alone would take ~{render_elapsed * 1000:.0f}ms"
+        )
+        assert len(plans) == 10_000
+        assert len(rendered) == 100
+        assert elapsed < 10.0
+
+
 class TestTemplateManagerWithRealTemplates:
     """Test TemplateManager with actual project templates."""
     
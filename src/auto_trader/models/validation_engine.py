@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import re
 import yaml
+from dataclasses import dataclass, field
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from pydantic import ValidationError
 from loguru import logger
@@ -19,6 +20,29 @@ from .trade_plan import (
 )
 
 
+# libyaml's C loader when PyYAML was built with it; same safe tag set as
+# yaml.safe_load, several times faster on large plan files
+YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def parse_yaml(content: str) -> Any:
+    """Parse YAML content with the fastest available safe loader."""
+    return yaml.load(content, Loader=YamlSafeLoader)
+
+
+@dataclass
+class PlanFileLoad:
+    """Result of reading, validating and building the plans of one file in one pass."""
+    
+    result: ValidationResult
+    # List of plan dicts, the raw parsed value if it is not a plan structure,
+    # or None if the content was empty or could not be parsed
+    plans_data: Any = None
+    # Model built during validation for each entry of plans_data, None
+    # where that plan failed validation
+    plans: List[Optional[TradePlan]] = field(default_factory=list)
+
+
 class ValidationEngine:
     """Validation engine for trade plan schema and business rules."""
     
@@ -53,18 +77,89 @@ class ValidationEngine:
         Returns:
             ValidationResult with validation status and any errors
         """
-        errors: List[TradePlanValidationError] = []
+        return self.load_yaml_content(yaml_content, file_path).result
+    
+    def load_yaml_content(
+        self,
+        yaml_content: str,
+        file_path: Optional[Path] = None
+    ) -> PlanFileLoad:
+        """
+        Parse and validate YAML content once, keeping the built plans.
         
+        Args:
+            yaml_content: Raw YAML content to validate
+            file_path: Optional path for context in error messages
+            
+        Returns:
+            PlanFileLoad with the validation result, parsed plan data and
+            the TradePlan built for each valid plan
+        """
         try:
-            # Parse YAML content
-            parsed_data = yaml.safe_load(yaml_content)
+            parsed_data = parse_yaml(yaml_content)
+        except yaml.YAMLError as e:
+            return self.load_yaml_error(e, file_path)
+        
+        return self.load_plan_data(parsed_data, file_path)
+    
+    def load_yaml_error(
+        self,
+        error: yaml.YAMLError,
+        file_path: Optional[Path] = None
+    ) -> PlanFileLoad:
+        """
+        Report content that failed to parse as YAML.
+        
+        Args:
+            error: Error raised by the YAML parser
+            file_path: Optional path for context in error messages
+            
+        Returns:
+            PlanFileLoad with a failed validation result
+        """
+        line_num = getattr(error, 'problem_mark', None)
+        line_info = f" at line {line_num.line + 1}" if line_num else ""
+        
+        validation_error = TradePlanValidationError(
+            f"YAML syntax error{line_info}: {error}",
+            line_number=line_num.line + 1 if line_num else None,
+            suggestion="Check YAML syntax - ensure proper indentation and structure"
+        )
+        logger.warning(
+            "Trade plan validation failed",
+            file_path=str(file_path) if file_path else "string",
+            error_count=1,
+            errors=[str(validation_error)]
+        )
+        return PlanFileLoad(ValidationResult(is_valid=False, errors=[validation_error]))
+    
+    def load_plan_data(
+        self,
+        parsed_data: Any,
+        file_path: Optional[Path] = None
+    ) -> PlanFileLoad:
+        """
+        Validate already parsed plan data, keeping the built plans.
+        
+        Args:
+            parsed_data: A plan dict or list of plan dicts, as parsed from YAML
+            file_path: Optional path for context in error messages
             
+        Returns:
+            PlanFileLoad with the validation result, plan data and the
+            TradePlan built for each valid plan
+        """
+        errors: List[TradePlanValidationError] = []
+        plans_data: Any = None
+        plans: List[Optional[TradePlan]] = []
+        
+        try:
             if parsed_data is None:
                 errors.append(TradePlanValidationError(
                     "Empty YAML content",
                     suggestion="Add valid trade plan data to the file"
                 ))
-                return ValidationResult(is_valid=False, errors=errors)
+                return PlanFileLoad(ValidationResult(is_valid=False, errors=errors))
             
             # Handle single plan or list of plans
             if isinstance(parsed_data, dict):
@@ -76,22 +171,17 @@ class ValidationEngine:
                     f"Invalid YAML structure. Expected dict or list, got {type(parsed_data).__name__}",
                     suggestion="Ensure YAML contains a trade plan object or list of objects"
                 ))
-                return ValidationResult(is_valid=False, errors=errors)
+                return PlanFileLoad(
+                    ValidationResult(is_valid=False, errors=errors),
+                    plans_data=parsed_data,
+                )
             
             # Validate each plan
             for i, plan_data in enumerate(plans_data):
-                plan_errors = self._validate_single_plan(plan_data, i + 1)
+                plan_errors, plan = self._build_single_plan(plan_data, i + 1)
                 errors.extend(plan_errors)
+                plans.append(plan)
             
-        except yaml.YAMLError as e:
-            line_num = getattr(e, 'problem_mark', None)
-            line_info = f" at line {line_num.line + 1}" if line_num else ""
-            
-            errors.append(TradePlanValidationError(
-                f"YAML syntax error{line_info}: {e}",
-                line_number=line_num.line + 1 if line_num else None,
-                suggestion="Check YAML syntax - ensure proper indentation and structure"
-            ))
         except Exception as e:
             errors.append(TradePlanValidationError(
                 f"Unexpected validation error: {e}",
@@ -116,10 +206,14 @@ class ValidationEngine:
         is_valid = len(errors) == 0
         plan_id = plans_data[0].get("plan_id") if is_valid and plans_data else None
         
-        return ValidationResult(
-            is_valid=is_valid,
-            errors=errors,
-            plan_id=plan_id
+        return PlanFileLoad(
+            ValidationResult(
+                is_valid=is_valid,
+                errors=errors,
+                plan_id=plan_id
+            ),
+            plans_data=plans_data,
+            plans=plans,
         )
     
     def validate_file(self, file_path: Path) -> ValidationResult:
@@ -132,47 +226,67 @@ class ValidationEngine:
         Returns:
             ValidationResult with validation status and any errors
         """
+        return self.load_file(file_path).result
+    
+    def load_file(self, file_path: Path) -> PlanFileLoad:
+        """
+        Read, parse and validate a YAML file once, keeping the built plans.
+        
+        Args:
+            file_path: Path to YAML file to load
+            
+        Returns:
+            PlanFileLoad with the validation result, parsed plan data and
+            the TradePlan built for each valid plan
+        """
         try:
             if not file_path.exists():
-                return ValidationResult(
+                return PlanFileLoad(ValidationResult(
                     is_valid=False,
                     errors=[TradePlanValidationError(
                         f"File not found: {file_path}",
                         suggestion="Check the file path and ensure the file exists"
                     )]
-                )
+                ))
             
             if file_path.suffix.lower() not in {'.yaml', '.yml'}:
-                return ValidationResult(
+                return PlanFileLoad(ValidationResult(
                     is_valid=False,
                     errors=[TradePlanValidationError(
                         f"Invalid file extension: {file_path.suffix}",
                         suggestion="Use .yaml or .yml file extension"
                     )]
-                )
+                ))
             
             content = file_path.read_text(encoding='utf-8')
-            return self.validate_yaml_content(content, file_path)
+            return self.load_yaml_content(content, file_path)
             
         except PermissionError:
-            return ValidationResult(
+            return PlanFileLoad(ValidationResult(
                 is_valid=False,
                 errors=[TradePlanValidationError(
                     f"Permission denied reading file: {file_path}",
                     suggestion="Check file permissions"
                 )]
-            )
+            ))
         except Exception as e:
-            return ValidationResult(
+            return PlanFileLoad(ValidationResult(
                 is_valid=False,
                 errors=[TradePlanValidationError(
                     f"Error reading file {file_path}: {e}",
                     suggestion="Check file accessibility and content"
                 )]
-            )
+            ))
     
     def _validate_single_plan(self, plan_data: Dict[str, Any], plan_index: int) -> List[TradePlanValidationError]:
         """Validate a single trade plan dictionary."""
+        errors, _ = self._build_single_plan(plan_data, plan_index)
+        return errors
+    
+    def _build_single_plan(
+        self, plan_data: Dict[str, Any], plan_index: int
+    ) -> Tuple[List[TradePlanValidationError], Optional[TradePlan]]:
+        """Validate a single trade plan dictionary, returning the model if it is valid."""
         errors: List[TradePlanValidationError] = []
         
         if not isinstance(plan_data, dict):
@@ -180,7 +294,7 @@ class ValidationEngine:
                 f"Plan {plan_index}: Expected dictionary, got {type(plan_data).__name__}",
                 suggestion="Each trade plan must be a YAML object with key-value pairs"
             ))
-            return errors
+            return errors, None
         
         # Check required fields
         required_fields = {
@@ -203,9 +317,10 @@ class ValidationEngine:
         self._validate_execution_functions(plan_data, errors, plan_index)
         
         # If no field-level errors, try creating the full model
+        plan = None
         if not errors:
             try:
-                TradePlan(**plan_data)
+                plan = TradePlan(**plan_data)
             except ValidationError as e:
                 for error_detail in e.errors():
                     field_name = '.'.join(str(loc) for loc in error_detail['loc'])
@@ -215,7 +330,7 @@ class ValidationEngine:
                         suggestion=self._get_field_suggestion(field_name, error_detail)
                     ))
         
-        return errors
+        return errors, plan
     
     def _validate_plan_id(self, plan_data: Dict[str, Any], errors: List[TradePlanValidationError], plan_index: int) -> None:
         """Validate plan_id field."""
@@ -407,6 +522,26 @@ class ValidationEngine:
         """Reset the tracked plan IDs (useful for testing or reloading)."""
         self._loaded_plan_ids.clear()
     
+    def release_plan_ids(self, plan_ids: set[str]) -> None:
+        """Stop tracking plan IDs whose plans were unloaded (e.g. before a reload)."""
+        self._loaded_plan_ids.difference_update(plan_ids)
+    
+    def claim_plan_ids(self, plan_ids: set[str]) -> bool:
+        """
+        Track the plan IDs of a file reused without re-validation.
+        
+        Args:
+            plan_ids: Plan IDs of the reused file
+            
+        Returns:
+            True if claimed; False, tracking nothing, if any ID is already
+            tracked and the file must be validated again to report duplicates
+        """
+        if not self._loaded_plan_ids.isdisjoint(plan_ids):
+            return False
+        self._loaded_plan_ids.update(plan_ids)
+        return True
+    
     def get_loaded_plan_ids(self) -> set[str]:
         """Get the set of currently loaded plan IDs."""
         return self._loaded_plan_ids.copy()
\ No newline at end of file
@@ -1 +1,35 @@
 """State management and data persistence."""
+
+from .backup_store import (
+    DEFAULT_BACKUP_STORE_DIR,
+    BackupManifest,
+    BackupStore,
+    BackupVersion,
+    stream_name,
+)
+from .bar_store import DEFAULT_BAR_STORE_DIR, BarStore
+from .position_store import DEFAULT_POSITION_DB_PATH, PositionStore
+from .state_snapshot import (
+    DEFAULT_SNAPSHOT_DIR,
+    SnapshotManifest,
+    StateSnapshot,
+    StateSnapshotStore,
+)
+from .write_behind import WriteBehindScheduler
+
+__all__ = [
+    "DEFAULT_BACKUP_STORE_DIR",
+    "BackupManifest",
+    "BackupStore",
+    "BackupVersion",
+    "stream_name",
+    "DEFAULT_BAR_STORE_DIR",
+    "BarStore",
+    "DEFAULT_POSITION_DB_PATH",
+    "PositionStore",
+    "DEFAULT_SNAPSHOT_DIR",
+    "SnapshotManifest",
+    "StateSnapshot",
+    "StateSnapshotStore",
+    "WriteBehindScheduler",
+]
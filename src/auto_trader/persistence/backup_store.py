@@ -0,0 +1,328 @@
+"""Content-addressed, deduplicating backup store for state files."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+from ..logging_config import get_logger
+
+logger = get_logger("backup_store", "system")
+
+DEFAULT_BACKUP_STORE_DIR = Path("data/state/backups")
+
+
+def stream_name(state_file: Path) -> str:
+    """
+    Get the default stream name of a state file.
+
+    Args:
+        state_file: State file backed up to the stream
+
+    Returns:
+        The resolved file path, so same-named files in different
+        directories do not share a stream
+    """
+    return str(Path(state_file).resolve())
+
+
+class BackupVersion(BaseModel):
+    """A retained backup version of one state stream."""
+
+    version: int = Field(..., ge=1, description="Monotonic version number")
+    digest: str = Field(..., description="SHA-256 of the backed-up content")
+    size: int = Field(..., ge=0, description="Content size in bytes")
+    created_at: datetime = Field(..., description="Backup timestamp (UTC)")
+    reason: str = Field(default="automated", description="Reason for backup")
+
+
+class BackupManifest(BaseModel):
+    """Index of retained versions per state stream."""
+
+    streams: Dict[str, List[BackupVersion]] = Field(default_factory=dict)
+
+
+class BackupStore:
+    """
+    Content-addressed backup store shared by state owners.
+
+    Content is stored once per SHA-256 digest under ``blobs/`` and a small
+    manifest lists the retained versions of each stream (one stream per
+    state file). A backup whose content matches the stream's latest version
+    is skipped, and unchanged files are detected from their size and mtime
+    without being read. Rotation drops versions from the manifest and
+    deletes blobs no longer referenced, without scanning the directory.
+    """
+
+    def __init__(
+        self,
+        root_dir: Optional[Path] = None,
+        max_versions: int = 10,
+    ) -> None:
+        """
+        Initialize backup store.
+
+        Args:
+            root_dir: Directory holding blobs and the manifest
+            max_versions: Versions retained per stream
+        """
+        self.root_dir = Path(root_dir or DEFAULT_BACKUP_STORE_DIR)
+        self.blob_dir = self.root_dir / "blobs"
+        self.manifest_file = self.root_dir / "manifest.json"
+        self.max_versions = max_versions
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._manifest = self._load_manifest()
+        self._refcounts = self._count_references()
+        # stream -> (size, mtime_ns) of the file last backed up
+        self._file_stats: Dict[str, Tuple[int, int]] = {}
+
+        # Metrics
+        self.backups_written = 0
+        self.backups_skipped = 0
+        self.blobs_written = 0
+        self.bytes_written = 0
+
+    def backup_file(
+        self, stream: str, path: Path, reason: str = "automated"
+    ) -> Optional[BackupVersion]:
+        """
+        Back up a state file if its content changed.
+
+        Args:
+            stream: Stream name for the state file
+            path: File to back up
+            reason: Reason recorded with the version
+
+        Returns:
+            The new version, or None if the file is missing or unchanged
+        """
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+
+        file_stat = (stat.st_size, stat.st_mtime_ns)
+        if self._file_stats.get(stream) == file_stat and self.latest(stream):
+            self.backups_skipped += 1
+            return None
+
+        version = self.backup_bytes(stream, path.read_bytes(), reason)
+        self._file_stats[stream] = file_stat
+        return version
+
+    def backup_bytes(
+        self, stream: str, content: bytes, reason: str = "automated"
+    ) -> Optional[BackupVersion]:
+        """
+        Back up content for a stream if it differs from the latest version.
+
+        Args:
+            stream: Stream name
+            content: Content to back up
+            reason: Reason recorded with the version
+
+        Returns:
+            The new version, or None if content is unchanged
+        """
+        digest = hashlib.sha256(content).hexdigest()
+
+        with self._lock:
+            versions = self._manifest.streams.setdefault(stream, [])
+            if versions and versions[-1].digest == digest:
+                self.backups_skipped += 1
+                return None
+
+            blob_path = self._blob_path(digest)
+            if not blob_path.exists():
+                self._write_atomic(blob_path, content)
+                self.blobs_written += 1
+                self.bytes_written += len(content)
+
+            version = BackupVersion(
+                version=versions[-1].version + 1 if versions else 1,
+                digest=digest,
+                size=len(content),
+                created_at=datetime.utcnow(),
+                reason=reason,
+            )
+            versions.append(version)
+            self._refcounts[digest] = self._refcounts.get(digest, 0) + 1
+
+            removed_blobs = self._rotate(versions)
+            self._save_manifest()
+            self.backups_written += 1
+
+        logger.debug(
+            "State backup stored",
+            stream=stream,
+            version=version.version,
+            digest=digest[:12],
+            reason=reason,
+            removed_blobs=removed_blobs,
+        )
+        return version
+
+    def list_versions(self, stream: str) -> List[BackupVersion]:
+        """Get retained versions of a stream, oldest first."""
+        with self._lock:
+            return list(self._manifest.streams.get(stream, []))
+
+    def latest(self, stream: str) -> Optional[BackupVersion]:
+        """Get the most recent version of a stream."""
+        versions = self._manifest.streams.get(stream)
+        return versions[-1] if versions else None
+
+    def find_version(
+        self,
+        stream: str,
+        version: Optional[int] = None,
+        at: Optional[datetime] = None,
+    ) -> Optional[BackupVersion]:
+        """
+        Find a retained version by number or point in time.
+
+        Args:
+            stream: Stream name
+            version: Exact version number
+            at: Latest version created at or before this time (naive
+                values are UTC; aware values are converted)
+
+        Returns:
+            Matching version, or None if not retained
+        """
+        versions = self.list_versions(stream)
+        if version is not None:
+            return next((v for v in versions if v.version == version), None)
+        if at is not None:
+            if at.tzinfo is not None:
+                # Versions are stamped in naive UTC
+                at = at.astimezone(timezone.utc).replace(tzinfo=None)
+            candidates = [v for v in versions if v.created_at <= at]
+            return candidates[-1] if candidates else None
+        return versions[-1] if versions else None
+
+    def read_version(self, stream: str, version: Optional[int] = None) -> bytes:
+        """
+        Read the content of a retained version.
+
+        Args:
+            stream: Stream name
+            version: Version number (defaults to latest)
+
+        Returns:
+            Backed-up content
+
+        Raises:
+            FileNotFoundError: If the version is not retained
+        """
+        found = self.find_version(stream, version=version)
+        if found is None:
+            raise FileNotFoundError(f"No backup version {version} for stream {stream}")
+        return self._blob_path(found.digest).read_bytes()
+
+    def restore(
+        self,
+        stream: str,
+        destination: Path,
+        version: Optional[int] = None,
+        at: Optional[datetime] = None,
+    ) -> BackupVersion:
+        """
+        Restore a retained version to a file.
+
+        Args:
+            stream: Stream name
+            destination: File to write the restored content to
+            version: Version number to restore
+            at: Restore the state as of this time (naive values are UTC)
+
+        Returns:
+            The restored version
+
+        Raises:
+            FileNotFoundError: If no matching version is retained
+        """
+        found = self.find_version(stream, version=version, at=at)
+        if found is None:
+            raise FileNotFoundError(f"No matching backup for stream {stream}")
+
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        self._write_atomic(destination, self._blob_path(found.digest).read_bytes())
+
+        logger.info(
+            "State restored from backup",
+            stream=stream,
+            version=found.version,
+            destination=str(destination),
+        )
+        return found
+
+    def blob_path(self, version: BackupVersion) -> Path:
+        """Get the blob file holding a version's content."""
+        return self._blob_path(version.digest)
+
+    def _rotate(self, versions: List[BackupVersion]) -> int:
+        """Drop versions beyond the limit and delete unreferenced blobs."""
+        removed_blobs = 0
+        while len(versions) > self.max_versions:
+            dropped = versions.pop(0)
+            self._refcounts[dropped.digest] -= 1
+            if self._refcounts[dropped.digest] <= 0:
+                del self._refcounts[dropped.digest]
+                self._blob_path(dropped.digest).unlink(missing_ok=True)
+                removed_blobs += 1
+        return removed_blobs
+
+    def _blob_path(self, digest: str) -> Path:
+        """Blob location for a digest."""
+        return self.blob_dir / digest[:2] / digest
+
+    def _count_references(self) -> Dict[str, int]:
+        """Count manifest references to each blob."""
+        counts: Dict[str, int] = {}
+        for versions in self._manifest.streams.values():
+            for version in versions:
+                counts[version.digest] = counts.get(version.digest, 0) + 1
+        return counts
+
+    def _load_manifest(self) -> BackupManifest:
+        """Load the manifest, starting empty if missing or unreadable."""
+        if not self.manifest_file.exists():
+            return BackupManifest()
+        try:
+            with open(self.manifest_file, "r") as f:
+                return BackupManifest(**json.load(f))
+        except Exception as e:
+            logger.error(
+                "Failed to load backup manifest",
+                file_path=str(self.manifest_file),
+                error=str(e),
+            )
+            return BackupManifest()
+
+    def _save_manifest(self) -> None:
+        """Atomically write the manifest."""
+        content = json.dumps(self._manifest.model_dump(mode="json"), separators=(",", ":"))
+        self._write_atomic(self.manifest_file, content.encode())
+
+    @staticmethod
+    def _write_atomic(path: Path, content: bytes) -> None:
+        """Write content to a temporary file and rename it into place."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        temp_path.replace(path)
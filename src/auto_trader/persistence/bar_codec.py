@@ -0,0 +1,105 @@
+"""Columnar NumPy encoding of OHLCV bars for binary persistence."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+from typing import List, Sequence
+
+import numpy as np
+
+from ..models.market_data import BarData, BarSizeType
+
+# Prices are stored as fixed-point integers so 4-decimal Decimals round-trip
+PRICE_SCALE = 10_000
+
+BAR_DTYPE = np.dtype(
+    [
+        ("timestamp_us", "<i8"),
+        ("open", "<i8"),
+        ("high", "<i8"),
+        ("low", "<i8"),
+        ("close", "<i8"),
+        ("volume", "<i8"),
+    ]
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def to_epoch_us(timestamp: datetime) -> int:
+    """Convert an aware datetime to integer microseconds since the epoch."""
+    return (timestamp - _EPOCH) // timedelta(microseconds=1)
+
+
+def from_epoch_us(value: int) -> datetime:
+    """Convert integer microseconds since the epoch to a UTC datetime."""
+    return _EPOCH + timedelta(microseconds=int(value))
+
+
+def _to_fixed(price: Decimal) -> int:
+    """Convert a price to fixed-point integer units."""
+    return int((price * PRICE_SCALE).to_integral_value())
+
+
+def _from_fixed(value: int) -> Decimal:
+    """Convert fixed-point integer units back to a Decimal price."""
+    return Decimal(int(value)).scaleb(-4)
+
+
+def bars_to_array(bars: Sequence[BarData]) -> np.ndarray:
+    """
+    Encode bars as a structured array with one row per bar.
+
+    Args:
+        bars: Bars in chronological order
+
+    Returns:
+        Array of ``BAR_DTYPE`` rows
+    """
+    return np.array(
+        [
+            (
+                to_epoch_us(bar.timestamp),
+                _to_fixed(bar.open_price),
+                _to_fixed(bar.high_price),
+                _to_fixed(bar.low_price),
+                _to_fixed(bar.close_price),
+                bar.volume,
+            )
+            for bar in bars
+        ],
+        dtype=BAR_DTYPE,
+    )
+
+
+def array_to_bars(
+    rows: np.ndarray, symbol: str, bar_size: BarSizeType
+) -> List[BarData]:
+    """
+    Decode structured array rows back into bars.
+
+    Rows were validated when the bars were first created, so bars are
+    constructed without re-running model validation.
+
+    Args:
+        rows: Array of ``BAR_DTYPE`` rows
+        symbol: Symbol of the bars
+        bar_size: Bar size of the bars
+
+    Returns:
+        Bars in array order
+    """
+    return [
+        BarData.model_construct(
+            symbol=symbol,
+            timestamp=from_epoch_us(timestamp_us),
+            open_price=_from_fixed(open_),
+            high_price=_from_fixed(high),
+            low_price=_from_fixed(low),
+            close_price=_from_fixed(close),
+            volume=int(volume),
+            bar_size=bar_size,
+        )
+        for timestamp_us, open_, high, low, close, volume in rows.tolist()
+    ]
@@ -0,0 +1,370 @@
+"""Local append-only historical bar store with memory-mapped columnar reads."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta, UTC
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..logging_config import get_logger
+from ..models.market_data import BarData, BarSizeType
+from .bar_codec import (
+    BAR_DTYPE,
+    array_to_bars,
+    bars_to_array,
+    from_epoch_us,
+    to_epoch_us,
+)
+
+logger = get_logger("bar_store", "system")
+
+DEFAULT_BAR_STORE_DIR = Path("data/market_data/bars")
+
+Interval = Tuple[int, int]
+
+
+class BarStore:
+    """
+    On-disk historical bar store keyed by symbol, bar size and trading day.
+
+    Each trading day (UTC date) is a directory holding one append-only file
+    per column (``timestamp_us.i8``, ``open.i8`` ...), read back through
+    ``numpy.memmap`` without parsing. Appends skip bars already stored, and
+    a torn append is repaired by truncating columns to a common length.
+
+    A per-series coverage file records which time ranges have been fetched
+    from the broker, including ranges that contained no bars, so callers can
+    ask for just the ``missing_ranges`` of a window. Qualified contract
+    details are kept alongside so contracts need not be re-qualified.
+    """
+
+    COVERAGE_FILE = "coverage.json"
+    CONTRACTS_FILE = "contracts.json"
+
+    def __init__(self, root_dir: Optional[Path] = None) -> None:
+        """
+        Initialize bar store.
+
+        Args:
+            root_dir: Root directory of the store
+        """
+        self.root_dir = Path(root_dir or DEFAULT_BAR_STORE_DIR)
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._coverage: Dict[Tuple[str, str], List[Interval]] = {}
+        self._contracts: Optional[Dict[str, Dict[str, Any]]] = None
+
+        # Metrics
+        self.bars_read = 0
+        self.bars_written = 0
+
+    def read_bars(
+        self,
+        symbol: str,
+        bar_size: BarSizeType,
+        start: datetime,
+        end: datetime,
+    ) -> List[BarData]:
+        """
+        Read stored bars with start <= timestamp < end.
+
+        Args:
+            symbol: Trading symbol
+            bar_size: Bar timeframe
+            start: Window start (UTC)
+            end: Window end (UTC)
+
+        Returns:
+            Bars in chronological order
+        """
+        start_us, end_us = to_epoch_us(start), to_epoch_us(end)
+        bars: List[BarData] = []
+        for day in self._days_between(start, end):
+            columns = self.read_columns(symbol, bar_size, day)
+            if columns is None:
+                continue
+            timestamps = columns["timestamp_us"]
+            mask = (timestamps >= start_us) & (timestamps < end_us)
+            if not mask.any():
+                continue
+            rows = np.empty(int(mask.sum()), dtype=BAR_DTYPE)
+            for name in BAR_DTYPE.names:
+                rows[name] = columns[name][mask]
+            rows.sort(order="timestamp_us")
+            bars.extend(array_to_bars(rows, symbol, bar_size))
+
+        self.bars_read += len(bars)
+        return bars
+
+    def read_columns(
+        self, symbol: str, bar_size: BarSizeType, day: date
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Memory-map the columns of one trading day.
+
+        Args:
+            symbol: Trading symbol
+            bar_size: Bar timeframe
+            day: Trading day (UTC date)
+
+        Returns:
+            Column arrays by name (rows in append order), or None if no bars
+        """
+        day_dir = self._day_dir(symbol, bar_size, day)
+        length = self._row_count(day_dir)
+        if not length:
+            return None
+        return {
+            name: np.memmap(
+                self._column_path(day_dir, name),
+                dtype=BAR_DTYPE[name],
+                mode="r",
+                shape=(length,),
+            )
+            for name in BAR_DTYPE.names
+        }
+
+    def append_bars(
+        self, symbol: str, bar_size: BarSizeType, bars: List[BarData]
+    ) -> int:
+        """
+        Append bars not already stored.
+
+        Args:
+            symbol: Trading symbol
+            bar_size: Bar timeframe
+            bars: Bars to store, in any order
+
+        Returns:
+            Number of bars written
+        """
+        by_day: Dict[date, List[BarData]] = {}
+        for bar in bars:
+            by_day.setdefault(bar.timestamp.date(), []).append(bar)
+
+        written = 0
+        with self._lock:
+            for day, day_bars in by_day.items():
+                written += self._append_day(
+                    self._day_dir(symbol, bar_size, day), day_bars
+                )
+
+        self.bars_written += written
+        return written
+
+    def missing_ranges(
+        self,
+        symbol: str,
+        bar_size: BarSizeType,
+        start: datetime,
+        end: datetime,
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Get the parts of a window that have not been fetched yet.
+
+        Args:
+            symbol: Trading symbol
+            bar_size: Bar timeframe
+            start: Window start (UTC)
+            end: Window end (UTC)
+
+        Returns:
+            Uncovered (start, end) ranges in chronological order
+        """
+        cursor, end_us = to_epoch_us(start), to_epoch_us(end)
+        missing = []
+        for covered_start, covered_end in self._get_coverage(symbol, bar_size):
+            if covered_end <= cursor:
+                continue
+            if covered_start >= end_us:
+                break
+            if covered_start > cursor:
+                missing.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+        if cursor < end_us:
+            missing.append((cursor, end_us))
+
+        return [(from_epoch_us(s), from_epoch_us(e)) for s, e in missing]
+
+    def mark_covered(
+        self,
+        symbol: str,
+        bar_size: BarSizeType,
+        start: datetime,
+        end: datetime,
+    ) -> None:
+        """
+        Record that a time range has been fetched in full.
+
+        Args:
+            symbol: Trading symbol
+            bar_size: Bar timeframe
+            start: Range start (UTC)
+            end: Range end (UTC)
+        """
+        if end <= start:
+            return
+
+        with self._lock:
+            intervals = self._get_coverage(symbol, bar_size) + [
+                (to_epoch_us(start), to_epoch_us(end))
+            ]
+            intervals.sort()
+            merged: List[Interval] = []
+            for interval_start, interval_end in intervals:
+                if merged and interval_start <= merged[-1][1]:
+                    merged[-1] = (merged[-1][0], max(merged[-1][1], interval_end))
+                else:
+                    merged.append((interval_start, interval_end))
+
+            self._coverage[(symbol, bar_size)] = merged
+            self._write_json(
+                self._series_dir(symbol, bar_size) / self.COVERAGE_FILE,
+                [list(interval) for interval in merged],
+            )
+
+    def get_contract(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Get stored contract details for a symbol."""
+        with self._lock:
+            return self._load_contracts().get(symbol)
+
+    def save_contract(self, symbol: str, details: Dict[str, Any]) -> None:
+        """
+        Store qualified contract details for a symbol.
+
+        Args:
+            symbol: Trading symbol
+            details: JSON-serializable contract fields
+        """
+        with self._lock:
+            contracts = self._load_contracts()
+            contracts[symbol] = details
+            self._write_json(self.root_dir / self.CONTRACTS_FILE, contracts)
+
+    def _append_day(self, day_dir: Path, bars: List[BarData]) -> int:
+        """Append new bars to one day's column files."""
+        day_dir.mkdir(parents=True, exist_ok=True)
+        length = self._repair(day_dir)
+
+        rows = bars_to_array(bars)
+        if length:
+            stored = np.fromfile(
+                self._column_path(day_dir, "timestamp_us"),
+                dtype=BAR_DTYPE["timestamp_us"],
+                count=length,
+            )
+            rows = rows[~np.isin(rows["timestamp_us"], stored)]
+        _, first_index = np.unique(rows["timestamp_us"], return_index=True)
+        rows = rows[np.sort(first_index)]
+        if not len(rows):
+            return 0
+
+        for name in BAR_DTYPE.names:
+            with open(self._column_path(day_dir, name), "ab") as f:
+                f.write(np.ascontiguousarray(rows[name]).tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+        return len(rows)
+
+    def _repair(self, day_dir: Path) -> int:
+        """Truncate columns to their common length after a torn append."""
+        paths = {name: self._column_path(day_dir, name) for name in BAR_DTYPE.names}
+        sizes = {
+            name: path.stat().st_size if path.exists() else 0
+            for name, path in paths.items()
+        }
+        length = min(sizes[name] // BAR_DTYPE[name].itemsize for name in paths)
+
+        for name, path in paths.items():
+            expected = length * BAR_DTYPE[name].itemsize
+            if sizes[name] != expected:
+                logger.warning("Truncating torn bar column", path=str(path), rows=length)
+                if path.exists():
+                    os.truncate(path, expected)
+        return length
+
+    def _row_count(self, day_dir: Path) -> int:
+        """Number of complete rows in a day directory."""
+        if not day_dir.exists():
+            return 0
+        counts = []
+        for name in BAR_DTYPE.names:
+            path = self._column_path(day_dir, name)
+            if not path.exists():
+                return 0
+            counts.append(path.stat().st_size // BAR_DTYPE[name].itemsize)
+        return min(counts)
+
+    def _get_coverage(self, symbol: str, bar_size: str) -> List[Interval]:
+        """Covered intervals of a series, loaded lazily."""
+        key = (symbol, bar_size)
+        if key not in self._coverage:
+            path = self._series_dir(symbol, bar_size) / self.COVERAGE_FILE
+            intervals: List[Interval] = []
+            if path.exists():
+                try:
+                    with open(path, "r") as f:
+                        intervals = [tuple(interval) for interval in json.load(f)]
+                except Exception as e:
+                    logger.error(
+                        "Failed to load bar coverage; treating series as unfetched",
+                        file_path=str(path),
+                        error=str(e),
+                    )
+            self._coverage[key] = intervals
+        return list(self._coverage[key])
+
+    def _load_contracts(self) -> Dict[str, Dict[str, Any]]:
+        """Contract details by symbol, loaded lazily."""
+        if self._contracts is None:
+            path = self.root_dir / self.CONTRACTS_FILE
+            self._contracts = {}
+            if path.exists():
+                try:
+                    with open(path, "r") as f:
+                        self._contracts = json.load(f)
+                except Exception as e:
+                    logger.error(
+                        "Failed to load stored contracts",
+                        file_path=str(path),
+                        error=str(e),
+                    )
+        return self._contracts
+
+    def _series_dir(self, symbol: str, bar_size: str) -> Path:
+        """Directory of one symbol/bar size series."""
+        return self.root_dir / symbol / bar_size
+
+    def _day_dir(self, symbol: str, bar_size: str, day: date) -> Path:
+        """Directory of one trading day."""
+        return self._series_dir(symbol, bar_size) / day.isoformat()
+
+    @staticmethod
+    def _column_path(day_dir: Path, name: str) -> Path:
+        """Column file within a day directory."""
+        return day_dir / f"{name}.i8"
+
+    @staticmethod
+    def _days_between(start: datetime, end: datetime) -> List[date]:
+        """UTC dates touched by the window [start, end)."""
+        start_day = start.astimezone(UTC).date()
+        last_day = (end.astimezone(UTC) - timedelta(microseconds=1)).date()
+        return [
+            start_day + timedelta(days=offset)
+            for offset in range((last_day - start_day).days + 1)
+        ]
+
+    @staticmethod
+    def _write_json(path: Path, data: Any) -> None:
+        """Atomically write a small JSON file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        temp_path.replace(path)
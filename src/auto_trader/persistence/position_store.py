@@ -0,0 +1,281 @@
+"""Transactional SQLite store for the position risk registry."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from ..logging_config import get_logger
+from ..risk_management.risk_models import PortfolioRiskState, PositionRiskEntry
+
+logger = get_logger("position_store", "system")
+
+DEFAULT_POSITION_DB_PATH = Path("data/state/position_registry.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS positions (
+    position_id TEXT PRIMARY KEY,
+    symbol TEXT NOT NULL,
+    risk_amount TEXT NOT NULL,
+    plan_id TEXT NOT NULL,
+    entry_time TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS registry_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_UPSERT_SQL = """
+INSERT INTO positions (position_id, symbol, risk_amount, plan_id, entry_time)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (position_id) DO UPDATE SET
+    symbol = excluded.symbol,
+    risk_amount = excluded.risk_amount,
+    plan_id = excluded.plan_id,
+    entry_time = excluded.entry_time
+"""
+
+_SET_META_SQL = """
+INSERT INTO registry_meta (key, value) VALUES (?, ?)
+ON CONFLICT (key) DO UPDATE SET value = excluded.value
+"""
+
+_ACCOUNT_VALUE_KEY = "account_value"
+_MIGRATED_FROM_KEY = "migrated_from"
+
+
+def _entry_row(entry: PositionRiskEntry) -> tuple:
+    """Convert a position entry to a positions table row."""
+    return (
+        entry.position_id,
+        entry.symbol,
+        str(entry.risk_amount),
+        entry.plan_id,
+        entry.entry_time.isoformat(),
+    )
+
+
+class PositionStore:
+    """
+    SQLite-backed position registry with one row per open position.
+
+    Each mutation is a single-row transaction, so adding or removing a
+    position costs the same regardless of how many positions are open. The
+    database runs in WAL mode; JSON remains available as an export format
+    via ``export_json`` and as a migration source via ``import_json``.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        """
+        Initialize position store.
+
+        Args:
+            db_path: Path to SQLite database file
+        """
+        self.db_path = Path(db_path or DEFAULT_POSITION_DB_PATH)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # Explicit transactions only; each statement group commits itself
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        logger.debug("PositionStore initialized", db_path=str(self.db_path))
+
+    def upsert_position(self, entry: PositionRiskEntry) -> None:
+        """
+        Insert or replace a single position in one transaction.
+
+        Args:
+            entry: Position risk entry to store
+        """
+        with self._lock:
+            with self._transaction():
+                self._conn.execute(_UPSERT_SQL, _entry_row(entry))
+
+    def delete_position(self, position_id: str) -> bool:
+        """
+        Delete a single position in one transaction.
+
+        Args:
+            position_id: Position identifier to delete
+
+        Returns:
+            True if a row was deleted, False if not found
+        """
+        with self._lock:
+            with self._transaction():
+                cursor = self._conn.execute(
+                    "DELETE FROM positions WHERE position_id = ?", (position_id,)
+                )
+        return cursor.rowcount > 0
+
+    def clear_positions(self) -> int:
+        """
+        Delete all positions.
+
+        Returns:
+            Number of positions deleted
+        """
+        with self._lock:
+            with self._transaction():
+                cursor = self._conn.execute("DELETE FROM positions")
+        return cursor.rowcount
+
+    def load_positions(self) -> Dict[str, PositionRiskEntry]:
+        """
+        Load all stored positions.
+
+        Returns:
+            Dictionary of position entries keyed by position ID
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT position_id, symbol, risk_amount, plan_id, entry_time "
+                "FROM positions ORDER BY rowid"
+            ).fetchall()
+
+        return {
+            position_id: PositionRiskEntry(
+                position_id=position_id,
+                symbol=symbol,
+                risk_amount=Decimal(risk_amount),
+                plan_id=plan_id,
+                entry_time=datetime.fromisoformat(entry_time),
+            )
+            for position_id, symbol, risk_amount, plan_id, entry_time in rows
+        }
+
+    def get_account_value(self) -> Optional[Decimal]:
+        """Get the stored account value, if any."""
+        value = self._get_meta(_ACCOUNT_VALUE_KEY)
+        return Decimal(value) if value is not None else None
+
+    def set_account_value(self, account_value: Decimal) -> None:
+        """Store the account value used for risk calculations."""
+        self._set_meta(_ACCOUNT_VALUE_KEY, str(account_value))
+
+    def position_count(self) -> int:
+        """Get number of stored positions."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+
+    def import_json(self, json_path: Path) -> int:
+        """
+        Import a JSON position registry into the store.
+
+        The import runs once per source file: a file that has already been
+        migrated is skipped, so calling this on every startup is safe.
+
+        Args:
+            json_path: Path to a PortfolioRiskState JSON file
+
+        Returns:
+            Number of positions imported
+        """
+        json_path = Path(json_path)
+        source = str(json_path.resolve())
+        if not json_path.exists() or self._get_meta(_MIGRATED_FROM_KEY) == source:
+            return 0
+
+        try:
+            with open(json_path, "r") as f:
+                state = PortfolioRiskState(**json.load(f))
+        except Exception as e:
+            logger.error(
+                "Failed to read JSON position registry for migration",
+                file_path=str(json_path),
+                error=str(e),
+            )
+            return 0
+
+        with self._lock:
+            with self._transaction():
+                self._conn.executemany(
+                    _UPSERT_SQL, [_entry_row(pos) for pos in state.positions]
+                )
+                self._conn.execute(
+                    _SET_META_SQL, (_ACCOUNT_VALUE_KEY, str(state.account_value))
+                )
+                self._conn.execute(_SET_META_SQL, (_MIGRATED_FROM_KEY, source))
+
+        logger.info(
+            "JSON position registry migrated to SQLite",
+            file_path=str(json_path),
+            db_path=str(self.db_path),
+            position_count=len(state.positions),
+        )
+        return len(state.positions)
+
+    def export_json(
+        self,
+        json_path: Path,
+        total_risk_percentage: Decimal = Decimal("0"),
+    ) -> Path:
+        """
+        Export the registry as a PortfolioRiskState JSON file.
+
+        Args:
+            json_path: Destination path
+            total_risk_percentage: Portfolio risk percentage to record
+
+        Returns:
+            Path to the exported file
+        """
+        json_path = Path(json_path)
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+
+        state = PortfolioRiskState(
+            positions=list(self.load_positions().values()),
+            total_risk_percentage=total_risk_percentage,
+            account_value=self.get_account_value() or Decimal("0"),
+            last_updated=datetime.utcnow(),
+        )
+
+        temp_file = json_path.with_suffix(".tmp")
+        with open(temp_file, "w") as f:
+            json.dump(state.model_dump(mode="json"), f, indent=2, default=str)
+        temp_file.replace(json_path)
+
+        return json_path
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        """Read a metadata value."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM registry_meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        """Write a metadata value in one transaction."""
+        with self._lock:
+            with self._transaction():
+                self._conn.execute(_SET_META_SQL, (key, value))
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run the enclosed statements in one explicit transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
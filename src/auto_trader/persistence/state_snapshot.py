@@ -0,0 +1,401 @@
+"""Binary warm-restart snapshots of in-memory bar stores and function state."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from ..io_executor import IOExecutor, get_io_executor
+from ..logging_config import get_logger
+from ..models.market_data import BarData
+from .bar_codec import BAR_DTYPE, array_to_bars, bars_to_array, from_epoch_us
+
+if TYPE_CHECKING:
+    from ..models.market_data_cache import MarketDataCache
+    from ..trade_engine.function_registry import ExecutionFunctionRegistry
+    from ..trade_engine.historical_data_manager import HistoricalDataManager
+
+logger = get_logger("state_snapshot", "system")
+
+DEFAULT_SNAPSHOT_DIR = Path("data/state/snapshot")
+
+HISTORICAL_SECTION = "historical"
+CACHE_SECTION = "cache"
+
+
+class SnapshotSegment(BaseModel):
+    """Location of one bar series within the snapshot bar array."""
+
+    section: str = Field(..., description="Owning bar store")
+    key: str = Field(..., description="Series key ('symbol:bar_size')")
+    offset: int = Field(..., ge=0, description="First row in the bar array")
+    count: int = Field(..., ge=0, description="Number of rows")
+
+
+class SnapshotManifest(BaseModel):
+    """Index of a snapshot: bar segments plus function state."""
+
+    generation: int = Field(..., ge=1, description="Monotonic snapshot number")
+    created_at: datetime = Field(..., description="Snapshot timestamp (UTC)")
+    bars_file: str = Field(..., description="Bar array file name")
+    segments: List[SnapshotSegment] = Field(default_factory=list)
+    function_state: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+
+
+@dataclass
+class StateSnapshot:
+    """A loaded snapshot whose bar rows are memory-mapped from disk."""
+
+    manifest: SnapshotManifest
+    rows: np.ndarray
+
+    @property
+    def created_at(self) -> datetime:
+        """When the snapshot was taken."""
+        return self.manifest.created_at
+
+    @property
+    def function_state(self) -> Dict[str, Dict[str, Any]]:
+        """Saved state of execution function instances by name."""
+        return self.manifest.function_state
+
+    def section_bars(self, section: str) -> Dict[str, List[BarData]]:
+        """
+        Decode the bar series of one section.
+
+        Args:
+            section: HISTORICAL_SECTION or CACHE_SECTION
+
+        Returns:
+            Bars by series key, in chronological order
+        """
+        result = {}
+        for segment in self.manifest.segments:
+            if segment.section != section:
+                continue
+            symbol, bar_size = segment.key.split(":")
+            rows = self.rows[segment.offset:segment.offset + segment.count]
+            result[segment.key] = array_to_bars(rows, symbol, bar_size)
+        return result
+
+    def backfill_start(self, bar_size: str) -> Dict[str, datetime]:
+        """
+        Get the newest snapshotted bar time per symbol for a bar size.
+
+        Startup only needs to fetch bars after these times.
+
+        Args:
+            bar_size: Bar size being backfilled
+
+        Returns:
+            Latest bar timestamp by symbol
+        """
+        latest: Dict[str, datetime] = {}
+        for segment in self.manifest.segments:
+            symbol, segment_bar_size = segment.key.split(":")
+            if segment_bar_size != bar_size or segment.count == 0:
+                continue
+            last_row = self.rows[segment.offset + segment.count - 1]
+            timestamp = from_epoch_us(last_row["timestamp_us"])
+            if symbol not in latest or timestamp > latest[symbol]:
+                latest[symbol] = timestamp
+        return latest
+
+
+class StateSnapshotStore:
+    """
+    Binary snapshot store for warm restarts.
+
+    All bar series of the historical data manager and market data cache
+    are packed into a single ``.npy`` structured array (fixed-point prices,
+    microsecond timestamps) that is memory-mapped on load. A small JSON
+    manifest records each series' row range and the state of stateful
+    execution functions. Each snapshot writes a new array file and then
+    atomically replaces the manifest, so a crash mid-write leaves the
+    previous snapshot readable.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(
+        self, snapshot_dir: Optional[Path] = None, io_executor: Optional[IOExecutor] = None
+    ) -> None:
+        """
+        Initialize snapshot store.
+
+        Args:
+            snapshot_dir: Directory holding the bar array and manifest
+            io_executor: Executor for snapshot reads and writes (defaults to the shared one)
+        """
+        self.snapshot_dir = Path(snapshot_dir or DEFAULT_SNAPSHOT_DIR)
+        self._io = io_executor or get_io_executor()
+        self.manifest_file = self.snapshot_dir / self.MANIFEST_NAME
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+
+        self._periodic_task: Optional[asyncio.Task] = None
+        self._periodic_owners: tuple = (None, None, None)
+
+        # Metrics
+        self.snapshots_written = 0
+        self.last_write_ms = 0.0
+        self.last_load_ms = 0.0
+
+    def write(
+        self,
+        sections: Dict[str, Dict[str, List[BarData]]],
+        function_state: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> SnapshotManifest:
+        """
+        Write a snapshot.
+
+        Args:
+            sections: Bar series by section, then by 'symbol:bar_size' key
+            function_state: Execution function state by instance name
+
+        Returns:
+            Manifest of the written snapshot
+        """
+        start = time.perf_counter()
+        previous = self._read_manifest()
+        generation = previous.generation + 1 if previous else 1
+
+        segments = []
+        arrays = []
+        offset = 0
+        for section, series in sections.items():
+            for key, bars in series.items():
+                segments.append(
+                    SnapshotSegment(
+                        section=section, key=key, offset=offset, count=len(bars)
+                    )
+                )
+                arrays.append(bars_to_array(bars))
+                offset += len(bars)
+
+        rows = np.concatenate(arrays) if arrays else np.empty(0, dtype=BAR_DTYPE)
+        manifest = SnapshotManifest(
+            generation=generation,
+            created_at=datetime.now(UTC),
+            bars_file=f"bars_{generation:08d}.npy",
+            segments=segments,
+            function_state=function_state or {},
+        )
+
+        self._write_array(self.snapshot_dir / manifest.bars_file, rows)
+        self._write_manifest(manifest)
+        if previous and previous.bars_file != manifest.bars_file:
+            (self.snapshot_dir / previous.bars_file).unlink(missing_ok=True)
+
+        self.snapshots_written += 1
+        self.last_write_ms = (time.perf_counter() - start) * 1000
+        logger.debug(
+            "State snapshot written",
+            generation=generation,
+            series=len(segments),
+            bars=len(rows),
+            write_ms=round(self.last_write_ms, 2),
+        )
+        return manifest
+
+    def read(self) -> Optional[StateSnapshot]:
+        """
+        Load the latest snapshot with its bar array memory-mapped.
+
+        Returns:
+            Loaded snapshot, or None if none exists or it is unreadable
+        """
+        start = time.perf_counter()
+        manifest = self._read_manifest()
+        if manifest is None:
+            return None
+
+        bars_path = self.snapshot_dir / manifest.bars_file
+        try:
+            total_rows = sum(segment.count for segment in manifest.segments)
+            # Zero-length arrays cannot be memory-mapped
+            rows = np.load(bars_path, mmap_mode="r" if total_rows else None)
+        except Exception as e:
+            logger.error(
+                "Failed to load state snapshot bars",
+                file_path=str(bars_path),
+                error=str(e),
+            )
+            return None
+
+        self.last_load_ms = (time.perf_counter() - start) * 1000
+        return StateSnapshot(manifest=manifest, rows=rows)
+
+    async def capture(
+        self,
+        historical_data_manager: Optional["HistoricalDataManager"] = None,
+        market_data_cache: Optional["MarketDataCache"] = None,
+        function_registry: Optional["ExecutionFunctionRegistry"] = None,
+    ) -> SnapshotManifest:
+        """
+        Snapshot live state owners and write it off the event loop.
+
+        Args:
+            historical_data_manager: Execution framework bar store
+            market_data_cache: Market data cache
+            function_registry: Registry of execution function instances
+
+        Returns:
+            Manifest of the written snapshot
+        """
+        sections: Dict[str, Dict[str, List[BarData]]] = {}
+        if historical_data_manager is not None:
+            sections[HISTORICAL_SECTION] = await historical_data_manager.export_bars()
+        if market_data_cache is not None:
+            sections[CACHE_SECTION] = market_data_cache.export_bars()
+        function_state = (
+            function_registry.export_function_state() if function_registry else {}
+        )
+
+        return await self._io.run("state_snapshot.write", self.write, sections, function_state)
+
+    async def restore(
+        self,
+        historical_data_manager: Optional["HistoricalDataManager"] = None,
+        market_data_cache: Optional["MarketDataCache"] = None,
+        function_registry: Optional["ExecutionFunctionRegistry"] = None,
+    ) -> Optional[StateSnapshot]:
+        """
+        Restore state owners from the latest snapshot.
+
+        Function state is applied to instances that already exist in the
+        registry, so functions should be created before restoring.
+
+        Args:
+            historical_data_manager: Execution framework bar store
+            market_data_cache: Market data cache
+            function_registry: Registry of execution function instances
+
+        Returns:
+            The restored snapshot (use ``backfill_start`` to fetch only the
+            gap), or None if no snapshot exists
+        """
+        snapshot = await self._io.run("state_snapshot.read", self.read)
+        if snapshot is None:
+            return None
+
+        restored_bars = 0
+        if historical_data_manager is not None:
+            restored_bars += await historical_data_manager.restore_bars(
+                snapshot.section_bars(HISTORICAL_SECTION)
+            )
+        if market_data_cache is not None:
+            restored_bars += market_data_cache.restore_bars(
+                snapshot.section_bars(CACHE_SECTION)
+            )
+        restored_functions = 0
+        if function_registry is not None:
+            restored_functions = function_registry.restore_function_state(
+                snapshot.function_state
+            )
+
+        logger.info(
+            "State restored from snapshot",
+            generation=snapshot.manifest.generation,
+            snapshot_age_seconds=round(
+                (datetime.now(UTC) - snapshot.created_at).total_seconds(), 1
+            ),
+            restored_bars=restored_bars,
+            restored_functions=restored_functions,
+            load_ms=round(self.last_load_ms, 2),
+        )
+        return snapshot
+
+    def start_periodic(
+        self,
+        interval_seconds: float,
+        historical_data_manager: Optional["HistoricalDataManager"] = None,
+        market_data_cache: Optional["MarketDataCache"] = None,
+        function_registry: Optional["ExecutionFunctionRegistry"] = None,
+    ) -> None:
+        """
+        Start snapshotting state owners on a fixed interval.
+
+        Args:
+            interval_seconds: Seconds between snapshots
+            historical_data_manager: Execution framework bar store
+            market_data_cache: Market data cache
+            function_registry: Registry of execution function instances
+        """
+        if self._periodic_task and not self._periodic_task.done():
+            return
+        self._periodic_owners = (
+            historical_data_manager, market_data_cache, function_registry
+        )
+        self._periodic_task = asyncio.get_running_loop().create_task(
+            self._periodic_loop(interval_seconds)
+        )
+
+    async def stop_periodic(self, final_snapshot: bool = True) -> None:
+        """
+        Stop periodic snapshots, by default writing one last snapshot.
+
+        Args:
+            final_snapshot: Write a snapshot after stopping (e.g. on shutdown)
+        """
+        if self._periodic_task is None:
+            return
+        self._periodic_task.cancel()
+        try:
+            await self._periodic_task
+        except asyncio.CancelledError:
+            pass
+        self._periodic_task = None
+        if final_snapshot:
+            await self.capture(*self._periodic_owners)
+
+    async def _periodic_loop(self, interval_seconds: float) -> None:
+        """Write a snapshot every interval."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await self.capture(*self._periodic_owners)
+            except Exception as e:
+                logger.error("Periodic state snapshot failed", error=str(e))
+
+    def _read_manifest(self) -> Optional[SnapshotManifest]:
+        """Load the manifest, or None if missing or unreadable."""
+        if not self.manifest_file.exists():
+            return None
+        try:
+            with open(self.manifest_file, "r") as f:
+                return SnapshotManifest(**json.load(f))
+        except Exception as e:
+            logger.error(
+                "Failed to load state snapshot manifest",
+                file_path=str(self.manifest_file),
+                error=str(e),
+            )
+            return None
+
+    def _write_manifest(self, manifest: SnapshotManifest) -> None:
+        """Atomically replace the manifest."""
+        temp_path = self.manifest_file.with_suffix(".tmp")
+        with open(temp_path, "w") as f:
+            json.dump(manifest.model_dump(mode="json"), f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        temp_path.replace(self.manifest_file)
+
+    @staticmethod
+    def _write_array(path: Path, rows: np.ndarray) -> None:
+        """Write a bar array durably before the manifest references it."""
+        temp_path = path.with_suffix(".tmp")
+        with open(temp_path, "wb") as f:
+            np.save(f, rows)
+            f.flush()
+            os.fsync(f.fileno())
+        temp_path.replace(path)
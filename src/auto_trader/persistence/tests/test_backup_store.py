@@ -0,0 +1,175 @@
+"""Tests for the content-addressed backup store."""
+
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from ...integrations.ibkr_client.state_manager import OrderStateManager
+from ...models import Order, OrderSide, OrderStatus, OrderType
+from ...risk_management.portfolio_tracker import PortfolioTracker
+from ..backup_store import BackupStore, stream_name
+
+
+@pytest.fixture
+def temp_dir():
+    """Create temporary directory."""
+    with tempfile.TemporaryDirectory() as directory:
+        yield Path(directory)
+
+
+@pytest.fixture
+def store(temp_dir):
+    """Create backup store in a temporary directory."""
+    return BackupStore(temp_dir / "backups", max_versions=3)
+
+
+class TestBackupStore:
+    """Tests for deduplication, rotation and restore."""
+
+    def test_unchanged_content_is_skipped(self, store, temp_dir):
+        """Test repeated backups of unchanged content write nothing."""
+        state_file = temp_dir / "state.json"
+        state_file.write_text('{"positions": []}')
+
+        first = store.backup_file("state", state_file)
+        for _ in range(5):
+            assert store.backup_file("state", state_file) is None
+
+        # Rewritten with identical content: read and hashed, still skipped
+        state_file.write_text('{"positions": []}')
+        assert store.backup_file("state", state_file) is None
+
+        assert first.version == 1
+        assert store.backups_written == 1
+        assert store.backups_skipped == 6
+        assert store.blobs_written == 1
+
+    def test_identical_blobs_shared_across_streams(self, store):
+        """Test identical content from different streams is stored once."""
+        store.backup_bytes("portfolio", b"same")
+        store.backup_bytes("orders", b"same")
+
+        assert store.blobs_written == 1
+        assert len(list(store.blob_dir.rglob("*"))) == 2  # one prefix dir + blob
+
+    def test_rotation_uses_manifest(self, store):
+        """Test old versions and unreferenced blobs are dropped."""
+        for i in range(5):
+            store.backup_bytes("state", f"content {i}".encode())
+
+        versions = store.list_versions("state")
+        assert [v.version for v in versions] == [3, 4, 5]
+        assert len([p for p in store.blob_dir.rglob("*") if p.is_file()]) == 3
+
+    def test_rotation_keeps_blobs_still_referenced(self, store):
+        """Test a blob shared with another stream survives rotation."""
+        store.backup_bytes("orders", b"shared")
+        for content in (b"shared", b"a", b"b", b"c"):
+            store.backup_bytes("state", content)
+
+        assert store.read_version("orders") == b"shared"
+
+    def test_point_in_time_restore(self, store, temp_dir):
+        """Test restoring by version number and by timestamp."""
+        store.backup_bytes("state", b"v1")
+        cutoff = datetime.utcnow()
+        time.sleep(0.01)
+        store.backup_bytes("state", b"v2")
+
+        destination = temp_dir / "restored.json"
+        restored = store.restore("state", destination, at=cutoff)
+        assert restored.version == 1
+        assert destination.read_bytes() == b"v1"
+
+        store.restore("state", destination, version=2)
+        assert destination.read_bytes() == b"v2"
+
+        with pytest.raises(FileNotFoundError):
+            store.restore("state", destination, at=cutoff - timedelta(days=1))
+
+    def test_aware_restore_time_converted_to_utc(self, store, temp_dir):
+        """Test timezone-aware restore times are compared in UTC."""
+        store.backup_bytes("state", b"v1")
+        cutoff = datetime.now(timezone.utc)
+        time.sleep(0.01)
+        store.backup_bytes("state", b"v2")
+
+        eastern_cutoff = cutoff.astimezone(timezone(timedelta(hours=-5)))
+        assert store.find_version("state", at=eastern_cutoff).version == 1
+        assert store.find_version("state", at=eastern_cutoff - timedelta(days=1)) is None
+
+    def test_same_named_files_use_separate_streams(self, store, temp_dir):
+        """Test default stream names keep same-named state files apart."""
+        first = temp_dir / "a" / "state.json"
+        second = temp_dir / "b" / "state.json"
+        for path, content in ((first, "a"), (second, "b")):
+            path.parent.mkdir()
+            path.write_text(content)
+            store.backup_file(stream_name(path), path)
+
+        assert stream_name(first) != stream_name(second)
+        assert store.read_version(stream_name(first)) == b"a"
+        assert store.read_version(stream_name(second)) == b"b"
+        assert stream_name(temp_dir / "a" / ".." / "a" / "state.json") == stream_name(first)
+
+    def test_manifest_survives_restart(self, store, temp_dir):
+        """Test a new store instance sees retained versions."""
+        store.backup_bytes("state", b"v1")
+        store.backup_bytes("state", b"v2")
+
+        reopened = BackupStore(temp_dir / "backups", max_versions=3)
+
+        assert [v.version for v in reopened.list_versions("state")] == [1, 2]
+        assert reopened.backup_bytes("state", b"v2") is None
+        assert reopened.read_version("state", 1) == b"v1"
+
+
+class TestBackupStoreIntegration:
+    """Tests for state owners sharing one backup store."""
+
+    def test_portfolio_tracker_uses_store(self, store, temp_dir):
+        """Test automated backups go to the store instead of sibling files."""
+        state_file = temp_dir / "position_registry.json"
+        tracker = PortfolioTracker(
+            state_file=state_file,
+            account_value=Decimal("10000.00"),
+            backup_store=store,
+        )
+        tracker.add_position("POS_001", "AAPL", Decimal("200.00"), "AAPL_001")
+        tracker.add_position("POS_002", "MSFT", Decimal("300.00"), "MSFT_001")
+
+        assert list(temp_dir.glob("*.backup_*.json")) == []
+        assert len(store.list_versions(stream_name(state_file))) == 1
+
+    async def test_order_state_backup_and_restore(self, store, temp_dir):
+        """Test order backups are deduplicated and restorable by version."""
+        manager = OrderStateManager(temp_dir / "orders", backup_store=store)
+        order = Order(
+            order_id="SIM_001",
+            trade_plan_id="AAPL_20250827_001",
+            symbol="AAPL",
+            side=OrderSide.BUY,
+            order_type=OrderType.MARKET,
+            quantity=100,
+            status=OrderStatus.SUBMITTED,
+        )
+
+        await manager.save_state({"SIM_001": order})
+        first_backup = await manager.create_backup("first")
+        assert await manager.create_backup("unchanged") == first_backup
+
+        await manager.save_state({})
+        await manager.create_backup("second")
+        assert [v.reason for v in store.list_versions(manager.backup_stream)] == [
+            "first",
+            "second",
+        ]
+        assert list(manager.backup_dir.iterdir()) == []
+
+        restored = await manager.restore_backup(version=1)
+        assert list(restored) == ["SIM_001"]
+        assert list(await manager.load_state()) == ["SIM_001"]
@@ -0,0 +1,115 @@
+"""Tests for the local historical bar store."""
+
+import tempfile
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ...models.market_data import BarData
+from ..bar_store import BarStore
+
+
+@pytest.fixture
+def store():
+    """Create bar store in a temporary directory."""
+    with tempfile.TemporaryDirectory() as directory:
+        yield BarStore(Path(directory) / "bars")
+
+
+def make_bars(start, count, symbol="AAPL"):
+    """Create consecutive 5-minute bars."""
+    return [
+        BarData(
+            symbol=symbol,
+            timestamp=start + timedelta(minutes=5 * i),
+            open_price=Decimal("180.1234"),
+            high_price=Decimal("181.0000"),
+            low_price=Decimal("179.5000"),
+            close_price=Decimal("180.5000"),
+            volume=1000 + i,
+            bar_size="5min",
+        )
+        for i in range(count)
+    ]
+
+
+START = datetime(2025, 8, 27, 23, 30, tzinfo=UTC)
+
+
+class TestBarStore:
+    """Tests for append-only storage, coverage and contracts."""
+
+    def test_bars_round_trip_across_days(self, store):
+        """Test bars are split by day on write and merged on read."""
+        bars = make_bars(START, 12)  # 23:30 to 00:25 next day
+
+        assert store.append_bars("AAPL", "5min", bars) == 12
+
+        assert store.read_bars("AAPL", "5min", START, START + timedelta(hours=2)) == bars
+        assert store.read_bars(
+            "AAPL", "5min", START + timedelta(minutes=30), START + timedelta(minutes=40)
+        ) == bars[6:8]
+        day_dirs = sorted(p.name for p in (store.root_dir / "AAPL" / "5min").iterdir())
+        assert day_dirs == ["2025-08-27", "2025-08-28"]
+
+    def test_append_skips_stored_bars_and_sorts_on_read(self, store):
+        """Test overlapping and out-of-order appends keep one row per bar."""
+        bars = make_bars(START, 6)
+        store.append_bars("AAPL", "5min", bars[3:])
+
+        assert store.append_bars("AAPL", "5min", bars) == 3
+        assert store.append_bars("AAPL", "5min", bars) == 0
+
+        assert store.read_bars("AAPL", "5min", START, START + timedelta(hours=1)) == bars
+
+    def test_read_columns_are_memory_mapped(self, store):
+        """Test day columns are exposed as memory maps."""
+        store.append_bars("AAPL", "5min", make_bars(START, 3))
+
+        columns = store.read_columns("AAPL", "5min", START.date())
+
+        assert isinstance(columns["close"], np.memmap)
+        assert columns["volume"].tolist() == [1000, 1001, 1002]
+        assert store.read_columns("MSFT", "5min", START.date()) is None
+
+    def test_torn_append_is_repaired(self, store):
+        """Test a partially written column is truncated before the next append."""
+        bars = make_bars(START, 4)
+        store.append_bars("AAPL", "5min", bars[:2])
+        day_dir = store.root_dir / "AAPL" / "5min" / START.date().isoformat()
+        with open(day_dir / "close.i8", "ab") as f:
+            f.write(b"\x00" * 12)
+
+        assert store.read_bars("AAPL", "5min", START, START + timedelta(hours=1)) == bars[:2]
+        assert store.append_bars("AAPL", "5min", bars) == 2
+        assert store.read_bars("AAPL", "5min", START, START + timedelta(hours=1)) == bars
+
+    def test_missing_ranges_follow_coverage(self, store):
+        """Test coverage is merged and persisted across instances."""
+        hour = timedelta(hours=1)
+        store.mark_covered("AAPL", "5min", START, START + hour)
+        store.mark_covered("AAPL", "5min", START + 2 * hour, START + 3 * hour)
+        store.mark_covered("AAPL", "5min", START + hour, START + 2 * hour)
+
+        reopened = BarStore(store.root_dir)
+
+        assert reopened.missing_ranges("AAPL", "5min", START, START + 3 * hour) == []
+        assert reopened.missing_ranges(
+            "AAPL", "5min", START - hour, START + 4 * hour
+        ) == [(START - hour, START), (START + 3 * hour, START + 4 * hour)]
+        assert reopened.missing_ranges("MSFT", "5min", START, START + hour) == [
+            (START, START + hour)
+        ]
+
+    def test_contracts_persist(self, store):
+        """Test contract details survive reopening the store."""
+        store.save_contract("AAPL", {"conId": 265598, "symbol": "AAPL"})
+
+        assert BarStore(store.root_dir).get_contract("AAPL") == {
+            "conId": 265598,
+            "symbol": "AAPL",
+        }
+        assert store.get_contract("MSFT") is None
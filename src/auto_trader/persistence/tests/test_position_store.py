@@ -0,0 +1,224 @@
+"""Tests for the SQLite position registry store."""
+
+import json
+import sqlite3
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from ...risk_management.portfolio_tracker import PortfolioTracker
+from ...risk_management.risk_models import PositionRiskEntry
+from ..position_store import PositionStore
+
+
+@pytest.fixture
+def temp_dir():
+    """Create temporary directory."""
+    with tempfile.TemporaryDirectory() as directory:
+        yield Path(directory)
+
+
+@pytest.fixture
+def store(temp_dir):
+    """Create position store with a temporary database."""
+    position_store = PositionStore(temp_dir / "positions.db")
+    yield position_store
+    position_store.close()
+
+
+def make_entry(position_id="POS_001", symbol="AAPL", risk_amount="200.00"):
+    """Create a position risk entry."""
+    return PositionRiskEntry(
+        position_id=position_id,
+        symbol=symbol,
+        risk_amount=Decimal(risk_amount),
+        plan_id=f"{symbol}_001",
+    )
+
+
+class TestPositionStore:
+    """Tests for single-row position persistence."""
+
+    def test_database_uses_wal(self, store, temp_dir):
+        """Test database is in WAL mode."""
+        conn = sqlite3.connect(str(temp_dir / "positions.db"))
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        finally:
+            conn.close()
+
+        assert mode == "wal"
+
+    def test_upsert_and_load_roundtrip(self, store):
+        """Test positions round-trip with exact decimal amounts."""
+        entry = make_entry(risk_amount="123.45")
+        store.upsert_position(entry)
+        store.upsert_position(make_entry("POS_001", "AAPL", "150.10"))
+        store.upsert_position(make_entry("POS_002", "MSFT"))
+
+        positions = store.load_positions()
+
+        assert list(positions) == ["POS_001", "POS_002"]
+        assert positions["POS_001"].risk_amount == Decimal("150.10")
+        assert positions["POS_002"].entry_time is not None
+        assert store.position_count() == 2
+
+    def test_delete_and_clear(self, store):
+        """Test deleting single positions and clearing the registry."""
+        store.upsert_position(make_entry("POS_001"))
+        store.upsert_position(make_entry("POS_002"))
+
+        assert store.delete_position("POS_001") is True
+        assert store.delete_position("POS_001") is False
+        assert store.clear_positions() == 1
+        assert store.load_positions() == {}
+
+    def test_account_value(self, store):
+        """Test account value is stored as metadata."""
+        assert store.get_account_value() is None
+
+        store.set_account_value(Decimal("25000.00"))
+
+        assert store.get_account_value() == Decimal("25000.00")
+
+    def test_import_json_runs_once(self, store, temp_dir):
+        """Test JSON registry migration imports positions once."""
+        json_path = temp_dir / "position_registry.json"
+        tracker = PortfolioTracker(state_file=json_path, account_value=Decimal("10000"))
+        tracker.add_position("POS_001", "AAPL", Decimal("200.00"), "AAPL_001")
+        tracker.add_position("POS_002", "MSFT", Decimal("300.00"), "MSFT_001")
+
+        assert store.import_json(json_path) == 2
+        assert store.import_json(json_path) == 0
+
+        store.delete_position("POS_001")
+        store.import_json(json_path)
+
+        assert list(store.load_positions()) == ["POS_002"]
+        assert store.get_account_value() == Decimal("10000.00")
+
+    def test_import_missing_or_corrupt_json(self, store, temp_dir):
+        """Test migration ignores missing and unreadable files."""
+        corrupt = temp_dir / "corrupt.json"
+        corrupt.write_text("invalid json content")
+
+        assert store.import_json(temp_dir / "missing.json") == 0
+        assert store.import_json(corrupt) == 0
+
+    def test_export_json(self, store, temp_dir):
+        """Test JSON export matches the registry state format."""
+        store.set_account_value(Decimal("10000.00"))
+        store.upsert_position(make_entry())
+
+        export_path = store.export_json(temp_dir / "export.json", Decimal("2.00"))
+
+        with open(export_path) as f:
+            data = json.load(f)
+        assert data["account_value"] == "10000.00"
+        assert data["total_risk_percentage"] == "2.00"
+        assert data["positions"][0]["position_id"] == "POS_001"
+
+
+class TestPortfolioTrackerWithStore:
+    """Tests for PortfolioTracker backed by the SQLite store."""
+
+    def test_mutations_persist_without_json_rewrite(self, store, temp_dir):
+        """Test add/remove go to the database and skip JSON state writes."""
+        json_path = temp_dir / "position_registry.json"
+        tracker = PortfolioTracker(
+            state_file=json_path,
+            account_value=Decimal("10000.00"),
+            position_store=store,
+        )
+        tracker.add_position("POS_001", "AAPL", Decimal("200.00"), "AAPL_001")
+        tracker.add_position("POS_002", "MSFT", Decimal("300.00"), "MSFT_001")
+        tracker.remove_position("POS_001")
+
+        assert not json_path.exists()
+        assert list(store.load_positions()) == ["POS_002"]
+
+        reloaded = PortfolioTracker(state_file=json_path, position_store=store)
+        assert reloaded.get_position_count() == 1
+        assert reloaded.get_current_portfolio_risk() == Decimal("3.00")
+
+    def test_migrates_existing_json_registry(self, temp_dir):
+        """Test an existing JSON registry is imported on first start."""
+        json_path = temp_dir / "position_registry.json"
+        legacy = PortfolioTracker(state_file=json_path, account_value=Decimal("10000"))
+        legacy.add_position("POS_001", "AAPL", Decimal("200.00"), "AAPL_001")
+
+        position_store = PositionStore(temp_dir / "positions.db")
+        try:
+            tracker = PortfolioTracker(state_file=json_path, position_store=position_store)
+
+            assert tracker.get_position_count() == 1
+            assert tracker.get_total_dollar_risk() == Decimal("200.00")
+            assert tracker._account_value == Decimal("10000.00")
+        finally:
+            position_store.close()
+
+    def test_backup_exports_json(self, store, temp_dir):
+        """Test backups export the registry before copying it."""
+        json_path = temp_dir / "position_registry.json"
+        tracker = PortfolioTracker(
+            state_file=json_path,
+            account_value=Decimal("10000.00"),
+            position_store=store,
+        )
+        tracker.add_position("POS_001", "AAPL", Decimal("200.00"), "AAPL_001")
+
+        backup_path = tracker.create_backup()
+
+        with open(backup_path) as f:
+            assert len(json.load(f)["positions"]) == 1
+
+    def test_clear_all_positions(self, store, temp_dir):
+        """Test clearing positions clears the database."""
+        tracker = PortfolioTracker(
+            state_file=temp_dir / "position_registry.json",
+            account_value=Decimal("10000.00"),
+            position_store=store,
+        )
+        tracker.add_position("POS_001", "AAPL", Decimal("200.00"), "AAPL_001")
+
+        assert tracker.clear_all_positions() == 1
+        assert store.position_count() == 0
+
+    def test_mutation_cost_independent_of_registry_size(self, temp_dir):
+        """Benchmark per-mutation cost of JSON rewrite vs single-row upsert."""
+        open_positions = 200
+        mutations = 50
+
+        def time_mutations(tracker):
+            for i in range(open_positions):
+                tracker.add_position(f"BASE_{i}", "AAPL", Decimal("1.00"), f"PLAN_{i}")
+            start = time.perf_counter()
+            for i in range(mutations):
+                tracker.add_position(f"NEW_{i}", "MSFT", Decimal("1.00"), f"NEW_{i}")
+                tracker.remove_position(f"NEW_{i}")
+            return (time.perf_counter() - start) * 1000 / (mutations * 2)
+
+        json_tracker = PortfolioTracker(
+            state_file=temp_dir / "json" / "registry.json",
+            account_value=Decimal("1000000"),
+        )
+        json_ms = time_mutations(json_tracker)
+
+        position_store = PositionStore(temp_dir / "positions.db")
+        try:
+            sqlite_tracker = PortfolioTracker(
+                state_file=temp_dir / "sqlite" / "registry.json",
+                account_value=Decimal("1000000"),
+                position_store=position_store,
+            )
+            sqlite_ms = time_mutations(sqlite_tracker)
+        finally:
+            position_store.close()
+
+        print(f"JSON rewrite with {open_positions} positions: {json_ms:.2f}ms/mutation")
+        print(f"SQLite single-row with {open_positions} positions: {sqlite_ms:.2f}ms/mutation")
+
+        assert sqlite_ms < json_ms
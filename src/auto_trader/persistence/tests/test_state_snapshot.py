@@ -0,0 +1,200 @@
+"""Tests for binary warm-restart state snapshots."""
+
+import tempfile
+import time
+from datetime import datetime, timedelta, UTC
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ...models.enums import Timeframe
+from ...models.execution import ExecutionFunctionConfig
+from ...models.market_data import BarData
+from ...models.market_data_cache import MarketDataCache
+from ...trade_engine.function_registry import ExecutionFunctionRegistry
+from ...trade_engine.functions import CloseAboveFunction, TrailingStopFunction
+from ...trade_engine.historical_data_manager import HistoricalDataManager
+from ..bar_codec import array_to_bars, bars_to_array
+from ..state_snapshot import CACHE_SECTION, HISTORICAL_SECTION, StateSnapshotStore
+
+
+@pytest.fixture
+def temp_dir():
+    """Create temporary directory."""
+    with tempfile.TemporaryDirectory() as directory:
+        yield Path(directory)
+
+
+def make_bars(symbol="AAPL", bar_size="1min", count=5, start=None):
+    """Create consecutive bars with 4-decimal prices."""
+    start = start or datetime(2025, 8, 28, 14, 30, tzinfo=UTC)
+    step = timedelta(minutes=1 if bar_size == "1min" else 5)
+    return [
+        BarData(
+            symbol=symbol,
+            timestamp=start + i * step,
+            open_price=Decimal("180.1234") + i,
+            high_price=Decimal("181.5000") + i,
+            low_price=Decimal("179.0001") + i,
+            close_price=Decimal("180.9999") + i,
+            volume=100_000 + i,
+            bar_size=bar_size,
+        )
+        for i in range(count)
+    ]
+
+
+async def make_registry():
+    """Create registry with a trailing stop and a stateless function."""
+    registry = ExecutionFunctionRegistry()
+    await registry.register("trailing_stop", TrailingStopFunction)
+    await registry.register("close_above", CloseAboveFunction)
+    await registry.create_function(
+        ExecutionFunctionConfig(
+            name="AAPL_trail",
+            function_type="trailing_stop",
+            timeframe=Timeframe.ONE_MIN,
+            parameters={"trail_percentage": 2.0},
+        )
+    )
+    await registry.create_function(
+        ExecutionFunctionConfig(
+            name="AAPL_entry",
+            function_type="close_above",
+            timeframe=Timeframe.ONE_MIN,
+            parameters={"threshold_price": 180.0},
+        )
+    )
+    return registry
+
+
+class TestBarCodec:
+    """Tests for the columnar bar encoding."""
+
+    def test_round_trip_is_exact(self):
+        """Test prices, timestamps and volumes survive encoding unchanged."""
+        bars = make_bars(count=3)
+
+        decoded = array_to_bars(bars_to_array(bars), "AAPL", "1min")
+
+        assert decoded == bars
+
+
+class TestStateSnapshotStore:
+    """Tests for snapshot writing, loading and restore."""
+
+    async def test_capture_and_restore_round_trip(self, temp_dir):
+        """Test bar stores and trailing stop state survive a restart."""
+        store = StateSnapshotStore(temp_dir / "snapshot")
+
+        manager = HistoricalDataManager()
+        for bar in make_bars(count=30):
+            await manager.update_data(bar, Timeframe.ONE_MIN)
+        cache = MarketDataCache()
+        await cache.populate_historical("MSFT", make_bars("MSFT", "5min", 10))
+        registry = await make_registry()
+        trail = registry.get_function("AAPL_trail")
+        trail._highest_price = Decimal("185.2500")
+        trail._current_stop_level = Decimal("181.5450")
+
+        await store.capture(manager, cache, registry)
+
+        restored_manager = HistoricalDataManager()
+        restored_cache = MarketDataCache()
+        restored_registry = await make_registry()
+        snapshot = await store.restore(
+            restored_manager, restored_cache, restored_registry
+        )
+
+        assert await restored_manager.get_historical_bars(
+            "AAPL", Timeframe.ONE_MIN
+        ) == await manager.get_historical_bars("AAPL", Timeframe.ONE_MIN)
+        assert await restored_manager.has_sufficient_data("AAPL", Timeframe.ONE_MIN)
+        assert restored_cache.get_bars("MSFT", "5min") == cache.get_bars("MSFT", "5min")
+
+        restored_trail = restored_registry.get_function("AAPL_trail")
+        assert restored_trail._highest_price == Decimal("185.2500")
+        assert restored_trail._lowest_price is None
+        assert restored_trail._current_stop_level == Decimal("181.5450")
+        assert set(snapshot.function_state) == {"AAPL_trail"}
+
+    async def test_backfill_start_reports_latest_bar(self, temp_dir):
+        """Test the snapshot reports where the startup backfill should begin."""
+        store = StateSnapshotStore(temp_dir / "snapshot")
+        aapl = make_bars("AAPL", "5min", 4)
+        store.write(
+            {
+                HISTORICAL_SECTION: {"AAPL:5min": aapl[:2]},
+                CACHE_SECTION: {"AAPL:5min": aapl, "MSFT:1min": make_bars("MSFT")},
+            }
+        )
+
+        snapshot = store.read()
+
+        assert snapshot.backfill_start("5min") == {"AAPL": aapl[-1].timestamp}
+        assert isinstance(snapshot.rows, np.memmap)
+
+    def test_new_snapshot_replaces_previous_array(self, temp_dir):
+        """Test each snapshot writes a new array and removes the old one."""
+        store = StateSnapshotStore(temp_dir / "snapshot")
+        store.write({CACHE_SECTION: {"AAPL:1min": make_bars(count=2)}})
+        store.write({CACHE_SECTION: {"AAPL:1min": make_bars(count=3)}})
+
+        snapshot = store.read()
+
+        assert snapshot.manifest.generation == 2
+        assert len(snapshot.section_bars(CACHE_SECTION)["AAPL:1min"]) == 3
+        assert [p.name for p in store.snapshot_dir.glob("*.npy")] == [
+            "bars_00000002.npy"
+        ]
+
+    def test_empty_and_missing_snapshots(self, temp_dir):
+        """Test missing snapshots read as None and empty ones load."""
+        store = StateSnapshotStore(temp_dir / "snapshot")
+        assert store.read() is None
+
+        store.write({})
+
+        snapshot = store.read()
+        assert snapshot.section_bars(CACHE_SECTION) == {}
+        assert snapshot.backfill_start("1min") == {}
+
+    async def test_periodic_snapshots_write_final_on_stop(self, temp_dir):
+        """Test stopping periodic snapshots writes a last snapshot."""
+        store = StateSnapshotStore(temp_dir / "snapshot")
+        manager = HistoricalDataManager()
+        store.start_periodic(3600, historical_data_manager=manager)
+
+        for bar in make_bars(count=3):
+            await manager.update_data(bar, Timeframe.ONE_MIN)
+        await store.stop_periodic()
+
+        snapshot = store.read()
+        assert len(snapshot.section_bars(HISTORICAL_SECTION)["AAPL:1min"]) == 3
+
+    def test_load_performance(self, temp_dir):
+        """Benchmark snapshot load against rebuilding the same bars."""
+        store = StateSnapshotStore(temp_dir / "snapshot")
+        bars = make_bars(count=1000)
+        series = {
+            f"SYM{i}:1min": [bar.model_copy(update={"symbol": f"SYM{i}"}) for bar in bars]
+            for i in range(20)
+        }
+        store.write({HISTORICAL_SECTION: series, CACHE_SECTION: series})
+
+        start = time.perf_counter()
+        snapshot = store.read()
+        map_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        decoded = snapshot.section_bars(HISTORICAL_SECTION)
+        decode_ms = (time.perf_counter() - start) * 1000
+
+        print(f"Snapshot write (40k bars): {store.last_write_ms:.1f}ms")
+        print(f"Snapshot map: {map_ms:.2f}ms, decode 20k bars: {decode_ms:.1f}ms")
+
+        assert sum(len(v) for v in decoded.values()) == 20_000
+        assert map_ms < 100
+        assert decode_ms < 2000
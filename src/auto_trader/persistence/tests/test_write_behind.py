@@ -0,0 +1,198 @@
+"""Tests for the write-behind persistence scheduler."""
+
+import asyncio
+import json
+import tempfile
+import threading
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from ...integrations.ibkr_client.circuit_breaker import CircuitBreaker, CircuitState
+from ...risk_management.portfolio_tracker import PortfolioTracker
+from ..write_behind import WriteBehindScheduler
+
+
+@pytest.fixture
+def temp_dir():
+    """Create temporary directory."""
+    with tempfile.TemporaryDirectory() as directory:
+        yield Path(directory)
+
+
+class RecordingTarget:
+    """State owner that records every write."""
+
+    def __init__(self):
+        self.value = 0
+        self.written = []
+
+    def snapshot(self):
+        return self.value
+
+    def write(self, payload):
+        self.written.append(payload)
+
+
+class TestWriteBehindScheduler:
+    """Tests for coalescing, forced writes and metrics."""
+
+    async def test_changes_coalesce_within_window(self):
+        """Test a burst of changes produces a single write of the latest state."""
+        scheduler = WriteBehindScheduler(window_seconds=0.05)
+        target = RecordingTarget()
+        scheduler.register("state", target.snapshot, target.write)
+
+        for i in range(1, 51):
+            target.value = i
+            scheduler.mark_dirty("state")
+
+        assert target.written == []
+        await asyncio.sleep(0.15)
+
+        assert target.written == [50]
+        metrics = scheduler.get_metrics()["state"]
+        assert metrics["marks"] == 50
+        assert metrics["writes"] == 1
+        assert metrics["coalesced"] == 49
+        assert metrics["writes_per_change"] == pytest.approx(0.02)
+
+    async def test_force_skips_window_and_writes_off_loop(self):
+        """Test safety-critical changes skip the window without writing on the loop."""
+        scheduler = WriteBehindScheduler(window_seconds=10)
+        target = RecordingTarget()
+        write_threads = []
+
+        def write(payload):
+            write_threads.append(threading.current_thread())
+            target.write(payload)
+
+        scheduler.register("state", target.snapshot, write)
+
+        target.value = 1
+        scheduler.mark_dirty("state")
+        target.value = 2
+        scheduler.mark_dirty("state", force=True)
+        assert target.written == []
+
+        await asyncio.sleep(0.05)
+        assert target.written == [2]
+        assert write_threads[0] is not threading.current_thread()
+        assert not scheduler.is_dirty("state")
+        assert scheduler.get_metrics()["state"]["forced_writes"] == 1
+        await scheduler.close()
+        assert target.written == [2]
+
+    async def test_flush_writes_dirty_targets(self):
+        """Test flush writes pending changes without waiting for the window."""
+        scheduler = WriteBehindScheduler(window_seconds=10)
+        target = RecordingTarget()
+        scheduler.register("state", target.snapshot, target.write)
+
+        target.value = 7
+        scheduler.mark_dirty("state")
+        await scheduler.flush()
+
+        assert target.written == [7]
+
+    async def test_coroutine_writer(self):
+        """Test coroutine writers are awaited on the loop."""
+        scheduler = WriteBehindScheduler(window_seconds=0.01)
+        written = []
+
+        async def write(payload):
+            written.append(payload)
+
+        scheduler.register("state", lambda: "snapshot", write)
+        scheduler.mark_dirty("state")
+        await asyncio.sleep(0.05)
+
+        assert written == ["snapshot"]
+
+    async def test_failed_write_stays_dirty(self):
+        """Test a failing write is counted and retried on flush."""
+        scheduler = WriteBehindScheduler(window_seconds=10)
+        attempts = []
+
+        def write(payload):
+            attempts.append(payload)
+            if len(attempts) == 1:
+                raise OSError("disk full")
+
+        scheduler.register("state", lambda: "snapshot", write)
+        scheduler.mark_dirty("state")
+        await scheduler.flush()
+
+        assert scheduler.is_dirty("state")
+        assert scheduler.get_metrics()["state"]["failures"] == 1
+
+        await scheduler.flush()
+        assert not scheduler.is_dirty("state")
+        assert len(attempts) == 2
+
+    def test_writes_through_without_event_loop(self):
+        """Test synchronous callers keep write-through behaviour."""
+        scheduler = WriteBehindScheduler()
+        target = RecordingTarget()
+        scheduler.register("state", target.snapshot, target.write)
+
+        target.value = 3
+        scheduler.mark_dirty("state")
+
+        assert target.written == [3]
+
+
+class TestWriteBehindIntegration:
+    """Tests for state owners using the scheduler."""
+
+    async def test_portfolio_tracker_coalesces_burst(self, temp_dir):
+        """Test a burst of position changes rewrites the registry once."""
+        scheduler = WriteBehindScheduler(window_seconds=0.05)
+        state_file = temp_dir / "position_registry.json"
+        tracker = PortfolioTracker(
+            state_file=state_file,
+            account_value=Decimal("10000.00"),
+            persistence_scheduler=scheduler,
+        )
+
+        for i in range(10):
+            tracker.add_position(f"POS_{i}", "AAPL", Decimal("10.00"), f"PLAN_{i}")
+        tracker.remove_position("POS_0")
+
+        assert not state_file.exists()
+        await scheduler.flush()
+
+        with open(state_file) as f:
+            assert len(json.load(f)["positions"]) == 9
+        metrics = next(iter(scheduler.get_metrics().values()))
+        assert metrics["marks"] == 11
+        assert metrics["writes"] == 1
+
+    async def test_circuit_breaker_flushes_transitions(self, temp_dir):
+        """Test failure counts are coalesced but opening the circuit is not."""
+        scheduler = WriteBehindScheduler(window_seconds=10)
+        state_file = temp_dir / "circuit_breaker_state.json"
+        breaker = CircuitBreaker(
+            failure_threshold=3,
+            state_file=state_file,
+            persistence_scheduler=scheduler,
+        )
+
+        breaker.record_failure()
+        breaker.record_failure()
+        assert not state_file.exists()
+
+        breaker.record_failure()
+        await asyncio.sleep(0.05)
+        with open(state_file) as f:
+            data = json.load(f)
+        assert data["state"] == CircuitState.OPEN.value
+        assert data["failure_count"] == 3
+
+        breaker.record_success()
+        await asyncio.sleep(0.05)
+        with open(state_file) as f:
+            assert json.load(f)["state"] == CircuitState.CLOSED.value
+
+        await scheduler.close()
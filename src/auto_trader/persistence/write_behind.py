@@ -0,0 +1,236 @@
+"""Write-behind persistence scheduler with coalesced, off-loop writes."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional, Union
+
+from ..io_executor import IOExecutor, get_io_executor
+from ..logging_config import get_logger
+
+logger = get_logger("write_behind", "system")
+
+SnapshotFn = Callable[[], Any]
+WriteFn = Callable[[Any], Union[None, Awaitable[None]]]
+
+
+@dataclass
+class _WriteTarget:
+    """Registered state owner and its write bookkeeping."""
+
+    key: str
+    snapshot: SnapshotFn
+    write: WriteFn
+    dirty: bool = False
+    version: int = 0
+    written_version: int = 0
+    task: Optional[asyncio.Task] = None
+    write_lock: threading.Lock = field(default_factory=threading.Lock)
+    flush_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    marks: int = 0
+    writes: int = 0
+    forced_writes: int = 0
+    failures: int = 0
+
+
+class WriteBehindScheduler:
+    """
+    Shared scheduler that coalesces state writes within a time window.
+
+    State owners register a ``snapshot`` function, called on the event loop
+    to capture state, and a ``write`` function that persists the snapshot.
+    Synchronous writers run on the shared I/O executor; coroutine writers are
+    awaited. ``mark_dirty`` records a change and schedules one write per
+    window no matter how many changes arrive. ``force=True`` skips the
+    window for safety-critical transitions, still writing off the event
+    loop on its next iteration, and ``flush``/``close``
+    write everything that is dirty (e.g. on shutdown).
+
+    Without a running event loop, writes happen synchronously on
+    ``mark_dirty`` so non-async callers keep write-through behaviour.
+    """
+
+    def __init__(
+        self, window_seconds: float = 0.25, io_executor: Optional[IOExecutor] = None
+    ) -> None:
+        """
+        Initialize scheduler.
+
+        Args:
+            window_seconds: Maximum staleness before a dirty target is written
+            io_executor: Executor for synchronous writers (defaults to the shared one)
+        """
+        self.window_seconds = window_seconds
+        self._io = io_executor or get_io_executor()
+        self._targets: Dict[str, _WriteTarget] = {}
+
+    def register(self, key: str, snapshot: SnapshotFn, write: WriteFn) -> None:
+        """
+        Register a state owner.
+
+        Args:
+            key: Unique target name (e.g. the state file path)
+            snapshot: Captures the state to persist; runs on the caller's thread
+            write: Persists a snapshot; sync functions run off the event loop
+        """
+        self._targets[key] = _WriteTarget(key=key, snapshot=snapshot, write=write)
+
+    def unregister(self, key: str) -> None:
+        """Remove a target, cancelling any scheduled write."""
+        target = self._targets.pop(key, None)
+        if target and target.task and not target.task.done():
+            target.task.cancel()
+
+    def is_dirty(self, key: str) -> bool:
+        """Check whether a target has changes not yet written."""
+        return self._targets[key].dirty
+
+    def mark_dirty(self, key: str, force: bool = False) -> None:
+        """
+        Record a state change for a target.
+
+        Args:
+            key: Registered target name
+            force: Write on the next loop iteration instead of waiting for
+                the window
+        """
+        target = self._targets[key]
+        target.marks += 1
+        target.dirty = True
+        target.version += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if force:
+            target.forced_writes += 1
+        if loop is None:
+            self._write_now(target)
+        elif force:
+            # Write on the next tick, off the event loop like any other write
+            self._schedule(target, loop, delay=0.0)
+        else:
+            self._schedule(target, loop, delay=self.window_seconds)
+
+    async def flush(self, key: Optional[str] = None) -> None:
+        """
+        Write dirty targets immediately.
+
+        Args:
+            key: Target to flush (defaults to all targets)
+        """
+        targets = [self._targets[key]] if key else list(self._targets.values())
+        for target in targets:
+            if target.task and not target.task.done():
+                target.task.cancel()
+                target.task = None
+            await self._write_async(target)
+
+    async def close(self) -> None:
+        """Flush all dirty targets; used on shutdown."""
+        await self.flush()
+
+    def get_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-target write-amplification metrics.
+
+        Returns:
+            Mapping of target key to marks, writes, forced writes, failures,
+            writes per change and changes coalesced away
+        """
+        return {
+            key: {
+                "marks": target.marks,
+                "writes": target.writes,
+                "forced_writes": target.forced_writes,
+                "failures": target.failures,
+                "writes_per_change": (
+                    target.writes / target.marks if target.marks else 0.0
+                ),
+                "coalesced": max(0, target.marks - target.writes),
+            }
+            for key, target in self._targets.items()
+        }
+
+    def _schedule(
+        self, target: _WriteTarget, loop: asyncio.AbstractEventLoop, delay: float
+    ) -> None:
+        """Schedule a delayed write unless one is already pending."""
+        if target.task is not None and not target.task.done():
+            if delay > 0:
+                return
+            target.task.cancel()
+        target.task = loop.create_task(self._delayed_write(target, delay))
+
+    async def _delayed_write(self, target: _WriteTarget, delay: float) -> None:
+        """Write a target after the coalescing window."""
+        await asyncio.sleep(delay)
+        # Detach before writing so flush() never cancels a write in flight
+        target.task = None
+        await self._write_async(target)
+
+        # Changes made while the write was in flight get their own window
+        if target.dirty and target.task is None:
+            self._schedule(target, asyncio.get_running_loop(), self.window_seconds)
+
+    async def _write_async(self, target: _WriteTarget) -> None:
+        """Capture and write a target without blocking the event loop."""
+        # Serialized so flush() also waits for a write already in flight
+        async with target.flush_lock:
+            if not target.dirty:
+                return
+
+            version, payload = self._capture(target)
+            try:
+                if inspect.iscoroutinefunction(target.write):
+                    await target.write(payload)
+                    self._record_write(target, version)
+                else:
+                    await self._io.run(
+                        "write_behind.write", self._write_versioned, target, version, payload
+                    )
+            except Exception as e:
+                self._record_failure(target, e)
+
+    def _write_now(self, target: _WriteTarget) -> None:
+        """Capture and write a target on the calling thread."""
+        version, payload = self._capture(target)
+        try:
+            self._write_versioned(target, version, payload)
+        except Exception as e:
+            self._record_failure(target, e)
+
+    def _capture(self, target: _WriteTarget) -> tuple:
+        """Snapshot target state and clear its dirty flag."""
+        target.dirty = False
+        return target.version, target.snapshot()
+
+    def _write_versioned(self, target: _WriteTarget, version: int, payload: Any) -> None:
+        """Write a snapshot unless a newer one has already been written."""
+        with target.write_lock:
+            if version <= target.written_version:
+                return
+            target.write(payload)
+            self._record_write(target, version)
+
+    @staticmethod
+    def _record_write(target: _WriteTarget, version: int) -> None:
+        """Update counters after a successful write."""
+        target.written_version = max(target.written_version, version)
+        target.writes += 1
+
+    @staticmethod
+    def _record_failure(target: _WriteTarget, error: Exception) -> None:
+        """Keep the target dirty so the next change retries the write."""
+        target.dirty = True
+        target.failures += 1
+        logger.error(
+            "Write-behind persistence failed",
+            target=target.key,
+            error=str(error),
+        )
@@ -5,6 +5,7 @@ from .portfolio_tracker import PortfolioTracker
 from .position_sizer import PositionSizer
 from .risk_manager import RiskManager
 from .order_risk_validator import OrderRiskValidator
+from .scenario_grid import ScenarioGrid
 from .risk_models import (
     PositionSizeResult,
     RiskCheck,
@@ -23,6 +24,7 @@ __all__ = [
     "PortfolioTracker",
     "PositionSizer",
     "OrderRiskValidator",
+    "ScenarioGrid",
     "PositionSizeResult",
     "RiskCheck", 
     "PositionRiskEntry",
@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Optional
 
 from ..logging_config import get_logger
+from ..persistence.backup_store import BackupStore, stream_name
 
 logger = get_logger("backup_manager", "risk")
 
@@ -15,14 +16,26 @@ logger = get_logger("backup_manager", "risk")
 class BackupManager:
     """Manages backup operations for portfolio state files."""
     
-    def __init__(self, state_file: Path) -> None:
+    def __init__(
+        self,
+        state_file: Path,
+        backup_store: Optional[BackupStore] = None,
+        stream: Optional[str] = None,
+    ) -> None:
         """
         Initialize backup manager.
         
         Args:
             state_file: Path to the state file to manage backups for
+            backup_store: Optional content-addressed store for automated
+                backups; unchanged content is skipped and rotation uses the
+                store manifest instead of directory scans
+            stream: Stream name in the backup store (defaults to the
+                    resolved file path)
         """
         self.state_file = state_file
+        self.backup_store = backup_store
+        self.stream = stream or stream_name(state_file)
         
     def create_backup(self, backup_path: Optional[Path] = None) -> Path:
         """
@@ -62,6 +75,16 @@ class BackupManager:
     
     def create_automated_backup(self) -> None:
         """Create automated backup with rotation."""
+        if self.backup_store is not None:
+            try:
+                self.backup_store.backup_file(self.stream, self.state_file)
+            except Exception as e:
+                logger.warning(
+                    "Failed to create automated backup",
+                    error=str(e),
+                )
+            return
+        
         try:
             # Create timestamped backup
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from dataclasses import dataclass
 from decimal import Decimal
 from typing import Dict, Any, Optional
 
@@ -12,7 +15,9 @@ from ..models.trade_plan import RiskCategory
 from .position_sizer import PositionSizer
 from .portfolio_tracker import PortfolioTracker
 from .risk_models import (
+    RiskCheck,
     RiskValidationResult,
+    PositionRiskEntry,
     PositionSizeResult,
     RiskManagementError,
     PortfolioRiskExceededError,
@@ -23,17 +28,56 @@ from .risk_models import (
 logger = get_logger("order_risk_validator", "risk")
 
 
+@dataclass(frozen=True)
+class RiskContextSnapshot:
+    """Account and portfolio figures shared by validations until refreshed."""
+    
+    version: int
+    account_value: Decimal
+    buying_power: Decimal
+    # Committed portfolio risk percentage (reservations excluded)
+    current_risk: Decimal
+    daily_losses: Decimal
+    # Portfolio tracker state version the figures were read at
+    tracker_version: int
+    # Invalidation count when the refresh started
+    generation: int
+    # time.monotonic() when the figures were fetched
+    fetched_at: float
+    
+    def age(self) -> float:
+        """Get seconds since the figures were fetched."""
+        return time.monotonic() - self.fetched_at
+
+
 class OrderRiskValidator:
-    """Validate order requests against risk management rules."""
+    """
+    Validate order requests against risk management rules.
+    
+    A valid order holds a risk reservation in the portfolio tracker, keyed
+    by its trade plan ID, until commit_reservation (fill) or
+    release_reservation (reject or cancel). Validations can therefore run
+    concurrently without together exceeding the portfolio risk limit.
+    
+    Account value, buying power, current risk and daily losses are read from
+    a versioned RiskContextSnapshot shared by all validations. It is
+    refetched once its TTL passes, when the portfolio tracker's positions or
+    account value change, or after invalidate_risk_context; validations
+    arriving during a refetch wait for that one refetch.
+    """
     
     # Portfolio risk limit (10% maximum total risk)
     MAX_PORTFOLIO_RISK_PERCENT = Decimal("10.0")
     
+    # Seconds a risk context snapshot is served before it is refetched
+    RISK_CONTEXT_TTL_SECONDS = 5.0
+    
     def __init__(
         self, 
         position_sizer: PositionSizer,
         portfolio_tracker: PortfolioTracker,
-        account_value: Optional[Decimal] = None
+        account_value: Optional[Decimal] = None,
+        risk_context_ttl: Optional[float] = None,
     ) -> None:
         """
         Initialize order risk validator.
@@ -42,11 +86,24 @@ class OrderRiskValidator:
             position_sizer: Position sizing calculator
             portfolio_tracker: Portfolio risk tracking
             account_value: Current account value (if None, will be fetched)
+            risk_context_ttl: Seconds a risk context snapshot is served
+                (defaults to RISK_CONTEXT_TTL_SECONDS)
         """
         self.position_sizer = position_sizer
         self.portfolio_tracker = portfolio_tracker
         self._account_value = account_value
         
+        self._risk_context_ttl = (
+            risk_context_ttl if risk_context_ttl is not None else self.RISK_CONTEXT_TTL_SECONDS
+        )
+        self._risk_context: Optional[RiskContextSnapshot] = None
+        self._risk_context_refresh: Optional[asyncio.Future] = None
+        self._risk_context_generation = 0
+        self._risk_context_hits = 0
+        self._risk_context_shared = 0
+        self._risk_context_refreshes = 0
+        self._max_served_age = 0.0
+        
         logger.debug("OrderRiskValidator initialized")
     
     async def validate_order_request(self, order_request: OrderRequest) -> RiskValidationResult:
@@ -70,26 +127,30 @@ class OrderRiskValidator:
                 risk_category=order_request.risk_category,
             )
             
-            # Get current account value
-            account_value = await self._get_account_value()
+            # Get account figures shared with other validations
+            risk_context = await self.get_risk_context()
             
             # Step 1: Calculate position size
             position_size_result = self._calculate_position_size(
-                order_request, account_value
-            )
-            
-            # Step 2: Check portfolio risk limit
-            await self._validate_portfolio_risk_limit(
-                position_size_result.dollar_risk
+                order_request, risk_context.account_value
             )
             
-            # Step 3: Check available capital
-            await self._validate_available_capital(
-                order_request, position_size_result, account_value
+            # Step 2: Check portfolio risk limit and reserve the trade's risk
+            portfolio_risk_check = self._reserve_portfolio_risk(
+                order_request, position_size_result.dollar_risk
             )
             
-            # Step 4: Check daily loss limit
-            await self._validate_daily_loss_limit()
+            try:
+                # Step 3: Check available capital
+                await self._validate_available_capital(
+                    order_request, position_size_result, risk_context.buying_power
+                )
+                
+                # Step 4: Check daily loss limit
+                await self._validate_daily_loss_limit(risk_context.daily_losses)
+            except Exception:
+                self.release_reservation(order_request.trade_plan_id)
+                raise
             
             # Update order request with calculated position size
             order_request.calculated_position_size = position_size_result.position_size
@@ -99,17 +160,7 @@ class OrderRiskValidator:
                 trade_plan_id=order_request.trade_plan_id,
                 calculated_position_size=position_size_result.position_size,
                 dollar_risk=float(position_size_result.dollar_risk),
-            )
-            
-            from .risk_models import RiskCheck
-            
-            portfolio_risk_check = RiskCheck(
-                passed=True,
-                reason=None,
-                current_risk=await self._get_current_portfolio_risk(),
-                new_trade_risk=position_size_result.portfolio_risk_percentage,
-                total_risk=(await self._get_current_portfolio_risk()) + position_size_result.portfolio_risk_percentage,
-                limit=self.MAX_PORTFOLIO_RISK_PERCENT,
+                risk_context_version=risk_context.version,
             )
             
             return RiskValidationResult(
@@ -128,8 +179,6 @@ class OrderRiskValidator:
                 error_type=type(e).__name__,
             )
             
-            from .risk_models import RiskCheck
-            
             portfolio_risk_check = RiskCheck(
                 passed=False,
                 reason=str(e),
@@ -170,43 +219,91 @@ class OrderRiskValidator:
             )
             raise
     
-    async def _validate_portfolio_risk_limit(self, new_trade_risk: Decimal) -> None:
-        """Validate that adding this trade doesn't exceed portfolio risk limit."""
-        try:
-            portfolio_state = await self.portfolio_tracker.get_current_state()
-            
-            # Calculate total risk including new trade
-            total_risk = portfolio_state.total_risk_percentage + (
-                (new_trade_risk / await self._get_account_value()) * Decimal("100")
-            )
-            
-            if total_risk > self.MAX_PORTFOLIO_RISK_PERCENT:
-                new_trade_risk_percent = (new_trade_risk / await self._get_account_value()) * Decimal('100')
-                raise PortfolioRiskExceededError(
-                    current_risk=portfolio_state.total_risk_percentage,
-                    new_risk=new_trade_risk_percent,
-                    limit=self.MAX_PORTFOLIO_RISK_PERCENT,
+    def _reserve_portfolio_risk(
+        self, order_request: OrderRequest, new_trade_risk: Decimal
+    ) -> RiskCheck:
+        """Reserve the trade's risk, failing if it would exceed the portfolio risk limit."""
+        portfolio_risk_check = self.portfolio_tracker.try_reserve_risk(
+            reservation_id=order_request.trade_plan_id,
+            symbol=order_request.symbol,
+            risk_amount=new_trade_risk,
+            plan_id=order_request.trade_plan_id,
+        )
+        
+        if not portfolio_risk_check.passed:
+            if self.portfolio_tracker.get_account_value() <= 0:
+                raise RiskManagementError(
+                    f"Portfolio risk validation failed: {portfolio_risk_check.reason}"
                 )
-                
-            logger.debug(
-                "Portfolio risk check passed",
-                current_risk=float(portfolio_state.total_risk_percentage),
-                new_trade_risk=float((new_trade_risk / await self._get_account_value()) * Decimal("100")),
-                total_risk=float(total_risk),
-                limit=float(self.MAX_PORTFOLIO_RISK_PERCENT),
+            raise PortfolioRiskExceededError(
+                current_risk=portfolio_risk_check.current_risk,
+                new_risk=portfolio_risk_check.new_trade_risk,
+                limit=self.MAX_PORTFOLIO_RISK_PERCENT,
             )
+        
+        logger.debug(
+            "Portfolio risk check passed and risk reserved",
+            trade_plan_id=order_request.trade_plan_id,
+            current_risk=float(portfolio_risk_check.current_risk),
+            new_trade_risk=float(portfolio_risk_check.new_trade_risk),
+            total_risk=float(portfolio_risk_check.total_risk),
+            limit=float(self.MAX_PORTFOLIO_RISK_PERCENT),
+        )
+        return portfolio_risk_check
+    
+    def pin_reservation(self, trade_plan_id: str) -> bool:
+        """
+        Keep the reserved risk of a working order until it fills or is cancelled.
+        
+        Args:
+            trade_plan_id: Trade plan of the working order
             
-        except Exception as e:
-            if isinstance(e, PortfolioRiskExceededError):
-                raise
-            logger.error("Portfolio risk validation error", error=str(e))
-            raise RiskManagementError(f"Portfolio risk validation failed: {e}")
+        Returns:
+            True if a reservation was held
+        """
+        return self.portfolio_tracker.pin_reservation(trade_plan_id) is not None
+    
+    def commit_reservation(
+        self,
+        trade_plan_id: str,
+        position_id: Optional[str] = None,
+        symbol: Optional[str] = None,
+        risk_amount: Optional[Decimal] = None,
+    ) -> Optional[PositionRiskEntry]:
+        """
+        Track the reserved risk of a filled order as an open position.
+        
+        Args:
+            trade_plan_id: Trade plan of the filled order
+            position_id: Position identifier (defaults to the trade plan ID)
+            symbol: Trading symbol, used if the reservation is no longer held
+            risk_amount: Dollar risk of the fill (defaults to the reserved amount)
+            
+        Returns:
+            The tracked position, or None if neither a reservation nor the
+            fill's symbol and risk were available
+        """
+        return self.portfolio_tracker.commit_reservation(
+            trade_plan_id, position_id, risk_amount=risk_amount, symbol=symbol
+        )
+    
+    def release_reservation(self, trade_plan_id: str) -> bool:
+        """
+        Release the reserved risk of a rejected or cancelled order.
+        
+        Args:
+            trade_plan_id: Trade plan of the order
+            
+        Returns:
+            True if a reservation was held
+        """
+        return self.portfolio_tracker.release_reservation(trade_plan_id)
     
     async def _validate_available_capital(
         self, 
         order_request: OrderRequest, 
         position_size_result: PositionSizeResult,
-        account_value: Decimal
+        available_capital: Decimal
     ) -> None:
         """Validate sufficient capital is available for the trade."""
         try:
@@ -214,10 +311,6 @@ class OrderRiskValidator:
             position_value = Decimal(str(position_size_result.position_size)) * order_request.entry_price
             required_capital = position_value * Decimal("1.02")  # 2% buffer for commissions/slippage
             
-            # Get available buying power (simplified: use 50% of account value)
-            # In real implementation, this would query IBKR for actual buying power
-            available_capital = account_value * Decimal("0.5")
-            
             if required_capital > available_capital:
                 raise InvalidPositionSizeError(
                     reason=f"Insufficient capital: required ${required_capital:.2f}, "
@@ -239,7 +332,7 @@ class OrderRiskValidator:
             logger.error("Capital validation error", error=str(e))
             raise RiskManagementError(f"Capital validation failed: {e}")
     
-    async def _validate_daily_loss_limit(self) -> None:
+    async def _validate_daily_loss_limit(self, daily_losses: Decimal) -> None:
         """Validate that daily loss limit has not been exceeded."""
         try:
             # For now, daily loss limit validation is simplified
@@ -249,7 +342,10 @@ class OrderRiskValidator:
             # 3. Block new positions if limit exceeded
             
             # Placeholder implementation - always passes for MVP
-            logger.debug("Daily loss limit check passed (simplified implementation)")
+            logger.debug(
+                "Daily loss limit check passed (simplified implementation)",
+                daily_losses=float(daily_losses),
+            )
             
         except Exception as e:
             logger.error("Daily loss limit validation error", error=str(e))
@@ -264,14 +360,122 @@ class OrderRiskValidator:
         # For now, return a placeholder value
         return Decimal("100000.00")  # $100k default
     
-    async def _get_current_portfolio_risk(self) -> Decimal:
-        """Get current portfolio risk percentage."""
+    async def _get_buying_power(self, account_value: Decimal) -> Decimal:
+        """Get capital available for new positions."""
+        # Simplified: use 50% of account value
+        # In real implementation, this would query IBKR for actual buying power
+        return account_value * Decimal("0.5")
+    
+    async def _get_daily_losses(self) -> Decimal:
+        """Get realized losses for the current trading day."""
+        # In real implementation, this would come from daily P&L account data
+        return Decimal("0.00")
+    
+    async def get_risk_context(self) -> RiskContextSnapshot:
+        """
+        Get the shared risk context snapshot, refetching it if stale.
+        
+        Returns:
+            Current snapshot; concurrent callers finding it stale all wait
+            for one refetch
+        """
+        snapshot = self._risk_context
+        if snapshot is not None and self._is_risk_context_current(snapshot):
+            self._risk_context_hits += 1
+            self._max_served_age = max(self._max_served_age, snapshot.age())
+            return snapshot
+        
+        if self._risk_context_refresh is None:
+            self._risk_context_refreshes += 1
+            self._risk_context_refresh = asyncio.ensure_future(self._refresh_risk_context())
+        else:
+            self._risk_context_shared += 1
+        return await asyncio.shield(self._risk_context_refresh)
+    
+    def invalidate_risk_context(self, reason: str) -> None:
+        """
+        Mark the risk context stale so the next validation refetches it.
+        
+        Args:
+            reason: Account or position event that made it stale (for logging)
+        """
+        self._risk_context_generation += 1
+        logger.debug(
+            "Risk context invalidated",
+            reason=reason,
+            version=self._risk_context.version if self._risk_context else None,
+        )
+    
+    def set_account_value(self, account_value: Decimal) -> None:
+        """Set the account value and refresh the risk context on next use."""
+        self._account_value = account_value
+        self.invalidate_risk_context("account value updated")
+    
+    def get_risk_context_stats(self) -> Dict[str, Any]:
+        """
+        Get risk context cache statistics.
+        
+        Returns:
+            Snapshot version and age, lookups served from the snapshot or a
+            shared refetch, refetches, hit rate, and the oldest snapshot age
+            served
+        """
+        snapshot = self._risk_context
+        hits = self._risk_context_hits + self._risk_context_shared
+        lookups = hits + self._risk_context_refreshes
+        return {
+            "version": snapshot.version if snapshot else 0,
+            "age_seconds": snapshot.age() if snapshot else None,
+            "hits": self._risk_context_hits,
+            "shared_refreshes": self._risk_context_shared,
+            "refreshes": self._risk_context_refreshes,
+            "hit_rate": hits / lookups if lookups else None,
+            "max_served_age_seconds": self._max_served_age,
+        }
+    
+    def _is_risk_context_current(self, snapshot: RiskContextSnapshot) -> bool:
+        """Check a snapshot is within its TTL and no event has made it stale."""
+        return (
+            snapshot.generation == self._risk_context_generation
+            and snapshot.tracker_version == self.portfolio_tracker.get_state_version()
+            and snapshot.age() < self._risk_context_ttl
+        )
+    
+    async def _refresh_risk_context(self) -> RiskContextSnapshot:
+        """Fetch account figures and publish them as the next snapshot version."""
         try:
-            portfolio_state = await self.portfolio_tracker.get_current_state()
-            return portfolio_state.total_risk_percentage
-        except Exception as e:
-            logger.warning(f"Could not get current portfolio risk: {e}")
-            return Decimal("0.0")
+            generation = self._risk_context_generation
+            tracker_version = self.portfolio_tracker.get_state_version()
+            current_risk = self.portfolio_tracker.get_current_portfolio_risk()
+            
+            account_value = await self._get_account_value()
+            buying_power = await self._get_buying_power(account_value)
+            daily_losses = await self._get_daily_losses()
+            
+            previous = self._risk_context
+            snapshot = RiskContextSnapshot(
+                version=previous.version + 1 if previous else 1,
+                account_value=account_value,
+                buying_power=buying_power,
+                current_risk=current_risk,
+                daily_losses=daily_losses,
+                tracker_version=tracker_version,
+                generation=generation,
+                fetched_at=time.monotonic(),
+            )
+            self._risk_context = snapshot
+            
+            logger.debug(
+                "Risk context refreshed",
+                version=snapshot.version,
+                account_value=float(account_value),
+                buying_power=float(buying_power),
+                current_risk=float(current_risk),
+                daily_losses=float(daily_losses),
+            )
+            return snapshot
+        finally:
+            self._risk_context_refresh = None
     
     def create_order_rejection_result(
         self, 
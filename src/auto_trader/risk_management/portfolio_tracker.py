@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Set, Tuple
 
 from ..logging_config import get_logger
 from .backup_manager import BackupManager
@@ -14,20 +18,58 @@ from .risk_models import (
     PortfolioRiskState,
     PositionRiskEntry,
     PortfolioRiskExceededError,
+    RiskCheck,
+    RiskManagementError,
 )
 
+if TYPE_CHECKING:
+    from ..persistence.backup_store import BackupStore
+    from ..persistence.position_store import PositionStore
+    from ..persistence.write_behind import WriteBehindScheduler
+
 logger = get_logger("portfolio_tracker", "risk")
 
 
+@dataclass
+class RiskReservation:
+    """Portfolio risk held for an order between validation and fill."""
+    
+    reservation_id: str
+    symbol: str
+    risk_amount: Decimal
+    plan_id: str
+    # time.monotonic() deadline after which the reservation lapses; None once
+    # pinned to a working order
+    expires_at: Optional[float]
+
+
 class PortfolioTracker:
-    """Track and persist portfolio risk across positions."""
+    """
+    Track and persist portfolio risk across positions.
+    
+    Dollar risk totals, overall and per symbol, are kept up to date as
+    positions are added and removed, so risk queries do not depend on the
+    number of tracked positions.
+    
+    Orders validated concurrently reserve their risk with try_reserve_risk,
+    which checks and reserves in one step against committed plus reserved
+    risk. The reservation is committed as a position on fill or released on
+    reject or cancel. Until its order is working and pinned with
+    pin_reservation, it lapses after the reservation TTL.
+    """
     
     MAX_PORTFOLIO_RISK = Decimal("10.0")  # 10% limit (AC 7, 19)
+    RESERVATION_TTL_SECONDS = 30.0
     
     def __init__(
         self, 
         state_file: Optional[Path] = None,
         account_value: Optional[Decimal] = None,
+        position_store: Optional[PositionStore] = None,
+        persistence_scheduler: Optional[WriteBehindScheduler] = None,
+        backup_store: Optional[BackupStore] = None,
+        verify_totals: bool = False,
+        reservation_ttl: Optional[float] = None,
     ) -> None:
         """
         Initialize portfolio tracker.
@@ -35,11 +77,46 @@ class PortfolioTracker:
         Args:
             state_file: Path to JSON state file for persistence
             account_value: Total account value for risk calculations
+            position_store: Optional SQLite registry; when set, mutations are
+                single-row transactions and state_file becomes the JSON
+                export/migration path
+            persistence_scheduler: Optional write-behind scheduler that
+                coalesces JSON state writes
+            backup_store: Optional deduplicating store for automated backups
+            verify_totals: Recompute the running risk totals from the
+                positions after every change and raise on any mismatch
+                (consistency self-check for tests)
+            reservation_ttl: Seconds an uncommitted risk reservation is held
+                (defaults to RESERVATION_TTL_SECONDS)
         """
         self.state_file = state_file or Path("data/state/position_registry.json")
         self._positions: Dict[str, PositionRiskEntry] = {}
+        self._total_risk = Decimal("0")
+        self._symbol_risk: Dict[str, Decimal] = {}
+        self._symbol_positions: Dict[str, Dict[str, PositionRiskEntry]] = {}
+        self._verify_totals = verify_totals
+        # Bumped on every position or account value change
+        self._state_version = 0
+        
+        # Reservations in expiry order: the TTL is fixed, so insertion order is
+        # deadline order and expired ones are dropped from the front
+        self._reservations: OrderedDict[str, RiskReservation] = OrderedDict()
+        # Reservations of working orders, held until fill, reject or cancel
+        self._pinned_reservations: Dict[str, RiskReservation] = {}
+        self._reserved_risk = Decimal("0")
+        self._reservation_ttl = (
+            reservation_ttl if reservation_ttl is not None else self.RESERVATION_TTL_SECONDS
+        )
+        self._reservation_lock = threading.Lock()
         self._account_value = account_value or Decimal("0")
-        self._backup_manager = BackupManager(self.state_file)
+        self._backup_manager = BackupManager(self.state_file, backup_store)
+        self._position_store = position_store
+        self._persistence_scheduler = persistence_scheduler
+        self._persistence_key = f"portfolio:{self.state_file}"
+        if persistence_scheduler is not None:
+            persistence_scheduler.register(
+                self._persistence_key, self._build_state, self._write_state
+            )
         
         # Load existing state if file exists
         self._load_state()
@@ -47,6 +124,7 @@ class PortfolioTracker:
         logger.debug(
             "PortfolioTracker initialized",
             state_file=str(self.state_file),
+            backend="sqlite" if self._position_store else "json",
             account_value=float(self._account_value),
             existing_positions=len(self._positions),
         )
@@ -54,8 +132,20 @@ class PortfolioTracker:
     def set_account_value(self, account_value: Decimal) -> None:
         """Set the account value for risk calculations."""
         self._account_value = account_value
+        self._state_version += 1
+        if self._position_store is not None:
+            self._position_store.set_account_value(account_value)
+        self._check_totals()
         logger.info("Account value updated", account_value=float(account_value))
     
+    def get_account_value(self) -> Decimal:
+        """Get the account value used for risk calculations."""
+        return self._account_value
+    
+    def get_state_version(self) -> int:
+        """Get a counter that changes whenever positions or the account value change."""
+        return self._state_version
+    
     def add_position(
         self, 
         position_id: str, 
@@ -79,8 +169,14 @@ class PortfolioTracker:
             plan_id=plan_id,
         )
         
-        self._positions[position_id] = entry
-        self._persist_state()
+        risk_before = self.get_current_portfolio_risk()
+        self._untrack_position(position_id)
+        self._track_position(entry)
+        self._check_totals()
+        if self._position_store is not None:
+            self._position_store.upsert_position(entry)
+        else:
+            self._persist_state()
         
         current_risk = self.get_current_portfolio_risk()
         logger.info(
@@ -102,7 +198,7 @@ class PortfolioTracker:
             risk_amount_dollars=float(risk_amount),
             plan_id=plan_id,
             account_value=float(self._account_value),
-            portfolio_risk_before=float(current_risk - (risk_amount / self._account_value * Decimal("100")) if self._account_value > 0 else Decimal("0")),
+            portfolio_risk_before=float(risk_before),
             portfolio_risk_after=float(current_risk),
             total_positions_count=len(self._positions),
             risk_capacity_remaining=float(self.MAX_PORTFOLIO_RISK - current_risk),
@@ -119,9 +215,13 @@ class PortfolioTracker:
             True if position was removed, False if not found
         """
         if position_id in self._positions:
-            removed = self._positions.pop(position_id)
-            risk_before = self.get_current_portfolio_risk() + (removed.risk_amount / self._account_value * Decimal("100") if self._account_value > 0 else Decimal("0"))
-            self._persist_state()
+            risk_before = self.get_current_portfolio_risk()
+            removed = self._untrack_position(position_id)
+            self._check_totals()
+            if self._position_store is not None:
+                self._position_store.delete_position(position_id)
+            else:
+                self._persist_state()
             
             current_risk = self.get_current_portfolio_risk()
             logger.info(
@@ -166,14 +266,21 @@ class PortfolioTracker:
         if self._account_value <= 0:
             return Decimal("0")
         
-        total_risk_dollars = sum(pos.risk_amount for pos in self._positions.values())
-        risk_percentage = (total_risk_dollars / self._account_value) * Decimal("100")
+        risk_percentage = (self._total_risk / self._account_value) * Decimal("100")
         
         return risk_percentage.quantize(Decimal("0.01"))
     
     def get_total_dollar_risk(self) -> Decimal:
         """Get total dollar risk across all positions."""
-        return sum(pos.risk_amount for pos in self._positions.values())
+        return self._total_risk
+    
+    def get_symbol_dollar_risk(self, symbol: str) -> Decimal:
+        """Get total dollar risk of the positions in one symbol."""
+        return self._symbol_risk.get(symbol, Decimal("0"))
+    
+    def get_symbol_risk_totals(self) -> Dict[str, Decimal]:
+        """Get total dollar risk per symbol with open positions."""
+        return self._symbol_risk.copy()
     
     def get_position_count(self) -> int:
         """Get number of open positions."""
@@ -189,11 +296,48 @@ class PortfolioTracker:
     
     def get_positions_by_symbol(self, symbol: str) -> Dict[str, PositionRiskEntry]:
         """Get all positions for a specific symbol."""
-        return {
-            pos_id: entry 
-            for pos_id, entry in self._positions.items() 
-            if entry.symbol == symbol
+        return self._symbol_positions.get(symbol, {}).copy()
+    
+    def verify_risk_totals(self) -> None:
+        """
+        Check the running risk totals against a full recomputation.
+        
+        Raises:
+            RiskManagementError: If a running total differs from the sum of
+                the tracked positions
+        """
+        symbol_risk: Dict[str, Decimal] = {}
+        symbol_ids: Dict[str, Set[str]] = {}
+        for position_id, entry in self._positions.items():
+            symbol_risk[entry.symbol] = symbol_risk.get(entry.symbol, Decimal("0")) + entry.risk_amount
+            symbol_ids.setdefault(entry.symbol, set()).add(position_id)
+        total_risk = sum(symbol_risk.values(), Decimal("0"))
+        
+        tracked_ids = {
+            symbol: set(positions) for symbol, positions in self._symbol_positions.items()
         }
+        reserved_risk = sum(
+            (reservation.risk_amount for reservation in self._iter_reservations()),
+            Decimal("0"),
+        )
+        if (
+            total_risk != self._total_risk
+            or symbol_risk != self._symbol_risk
+            or symbol_ids != tracked_ids
+            or reserved_risk != self._reserved_risk
+        ):
+            raise RiskManagementError(
+                "Portfolio risk totals out of sync with positions",
+                error_code="RISK_TOTALS_MISMATCH",
+                context={
+                    "tracked_total": str(self._total_risk),
+                    "actual_total": str(total_risk),
+                    "tracked_symbols": {k: str(v) for k, v in self._symbol_risk.items()},
+                    "actual_symbols": {k: str(v) for k, v in symbol_risk.items()},
+                    "tracked_reserved": str(self._reserved_risk),
+                    "actual_reserved": str(reserved_risk),
+                },
+            )
     
     def check_new_trade_risk(self, new_risk_amount: Decimal) -> Tuple[bool, str]:
         """
@@ -254,6 +398,218 @@ class PortfolioTracker:
                 limit=self.MAX_PORTFOLIO_RISK,
             )
     
+    def try_reserve_risk(
+        self,
+        reservation_id: str,
+        symbol: str,
+        risk_amount: Decimal,
+        plan_id: str,
+    ) -> RiskCheck:
+        """
+        Reserve risk for an order if the portfolio limit allows it.
+        
+        The check and the reservation happen under one lock without
+        awaiting, so concurrent validations can never reserve more than
+        the limit together. Reserving an ID that is already held replaces
+        the earlier reservation.
+        
+        Args:
+            reservation_id: Reservation identifier (one per pending order)
+            symbol: Trading symbol
+            risk_amount: Dollar risk of the order
+            plan_id: Trade plan identifier
+            
+        Returns:
+            RiskCheck against committed plus reserved risk; the risk is
+            reserved only if it passed
+        """
+        with self._reservation_lock:
+            now = time.monotonic()
+            self._expire_reservations(now)
+            
+            if self._account_value <= 0:
+                return RiskCheck(
+                    passed=False,
+                    reason="Invalid account value for risk calculation",
+                    current_risk=Decimal("0"),
+                    new_trade_risk=Decimal("0"),
+                    limit=self.MAX_PORTFOLIO_RISK,
+                )
+            
+            previous = self._find_reservation(reservation_id)
+            held_risk = self._total_risk + self._reserved_risk
+            if previous is not None:
+                held_risk -= previous.risk_amount
+            
+            current_percent = held_risk / self._account_value * Decimal("100")
+            new_percent = risk_amount / self._account_value * Decimal("100")
+            total_percent = current_percent + new_percent
+            passed = total_percent <= self.MAX_PORTFOLIO_RISK
+            
+            reason = None
+            if passed:
+                if previous is not None:
+                    self._drop_reservation(reservation_id)
+                self._reservations[reservation_id] = RiskReservation(
+                    reservation_id=reservation_id,
+                    symbol=symbol,
+                    risk_amount=risk_amount,
+                    plan_id=plan_id,
+                    expires_at=now + self._reservation_ttl,
+                )
+                self._reserved_risk += risk_amount
+                self._check_totals()
+            else:
+                reason = (
+                    f"Portfolio risk limit exceeded: {total_percent:.2f}% "
+                    f"(current and reserved: {current_percent:.2f}% + new: {new_percent:.2f}%) "
+                    f"exceeds limit of {self.MAX_PORTFOLIO_RISK:.1f}%"
+                )
+                logger.warning(
+                    "Risk reservation rejected",
+                    reservation_id=reservation_id,
+                    symbol=symbol,
+                    current_risk=float(current_percent),
+                    new_risk=float(new_percent),
+                    limit=float(self.MAX_PORTFOLIO_RISK),
+                    reservation_count=self._reservation_count(),
+                )
+        
+        current_risk = current_percent.quantize(Decimal("0.01"))
+        new_trade_risk = new_percent.quantize(Decimal("0.01"))
+        return RiskCheck(
+            passed=passed,
+            reason=reason,
+            current_risk=current_risk,
+            new_trade_risk=new_trade_risk,
+            total_risk=current_risk + new_trade_risk,
+            limit=self.MAX_PORTFOLIO_RISK,
+        )
+    
+    def pin_reservation(self, reservation_id: str) -> Optional[RiskReservation]:
+        """
+        Hold a reservation until its order fills, is rejected or is cancelled.
+        
+        Called once the reserving order is working at the broker, so a
+        resting entry keeps its risk counted however long it waits.
+        
+        Args:
+            reservation_id: Reservation identifier
+            
+        Returns:
+            The pinned reservation, or None if unknown or already expired
+        """
+        with self._reservation_lock:
+            self._expire_reservations(time.monotonic())
+            reservation = self._reservations.pop(reservation_id, None)
+            if reservation is None:
+                reservation = self._pinned_reservations.get(reservation_id)
+            else:
+                reservation.expires_at = None
+                self._pinned_reservations[reservation_id] = reservation
+        
+        if reservation is None:
+            logger.warning(
+                "Attempted to pin unknown or expired risk reservation",
+                reservation_id=reservation_id,
+            )
+        return reservation
+    
+    def commit_reservation(
+        self,
+        reservation_id: str,
+        position_id: Optional[str] = None,
+        risk_amount: Optional[Decimal] = None,
+        symbol: Optional[str] = None,
+    ) -> Optional[PositionRiskEntry]:
+        """
+        Turn a reservation into a tracked position when its order fills.
+        
+        A fill is always tracked: without a held reservation (expired or
+        never made) the position is added from symbol and risk_amount.
+        
+        Args:
+            reservation_id: Reservation identifier
+            position_id: Position identifier (defaults to the reservation ID)
+            risk_amount: Filled dollar risk (defaults to the reserved amount)
+            symbol: Trading symbol, used when no reservation is held
+            
+        Returns:
+            The added position entry, or None if no reservation was held and
+            symbol or risk_amount is missing
+        """
+        with self._reservation_lock:
+            reservation = self._drop_reservation(reservation_id)
+            if reservation is None:
+                if symbol is None or risk_amount is None:
+                    logger.error(
+                        "Cannot track fill without a risk reservation or its risk",
+                        reservation_id=reservation_id,
+                    )
+                    return None
+                logger.warning(
+                    "Tracking fill without a held risk reservation",
+                    reservation_id=reservation_id,
+                    symbol=symbol,
+                    risk_amount=float(risk_amount),
+                )
+                reservation = RiskReservation(
+                    reservation_id=reservation_id,
+                    symbol=symbol,
+                    risk_amount=risk_amount,
+                    plan_id=reservation_id,
+                    expires_at=None,
+                )
+            
+            position_id = position_id or reservation_id
+            self.add_position(
+                position_id,
+                reservation.symbol,
+                risk_amount if risk_amount is not None else reservation.risk_amount,
+                reservation.plan_id,
+            )
+            return self._positions[position_id]
+    
+    def release_reservation(self, reservation_id: str) -> bool:
+        """
+        Release a reservation whose order was rejected or cancelled.
+        
+        Args:
+            reservation_id: Reservation identifier
+            
+        Returns:
+            True if the reservation was held, False if unknown or expired
+        """
+        with self._reservation_lock:
+            self._expire_reservations(time.monotonic())
+            released = self._drop_reservation(reservation_id) is not None
+            self._check_totals()
+        
+        logger.debug(
+            "Risk reservation released",
+            reservation_id=reservation_id,
+            found=released,
+        )
+        return released
+    
+    def get_reserved_risk(self) -> Decimal:
+        """Get dollar risk held by unexpired reservations."""
+        with self._reservation_lock:
+            self._expire_reservations(time.monotonic())
+            return self._reserved_risk
+    
+    def get_reservation(self, reservation_id: str) -> Optional[RiskReservation]:
+        """Get an unexpired reservation by ID."""
+        with self._reservation_lock:
+            self._expire_reservations(time.monotonic())
+            return self._find_reservation(reservation_id)
+    
+    def get_reservation_count(self) -> int:
+        """Get number of unexpired reservations."""
+        with self._reservation_lock:
+            self._expire_reservations(time.monotonic())
+            return self._reservation_count()
+    
     def get_available_risk_capacity(self) -> Tuple[Decimal, Decimal]:
         """
         Get remaining risk capacity.
@@ -294,6 +650,10 @@ class PortfolioTracker:
     
     def _load_state(self) -> None:
         """Load position registry from file (AC 17)."""
+        if self._position_store is not None:
+            self._load_from_store()
+            return
+        
         if not self.state_file.exists():
             logger.debug("No existing state file found, starting with empty portfolio")
             return
@@ -305,9 +665,9 @@ class PortfolioTracker:
             state = PortfolioRiskState(**data)
             
             # Restore positions
-            self._positions = {
+            self._set_positions({
                 pos.position_id: pos for pos in state.positions
-            }
+            })
             
             # Update account value if provided in state and not already set
             if hasattr(state, "account_value") and state.account_value >= 0:
@@ -335,8 +695,51 @@ class PortfolioTracker:
                 error=str(e),
             )
     
-    def _persist_state(self) -> None:
-        """Save position registry to file with atomic write (AC 17)."""
+    def _load_from_store(self) -> None:
+        """Load position registry from the SQLite store, migrating JSON once."""
+        store = self._position_store
+        store.import_json(self.state_file)
+        
+        self._set_positions(store.load_positions())
+        
+        stored_account_value = store.get_account_value()
+        if self._account_value == Decimal("0") and stored_account_value is not None:
+            self._account_value = stored_account_value
+        elif self._account_value != stored_account_value:
+            store.set_account_value(self._account_value)
+        
+        logger.info(
+            "Position registry loaded from database",
+            db_path=str(store.db_path),
+            position_count=len(self._positions),
+            account_value=float(self._account_value),
+            portfolio_risk=float(self.get_current_portfolio_risk()),
+        )
+    
+    def _persist_state(self, force: bool = False) -> None:
+        """
+        Save position registry to file with atomic write (AC 17).
+        
+        With a write-behind scheduler the write is coalesced with other
+        changes in the same window unless force is set.
+        """
+        if self._persistence_scheduler is not None:
+            self._persistence_scheduler.mark_dirty(self._persistence_key, force=force)
+            return
+        
+        self._write_state(self._build_state())
+    
+    def _build_state(self) -> PortfolioRiskState:
+        """Capture the current registry as a portfolio state snapshot."""
+        return PortfolioRiskState(
+            positions=list(self._positions.values()),
+            total_risk_percentage=self.get_current_portfolio_risk(),
+            account_value=self._account_value,
+            last_updated=datetime.utcnow(),
+        )
+    
+    def _write_state(self, state: PortfolioRiskState) -> None:
+        """Back up and atomically write a portfolio state snapshot."""
         try:
             # Ensure directory exists
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
@@ -345,32 +748,12 @@ class PortfolioTracker:
             if self.state_file.exists():
                 self._backup_manager.create_automated_backup()
             
-            # Create portfolio state
-            state = PortfolioRiskState(
-                positions=list(self._positions.values()),
-                total_risk_percentage=self.get_current_portfolio_risk(),
-                account_value=self._account_value,
-                last_updated=datetime.utcnow(),
-            )
-            
-            # Atomic write using temporary file
-            temp_file = self.state_file.with_suffix(".tmp")
-            
-            with open(temp_file, "w") as f:
-                json.dump(
-                    state.model_dump(mode="json"), 
-                    f, 
-                    indent=2, 
-                    default=str,
-                )
-            
-            # Atomically replace the original file
-            temp_file.replace(self.state_file)
+            self._write_state_json(self.state_file, state)
             
             logger.debug(
                 "Position registry persisted",
                 file_path=str(self.state_file),
-                position_count=len(self._positions),
+                position_count=len(state.positions),
                 total_risk=float(state.total_risk_percentage),
             )
             
@@ -382,6 +765,23 @@ class PortfolioTracker:
             )
             raise
     
+    @staticmethod
+    def _write_state_json(path: Path, state: PortfolioRiskState) -> None:
+        """Atomically write a portfolio state snapshot as JSON."""
+        # Atomic write using temporary file
+        temp_file = path.with_suffix(".tmp")
+        
+        with open(temp_file, "w") as f:
+            json.dump(
+                state.model_dump(mode="json"), 
+                f, 
+                indent=2, 
+                default=str,
+            )
+        
+        # Atomically replace the original file
+        temp_file.replace(path)
+    
     def create_backup(self, backup_path: Optional[Path] = None) -> Path:
         """
         Create a backup of the current state.
@@ -392,8 +792,31 @@ class PortfolioTracker:
         Returns:
             Path to created backup file
         """
+        if self._position_store is not None:
+            self.export_state()
         return self._backup_manager.create_backup(backup_path)
     
+    def export_state(self, export_path: Optional[Path] = None) -> Path:
+        """
+        Export the position registry as JSON.
+        
+        Args:
+            export_path: Destination path (defaults to state_file)
+            
+        Returns:
+            Path to exported JSON file
+        """
+        export_path = export_path or self.state_file
+        
+        if self._position_store is not None:
+            return self._position_store.export_json(
+                export_path, self.get_current_portfolio_risk()
+            )
+        
+        export_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_state_json(export_path, self._build_state())
+        return export_path
+    
     def clear_all_positions(self) -> int:
         """
         Clear all positions from registry.
@@ -402,12 +825,105 @@ class PortfolioTracker:
             Number of positions cleared
         """
         count = len(self._positions)
-        self._positions.clear()
-        self._persist_state()
+        self._set_positions({})
+        if self._position_store is not None:
+            self._position_store.clear_positions()
+        else:
+            self._persist_state(force=True)
         
         logger.warning(
             "All positions cleared from registry",
             cleared_count=count,
         )
         
-        return count
\ No newline at end of file
+        return count
+    
+    def _track_position(self, entry: PositionRiskEntry) -> None:
+        """Register a position and add its risk to the running totals."""
+        self._positions[entry.position_id] = entry
+        self._symbol_positions.setdefault(entry.symbol, {})[entry.position_id] = entry
+        self._symbol_risk[entry.symbol] = (
+            self._symbol_risk.get(entry.symbol, Decimal("0")) + entry.risk_amount
+        )
+        self._total_risk += entry.risk_amount
+        self._state_version += 1
+    
+    def _untrack_position(self, position_id: str) -> Optional[PositionRiskEntry]:
+        """Unregister a position and take its risk off the running totals."""
+        entry = self._positions.pop(position_id, None)
+        if entry is None:
+            return None
+        
+        symbol_positions = self._symbol_positions[entry.symbol]
+        del symbol_positions[position_id]
+        if symbol_positions:
+            self._symbol_risk[entry.symbol] -= entry.risk_amount
+        else:
+            del self._symbol_positions[entry.symbol]
+            del self._symbol_risk[entry.symbol]
+        
+        self._total_risk = (
+            self._total_risk - entry.risk_amount if self._positions else Decimal("0")
+        )
+        self._state_version += 1
+        return entry
+    
+    def _set_positions(self, positions: Dict[str, PositionRiskEntry]) -> None:
+        """Replace all positions and rebuild the running totals."""
+        self._positions = {}
+        self._total_risk = Decimal("0")
+        self._symbol_risk = {}
+        self._symbol_positions = {}
+        self._state_version += 1
+        for entry in positions.values():
+            self._track_position(entry)
+        self._check_totals()
+    
+    def _check_totals(self) -> None:
+        """Verify the running totals when the self-check mode is on."""
+        if self._verify_totals:
+            self.verify_risk_totals()
+    
+    def _find_reservation(self, reservation_id: str) -> Optional[RiskReservation]:
+        """Get a held reservation, pinned or not."""
+        reservation = self._reservations.get(reservation_id)
+        if reservation is None:
+            reservation = self._pinned_reservations.get(reservation_id)
+        return reservation
+    
+    def _iter_reservations(self) -> Iterator[RiskReservation]:
+        """Iterate over all held reservations."""
+        yield from self._reservations.values()
+        yield from self._pinned_reservations.values()
+    
+    def _reservation_count(self) -> int:
+        """Count held reservations."""
+        return len(self._reservations) + len(self._pinned_reservations)
+    
+    def _drop_reservation(self, reservation_id: str) -> Optional[RiskReservation]:
+        """Remove a reservation and take its risk off the reserved total."""
+        reservation = self._reservations.pop(reservation_id, None)
+        if reservation is None:
+            reservation = self._pinned_reservations.pop(reservation_id, None)
+        if reservation is None:
+            return None
+        self._reserved_risk = (
+            self._reserved_risk - reservation.risk_amount
+            if self._reservation_count()
+            else Decimal("0")
+        )
+        return reservation
+    
+    def _expire_reservations(self, now: float) -> None:
+        """Drop unpinned reservations past their deadline, oldest first."""
+        while self._reservations:
+            reservation = next(iter(self._reservations.values()))
+            if reservation.expires_at > now:
+                break
+            self._drop_reservation(reservation.reservation_id)
+            logger.warning(
+                "Risk reservation expired without fill",
+                reservation_id=reservation.reservation_id,
+                symbol=reservation.symbol,
+                risk_amount=float(reservation.risk_amount),
+            )
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from decimal import Decimal, ROUND_DOWN
-from typing import Dict
+from typing import Dict, Mapping, Optional, Sequence
+
+import numpy as np
 
 from ..logging_config import get_logger
 from .risk_models import PositionSizeResult, InvalidPositionSizeError
+from .scenario_grid import ScenarioGrid, evaluate_scenario_grid
 
 logger = get_logger("position_sizer", "risk")
 
@@ -21,6 +24,10 @@ class PositionSizer:
         "large": Decimal("3.0"),   # 3%
     }
     
+    # Fixed-point units per dollar for vectorized sizing; trade plan prices
+    # have at most 4 decimal places, so the conversion is exact
+    PRICE_SCALE = 10_000
+    
     def __init__(self) -> None:
         """Initialize position sizer."""
         logger.debug("PositionSizer initialized")
@@ -98,6 +105,62 @@ class PositionSizer:
             account_value=account_value,
         )
     
+    def get_dollar_risk(self, account_value: Decimal, risk_category: str) -> Decimal:
+        """
+        Get the dollar risk of one trade in a risk category.
+        
+        Args:
+            account_value: Total account balance
+            risk_category: Risk level (small/normal/large)
+            
+        Returns:
+            Dollar risk rounded to cents
+            
+        Raises:
+            InvalidPositionSizeError: If account value or risk category is invalid
+        """
+        if account_value <= 0:
+            raise InvalidPositionSizeError("Account value must be positive")
+        
+        return self._calculate_dollar_risk(
+            account_value, self.get_risk_percentage(risk_category)
+        )
+    
+    def size_positions(
+        self,
+        dollar_risk: Decimal,
+        entry_prices: np.ndarray,
+        stop_losses: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Calculate position sizes for many trades sharing one dollar risk.
+        
+        Vectorized equivalent of calculate_position_size over fixed-point
+        prices: integer floor division gives the same whole-share sizes as
+        the Decimal formula, and no per-trade result is logged.
+        
+        Args:
+            dollar_risk: Dollar risk per trade (from get_dollar_risk)
+            entry_prices: Entry prices in PRICE_SCALE units (int64)
+            stop_losses: Stop loss prices in PRICE_SCALE units (int64)
+            
+        Returns:
+            Position sizes in shares (int64); 0 where the prices are not
+            positive or entry equals stop, which calculate_position_size rejects
+        """
+        risk_units = int(dollar_risk * self.PRICE_SCALE)
+        price_difference = np.abs(entry_prices - stop_losses)
+        valid = (entry_prices > 0) & (stop_losses > 0) & (price_difference > 0)
+        
+        sizes = np.zeros(len(price_difference), dtype=np.int64)
+        sizes[valid] = np.maximum(risk_units // price_difference[valid], 1)
+        return sizes
+    
+    @classmethod
+    def to_fixed_point(cls, price: Decimal) -> int:
+        """Convert a price to PRICE_SCALE units."""
+        return int(price * cls.PRICE_SCALE)
+    
     def _validate_inputs(
         self,
         account_value: Decimal,
@@ -226,4 +289,43 @@ class PositionSizer:
                     error=str(e),
                 )
                 
-        return results
\ No newline at end of file
+        return results
+    
+    def preview_position_size_grid(
+        self,
+        entry_prices: Mapping[str, Decimal],
+        stop_percents: Sequence[Decimal],
+        account_values: Sequence[Decimal],
+        risk_categories: Optional[Sequence[str]] = None,
+        committed_risk: Decimal = Decimal("0"),
+        max_portfolio_risk: Decimal = Decimal("10.0"),
+    ) -> ScenarioGrid:
+        """
+        Preview position sizes over a grid of scenarios.
+        
+        Vectorized counterpart of preview_position_sizes for planning sweeps:
+        every symbol × stop distance × risk category × account value.
+        
+        Args:
+            entry_prices: Symbol -> planned entry price
+            stop_percents: Stop distances below entry, percent of entry price
+            account_values: Account balances to size against
+            risk_categories: Risk levels (defaults to all categories)
+            committed_risk: Dollar risk of open positions
+            max_portfolio_risk: Portfolio risk limit percentage
+            
+        Returns:
+            ScenarioGrid of sizes with portfolio limit and account value flags
+            
+        Raises:
+            InvalidPositionSizeError: If any input value is invalid
+        """
+        return evaluate_scenario_grid(
+            self,
+            entry_prices=entry_prices,
+            stop_percents=stop_percents,
+            risk_categories=risk_categories or self.get_supported_risk_categories(),
+            account_values=account_values,
+            committed_risk=committed_risk,
+            max_portfolio_risk=max_portfolio_risk,
+        )
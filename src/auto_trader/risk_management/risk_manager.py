@@ -5,7 +5,9 @@ from __future__ import annotations
 from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+import numpy as np
 
 from ..logging_config import get_logger
 from ..models import TradePlan
@@ -14,10 +16,16 @@ from .position_sizer import PositionSizer
 from .risk_models import (
     DailyLossLimitExceededError,
     InvalidPositionSizeError,
+    PositionSizeResult,
     RiskCheck,
     RiskValidationResult,
 )
 
+if TYPE_CHECKING:
+    from ..persistence.backup_store import BackupStore
+    from ..persistence.position_store import PositionStore
+    from ..persistence.write_behind import WriteBehindScheduler
+
 logger = get_logger("risk_manager", "risk")
 
 
@@ -29,6 +37,9 @@ class RiskManager:
         account_value: Decimal,
         daily_loss_limit: Optional[Decimal] = None,
         state_file: Optional[Path] = None,
+        position_store: Optional[PositionStore] = None,
+        persistence_scheduler: Optional[WriteBehindScheduler] = None,
+        backup_store: Optional[BackupStore] = None,
     ) -> None:
         """
         Initialize risk manager.
@@ -37,6 +48,9 @@ class RiskManager:
             account_value: Total account balance for calculations
             daily_loss_limit: Maximum daily loss allowed (defaults to $500)
             state_file: Path to position registry state file
+            position_store: Optional SQLite position registry backend
+            persistence_scheduler: Optional write-behind scheduler for state writes
+            backup_store: Optional deduplicating backup store
         """
         self.account_value = account_value
         self.daily_loss_limit = daily_loss_limit if daily_loss_limit is not None else Decimal("500.00")
@@ -46,6 +60,9 @@ class RiskManager:
         self.portfolio_tracker = PortfolioTracker(
             state_file=state_file,
             account_value=account_value,
+            position_store=position_store,
+            persistence_scheduler=persistence_scheduler,
+            backup_store=backup_store,
         )
         
         # Track daily losses
@@ -109,17 +126,9 @@ class RiskManager:
         # Check portfolio risk limit (AC 7, 12, 19)
         portfolio_check = self._check_portfolio_risk_limit(position_result.dollar_risk)
         
-        if not portfolio_check.passed:
-            errors.append(portfolio_check.reason or "Portfolio risk limit exceeded")
-        
         # Check daily loss limit (AC 24)
         daily_loss_check = self._check_daily_loss_limit()
-        if not daily_loss_check:
-            errors.append(
-                f"Daily loss limit exceeded: ${self._daily_losses:.2f} >= "
-                f"${self.daily_loss_limit:.2f}"
-            )
-            warnings.append("Consider waiting until tomorrow to trade")
+        self._append_limit_errors(portfolio_check, daily_loss_check, errors, warnings)
         
         # Create comprehensive result
         result = RiskValidationResult(
@@ -171,6 +180,104 @@ class RiskManager:
         
         return result
     
+    def validate_trade_plans(self, trade_plans: Sequence[TradePlan]) -> List[RiskValidationResult]:
+        """
+        Risk validation for many trade plans in one pass.
+        
+        Gives the same results as calling validate_trade_plan for each plan.
+        Dollar risk and the portfolio limit check depend only on the risk
+        category, so they are computed once per category, and position sizes
+        are computed with NumPy over fixed-point prices. One audit record is
+        written for the whole batch instead of one per plan.
+        
+        Args:
+            trade_plans: Trade plans to validate
+            
+        Returns:
+            RiskValidationResult per plan, in input order
+        """
+        results: List[Optional[RiskValidationResult]] = [None] * len(trade_plans)
+        category_audit: Dict[str, dict] = {}
+        
+        if self.account_value <= 0:
+            for index in range(len(trade_plans)):
+                results[index] = self._create_failed_result(
+                    ["Invalid account value for risk calculations"], "Invalid account value"
+                )
+            self._audit_batch(trade_plans, results, category_audit)
+            return results
+        
+        daily_loss_check = self._check_daily_loss_limit()
+        
+        plans_by_category: Dict[str, List[int]] = {}
+        for index, trade_plan in enumerate(trade_plans):
+            plans_by_category.setdefault(trade_plan.risk_category, []).append(index)
+        
+        for risk_category, indices in plans_by_category.items():
+            try:
+                dollar_risk = self.position_sizer.get_dollar_risk(self.account_value, risk_category)
+            except InvalidPositionSizeError as e:
+                for index in indices:
+                    results[index] = self._create_failed_result([str(e)], str(e))
+                continue
+            
+            to_fixed = self.position_sizer.to_fixed_point
+            sizes = self.position_sizer.size_positions(
+                dollar_risk,
+                np.fromiter(
+                    (to_fixed(trade_plans[i].entry_level) for i in indices),
+                    dtype=np.int64,
+                    count=len(indices),
+                ),
+                np.fromiter(
+                    (to_fixed(trade_plans[i].stop_loss) for i in indices),
+                    dtype=np.int64,
+                    count=len(indices),
+                ),
+            )
+            
+            # Limit checks and the sized result are shared by the category's
+            # plans, built when the first plan passes sizing
+            shared = None
+            for index, size in zip(indices, sizes.tolist()):
+                if size == 0:
+                    # Rejected by the kernel; the scalar sizer gives the exact error
+                    trade_plan = trade_plans[index]
+                    try:
+                        size = self.position_sizer.calculate_position_size(
+                            account_value=self.account_value,
+                            risk_category=risk_category,
+                            entry_price=trade_plan.entry_level,
+                            stop_loss=trade_plan.stop_loss,
+                        ).position_size
+                    except InvalidPositionSizeError as e:
+                        results[index] = self._create_failed_result([str(e)], str(e))
+                        continue
+                
+                if shared is None:
+                    shared = self._category_checks(risk_category, dollar_risk, daily_loss_check)
+                    category_audit[risk_category] = {
+                        "plan_count": len(indices),
+                        "dollar_risk": float(dollar_risk),
+                        "portfolio_risk_new": float(shared[0].new_trade_risk),
+                        "portfolio_risk_total": float(shared[0].total_risk),
+                        "portfolio_check_passed": shared[0].passed,
+                    }
+                portfolio_check, errors, warnings, base_result = shared
+                
+                results[index] = RiskValidationResult.model_construct(
+                    is_valid=not errors,
+                    position_size_result=(
+                        None if errors else base_result.model_copy(update={"position_size": size})
+                    ),
+                    portfolio_risk_check=portfolio_check,
+                    errors=list(errors),
+                    warnings=list(warnings),
+                )
+        
+        self._audit_batch(trade_plans, results, category_audit)
+        return results
+    
     def calculate_position_size_for_plan(self, trade_plan: TradePlan) -> int:
         """
         Calculate position size for a trade plan.
@@ -376,6 +483,76 @@ class RiskManager:
             limit=self.portfolio_tracker.MAX_PORTFOLIO_RISK,
         )
     
+    def _category_checks(
+        self,
+        risk_category: str,
+        dollar_risk: Decimal,
+        daily_loss_check: bool,
+    ) -> tuple[RiskCheck, List[str], List[str], PositionSizeResult]:
+        """Get the limit checks and sizing result shared by a category's plans in a batch."""
+        portfolio_check = self._check_portfolio_risk_limit(dollar_risk)
+        errors: List[str] = []
+        warnings: List[str] = []
+        self._append_limit_errors(portfolio_check, daily_loss_check, errors, warnings)
+        
+        # Validated once; each plan gets a copy with its own share count
+        base_result = PositionSizeResult(
+            position_size=1,
+            dollar_risk=dollar_risk,
+            validation_status=True,
+            portfolio_risk_percentage=self.position_sizer.get_risk_percentage(risk_category),
+            risk_category=risk_category,
+            account_value=self.account_value,
+        )
+        return portfolio_check, errors, warnings, base_result
+    
+    def _append_limit_errors(
+        self,
+        portfolio_check: RiskCheck,
+        daily_loss_check: bool,
+        errors: List[str],
+        warnings: List[str],
+    ) -> None:
+        """Add the errors and warnings of failed portfolio and daily loss checks."""
+        if not portfolio_check.passed:
+            errors.append(portfolio_check.reason or "Portfolio risk limit exceeded")
+        
+        if not daily_loss_check:
+            errors.append(
+                f"Daily loss limit exceeded: ${self._daily_losses:.2f} >= "
+                f"${self.daily_loss_limit:.2f}"
+            )
+            warnings.append("Consider waiting until tomorrow to trade")
+    
+    def _audit_batch(
+        self,
+        trade_plans: Sequence[TradePlan],
+        results: Sequence[RiskValidationResult],
+        category_audit: Dict[str, dict],
+    ) -> None:
+        """Write one audit record for a batch of trade plan validations."""
+        position_sizes = {}
+        rejections = {}
+        for trade_plan, result in zip(trade_plans, results):
+            if result.is_valid:
+                position_sizes[trade_plan.plan_id] = result.position_size_result.position_size
+            else:
+                rejections[trade_plan.plan_id] = result.errors
+        
+        logger.info(
+            "AUDIT: Trade plan batch validation decision",
+            plan_count=len(trade_plans),
+            valid_count=len(position_sizes),
+            rejected_count=len(rejections),
+            account_value=float(self.account_value),
+            portfolio_risk_current=float(self.portfolio_tracker.get_current_portfolio_risk()),
+            portfolio_risk_limit=float(self.portfolio_tracker.MAX_PORTFOLIO_RISK),
+            daily_losses=float(self._daily_losses),
+            categories=category_audit,
+            position_sizes=position_sizes,
+            rejection_reasons=rejections,
+        )
+    
     def _check_daily_loss_limit(self) -> bool:
         """Check if daily loss limit would be exceeded."""
         self._reset_daily_losses_if_needed()
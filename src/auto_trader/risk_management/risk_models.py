@@ -210,6 +210,11 @@ class RiskValidationResult(BaseModel):
         description="List of non-blocking warnings",
     )
     
+    @property
+    def passed(self) -> bool:
+        """Overall validation status, as read by the CLI risk utilities."""
+        return self.is_valid
+    
     @property
     def error_count(self) -> int:
         """Number of validation errors."""
@@ -0,0 +1,310 @@
+"""Vectorized position size scenarios over symbols, stops, categories and account values."""
+
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Mapping, Sequence, TextIO
+
+import numpy as np
+
+from ..logging_config import get_logger
+from .risk_models import InvalidPositionSizeError
+
+if TYPE_CHECKING:
+    from .position_sizer import PositionSizer
+
+logger = get_logger("scenario_grid", "risk")
+
+# Stop distances are whole basis points of the entry price
+STOP_PERCENT_STEP = Decimal("0.01")
+
+# Flattened table columns, in output order
+GRID_COLUMNS = (
+    "symbol",
+    "entry_price",
+    "stop_loss",
+    "stop_percent",
+    "risk_category",
+    "account_value",
+    "dollar_risk",
+    "position_size",
+    "position_value",
+    "total_portfolio_risk",
+    "within_portfolio_limit",
+    "within_account_value",
+    "feasible",
+)
+
+
+@dataclass
+class ScenarioGrid:
+    """
+    Position sizes for every symbol × stop × risk category × account value.
+
+    Arrays are indexed [symbol, stop, category, account]; the portfolio
+    figures depend only on category and account and are stored [category,
+    account]. Prices are in PositionSizer.PRICE_SCALE units.
+    """
+
+    symbols: List[str]
+    entry_prices: List[Decimal]
+    stop_percents: List[Decimal]
+    risk_categories: List[str]
+    account_values: List[Decimal]
+    price_scale: int
+    # [symbol, stop] stop loss prices (long side: below entry)
+    stop_losses: np.ndarray
+    # [category, account] dollar risk per trade in cents
+    dollar_risk_cents: np.ndarray
+    # [category, account] committed plus new trade risk, percent of account
+    total_portfolio_risk: np.ndarray
+    # [category, account] whether the trade fits the portfolio risk limit
+    within_portfolio_limit: np.ndarray
+    # [symbol, stop, category, account] whole shares; 0 where the stop is unusable
+    position_sizes: np.ndarray
+    # [symbol, stop, category, account] whether the position costs no more than the account
+    within_account_value: np.ndarray
+
+    @property
+    def shape(self) -> tuple:
+        """Grid dimensions (symbols, stops, categories, account values)."""
+        return self.position_sizes.shape
+
+    @property
+    def cell_count(self) -> int:
+        """Number of scenarios."""
+        return self.position_sizes.size
+
+    @property
+    def feasible(self) -> np.ndarray:
+        """Scenarios with a valid size that fit both the portfolio limit and the account."""
+        return (
+            (self.position_sizes > 0)
+            & self.within_account_value
+            & self.within_portfolio_limit[np.newaxis, np.newaxis]
+        )
+
+    def to_columns(self, feasible_only: bool = False) -> Dict[str, np.ndarray]:
+        """
+        Flatten the grid into a compact table.
+
+        Args:
+            feasible_only: Keep only feasible scenarios
+
+        Returns:
+            GRID_COLUMNS -> one array per column, account value varying fastest;
+            prices, values and risk as floats, labels as strings
+        """
+        shape = self.shape
+        symbol_index, stop_index, category_index, account_index = (
+            index.ravel() for index in np.indices(shape, dtype=np.intp)
+        )
+        feasible = self.feasible.ravel()
+        if feasible_only:
+            symbol_index = symbol_index[feasible]
+            stop_index = stop_index[feasible]
+            category_index = category_index[feasible]
+            account_index = account_index[feasible]
+
+        scale = float(self.price_scale)
+        entry_units = np.array(
+            [int(price * self.price_scale) for price in self.entry_prices], dtype=np.int64
+        )
+        accounts = np.array([float(value) for value in self.account_values])
+        sizes = self.position_sizes[symbol_index, stop_index, category_index, account_index]
+
+        return {
+            "symbol": np.array(self.symbols, dtype=object)[symbol_index],
+            "entry_price": entry_units[symbol_index] / scale,
+            "stop_loss": self.stop_losses[symbol_index, stop_index] / scale,
+            "stop_percent": np.array([float(p) for p in self.stop_percents])[stop_index],
+            "risk_category": np.array(self.risk_categories, dtype=object)[category_index],
+            "account_value": accounts[account_index],
+            "dollar_risk": self.dollar_risk_cents[category_index, account_index] / 100.0,
+            "position_size": sizes,
+            "position_value": sizes * entry_units[symbol_index] / scale,
+            "total_portfolio_risk": self.total_portfolio_risk[category_index, account_index],
+            "within_portfolio_limit": self.within_portfolio_limit[category_index, account_index],
+            "within_account_value": self.within_account_value[
+                symbol_index, stop_index, category_index, account_index
+            ],
+            "feasible": feasible[feasible] if feasible_only else feasible,
+        }
+
+    def iter_rows(self, feasible_only: bool = False) -> Iterator[List[Any]]:
+        """Iterate table rows as plain Python values in GRID_COLUMNS order."""
+        columns = self.to_columns(feasible_only)
+        return zip(*(columns[name].tolist() for name in GRID_COLUMNS))
+
+    def write_csv(self, stream: TextIO, feasible_only: bool = False) -> int:
+        """
+        Write the table as CSV with a header row.
+
+        Args:
+            stream: Text stream to write to
+            feasible_only: Keep only feasible scenarios
+
+        Returns:
+            Number of data rows written
+        """
+        writer = csv.writer(stream, lineterminator="\n")
+        writer.writerow(GRID_COLUMNS)
+        count = 0
+        for row in self.iter_rows(feasible_only):
+            writer.writerow(row)
+            count += 1
+        return count
+
+    def write_json(self, stream: TextIO, feasible_only: bool = False) -> int:
+        """
+        Write the table as one JSON object of column names and row arrays.
+
+        Args:
+            stream: Text stream to write to
+            feasible_only: Keep only feasible scenarios
+
+        Returns:
+            Number of data rows written
+        """
+        rows = list(self.iter_rows(feasible_only))
+        json.dump(
+            {
+                "shape": dict(zip(("symbols", "stops", "categories", "account_values"), self.shape)),
+                "columns": list(GRID_COLUMNS),
+                "rows": rows,
+            },
+            stream,
+            separators=(",", ":"),
+        )
+        return len(rows)
+
+
+def evaluate_scenario_grid(
+    position_sizer: PositionSizer,
+    entry_prices: Mapping[str, Decimal],
+    stop_percents: Sequence[Decimal],
+    risk_categories: Sequence[str],
+    account_values: Sequence[Decimal],
+    committed_risk: Decimal = Decimal("0"),
+    max_portfolio_risk: Decimal = Decimal("10.0"),
+) -> ScenarioGrid:
+    """
+    Size every combination of symbol, stop distance, risk category and account value.
+
+    Each cell gives the same whole-share size as calculate_position_size
+    with the cell's entry and stop; sizes are computed in one fixed-point
+    numpy pass, so a million-cell grid takes well under a second. Dollar
+    risk and portfolio limit checks are computed once per category and
+    account value with the Decimal formulas of the position sizer and
+    portfolio tracker.
+
+    Args:
+        position_sizer: Sizer supplying risk percentages and fixed-point scale
+        entry_prices: Symbol -> planned entry price
+        stop_percents: Stop distances below entry, percent of entry price
+        risk_categories: Risk levels (small/normal/large)
+        account_values: Account balances to size against
+        committed_risk: Dollar risk of open positions
+        max_portfolio_risk: Portfolio risk limit percentage
+
+    Returns:
+        ScenarioGrid of sizes and feasibility flags
+
+    Raises:
+        InvalidPositionSizeError: If any input value is invalid
+    """
+    _validate_grid_inputs(entry_prices, stop_percents, account_values)
+    scale = position_sizer.PRICE_SCALE
+    categories = [category.lower() for category in risk_categories]
+
+    # Per category and account value: Decimal dollar risk and limit checks
+    dollar_risk_cents = np.empty((len(categories), len(account_values)), dtype=np.int64)
+    total_risk = np.empty(dollar_risk_cents.shape)
+    within_limit = np.empty(dollar_risk_cents.shape, dtype=bool)
+    for a, account_value in enumerate(account_values):
+        current_risk = (committed_risk / account_value * Decimal("100")).quantize(Decimal("0.01"))
+        for c, category in enumerate(categories):
+            dollar_risk = position_sizer.get_dollar_risk(account_value, category)
+            total = current_risk + dollar_risk / account_value * Decimal("100")
+            dollar_risk_cents[c, a] = int(dollar_risk * 100)
+            total_risk[c, a] = float(total.quantize(Decimal("0.01")))
+            within_limit[c, a] = total <= max_portfolio_risk
+
+    entry_units = np.array(
+        [position_sizer.to_fixed_point(price) for price in entry_prices.values()], dtype=np.int64
+    )
+    stop_bps = np.array(
+        [int(percent / STOP_PERCENT_STEP) for percent in stop_percents], dtype=np.int64
+    )
+    account_units = np.array(
+        [position_sizer.to_fixed_point(value) for value in account_values], dtype=np.int64
+    )
+
+    # [symbol, stop] risk per share, truncated to whole price units
+    distances = entry_units[:, np.newaxis] * stop_bps[np.newaxis, :] // 10_000
+    stop_losses = entry_units[:, np.newaxis] - distances
+
+    # [symbol, stop, category, account] shares, floor as in calculate_position_size
+    risk_units = (dollar_risk_cents * (scale // 100))[np.newaxis, np.newaxis]
+    safe_distances = np.maximum(distances, 1)[:, :, np.newaxis, np.newaxis]
+    sizes = np.maximum(risk_units // safe_distances, 1)
+    sizes *= (distances > 0)[:, :, np.newaxis, np.newaxis]
+
+    position_values = sizes * entry_units[:, np.newaxis, np.newaxis, np.newaxis]
+    within_account = position_values <= account_units[np.newaxis, np.newaxis, np.newaxis, :]
+
+    grid = ScenarioGrid(
+        symbols=list(entry_prices),
+        entry_prices=list(entry_prices.values()),
+        stop_percents=list(stop_percents),
+        risk_categories=categories,
+        account_values=list(account_values),
+        price_scale=scale,
+        stop_losses=stop_losses,
+        dollar_risk_cents=dollar_risk_cents,
+        total_portfolio_risk=total_risk,
+        within_portfolio_limit=within_limit,
+        position_sizes=sizes,
+        within_account_value=within_account,
+    )
+
+    logger.info(
+        "Position size scenario grid evaluated",
+        shape=grid.shape,
+        cell_count=grid.cell_count,
+        committed_risk=float(committed_risk),
+    )
+    return grid
+
+
+def _validate_grid_inputs(
+    entry_prices: Mapping[str, Decimal],
+    stop_percents: Sequence[Decimal],
+    account_values: Sequence[Decimal],
+) -> None:
+    """Check the grid axes are non-empty and hold exactly representable values."""
+    if not entry_prices or not stop_percents or not account_values:
+        raise InvalidPositionSizeError(
+            "Scenario grid needs at least one entry price, stop distance and account value"
+        )
+
+    for symbol, price in entry_prices.items():
+        if price <= 0 or price != price.quantize(Decimal("0.0001")):
+            raise InvalidPositionSizeError(
+                f"Entry price for {symbol} must be positive with at most 4 decimal places",
+                entry_price=price,
+            )
+
+    for percent in stop_percents:
+        if not Decimal("0") < percent < Decimal("100") or percent % STOP_PERCENT_STEP:
+            raise InvalidPositionSizeError(
+                f"Stop distance {percent}% must be between 0 and 100 "
+                f"in steps of {STOP_PERCENT_STEP}%"
+            )
+
+    for value in account_values:
+        if value <= 0:
+            raise InvalidPositionSizeError("Account value must be positive")
@@ -1,4 +1,6 @@
 # Test suite for OrderRiskValidator
+import asyncio
+
 import pytest
 from decimal import Decimal
 from unittest.mock import Mock, AsyncMock
@@ -34,15 +36,15 @@ def mock_position_sizer():
 
 
 @pytest.fixture
-def mock_portfolio_tracker():
-    """Mock portfolio tracker."""
-    mock = Mock(spec=PortfolioTracker)
-    mock.get_current_state = AsyncMock(return_value=PortfolioRiskState(
-        positions=[],
-        total_risk_percentage=Decimal("3.0"),
+def portfolio_tracker(tmp_path):
+    """Portfolio tracker holding 3% committed risk."""
+    tracker = PortfolioTracker(
+        state_file=tmp_path / "position_registry.json",
         account_value=Decimal("100000.00"),
-    ))
-    return mock
+        verify_totals=True,
+    )
+    tracker.add_position("POS_001", "MSFT", Decimal("3000.00"), "MSFT_20250827_001")
+    return tracker
 
 
 @pytest.fixture
@@ -61,11 +63,11 @@ def sample_order_request():
 
 
 @pytest.fixture
-def order_risk_validator(mock_position_sizer, mock_portfolio_tracker):
+def order_risk_validator(mock_position_sizer, portfolio_tracker):
     """Order risk validator with mocked dependencies."""
     return OrderRiskValidator(
         position_sizer=mock_position_sizer,
-        portfolio_tracker=mock_portfolio_tracker,
+        portfolio_tracker=portfolio_tracker,
         account_value=Decimal("100000.00"),
     )
 
@@ -89,19 +91,15 @@ class TestOrderRiskValidator:
 
     @pytest.mark.asyncio
     async def test_portfolio_risk_limit_exceeded(
-        self, mock_position_sizer, mock_portfolio_tracker, sample_order_request
+        self, mock_position_sizer, portfolio_tracker, sample_order_request
     ):
         """Test validation failure when portfolio risk limit is exceeded."""
-        # Set high current risk to trigger limit
-        mock_portfolio_tracker.get_current_state = AsyncMock(return_value=PortfolioRiskState(
-            positions=[],
-            total_risk_percentage=Decimal("9.0"),  # High current risk
-            account_value=Decimal("100000.00"),
-        ))
+        # Raise current risk to 9% to trigger limit
+        portfolio_tracker.add_position("POS_002", "NVDA", Decimal("6000.00"), "NVDA_20250827_001")
         
         validator = OrderRiskValidator(
             position_sizer=mock_position_sizer,
-            portfolio_tracker=mock_portfolio_tracker,
+            portfolio_tracker=portfolio_tracker,
             account_value=Decimal("100000.00"),
         )
         
@@ -113,12 +111,12 @@ class TestOrderRiskValidator:
 
     @pytest.mark.asyncio
     async def test_daily_loss_limit_validation(
-        self, mock_position_sizer, mock_portfolio_tracker, sample_order_request
+        self, mock_position_sizer, portfolio_tracker, sample_order_request
     ):
         """Test daily loss limit validation (currently simplified implementation)."""        
         validator = OrderRiskValidator(
             position_sizer=mock_position_sizer,
-            portfolio_tracker=mock_portfolio_tracker,
+            portfolio_tracker=portfolio_tracker,
             account_value=Decimal("100000.00"),
         )
         
@@ -129,7 +127,7 @@ class TestOrderRiskValidator:
 
     @pytest.mark.asyncio
     async def test_invalid_position_size(
-        self, mock_position_sizer, mock_portfolio_tracker, sample_order_request
+        self, mock_position_sizer, portfolio_tracker, sample_order_request
     ):
         """Test validation failure due to invalid position size calculation."""
         # Make position sizer raise error
@@ -139,7 +137,7 @@ class TestOrderRiskValidator:
         
         validator = OrderRiskValidator(
             position_sizer=mock_position_sizer,
-            portfolio_tracker=mock_portfolio_tracker,
+            portfolio_tracker=portfolio_tracker,
             account_value=Decimal("100000.00"),
         )
         
@@ -151,7 +149,7 @@ class TestOrderRiskValidator:
 
     @pytest.mark.asyncio
     async def test_insufficient_capital(
-        self, mock_position_sizer, mock_portfolio_tracker, sample_order_request
+        self, mock_position_sizer, portfolio_tracker, sample_order_request
     ):
         """Test validation failure due to insufficient capital."""
         # Set very high position size to trigger capital check
@@ -166,7 +164,7 @@ class TestOrderRiskValidator:
         
         validator = OrderRiskValidator(
             position_sizer=mock_position_sizer,
-            portfolio_tracker=mock_portfolio_tracker,
+            portfolio_tracker=portfolio_tracker,
             account_value=Decimal("100000.00"),  # Not enough for 10000 * $180.50
         )
         
@@ -211,7 +209,7 @@ class TestOrderRiskValidator:
 
     @pytest.mark.asyncio
     async def test_risk_category_mapping(
-        self, mock_position_sizer, mock_portfolio_tracker
+        self, mock_position_sizer, portfolio_tracker
     ):
         """Test that RiskCategory enum values are correctly mapped to strings."""
         order_request = OrderRequest(
@@ -227,7 +225,7 @@ class TestOrderRiskValidator:
         
         validator = OrderRiskValidator(
             position_sizer=mock_position_sizer,
-            portfolio_tracker=mock_portfolio_tracker,
+            portfolio_tracker=portfolio_tracker,
             account_value=Decimal("100000.00"),
         )
         
@@ -240,14 +238,14 @@ class TestOrderRiskValidator:
 
     @pytest.mark.asyncio
     async def test_account_value_precedence(
-        self, mock_position_sizer, mock_portfolio_tracker, sample_order_request
+        self, mock_position_sizer, portfolio_tracker, sample_order_request
     ):
         """Test that explicitly set account value takes precedence."""
         explicit_account_value = Decimal("50000.00")
         
         validator = OrderRiskValidator(
             position_sizer=mock_position_sizer,
-            portfolio_tracker=mock_portfolio_tracker,
+            portfolio_tracker=portfolio_tracker,
             account_value=explicit_account_value,
         )
         
@@ -256,14 +254,154 @@ class TestOrderRiskValidator:
 
     @pytest.mark.asyncio
     async def test_default_account_value(
-        self, mock_position_sizer, mock_portfolio_tracker, sample_order_request
+        self, mock_position_sizer, portfolio_tracker, sample_order_request
     ):
         """Test that default account value is used when not explicitly set."""
         validator = OrderRiskValidator(
             position_sizer=mock_position_sizer,
-            portfolio_tracker=mock_portfolio_tracker,
+            portfolio_tracker=portfolio_tracker,
             account_value=None,  # No explicit value
         )
         
         account_value = await validator._get_account_value()
-        assert account_value == Decimal("100000.00")  # Default value
\ No newline at end of file
+        assert account_value == Decimal("100000.00")  # Default value
+    @pytest.mark.asyncio
+    async def test_concurrent_validations_respect_limit(
+        self, order_risk_validator, portfolio_tracker
+    ):
+        """Test in-flight validations reserve risk so together they stay within the limit."""
+        requests = [
+            OrderRequest(
+                trade_plan_id=f"AAPL_20250827_{index:03d}",
+                symbol="AAPL",
+                side=OrderSide.BUY,
+                order_type=OrderType.MARKET,
+                entry_price=Decimal("180.50"),
+                stop_loss_price=Decimal("178.00"),
+                take_profit_price=Decimal("185.00"),
+                risk_category=RiskCategory.NORMAL,
+            )
+            for index in range(1, 7)
+        ]
+        
+        results = await asyncio.gather(
+            *(order_risk_validator.validate_order_request(request) for request in requests)
+        )
+        
+        # 3% committed leaves room for three 2% orders under the 10% limit
+        assert sum(result.is_valid for result in results) == 3
+        assert portfolio_tracker.get_reserved_risk() == Decimal("6000.00")
+        assert portfolio_tracker.get_current_portfolio_risk() == Decimal("3.00")
+
+    @pytest.mark.asyncio
+    async def test_failed_validation_releases_reservation(
+        self, mock_position_sizer, portfolio_tracker, sample_order_request
+    ):
+        """Test a reservation is dropped when a later check rejects the order."""
+        mock_position_sizer.calculate_position_size.return_value = PositionSizeResult(
+            position_size=10000,
+            dollar_risk=Decimal("5000.00"),
+            validation_status=True,
+            portfolio_risk_percentage=Decimal("5.0"),
+            risk_category="normal",
+            account_value=Decimal("100000.00"),
+        )
+        validator = OrderRiskValidator(
+            position_sizer=mock_position_sizer,
+            portfolio_tracker=portfolio_tracker,
+            account_value=Decimal("100000.00"),
+        )
+        
+        result = await validator.validate_order_request(sample_order_request)
+        
+        assert result.is_valid is False
+        assert portfolio_tracker.get_reserved_risk() == Decimal("0")
+
+    @pytest.mark.asyncio
+    async def test_commit_and_release_reservation(
+        self, order_risk_validator, portfolio_tracker, sample_order_request
+    ):
+        """Test fills commit the reserved risk and cancellations release it."""
+        await order_risk_validator.validate_order_request(sample_order_request)
+        
+        entry = order_risk_validator.commit_reservation("AAPL_20250827_001", "ORDER_1")
+        
+        assert entry.position_id == "ORDER_1"
+        assert portfolio_tracker.get_total_dollar_risk() == Decimal("5000.00")
+        assert portfolio_tracker.get_reserved_risk() == Decimal("0")
+        
+        await order_risk_validator.validate_order_request(sample_order_request)
+        assert order_risk_validator.pin_reservation("AAPL_20250827_001") is True
+        assert order_risk_validator.release_reservation("AAPL_20250827_001") is True
+        assert portfolio_tracker.get_reserved_risk() == Decimal("0")
+
+
+class TestRiskContextSnapshot:
+    """Test the shared account and risk snapshot."""
+
+    @pytest.fixture
+    def validator(self, mock_position_sizer, portfolio_tracker):
+        """Validator counting account value fetches."""
+        validator = OrderRiskValidator(
+            position_sizer=mock_position_sizer,
+            portfolio_tracker=portfolio_tracker,
+            account_value=Decimal("100000.00"),
+        )
+        validator._get_account_value = AsyncMock(return_value=Decimal("100000.00"))
+        return validator
+
+    @pytest.mark.asyncio
+    async def test_snapshot_reused_across_validations(self, validator, sample_order_request):
+        """Test repeated validations fetch account figures once."""
+        for _ in range(3):
+            result = await validator.validate_order_request(sample_order_request)
+            assert result.is_valid is True
+
+        snapshot = await validator.get_risk_context()
+        assert validator._get_account_value.await_count == 1
+        assert snapshot.version == 1
+        assert snapshot.account_value == Decimal("100000.00")
+        assert snapshot.buying_power == Decimal("50000.00")
+        assert snapshot.current_risk == Decimal("3.00")
+        assert snapshot.daily_losses == Decimal("0.00")
+
+        stats = validator.get_risk_context_stats()
+        assert stats["hits"] == 3
+        assert stats["refreshes"] == 1
+        assert stats["hit_rate"] == 0.75
+        assert 0 <= stats["age_seconds"] < validator.RISK_CONTEXT_TTL_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_refresh(self, validator):
+        """Test validations arriving during a refetch wait for it instead of fetching again."""
+        async def slow_fetch():
+            await asyncio.sleep(0.01)
+            return Decimal("100000.00")
+
+        validator._get_account_value = AsyncMock(side_effect=slow_fetch)
+
+        snapshots = await asyncio.gather(*(validator.get_risk_context() for _ in range(5)))
+
+        assert validator._get_account_value.await_count == 1
+        assert all(snapshot is snapshots[0] for snapshot in snapshots)
+        assert validator.get_risk_context_stats()["shared_refreshes"] == 4
+
+    @pytest.mark.asyncio
+    async def test_events_and_ttl_refresh_snapshot(self, validator, portfolio_tracker):
+        """Test position changes, account updates and the TTL each force a refetch."""
+        first = await validator.get_risk_context()
+
+        portfolio_tracker.add_position("POS_002", "NVDA", Decimal("2000.00"), "NVDA_20250827_001")
+        second = await validator.get_risk_context()
+        assert second.version == first.version + 1
+        assert second.current_risk == Decimal("5.00")
+
+        validator.set_account_value(Decimal("80000.00"))
+        validator._get_account_value.return_value = Decimal("80000.00")
+        third = await validator.get_risk_context()
+        assert third.version == second.version + 1
+        assert third.buying_power == Decimal("40000.00")
+
+        validator._risk_context_ttl = 0
+        assert (await validator.get_risk_context()).version == third.version + 1
+        assert validator._get_account_value.await_count == 4
@@ -2,6 +2,7 @@
 
 import json
 import tempfile
+import time
 from decimal import Decimal
 from pathlib import Path
 from unittest.mock import patch
@@ -9,7 +10,12 @@ from unittest.mock import patch
 import pytest
 
 from ..portfolio_tracker import PortfolioTracker
-from ..risk_models import PortfolioRiskExceededError, PositionRiskEntry
+from ..risk_models import (
+    PortfolioRiskExceededError,
+    PortfolioRiskState,
+    PositionRiskEntry,
+    RiskManagementError,
+)
 
 
 class TestPortfolioTrackerInitialization:
@@ -542,4 +548,214 @@ class TestBackupAndMaintenance:
             assert cleared_count == 2
             assert tracker.get_position_count() == 0
             assert tracker.get_total_dollar_risk() == Decimal("0.00")
-            assert tracker.get_current_portfolio_risk() == Decimal("0.00")
\ No newline at end of file
+            assert tracker.get_current_portfolio_risk() == Decimal("0.00")
+
+class TestRunningRiskTotals:
+    """Tests for incrementally maintained risk totals."""
+    
+    @pytest.fixture
+    def tracker(self, tmp_path) -> PortfolioTracker:
+        """Create tracker that verifies its totals after every change."""
+        return PortfolioTracker(
+            state_file=tmp_path / "totals_registry.json",
+            account_value=Decimal("10000.00"),
+            verify_totals=True,
+        )
+    
+    def test_totals_follow_adds_replacements_and_removals(self, tracker: PortfolioTracker) -> None:
+        """Test overall and per-symbol totals through every kind of change."""
+        tracker.add_position("POS_001", "AAPL", Decimal("200.00"), "AAPL_001")
+        tracker.add_position("POS_002", "AAPL", Decimal("150.00"), "AAPL_002")
+        tracker.add_position("POS_003", "MSFT", Decimal("100.00"), "MSFT_001")
+        
+        assert tracker.get_total_dollar_risk() == Decimal("450.00")
+        assert tracker.get_symbol_risk_totals() == {
+            "AAPL": Decimal("350.00"),
+            "MSFT": Decimal("100.00"),
+        }
+        
+        # Re-adding an ID replaces the position rather than double counting it
+        tracker.add_position("POS_001", "MSFT", Decimal("50.00"), "MSFT_002")
+        assert tracker.get_total_dollar_risk() == Decimal("300.00")
+        assert tracker.get_symbol_dollar_risk("AAPL") == Decimal("150.00")
+        assert sorted(tracker.get_positions_by_symbol("MSFT")) == ["POS_001", "POS_003"]
+        
+        tracker.remove_position("POS_002")
+        assert tracker.get_symbol_dollar_risk("AAPL") == Decimal("0")
+        assert "AAPL" not in tracker.get_symbol_risk_totals()
+        assert tracker.get_current_portfolio_risk() == Decimal("1.50")
+        
+        tracker.set_account_value(Decimal("5000.00"))
+        assert tracker.get_current_portfolio_risk() == Decimal("3.00")
+    
+    def test_totals_rebuilt_on_load_and_clear(self, tracker: PortfolioTracker) -> None:
+        """Test totals restored from persisted state and reset by clearing."""
+        tracker.add_position("POS_001", "AAPL", Decimal("200.00"), "AAPL_001")
+        tracker.add_position("POS_002", "MSFT", Decimal("300.00"), "MSFT_001")
+        
+        reloaded = PortfolioTracker(state_file=tracker.state_file, verify_totals=True)
+        assert reloaded.get_total_dollar_risk() == Decimal("500.00")
+        assert reloaded.get_symbol_risk_totals() == tracker.get_symbol_risk_totals()
+        
+        reloaded.clear_all_positions()
+        assert reloaded.get_total_dollar_risk() == Decimal("0")
+        assert reloaded.get_symbol_risk_totals() == {}
+    
+    def test_verify_detects_drift(self, tracker: PortfolioTracker) -> None:
+        """Test the self-check reports totals that no longer match the positions."""
+        tracker.add_position("POS_001", "AAPL", Decimal("200.00"), "AAPL_001")
+        tracker.verify_risk_totals()
+        
+        tracker._symbol_risk["AAPL"] = Decimal("250.00")
+        
+        with pytest.raises(RiskManagementError, match="out of sync") as exc_info:
+            tracker.verify_risk_totals()
+        assert exc_info.value.error_code == "RISK_TOTALS_MISMATCH"
+        with pytest.raises(RiskManagementError):
+            tracker.add_position("POS_002", "MSFT", Decimal("100.00"), "MSFT_001")
+    
+    def test_risk_checks_independent_of_position_count(self, tmp_path) -> None:
+        """Benchmark risk checks with 5 and 5,000 tracked positions."""
+        timings = {}
+        for count in (5, 5000):
+            state_file = tmp_path / f"registry_{count}.json"
+            state = PortfolioRiskState(
+                positions=[
+                    PositionRiskEntry(
+                        position_id=f"POS_{i:05d}",
+                        symbol=f"SYM{i % 50}",
+                        risk_amount=Decimal("0.01"),
+                        plan_id=f"PLAN_{i:05d}",
+                    )
+                    for i in range(count)
+                ],
+                account_value=Decimal("1000000.00"),
+            )
+            state_file.write_text(json.dumps(state.model_dump(mode="json")))
+            tracker = PortfolioTracker(state_file=state_file)
+            assert tracker.get_total_dollar_risk() == Decimal("0.01") * count
+            
+            start = time.perf_counter()
+            for _ in range(2000):
+                tracker.check_new_trade_risk(Decimal("500.00"))
+                tracker.get_available_risk_capacity()
+            timings[count] = time.perf_counter() - start
+        
+        print(
+            f"2000 risk checks - 5 positions: {timings[5] * 1000:.1f}ms, "
+            f"5000 positions: {timings[5000] * 1000:.1f}ms"
+        )
+        assert timings[5000] < timings[5] * 3
+
+
+class TestRiskReservations:
+    """Tests for the pending-order risk reservation ledger."""
+    
+    @pytest.fixture
+    def tracker(self, tmp_path) -> PortfolioTracker:
+        """Create tracker with 3% of a $10,000 account already committed."""
+        tracker = PortfolioTracker(
+            state_file=tmp_path / "reservation_registry.json",
+            account_value=Decimal("10000.00"),
+            verify_totals=True,
+        )
+        tracker.add_position("POS_001", "AAPL", Decimal("300.00"), "AAPL_001")
+        return tracker
+    
+    def test_reservations_count_against_limit(self, tracker: PortfolioTracker) -> None:
+        """Test held reservations block risk that committed positions alone would allow."""
+        for index in range(3):
+            check = tracker.try_reserve_risk(f"PLAN_{index}", "MSFT", Decimal("200.00"), f"PLAN_{index}")
+            assert check.passed is True
+        
+        check = tracker.try_reserve_risk("PLAN_3", "MSFT", Decimal("200.00"), "PLAN_3")
+        
+        assert check.passed is False
+        assert check.current_risk == Decimal("9.00")
+        assert check.new_trade_risk == Decimal("2.00")
+        assert "current and reserved" in check.reason
+        assert tracker.get_reserved_risk() == Decimal("600.00")
+        assert tracker.get_reservation("PLAN_3") is None
+        # Committed risk is unchanged until an order fills
+        assert tracker.get_current_portfolio_risk() == Decimal("3.00")
+    
+    def test_re_reserving_replaces(self, tracker: PortfolioTracker) -> None:
+        """Test reserving an ID again replaces its earlier amount."""
+        tracker.try_reserve_risk("PLAN_1", "MSFT", Decimal("600.00"), "PLAN_1")
+        
+        check = tracker.try_reserve_risk("PLAN_1", "MSFT", Decimal("700.00"), "PLAN_1")
+        
+        assert check.passed is True
+        assert check.current_risk == Decimal("3.00")
+        assert tracker.get_reserved_risk() == Decimal("700.00")
+        assert tracker.get_reservation_count() == 1
+    
+    def test_commit_turns_reservation_into_position(self, tracker: PortfolioTracker) -> None:
+        """Test a fill moves the reserved risk into committed positions."""
+        tracker.try_reserve_risk("PLAN_1", "MSFT", Decimal("200.00"), "MSFT_001")
+        
+        entry = tracker.commit_reservation("PLAN_1", position_id="ORDER_1")
+        
+        assert entry.position_id == "ORDER_1"
+        assert entry.symbol == "MSFT"
+        assert entry.plan_id == "MSFT_001"
+        assert tracker.get_reserved_risk() == Decimal("0")
+        assert tracker.get_total_dollar_risk() == Decimal("500.00")
+        assert tracker.commit_reservation("PLAN_1") is None
+    
+    def test_release_frees_capacity(self, tracker: PortfolioTracker) -> None:
+        """Test a rejected or cancelled order gives its risk back."""
+        tracker.try_reserve_risk("PLAN_1", "MSFT", Decimal("700.00"), "PLAN_1")
+        assert not tracker.try_reserve_risk("PLAN_2", "NVDA", Decimal("100.00"), "PLAN_2").passed
+        
+        assert tracker.release_reservation("PLAN_1") is True
+        assert tracker.release_reservation("PLAN_1") is False
+        assert tracker.try_reserve_risk("PLAN_2", "NVDA", Decimal("100.00"), "PLAN_2").passed
+    
+    def test_reservations_expire(self, tracker: PortfolioTracker) -> None:
+        """Test reservations of orders never settled lapse after the TTL."""
+        with patch("auto_trader.risk_management.portfolio_tracker.time.monotonic", return_value=100.0):
+            tracker.try_reserve_risk("PLAN_1", "MSFT", Decimal("700.00"), "PLAN_1")
+        
+        expired_at = 100.0 + PortfolioTracker.RESERVATION_TTL_SECONDS
+        with patch("auto_trader.risk_management.portfolio_tracker.time.monotonic", return_value=expired_at):
+            assert tracker.get_reservation("PLAN_1") is None
+            assert tracker.try_reserve_risk("PLAN_2", "NVDA", Decimal("700.00"), "PLAN_2").passed
+            assert tracker.get_reservation_count() == 1
+    
+    def test_pinned_reservation_outlives_ttl(self, tracker: PortfolioTracker) -> None:
+        """Test a working order's reservation keeps blocking risk until it settles."""
+        monotonic = "auto_trader.risk_management.portfolio_tracker.time.monotonic"
+        with patch(monotonic, return_value=100.0):
+            tracker.try_reserve_risk("PLAN_A", "MSFT", Decimal("600.00"), "PLAN_A")
+            assert tracker.pin_reservation("PLAN_A").expires_at is None
+        
+        with patch(monotonic, return_value=100.0 + 10 * PortfolioTracker.RESERVATION_TTL_SECONDS):
+            assert tracker.get_reservation("PLAN_A") is not None
+            assert not tracker.try_reserve_risk("PLAN_B", "NVDA", Decimal("600.00"), "PLAN_B").passed
+            assert tracker.pin_reservation("PLAN_B") is None
+        
+        tracker.commit_reservation("PLAN_A", "ORDER_A")
+        assert tracker.get_reserved_risk() == Decimal("0")
+        assert tracker.get_total_dollar_risk() == Decimal("900.00")
+    
+    def test_fill_without_reservation_still_tracked(self, tracker: PortfolioTracker) -> None:
+        """Test a fill whose reservation lapsed is added from its symbol and risk."""
+        entry = tracker.commit_reservation(
+            "PLAN_A", "ORDER_A", risk_amount=Decimal("600.00"), symbol="MSFT"
+        )
+        
+        assert entry.symbol == "MSFT"
+        assert entry.plan_id == "PLAN_A"
+        assert tracker.get_total_dollar_risk() == Decimal("900.00")
+        assert tracker.commit_reservation("PLAN_B") is None
+    
+    def test_invalid_account_value(self, tmp_path) -> None:
+        """Test nothing is reserved without an account value."""
+        tracker = PortfolioTracker(state_file=tmp_path / "empty_registry.json")
+        
+        check = tracker.try_reserve_risk("PLAN_1", "MSFT", Decimal("100.00"), "PLAN_1")
+        
+        assert check.passed is False
+        assert "Invalid account value" in check.reason
+        assert tracker.get_reservation_count() == 0
@@ -1,9 +1,11 @@
 """Tests for the RiskManager orchestrator."""
 
 import tempfile
+import time
 from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -584,4 +586,125 @@ class TestEdgeCasesAndErrorHandling:
         
         # Should load existing positions
         assert risk_manager2.get_current_portfolio_risk() == Decimal("2.00")
-        assert risk_manager2.portfolio_tracker.get_position_count() == 1
\ No newline at end of file
+        assert risk_manager2.portfolio_tracker.get_position_count() == 1
+
+class TestBatchValidation:
+    """Tests for vectorized batch trade plan validation."""
+    
+    @pytest.fixture
+    def risk_manager(self, temp_state_file: Path) -> RiskManager:
+        """Create risk manager for testing."""
+        return RiskManager(
+            account_value=Decimal("10000.00"),
+            daily_loss_limit=Decimal("500.00"),
+            state_file=temp_state_file,
+        )
+    
+    @staticmethod
+    def make_plans(sample_trade_plan: TradePlan, count: int) -> list:
+        """Create long and short plans across all risk categories and price scales."""
+        plans = []
+        for i in range(count):
+            entry = Decimal("180.00") + Decimal(i % 97) * Decimal("0.3719")
+            offset = Decimal("0.0001") + Decimal(i % 13) * Decimal("1.2345")
+            short = i % 2 == 1
+            plans.append(sample_trade_plan.model_copy(update={
+                "plan_id": f"AAPL_20250815_{i:05d}",
+                "entry_level": entry,
+                "stop_loss": entry + offset if short else entry - offset,
+                "take_profit": entry - Decimal("20") if short else entry + Decimal("20"),
+                "risk_category": ("small", "normal", "large")[i % 3],
+            }))
+        return plans
+    
+    def test_results_identical_to_single_validation(
+        self,
+        risk_manager: RiskManager,
+        sample_trade_plan: TradePlan,
+    ) -> None:
+        """Test batch results equal validate_trade_plan results plan by plan."""
+        plans = self.make_plans(sample_trade_plan, 300)
+        
+        batch = risk_manager.validate_trade_plans(plans)
+        
+        assert batch == [risk_manager.validate_trade_plan(plan) for plan in plans]
+        assert len({result.position_size_result.position_size for result in batch}) > 20
+    
+    def test_limit_failures_identical(
+        self,
+        risk_manager: RiskManager,
+        sample_trade_plan: TradePlan,
+    ) -> None:
+        """Test portfolio limit, daily loss and sizing rejections match single validation."""
+        risk_manager.add_position_to_tracking("POS_001", "MSFT", Decimal("750.00"), "MSFT_001")
+        risk_manager._daily_losses = Decimal("500.00")
+        plans = self.make_plans(sample_trade_plan, 6) + [
+            # Bypasses model validation to reach the sizer's zero-risk rejection
+            sample_trade_plan.model_copy(update={"plan_id": "ZERO_RISK_001", "stop_loss": Decimal("180.00")}),
+        ]
+        
+        batch = risk_manager.validate_trade_plans(plans)
+        
+        assert batch == [risk_manager.validate_trade_plan(plan) for plan in plans]
+        assert not batch[2].portfolio_risk_check.passed  # large: 7.5% + 3% > 10%
+        assert batch[0].portfolio_risk_check.passed
+        assert batch[0].warnings == ["Consider waiting until tomorrow to trade"]
+        assert "cannot equal stop loss" in batch[-1].errors[0]
+    
+    def test_invalid_account_value(
+        self,
+        sample_trade_plan: TradePlan,
+        temp_state_file: Path,
+    ) -> None:
+        """Test every plan fails without a usable account value."""
+        risk_manager = RiskManager(account_value=Decimal("0.00"), state_file=temp_state_file)
+        plans = self.make_plans(sample_trade_plan, 3)
+        
+        assert risk_manager.validate_trade_plans(plans) == [
+            risk_manager.validate_trade_plan(plan) for plan in plans
+        ]
+        assert risk_manager.validate_trade_plans([]) == []
+    
+    def test_one_audit_record_per_batch(
+        self,
+        risk_manager: RiskManager,
+        sample_trade_plan: TradePlan,
+    ) -> None:
+        """Test the batch writes a single audit record covering every plan."""
+        plans = self.make_plans(sample_trade_plan, 20)
+        
+        with patch("auto_trader.risk_management.risk_manager.logger") as mock_logger:
+            results = risk_manager.validate_trade_plans(plans)
+        
+        audit_calls = [
+            call for call in mock_logger.info.call_args_list
+            if call.args[0].startswith("AUDIT")
+        ]
+        assert len(audit_calls) == 1
+        audit = audit_calls[0].kwargs
+        assert audit["plan_count"] == 20 and audit["valid_count"] == 20
+        assert audit["position_sizes"]["AAPL_20250815_00004"] == results[4].position_size_result.position_size
+        assert sorted(audit["categories"]) == ["large", "normal", "small"]
+    
+    def test_batch_throughput(
+        self,
+        risk_manager: RiskManager,
+        sample_trade_plan: TradePlan,
+    ) -> None:
+        """Benchmark 10k plans against one validate_trade_plan call per plan."""
+        plans = self.make_plans(sample_trade_plan, 10_000)
+        
+        start = time.perf_counter()
+        single = [risk_manager.validate_trade_plan(plan) for plan in plans]
+        single_seconds = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        batch = risk_manager.validate_trade_plans(plans)
+        batch_seconds = time.perf_counter() - start
+        
+        print(
+            f"10k plans - per plan: {single_seconds * 1000:.0f}ms, "
+            f"batch: {batch_seconds * 1000:.0f}ms"
+        )
+        assert batch == single
+        assert batch_seconds < single_seconds
@@ -0,0 +1,120 @@
+"""Tests for vectorized position size scenario grids."""
+
+import io
+import itertools
+import json
+import time
+from decimal import Decimal
+
+import pytest
+
+from ..position_sizer import PositionSizer
+from ..risk_models import InvalidPositionSizeError
+from ..scenario_grid import GRID_COLUMNS
+
+
+@pytest.fixture
+def position_sizer() -> PositionSizer:
+    """Create a position sizer instance for testing."""
+    return PositionSizer()
+
+
+class TestScenarioGrid:
+    """Tests for preview_position_size_grid."""
+
+    def test_sizes_match_scalar_calculation(self, position_sizer: PositionSizer) -> None:
+        """Test every cell equals calculate_position_size for its entry and stop."""
+        entries = {"AAPL": Decimal("180.50"), "PENNY": Decimal("0.0123"), "BRK": Decimal("612345.6789")}
+        stops = [Decimal("0.01"), Decimal("1.37"), Decimal("5"), Decimal("99.99")]
+        accounts = [Decimal("2500.55"), Decimal("100000")]
+
+        grid = position_sizer.preview_position_size_grid(entries, stops, accounts)
+
+        assert grid.shape == (3, 4, 3, 2)
+        for (s, (symbol, entry)), (d, _), (c, category), (a, account) in itertools.product(
+            enumerate(entries.items()), enumerate(stops), enumerate(grid.risk_categories), enumerate(accounts)
+        ):
+            stop_loss = Decimal(int(grid.stop_losses[s, d])) / PositionSizer.PRICE_SCALE
+            if stop_loss == entry:
+                assert grid.position_sizes[s, d, c, a] == 0
+                continue
+            expected = position_sizer.calculate_position_size(account, category, entry, stop_loss)
+            assert grid.position_sizes[s, d, c, a] == expected.position_size, (symbol, stop_loss)
+            assert grid.dollar_risk_cents[c, a] == expected.dollar_risk * 100
+
+    def test_feasibility_flags(self, position_sizer: PositionSizer) -> None:
+        """Test portfolio limit and account value flags, and the flattened table."""
+        grid = position_sizer.preview_position_size_grid(
+            {"AAPL": Decimal("100.00")},
+            [Decimal("1"), Decimal("5")],
+            [Decimal("100000")],
+            risk_categories=["small", "large"],
+            committed_risk=Decimal("8000"),
+        )
+
+        # 8% committed: 1% fits the 10% limit, 3% does not
+        assert grid.within_portfolio_limit.tolist() == [[True], [False]]
+        assert grid.total_portfolio_risk.tolist() == [[9.0], [11.0]]
+        # A 1% stop with 1% risk buys the whole account, a 5% stop a fifth of it
+        assert grid.position_sizes[0, :, 0, 0].tolist() == [1000, 200]
+        assert grid.within_account_value[0, :, 0, 0].tolist() == [True, True]
+        assert not grid.within_account_value[0, 0, 1, 0]
+
+        columns = grid.to_columns(feasible_only=True)
+        assert columns["stop_percent"].tolist() == [1.0, 5.0]
+        assert columns["stop_loss"].tolist() == [99.0, 95.0]
+        assert set(columns["risk_category"]) == {"small"}
+
+        stream = io.StringIO()
+        assert grid.write_csv(stream) == 4
+        lines = stream.getvalue().splitlines()
+        assert lines[0] == ",".join(GRID_COLUMNS)
+        assert lines[1] == "AAPL,100.0,99.0,1.0,small,100000.0,1000.0,1000,100000.0,9.0,True,True,True"
+
+        stream = io.StringIO()
+        assert grid.write_json(stream, feasible_only=True) == 2
+        table = json.loads(stream.getvalue())
+        assert table["shape"] == {"symbols": 1, "stops": 2, "categories": 2, "account_values": 1}
+        assert table["rows"][1][GRID_COLUMNS.index("position_size")] == 200
+
+    @pytest.mark.parametrize(
+        "entries, stops, accounts, categories, message",
+        [
+            ({"AAPL": Decimal("180.12345")}, [Decimal("1")], [Decimal("1000")], None, "4 decimal places"),
+            ({"AAPL": Decimal("180")}, [Decimal("100")], [Decimal("1000")], None, "between 0 and 100"),
+            ({"AAPL": Decimal("180")}, [Decimal("1.005")], [Decimal("1000")], None, "steps of"),
+            ({"AAPL": Decimal("180")}, [Decimal("1")], [Decimal("0")], None, "Account value"),
+            ({"AAPL": Decimal("180")}, [Decimal("1")], [Decimal("1000")], ["huge"], "Invalid risk category"),
+            ({}, [Decimal("1")], [Decimal("1000")], None, "at least one"),
+        ],
+    )
+    def test_invalid_inputs(self, position_sizer, entries, stops, accounts, categories, message) -> None:
+        """Test invalid axis values are rejected."""
+        with pytest.raises(InvalidPositionSizeError, match=message):
+            position_sizer.preview_position_size_grid(entries, stops, accounts, categories)
+
+    def test_million_cell_throughput(self, position_sizer: PositionSizer) -> None:
+        """Benchmark a 1M-cell grid against scalar sizing of a sample of its cells."""
+        entries = {f"SYM{i:03d}": Decimal("20") + Decimal(i) / 8 for i in range(200)}
+        stops = [Decimal(i) / 20 for i in range(1, 101)]
+        accounts = [Decimal(10_000 + 5_000 * i) for i in range(17)]
+
+        start = time.perf_counter()
+        grid = position_sizer.preview_position_size_grid(entries, stops, accounts)
+        grid_seconds = time.perf_counter() - start
+
+        sample = 1000
+        start = time.perf_counter()
+        for index in range(sample):
+            position_sizer.calculate_position_size(
+                accounts[index % 17], "normal", Decimal("20.125"), Decimal("19.50")
+            )
+        scalar_seconds = (time.perf_counter() - start) / sample * grid.cell_count
+
+        print(
+            f"{grid.cell_count:,} cells - grid {grid_seconds:.3f}s, "
+            f"scalar (extrapolated) {scalar_seconds:.1f}s"
+        )
+        assert grid.cell_count == 1_020_000
+        assert grid_seconds < 2.0
+        assert grid_seconds * 10 < scalar_seconds
@@ -0,0 +1,145 @@
+"""Tests for the bounded file I/O executor."""
+
+import asyncio
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from auto_trader.io_executor import IOExecutor
+from auto_trader.integrations.ibkr_client.state_manager import OrderStateManager
+from auto_trader.trade_engine.execution_logger import ExecutionLogger
+from auto_trader.trade_engine.tests.test_execution_audit_store import make_entry
+
+
+@pytest.fixture
+def executor():
+    """Create an I/O executor with two workers."""
+    io_executor = IOExecutor(max_workers=2)
+    yield io_executor
+    io_executor.shutdown()
+
+
+class TestIOExecutor:
+    """Test offloading, bounds and per-call-site timings."""
+
+    async def test_run_returns_result_and_records_site(self, executor):
+        """Test results are returned and timings attributed to the call site."""
+        measurements = []
+        executor.add_blocking_hook(lambda *args: measurements.append(args))
+
+        result = await executor.run("test.add", lambda a, b: a + b, 2, b=3)
+
+        assert result == 5
+        metrics = executor.get_metrics()["test.add"]
+        assert metrics["calls"] == 1
+        assert metrics["failures"] == 0
+        assert measurements[0][0] == "test.add"
+
+    async def test_errors_propagate_and_count_as_failures(self, executor):
+        """Test exceptions from the I/O function reach the caller."""
+
+        def fail():
+            raise OSError("disk full")
+
+        with pytest.raises(OSError, match="disk full"):
+            await executor.run("test.fail", fail)
+
+        assert executor.get_metrics()["test.fail"]["failures"] == 1
+
+    async def test_concurrency_is_bounded(self, executor):
+        """Test no more than max_workers I/O calls run at once."""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_io():
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.03)
+            with lock:
+                active -= 1
+
+        await asyncio.gather(*(executor.run("test.slow", slow_io) for _ in range(6)))
+
+        assert peak == 2
+        assert executor.get_metrics()["test.slow"]["queue_wait_ms"] > 0
+
+    async def test_slow_io_does_not_block_loop(self, executor):
+        """Test the event loop keeps running while a slow write is in flight."""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await executor.run("test.fsync", time.sleep, 0.2)
+        task.cancel()
+
+        metrics = executor.get_metrics()["test.fsync"]
+        assert ticks >= 10
+        assert metrics["io_ms"] >= 190
+        assert metrics["max_loop_blocked_ms"] < 50
+
+    def test_blocking_attributes_on_loop_work(self, executor):
+        """Test work measured with blocking() is reported as loop time."""
+        with executor.blocking("test.serialize"):
+            time.sleep(0.02)
+
+        metrics = executor.get_metrics()["test.serialize"]
+        assert metrics["loop_blocked_ms"] >= 15
+        assert metrics["io_ms"] == 0
+
+
+class TestIOExecutorCallSites:
+    """Test persistence paths report through the executor."""
+
+    async def test_order_state_manager_paths(self, executor):
+        """Test state save, load, backup and cleanup run on the executor."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = OrderStateManager(
+                Path(temp_dir), max_backups=1, io_executor=executor
+            )
+            await manager.save_state({})
+            await manager.load_state()
+            await manager.create_backup("first")
+            await asyncio.sleep(1.1)  # backups are named by second
+            await manager.create_backup("second")
+            await manager.close()
+
+            assert len(list(manager.backup_dir.glob("order_state_*.json"))) == 1
+
+        sites = executor.get_metrics()
+        for site in (
+            "order_state.save_state",
+            "order_state.load_state",
+            "order_state.create_backup",
+            "order_state.cleanup_backups",
+            "order_journal.rotate",
+        ):
+            assert sites[site]["calls"] >= 1, site
+
+    async def test_execution_logger_writes_in_order(self, executor):
+        """Test log file writes go through the executor and keep their order."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            execution_logger = ExecutionLogger(log_dir=Path(temp_dir), io_executor=executor)
+            entries = [make_entry(duration_ms=float(i + 1)) for i in range(20)]
+
+            await asyncio.gather(
+                *(execution_logger.log_execution_decision(entry) for entry in entries)
+            )
+
+            lines = execution_logger.current_log_file.read_text().splitlines()
+
+        assert len(lines) == 20
+        assert [f'"duration_ms":{float(i + 1)}' in line for i, line in enumerate(lines)] == [
+            True
+        ] * 20
+        assert executor.get_metrics()["execution_logger.write_entry"]["calls"] == 20
@@ -76,9 +76,9 @@ class TestStory153BasicIntegration:
         mock_validation = MagicMock()
         mock_validation.passed = True
         mock_validation.position_size_result = MagicMock()
-        mock_validation.position_size_result.risk_amount_percent = Decimal("2.0")
+        mock_validation.position_size_result.portfolio_risk_percentage = Decimal("2.0")
         mock_validation.position_size_result.position_size = 100
-        mock_validation.position_size_result.risk_amount_dollars = Decimal("200.0")
+        mock_validation.position_size_result.dollar_risk = Decimal("200.0")
         
         mock_rm.validate_trade_plan.return_value = mock_validation
         mock_risk_manager.return_value = mock_rm
@@ -189,9 +189,9 @@ class TestStory153BasicIntegration:
         mock_validation = MagicMock()
         mock_validation.passed = True
         mock_validation.position_size_result = MagicMock()
-        mock_validation.position_size_result.risk_amount_percent = Decimal("2.0")
+        mock_validation.position_size_result.portfolio_risk_percentage = Decimal("2.0")
         mock_validation.position_size_result.position_size = 100
-        mock_validation.position_size_result.risk_amount_dollars = Decimal("200.0")
+        mock_validation.position_size_result.dollar_risk = Decimal("200.0")
         
         mock_rm.validate_trade_plan.return_value = mock_validation
         mock_risk_manager.return_value = mock_rm
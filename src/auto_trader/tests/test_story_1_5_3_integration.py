@@ -123,7 +123,7 @@ class TestListPlansEnhancedIntegration(TestStory153EndToEndIntegration):
             mock_result = MagicMock()
             mock_result.passed = True
             mock_pos_result = MagicMock()
-            mock_pos_result.risk_amount_percent = risk_map.get(plan.plan_id, Decimal("2.0"))
+            mock_pos_result.portfolio_risk_percentage = risk_map.get(plan.plan_id, Decimal("2.0"))
             mock_pos_result.position_size = 100
             mock_pos_result.dollar_risk = Decimal("200.00")
             mock_result.position_size_result = mock_pos_result
@@ -243,7 +243,7 @@ class TestListPlansEnhancedIntegration(TestStory153EndToEndIntegration):
         mock_rm.validate_trade_plan.return_value = MagicMock(
             passed=False,  # Would exceed limits
             position_size_result=MagicMock(
-                risk_amount_percent=Decimal("12.0"),  # Exceeds 10% limit
+                portfolio_risk_percentage=Decimal("12.0"),  # Exceeds 10% limit
                 position_size=0,
                 dollar_risk=Decimal("1200.00"),
             )
@@ -388,14 +388,14 @@ class TestUpdatePlanIntegration(TestStory153EndToEndIntegration):
             passed=True,
             position_size_result=MagicMock(
                 position_size=100,
-                risk_amount_dollars=Decimal("250.00"),
+                dollar_risk=Decimal("250.00"),
             )
         )
         updated_result = MagicMock(
             passed=True,
             position_size_result=MagicMock(
                 position_size=95,  # Different after update
-                risk_amount_dollars=Decimal("238.00"),  # Reduced risk
+                dollar_risk=Decimal("238.00"),  # Reduced risk
             )
         )
         
@@ -455,7 +455,7 @@ class TestUpdatePlanIntegration(TestStory153EndToEndIntegration):
         mock_rm = MagicMock()
         mock_rm.validate_trade_plan.return_value = MagicMock(
             passed=True,
-            position_size_result=MagicMock(position_size=50, risk_amount_dollars=Decimal("150.00"))
+            position_size_result=MagicMock(position_size=50, dollar_risk=Decimal("150.00"))
         )
         mock_risk_manager.return_value = mock_rm
         
@@ -578,7 +578,7 @@ class TestPlanStatsIntegration(TestStory153EndToEndIntegration):
         mock_rm.validate_trade_plan.return_value = MagicMock(
             passed=True,
             position_size_result=MagicMock(
-                risk_amount_percent=Decimal("2.0"),
+                portfolio_risk_percentage=Decimal("2.0"),
                 position_size=100,
                 dollar_risk=Decimal("200.00"),
             )
@@ -661,8 +661,8 @@ class TestCrossCommandIntegration(TestStory153EndToEndIntegration):
             passed=True,
             position_size_result=MagicMock(
                 position_size=100,
-                risk_amount_dollars=Decimal("200.00"),
-                risk_amount_percent=Decimal("2.0"),
+                dollar_risk=Decimal("200.00"),
+                portfolio_risk_percentage=Decimal("2.0"),
             )
         )
         mock_risk_manager.return_value = mock_rm
@@ -847,7 +847,7 @@ class TestUXComplianceIntegration(TestStory153EndToEndIntegration):
         mock_rm.validate_trade_plan.return_value = MagicMock(
             passed=True,
             position_size_result=MagicMock(
-                risk_amount_percent=Decimal("2.0"),
+                portfolio_risk_percentage=Decimal("2.0"),
                 position_size=100,
                 dollar_risk=Decimal("200.00"),
             )
@@ -923,7 +923,7 @@ class TestUXComplianceIntegration(TestStory153EndToEndIntegration):
                     mock_rm.validate_trade_plan.return_value = MagicMock(
                         passed=True,
                         position_size_result=MagicMock(
-                            risk_amount_percent=Decimal("2.0"),
+                            portfolio_risk_percentage=Decimal("2.0"),
                             position_size=100,
                             dollar_risk=Decimal("200.00"),
                         )
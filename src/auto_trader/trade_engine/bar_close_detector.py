@@ -10,11 +10,15 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.date import DateTrigger
 from loguru import logger
 
+from auto_trader.logging_config import HotPathLogger
 from auto_trader.models.execution import BarCloseEvent
 from auto_trader.models.enums import Timeframe
 from auto_trader.models.market_data import BarData
 
 
+_schedule_log = HotPathLogger("DEBUG")
+
+
 class BarCloseDetector:
     """Detect bar closes with <1 second accuracy.
 
@@ -189,8 +193,11 @@ class BarCloseDetector:
 
         self.scheduled_jobs[(symbol, timeframe)] = job.id
 
-        logger.debug(
-            f"Scheduled {symbol} {timeframe.value} bar close check at {schedule_time}"
+        _schedule_log.log(
+            "Scheduled {symbol} {timeframe} bar close check at {schedule_time}",
+            symbol=symbol,
+            timeframe=timeframe.value,
+            schedule_time=schedule_time,
         )
 
     async def _check_bar_close(
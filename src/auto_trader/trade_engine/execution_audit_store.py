@@ -0,0 +1,525 @@
+"""SQLite-backed audit store for execution log entries."""
+
+import asyncio
+import math
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from auto_trader.io_executor import IOExecutor, get_io_executor
+from auto_trader.models.execution import ExecutionLogEntry
+from auto_trader.models.enums import ExecutionAction, Timeframe
+
+
+DEFAULT_AUDIT_DB_PATH = Path("logs/execution/audit.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluations (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    function_name TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    timeframe TEXT NOT NULL,
+    action TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    duration_ms REAL NOT NULL,
+    error TEXT,
+    entry_json TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_evaluations_symbol_time
+    ON evaluations (symbol, timestamp);
+CREATE INDEX IF NOT EXISTS idx_evaluations_function_time
+    ON evaluations (function_name, timestamp);
+"""
+
+_INSERT_SQL = """
+INSERT INTO evaluations (
+    timestamp, function_name, symbol, timeframe, action,
+    confidence, duration_ms, error, entry_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+SECONDS_PER_DAY = 86400
+
+# Per-function daily rollups, maintained on every batch write so statistics
+# over long periods read one row per function per day
+_ROLLUP_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluation_rollups (
+    function_name TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    evaluations INTEGER NOT NULL,
+    signals INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    total_duration_ms REAL NOT NULL,
+    max_duration_ms REAL NOT NULL,
+    min_duration_ms REAL NOT NULL,
+    PRIMARY KEY (function_name, day)
+);
+"""
+
+_ROLLUP_UPSERT_SQL = """
+INSERT INTO evaluation_rollups (
+    function_name, day, evaluations, signals, errors,
+    total_duration_ms, max_duration_ms, min_duration_ms
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (function_name, day) DO UPDATE SET
+    evaluations = evaluations + excluded.evaluations,
+    signals = signals + excluded.signals,
+    errors = errors + excluded.errors,
+    total_duration_ms = total_duration_ms + excluded.total_duration_ms,
+    max_duration_ms = MAX(max_duration_ms, excluded.max_duration_ms),
+    min_duration_ms = MIN(min_duration_ms, excluded.min_duration_ms)
+"""
+
+# Aggregates over raw rows (partial days) and rollups (whole days); both
+# return (function, evaluations, signals, errors, total, max, min)
+_RAW_STATS_SQL = """
+SELECT
+    function_name,
+    COUNT(*),
+    SUM(action != 'NONE' AND error IS NULL),
+    SUM(error IS NOT NULL),
+    SUM(duration_ms),
+    MAX(duration_ms),
+    MIN(duration_ms)
+FROM evaluations
+WHERE {function_filter} timestamp >= ? AND timestamp < ?
+GROUP BY function_name
+"""
+
+_ROLLUP_STATS_SQL = """
+SELECT
+    function_name,
+    SUM(evaluations),
+    SUM(signals),
+    SUM(errors),
+    SUM(total_duration_ms),
+    MAX(max_duration_ms),
+    MIN(min_duration_ms)
+FROM evaluation_rollups
+WHERE {function_filter} day >= ? AND day < ?
+GROUP BY function_name
+"""
+
+_STATS_QUERIES = {
+    (table_sql, single): table_sql.format(
+        function_filter="function_name = ? AND" if single else ""
+    )
+    for table_sql in (_RAW_STATS_SQL, _ROLLUP_STATS_SQL)
+    for single in (False, True)
+}
+
+_ACTION_COUNTS_SQL = """
+SELECT action, COUNT(*)
+FROM evaluations
+WHERE timestamp >= ? AND timestamp <= ?
+GROUP BY action
+"""
+
+AuditRow = Tuple[
+    float, str, str, str, str, float, float, Optional[str], Optional[str]
+]
+
+
+class ExecutionAuditStore:
+    """Optional SQLite (WAL mode) sink for execution log entries.
+
+    Entries are buffered and written in batches by a background writer task,
+    so logging never waits on disk. History queries use indexes on
+    (symbol, timestamp) and (function_name, timestamp); function statistics
+    read per-day rollups maintained by the writer, so both stay fast over
+    millions of evaluations.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = DEFAULT_AUDIT_DB_PATH,
+        batch_size: int = 500,
+        flush_interval_seconds: float = 1.0,
+        read_only: bool = False,
+        io_executor: Optional[IOExecutor] = None,
+    ):
+        """Initialize audit store.
+
+        Args:
+            db_path: SQLite database file
+            batch_size: Pending rows that trigger an immediate batch write
+            flush_interval_seconds: Maximum time rows wait before being written
+            read_only: Open an existing database for queries only, without
+                creating tables or changing its journal mode
+            io_executor: Executor for batch writes (defaults to the shared one)
+        """
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if flush_interval_seconds <= 0:
+            raise ValueError(
+                f"flush_interval_seconds must be positive, got {flush_interval_seconds}"
+            )
+
+        self.db_path = Path(db_path)
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.read_only = read_only
+        self._io = io_executor or get_io_executor()
+
+        self._pending: List[AuditRow] = []
+        # Queries flush from I/O threads while the loop keeps adding rows
+        self._pending_lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._writer_task: Optional[asyncio.Task] = None
+        self._wake_writer: Optional[asyncio.Event] = None
+        self.rows_written = 0
+        self.batches_written = 0
+
+        if read_only:
+            self._conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+        else:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.executescript(_ROLLUP_SCHEMA)
+            self._conn.commit()
+
+        mode = "read-only" if read_only else "read-write"
+        logger.info(f"ExecutionAuditStore opened {mode} at {self.db_path}")
+
+    @property
+    def pending_count(self) -> int:
+        """Number of rows buffered but not yet written."""
+        return len(self._pending)
+
+    def add(self, entry: ExecutionLogEntry) -> None:
+        """Queue a full log entry for writing.
+
+        Args:
+            entry: Execution log entry
+        """
+        self._enqueue(
+            (
+                entry.timestamp.timestamp(),
+                entry.function_name,
+                entry.symbol,
+                entry.timeframe.value,
+                entry.signal.action.value,
+                entry.signal.confidence,
+                entry.duration_ms,
+                entry.error,
+                entry.model_dump_json(),
+            )
+        )
+
+    def add_compact(
+        self,
+        timestamp: float,
+        function_name: str,
+        symbol: str,
+        timeframe: Timeframe,
+        duration_ms: float,
+    ) -> None:
+        """Queue a compact no-action evaluation (no entry payload).
+
+        Args:
+            timestamp: Unix epoch seconds
+            function_name: Execution function name
+            symbol: Trading symbol
+            timeframe: Evaluation timeframe
+            duration_ms: Evaluation duration in milliseconds
+        """
+        self._enqueue(
+            (
+                timestamp,
+                function_name,
+                symbol,
+                timeframe.value,
+                ExecutionAction.NONE.value,
+                0.0,
+                duration_ms,
+                None,
+                None,
+            )
+        )
+
+    def _enqueue(self, row: AuditRow) -> None:
+        """Buffer a row and make sure the writer will pick it up."""
+        if self.read_only:
+            raise ValueError(f"Audit store {self.db_path} is open read-only")
+        with self._pending_lock:
+            self._pending.append(row)
+        self._ensure_writer()
+        if len(self._pending) >= self.batch_size and self._wake_writer:
+            self._wake_writer.set()
+
+    def _ensure_writer(self) -> None:
+        """Start the background writer task when an event loop is running."""
+        if self._writer_task and not self._writer_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No loop: rows are written on flush()
+        self._wake_writer = asyncio.Event()
+        self._writer_task = loop.create_task(self._writer_loop())
+
+    async def _writer_loop(self) -> None:
+        """Write pending rows in batches until cancelled."""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._wake_writer.wait(), timeout=self.flush_interval_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wake_writer.clear()
+
+            rows = self._take_pending()
+            if rows:
+                try:
+                    await self._io.run("execution_audit.write_batch", self._write_batch, rows)
+                except sqlite3.Error as e:
+                    # Keep the rows for the next attempt instead of losing them
+                    self._requeue(rows)
+                    logger.error(
+                        f"Failed to write execution audit batch of {len(rows)} rows, "
+                        f"retrying in {self.flush_interval_seconds}s: {e}"
+                    )
+                    await asyncio.sleep(self.flush_interval_seconds)
+
+    def _take_pending(self) -> List[AuditRow]:
+        """Swap out the pending buffer."""
+        with self._pending_lock:
+            rows, self._pending = self._pending, []
+        return rows
+
+    def _requeue(self, rows: List[AuditRow]) -> None:
+        """Put rows from a failed write back ahead of newer pending rows."""
+        with self._pending_lock:
+            self._pending[:0] = rows
+
+    def _write_batch(self, rows: List[AuditRow]) -> None:
+        """Insert a batch of rows in one transaction."""
+        rollups = self._rollup_rows(rows)
+        with self._db_lock:
+            with self._conn:
+                self._conn.executemany(_INSERT_SQL, rows)
+                self._conn.executemany(_ROLLUP_UPSERT_SQL, rollups)
+        self.rows_written += len(rows)
+        self.batches_written += 1
+
+    @staticmethod
+    def _rollup_rows(rows: List[AuditRow]) -> List[Tuple]:
+        """Aggregate a batch into per-function daily rollup rows."""
+        rollups: Dict[Tuple[str, int], List] = {}
+        for timestamp, function_name, _, _, action, _, duration_ms, error, _ in rows:
+            key = (function_name, int(timestamp // SECONDS_PER_DAY))
+            rollup = rollups.get(key)
+            if rollup is None:
+                rollup = rollups[key] = [0, 0, 0, 0.0, duration_ms, duration_ms]
+            rollup[0] += 1
+            if error is not None:
+                rollup[2] += 1
+            elif action != ExecutionAction.NONE.value:
+                rollup[1] += 1
+            rollup[3] += duration_ms
+            rollup[4] = max(rollup[4], duration_ms)
+            rollup[5] = min(rollup[5], duration_ms)
+        return [(name, day, *values) for (name, day), values in rollups.items()]
+
+    def flush(self) -> None:
+        """Synchronously write all pending rows.
+
+        Raises:
+            sqlite3.Error: If the write fails; the rows stay pending
+        """
+        rows = self._take_pending()
+        if rows:
+            try:
+                self._write_batch(rows)
+            except sqlite3.Error:
+                self._requeue(rows)
+                raise
+
+    async def aclose(self) -> None:
+        """Stop the writer task, then write pending rows and close the database."""
+        if self._writer_task and not self._writer_task.done():
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+        self._writer_task = None
+        self.close()
+
+    def close(self) -> None:
+        """Write pending rows and close the database."""
+        if self._writer_task and not self._writer_task.done():
+            self._writer_task.cancel()
+        self._writer_task = None
+
+        try:
+            self.flush()
+        finally:
+            with self._db_lock:
+                self._conn.close()
+        logger.info(f"ExecutionAuditStore closed ({self.rows_written} rows written)")
+
+    def query_entries(
+        self,
+        symbol: Optional[str] = None,
+        function_name: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        actions_only: bool = False,
+        limit: int = 100,
+    ) -> List[ExecutionLogEntry]:
+        """Query stored log entries, most recent last.
+
+        Compact no-action records carry no entry payload and are not returned.
+
+        Args:
+            symbol: Optional symbol filter
+            function_name: Optional function filter
+            since: Optional inclusive start time
+            until: Optional inclusive end time
+            actions_only: Only return actionable signals and errors
+            limit: Maximum entries to return
+
+        Returns:
+            Matching log entries in chronological order
+        """
+        self.flush()  # Read-your-writes for rows still buffered
+        clauses = ["entry_json IS NOT NULL", "timestamp >= ?", "timestamp <= ?"]
+        params: List[Any] = list(self._time_bounds(since, until))
+
+        if symbol:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        if function_name:
+            clauses.append("function_name = ?")
+            params.append(function_name)
+        if actions_only:
+            clauses.append("(action != 'NONE' OR error IS NOT NULL)")
+
+        sql = (
+            "SELECT entry_json FROM evaluations WHERE "
+            + " AND ".join(clauses)
+            + " ORDER BY timestamp DESC LIMIT ?"
+        )
+        params.append(limit)
+
+        with self._db_lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        return [ExecutionLogEntry.model_validate_json(row[0]) for row in reversed(rows)]
+
+    def function_statistics(
+        self,
+        function_name: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Aggregate statistics per execution function.
+
+        Args:
+            function_name: Optional single function to aggregate
+            since: Optional inclusive start time
+            until: Optional inclusive end time
+
+        Returns:
+            Mapping of function name to statistics, in the same shape as
+            ExecutionMetricsCalculator.get_function_statistics
+        """
+        self.flush()  # Read-your-writes for rows still buffered
+        start, end = self._time_bounds(since, until)
+        end = math.nextafter(end, math.inf)  # Inclusive end for half-open queries
+
+        # Whole days come from rollups; only the partial days at either end
+        # of the range are aggregated from raw rows
+        first_day = math.ceil(start / SECONDS_PER_DAY)
+        last_day = (
+            math.floor(end / SECONDS_PER_DAY) if math.isfinite(end) else 2**62
+        )
+        if first_day < last_day:
+            segments = [
+                (_RAW_STATS_SQL, start, first_day * SECONDS_PER_DAY),
+                (_ROLLUP_STATS_SQL, first_day, last_day),
+            ]
+            if math.isfinite(end):
+                segments.append((_RAW_STATS_SQL, last_day * SECONDS_PER_DAY, end))
+        else:
+            segments = [(_RAW_STATS_SQL, start, end)]
+
+        totals: Dict[str, List] = {}
+        with self._db_lock:
+            for table_sql, lower, upper in segments:
+                sql = _STATS_QUERIES[(table_sql, function_name is not None)]
+                params = (function_name, lower, upper) if function_name else (lower, upper)
+                for name, *values in self._conn.execute(sql, params):
+                    self._merge_totals(totals, name, values)
+
+        stats = {}
+        for name in sorted(totals):
+            evaluations, signals, errors, total_ms, max_ms, min_ms = totals[name]
+            stats[name] = {
+                "function": name,
+                "evaluations": evaluations,
+                "signals": signals,
+                "signal_rate": signals / evaluations,
+                "errors": errors,
+                "error_rate": errors / evaluations,
+                "avg_duration_ms": total_ms / evaluations,
+                "max_duration_ms": max_ms,
+                "min_duration_ms": min_ms,
+            }
+        return stats
+
+    @staticmethod
+    def _merge_totals(totals: Dict[str, List], name: str, values: List) -> None:
+        """Combine aggregate values for one function from another segment."""
+        current = totals.get(name)
+        if current is None:
+            totals[name] = list(values)
+            return
+        for i in range(4):
+            current[i] += values[i]
+        current[4] = max(current[4], values[4])
+        current[5] = min(current[5], values[5])
+
+    def action_counts(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """Count evaluations per signal action.
+
+        Args:
+            since: Optional inclusive start time
+            until: Optional inclusive end time
+
+        Returns:
+            Mapping of action value to evaluation count
+        """
+        self.flush()  # Read-your-writes for rows still buffered
+        with self._db_lock:
+            rows = self._conn.execute(
+                _ACTION_COUNTS_SQL, self._time_bounds(since, until)
+            ).fetchall()
+        return dict(rows)
+
+    @staticmethod
+    def _time_bounds(
+        since: Optional[datetime], until: Optional[datetime]
+    ) -> Tuple[float, float]:
+        """Convert optional datetimes to epoch bounds."""
+        start = since.timestamp() if since else 0.0
+        end = until.timestamp() if until else float("inf")
+        return start, end
@@ -1,7 +1,7 @@
 """Execution function framework base classes and utilities."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Set, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 from decimal import Decimal
 
 from loguru import logger
@@ -22,8 +22,16 @@ class ExecutionFunctionBase(ABC):
 
     Execution functions evaluate market conditions and generate trading signals
     based on their specific logic and parameters.
+
+    Instances are shared by all configs with the same type, timeframe and
+    parameters. Functions that keep runtime state between evaluations list
+    the attributes holding it in ``state_fields`` so the registry can keep
+    a copy per owning config.
     """
 
+    # Instance attributes holding per-owner runtime state
+    state_fields: Tuple[str, ...] = ()
+
     def __init__(self, config: ExecutionFunctionConfig):
         """Initialize execution function with configuration.
 
@@ -128,6 +136,23 @@ class ExecutionFunctionBase(ABC):
             return False
         return True
 
+    def get_state(self) -> Dict[str, Any]:
+        """Get JSON-serializable runtime state to carry across restarts.
+
+        Stateless functions return an empty dict.
+
+        Returns:
+            Function state
+        """
+        return {}
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Restore runtime state saved by get_state.
+
+        Args:
+            state: Previously saved function state
+        """
+
     def calculate_confidence_from_volume(
         self, current_volume: int, avg_volume: float, base_confidence: float = 0.5
     ) -> float:
@@ -1,22 +1,64 @@
 """Execution decision logging system for comprehensive audit trail."""
 
 import asyncio
+import time
 from datetime import datetime, timedelta, UTC
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 from pathlib import Path
 from collections import deque
 
 from loguru import logger
 
+from auto_trader.io_executor import IOExecutor, get_io_executor
 from auto_trader.models.execution import (
     ExecutionContext,
     ExecutionSignal,
     ExecutionLogEntry,
 )
-from auto_trader.models.enums import ExecutionAction, Timeframe
+from auto_trader.models.enums import ExecutionAction, ExecutionLogTier, Timeframe
 from auto_trader.trade_engine.logger_validation import LoggerValidationMixin
 from auto_trader.trade_engine.execution_metrics import ExecutionMetricsCalculator
 from auto_trader.trade_engine.log_file_manager import LogFileManager
+from auto_trader.trade_engine.execution_audit_store import ExecutionAuditStore
+
+
+# Stable integer codes for compact records
+_TIMEFRAME_CODES = {timeframe: code for code, timeframe in enumerate(Timeframe)}
+_TIMEFRAMES_BY_CODE = list(Timeframe)
+
+
+class CompactEvaluationRecord(NamedTuple):
+    """Fixed-size record of a no-action evaluation.
+
+    Function names and symbols are interned to integer ids by the owning
+    ExecutionLogger; use ExecutionLogger.describe_compact_record to decode.
+    """
+
+    timestamp: float  # Unix epoch seconds
+    function_id: int
+    symbol_id: int
+    timeframe_code: int
+    duration_ms: float
+
+
+class _NoActionCounter:
+    """Running aggregate for no-action evaluations of one function/symbol/timeframe."""
+
+    __slots__ = ("count", "total_duration_ms", "max_duration_ms", "min_duration_ms")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_duration_ms = 0.0
+        self.max_duration_ms = 0.0
+        self.min_duration_ms = float("inf")
+
+    def add(self, duration_ms: float) -> None:
+        self.count += 1
+        self.total_duration_ms += duration_ms
+        if duration_ms > self.max_duration_ms:
+            self.max_duration_ms = duration_ms
+        if duration_ms < self.min_duration_ms:
+            self.min_duration_ms = duration_ms
 
 
 class ExecutionLogger(LoggerValidationMixin):
@@ -34,6 +76,11 @@ class ExecutionLogger(LoggerValidationMixin):
         enable_file_logging: bool = True,
         max_entries_per_file: int = 1000,
         max_log_files: int = 10,
+        log_tier: ExecutionLogTier = ExecutionLogTier.FULL,
+        snapshot_sample_rate: int = 0,
+        max_snapshot_params: int = 50,
+        audit_store: Optional[ExecutionAuditStore] = None,
+        io_executor: Optional[IOExecutor] = None,
     ):
         """Initialize execution logger.
 
@@ -44,12 +91,24 @@ class ExecutionLogger(LoggerValidationMixin):
             enable_file_logging: Whether to write logs to files
             max_entries_per_file: Maximum entries per log file before rotation
             max_log_files: Maximum number of log files to keep
+            log_tier: FULL logs every evaluation as a full entry; COMPACT records
+                no-action evaluations as compact records aggregated into counters
+            snapshot_sample_rate: In COMPACT tier, fully log every Nth no-action
+                evaluation (0 disables sampling)
+            max_snapshot_params: Maximum trade plan params kept in a context snapshot
+            audit_store: Optional SQLite store receiving every evaluation; when set,
+                audit trail and statistics queries are answered from it
+            io_executor: Executor for log file writes (defaults to the shared one)
         """
         # Validate parameters using mixin
         self._validate_init_parameters(
             log_dir, log_directory, max_memory_entries, enable_file_logging,
             max_entries_per_file, max_log_files
         )
+        if not self.validate_tier_settings(
+            log_tier, snapshot_sample_rate, max_snapshot_params
+        ):
+            raise ValueError("Invalid logging tier settings")
 
         # Support both parameter names for backward compatibility
         self.log_dir = Path(log_directory or log_dir or "logs/execution")
@@ -62,10 +121,26 @@ class ExecutionLogger(LoggerValidationMixin):
         self.lock = asyncio.Lock()  # Use asyncio.Lock for async-safe synchronization
         self.current_entries = 0  # Track count for test compatibility
 
+        # Tiered logging: no-action evaluations kept as compact records
+        self.log_tier = ExecutionLogTier(log_tier)
+        self.snapshot_sample_rate = snapshot_sample_rate
+        self.max_snapshot_params = max_snapshot_params
+        self.compact_records: deque = deque(maxlen=max_memory_entries)
+        self._no_action_counters: Dict[Tuple[str, str, Timeframe], _NoActionCounter] = {}
+        self._no_action_seen = 0
+        self._function_ids: Dict[str, int] = {}
+        self._symbol_ids: Dict[str, int] = {}
+        self._function_names: List[str] = []
+        self._symbols: List[str] = []
+
         # Initialize component classes
         self.metrics_calculator = ExecutionMetricsCalculator()
+        self.audit_store = audit_store
         
-        # Initialize file manager if file logging enabled
+        # Initialize file manager if file logging enabled; writes run on the
+        # I/O executor, serialized so entries keep their order
+        self._io = io_executor or get_io_executor()
+        self._file_lock = asyncio.Lock()
         self.file_manager = None
         if self.enable_file_logging:
             if self.ensure_log_directory_exists(self.log_dir):
@@ -78,7 +153,8 @@ class ExecutionLogger(LoggerValidationMixin):
                 self.enable_file_logging = False
 
         logger.info(
-            f"ExecutionLogger initialized (memory capacity: {max_memory_entries})"
+            f"ExecutionLogger initialized (memory capacity: {max_memory_entries}, "
+            f"tier: {self.log_tier.value})"
         )
 
     @property
@@ -168,6 +244,17 @@ class ExecutionLogger(LoggerValidationMixin):
             duration_ms: Evaluation duration in milliseconds
             error: Error message if evaluation failed
         """
+        if (
+            error is None
+            and signal.action == ExecutionAction.NONE
+            and self.log_tier == ExecutionLogTier.COMPACT
+            and not self._should_sample_no_action()
+        ):
+            await self._record_compact(
+                function_name, context.symbol, context.timeframe, duration_ms
+            )
+            return
+
         # Create context snapshot (subset of data to avoid huge logs)
         context_snapshot = self._create_context_snapshot(context)
 
@@ -192,11 +279,109 @@ class ExecutionLogger(LoggerValidationMixin):
 
         # Write to file if enabled
         if self.enable_file_logging and self.file_manager:
-            self.file_manager.write_entry(entry)
+            await self._write_to_file(entry)
+
+        if self.audit_store:
+            self.audit_store.add(entry)
 
         # Log to standard logger based on importance
         self._log_to_standard(entry)
 
+    def _should_sample_no_action(self) -> bool:
+        """Check whether this no-action evaluation is sampled for full logging."""
+        self._no_action_seen += 1
+        return (
+            self.snapshot_sample_rate > 0
+            and self._no_action_seen % self.snapshot_sample_rate == 0
+        )
+
+    async def _record_compact(
+        self,
+        function_name: str,
+        symbol: str,
+        timeframe: Timeframe,
+        duration_ms: float,
+    ) -> None:
+        """Record a no-action evaluation without building a log entry.
+
+        Args:
+            function_name: Name of execution function
+            symbol: Trading symbol
+            timeframe: Evaluation timeframe
+            duration_ms: Evaluation duration in milliseconds
+        """
+        timestamp = time.time()
+        record = CompactEvaluationRecord(
+            timestamp,
+            self._intern(function_name, self._function_ids, self._function_names),
+            self._intern(symbol, self._symbol_ids, self._symbols),
+            _TIMEFRAME_CODES[timeframe],
+            duration_ms,
+        )
+
+        async with self.lock:
+            self.compact_records.append(record)
+            counter_key = (function_name, symbol, timeframe)
+            counter = self._no_action_counters.get(counter_key)
+            if counter is None:
+                counter = self._no_action_counters[counter_key] = _NoActionCounter()
+            counter.add(duration_ms)
+            await self.metrics_calculator.record(duration_ms)
+
+        if self.audit_store:
+            self.audit_store.add_compact(
+                timestamp, function_name, symbol, timeframe, duration_ms
+            )
+
+    @staticmethod
+    def _intern(value: str, ids: Dict[str, int], values: List[str]) -> int:
+        """Map a string to a stable integer id."""
+        value_id = ids.get(value)
+        if value_id is None:
+            value_id = ids[value] = len(values)
+            values.append(value)
+        return value_id
+
+    def describe_compact_record(self, record: CompactEvaluationRecord) -> Dict[str, Any]:
+        """Decode a compact record into readable fields.
+
+        Args:
+            record: Compact record from this logger
+
+        Returns:
+            Dictionary with timestamp, function name, symbol, timeframe and duration
+        """
+        return {
+            "timestamp": datetime.fromtimestamp(record.timestamp, UTC),
+            "function_name": self._function_names[record.function_id],
+            "symbol": self._symbols[record.symbol_id],
+            "timeframe": _TIMEFRAMES_BY_CODE[record.timeframe_code],
+            "action": ExecutionAction.NONE,
+            "duration_ms": record.duration_ms,
+        }
+
+    async def get_no_action_counters(self) -> List[Dict[str, Any]]:
+        """Get aggregated counters for compactly recorded no-action evaluations.
+
+        Returns:
+            One dictionary per function/symbol/timeframe combination
+        """
+        async with self.lock:
+            items = list(self._no_action_counters.items())
+
+        return [
+            {
+                "function_name": function_name,
+                "symbol": symbol,
+                "timeframe": timeframe,
+                "count": counter.count,
+                "avg_duration_ms": counter.total_duration_ms / counter.count,
+                "max_duration_ms": counter.max_duration_ms,
+                "min_duration_ms": counter.min_duration_ms,
+            }
+            for (function_name, symbol, timeframe), counter in items
+        ]
+
     async def log_error(
         self,
         function_name: str,
@@ -234,7 +419,10 @@ class ExecutionLogger(LoggerValidationMixin):
             await self.metrics_calculator.update(entry)
 
         if self.enable_file_logging and self.file_manager:
-            self.file_manager.write_entry(entry)
+            await self._write_to_file(entry)
+
+        if self.audit_store:
+            self.audit_store.add(entry)
 
         logger.error(f"Execution error in {function_name}: {error_msg}")
 
@@ -347,8 +535,43 @@ class ExecutionLogger(LoggerValidationMixin):
         Returns:
             Dictionary of function statistics
         """
+        if self.audit_store:
+            stats = await self._io.run(
+                "execution_logger.function_statistics",
+                self.audit_store.function_statistics,
+                function_name,
+            )
+            return stats.get(
+                function_name,
+                self.metrics_calculator.get_function_statistics(function_name, []),
+            )
+
         entries = await self.query_logs({"function_name": function_name}, limit=10000)
-        return self.metrics_calculator.get_function_statistics(function_name, entries)
+        stats = self.metrics_calculator.get_function_statistics(function_name, entries)
+
+        async with self.lock:
+            count, total, max_ms, min_ms = self._aggregate_no_action(function_name)
+        return self.metrics_calculator.merge_compact_statistics(
+            stats, count, total, max_ms, min_ms
+        )
+
+    def _aggregate_no_action(self, function_name: str) -> Tuple[int, float, float, float]:
+        """Sum no-action counters for a function across symbols and timeframes.
+
+        Call with self.lock held; counters are updated under it.
+        """
+        count = 0
+        total = 0.0
+        max_ms = 0.0
+        min_ms = float("inf")
+        for (name, _, _), counter in self._no_action_counters.items():
+            if name != function_name:
+                continue
+            count += counter.count
+            total += counter.total_duration_ms
+            max_ms = max(max_ms, counter.max_duration_ms)
+            min_ms = min(min_ms, counter.min_duration_ms)
+        return count, total, max_ms, min_ms
 
     async def clear_old_entries(self, days: int = 7) -> int:
         """Clear entries older than specified days.
@@ -369,6 +592,14 @@ class ExecutionLogger(LoggerValidationMixin):
             )
             removed = original_count - len(self.entries)
 
+            cutoff_epoch = cutoff.timestamp()
+            original_compact = len(self.compact_records)
+            self.compact_records = deque(
+                (r for r in self.compact_records if r.timestamp >= cutoff_epoch),
+                maxlen=self.max_memory_entries,
+            )
+            removed += original_compact - len(self.compact_records)
+
         if removed > 0:
             logger.info(
                 f"Cleared {removed} execution log entries older than {days} days"
@@ -390,7 +621,10 @@ class ExecutionLogger(LoggerValidationMixin):
 
         # Write to file if enabled
         if self.enable_file_logging and self.file_manager:
-            self.file_manager.write_entry(entry)
+            await self._write_to_file(entry)
+
+        if self.audit_store:
+            self.audit_store.add(entry)
 
         # Log to standard logger based on importance
         self._log_to_standard(entry)
@@ -404,20 +638,63 @@ class ExecutionLogger(LoggerValidationMixin):
         if function_name:
             return await self.get_function_stats(function_name)
         
+        if self.audit_store:
+            return await self._io.run(
+                "execution_logger.function_statistics",
+                self.audit_store.function_statistics,
+            )
+
         # Get stats for all functions
         async with self.lock:
             entries_list = list(self.entries)
+            no_action = {
+                name: self._aggregate_no_action(name)
+                for name in {key[0] for key in self._no_action_counters}
+            }
         
-        return self.metrics_calculator.get_all_function_statistics(entries_list)
+        stats = self.metrics_calculator.get_all_function_statistics(entries_list)
+        for function_name, (count, total, max_ms, min_ms) in no_action.items():
+            if function_name not in stats:
+                stats[function_name] = self.metrics_calculator.get_function_statistics(
+                    function_name, []
+                )
+            stats[function_name] = self.metrics_calculator.merge_compact_statistics(
+                stats[function_name], count, total, max_ms, min_ms
+            )
+        return stats
 
     async def get_audit_trail(self, symbol: Optional[str] = None) -> List[ExecutionLogEntry]:
         """Get audit trail for symbol or all symbols."""
+        if self.audit_store:
+            return await self._io.run(
+                "execution_logger.audit_trail",
+                self.audit_store.query_entries,
+                symbol=symbol,
+                limit=10000,
+            )
+
         filters = {}
         if symbol:
             filters["symbol"] = symbol
         
         return await self.query_logs(filters, limit=10000)
 
+    async def _write_to_file(self, entry: ExecutionLogEntry) -> None:
+        """Append an entry to the current log file off the event loop.
+
+        Args:
+            entry: Log entry to write
+        """
+        async with self._file_lock:
+            await self._io.run(
+                "execution_logger.write_entry", self.file_manager.write_entry, entry
+            )
+
+    async def close(self) -> None:
+        """Flush and close the audit store if one is attached."""
+        if self.audit_store:
+            await self.audit_store.aclose()
+
     def _create_context_snapshot(
         self, context: Optional[ExecutionContext]
     ) -> Dict[str, Any]:
@@ -447,6 +724,16 @@ class ExecutionLogger(LoggerValidationMixin):
             "trade_plan_params": context.trade_plan_params,
         }
 
+        # Bound snapshot size when plans carry large parameter sets
+        params = context.trade_plan_params
+        if params and len(params) > self.max_snapshot_params:
+            snapshot["trade_plan_params"] = dict(
+                list(params.items())[: self.max_snapshot_params]
+            )
+            snapshot["trade_plan_params_truncated"] = (
+                len(params) - self.max_snapshot_params
+            )
+
         if context.position_state:
             snapshot["position"] = {
                 "quantity": context.position_state.quantity,
@@ -33,19 +33,40 @@ class ExecutionMetricsCalculator:
         Args:
             entry: Log entry to process
         """
+        await self.record(
+            entry.duration_ms,
+            has_error=bool(entry.error),
+            action_triggered=entry.signal.action != ExecutionAction.NONE,
+        )
+
+    async def record(
+        self,
+        duration_ms: float,
+        has_error: bool = False,
+        action_triggered: bool = False,
+    ) -> None:
+        """Update metrics from raw evaluation fields.
+
+        Used directly for compact records that never build a log entry.
+
+        Args:
+            duration_ms: Evaluation duration in milliseconds
+            has_error: Whether the evaluation failed
+            action_triggered: Whether the evaluation produced an action
+        """
         async with self.lock:
             self.metrics["total_evaluations"] += 1
 
-            if entry.error:
+            if has_error:
                 self.metrics["failed_evaluations"] += 1
             else:
                 self.metrics["successful_evaluations"] += 1
 
-                if entry.signal.action != ExecutionAction.NONE:
+                if action_triggered:
                     self.metrics["actions_triggered"] += 1
 
-            if entry.duration_ms > 0:
-                self._update_duration_metrics(entry.duration_ms)
+            if duration_ms > 0:
+                self._update_duration_metrics(duration_ms)
 
     async def get_summary(self) -> Dict[str, Any]:
         """Get summary of all metrics.
@@ -99,6 +120,46 @@ class ExecutionMetricsCalculator:
             "min_duration_ms": min(durations) if durations else 0,
         }
 
+    @staticmethod
+    def merge_compact_statistics(
+        stats: Dict[str, Any],
+        count: int,
+        total_duration_ms: float,
+        max_duration_ms: float,
+        min_duration_ms: float,
+    ) -> Dict[str, Any]:
+        """Fold aggregated no-action counters into function statistics.
+
+        Args:
+            stats: Statistics produced by get_function_statistics
+            count: Number of compact no-action evaluations
+            total_duration_ms: Summed duration of those evaluations
+            max_duration_ms: Longest compact evaluation duration
+            min_duration_ms: Shortest compact evaluation duration
+
+        Returns:
+            Statistics covering both full entries and compact records
+        """
+        if count == 0:
+            return stats
+
+        entry_count = stats["evaluations"]
+        evaluations = entry_count + count
+        total_duration = stats["avg_duration_ms"] * entry_count + total_duration_ms
+
+        merged = dict(stats)
+        merged["evaluations"] = evaluations
+        merged["signal_rate"] = stats["signals"] / evaluations
+        merged["error_rate"] = stats["errors"] / evaluations
+        merged["avg_duration_ms"] = total_duration / evaluations
+        merged["max_duration_ms"] = max(stats["max_duration_ms"], max_duration_ms)
+        merged["min_duration_ms"] = (
+            min(stats["min_duration_ms"], min_duration_ms)
+            if entry_count
+            else min_duration_ms
+        )
+        return merged
+
     async def get_performance_summary(self) -> Dict[str, Any]:
         """Get performance metrics summary (alias for get_summary)."""
         return await self.get_summary()
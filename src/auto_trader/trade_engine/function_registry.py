@@ -1,19 +1,83 @@
 """Execution function registry for plugin-based function management."""
 
 import asyncio
-from typing import Dict, List, Type, Optional, Any
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, Type, Optional, Any, Tuple
 
 from loguru import logger
 
-from auto_trader.models.execution import ExecutionFunctionConfig
+from auto_trader.models.execution import ExecutionFunctionConfig, ExecutionSignal
 from auto_trader.trade_engine.execution_functions import ExecutionFunctionBase
 
+# (function_type, timeframe, parameters, enabled, lookback_bars) of a config
+FunctionSignature = Tuple[str, str, str, bool, int]
+
+
+class FunctionStateTable:
+    """Per-owner runtime state of one shared stateful function instance.
+
+    The instance's ``state_fields`` attributes hold the state of the owner
+    activated last; every other owner's state is kept as a tuple of those
+    attribute values and swapped in when that owner is activated.
+    """
+
+    def __init__(self, instance: ExecutionFunctionBase, owner: Optional[str] = None):
+        """Initialize table; the instance's current state is the initial state of every owner.
+
+        Args:
+            instance: Shared stateful function instance
+            owner: Owner whose state the instance holds now
+        """
+        self._instance = instance
+        self._fields: Tuple[str, ...] = type(instance).state_fields
+        self._initial = self._read()
+        self._rows: Dict[str, Tuple[Any, ...]] = {}
+        self._current = owner
+
+    def activate(self, owner: str) -> None:
+        """Put an owner's state into the instance, saving the previous owner's."""
+        if owner == self._current:
+            return
+        if self._current is not None:
+            self._rows[self._current] = self._read()
+        for name, value in zip(self._fields, self._rows.pop(owner, self._initial)):
+            setattr(self._instance, name, value)
+        self._current = owner
+
+    def discard(self, owner: str) -> None:
+        """Drop an owner's state."""
+        self._rows.pop(owner, None)
+        if owner == self._current:
+            self._current = None
+
+    def _read(self) -> Tuple[Any, ...]:
+        """Read the state fields of the instance."""
+        return tuple(getattr(self._instance, name) for name in self._fields)
+
+
+@dataclass
+class SharedFunction:
+    """One function instance serving every config with the same signature."""
+
+    instance: ExecutionFunctionBase
+    owners: List[str]
+    # Per-owner state for stateful functions, None for stateless ones
+    states: Optional[FunctionStateTable] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
 
 class ExecutionFunctionRegistry:
     """Registry for execution function plugins.
 
     Manages registration, instantiation, and discovery of execution functions.
     Uses asyncio-safe synchronization patterns for concurrent access protection.
+
+    Configs that differ only in name share one function instance, so each
+    distinct configuration is evaluated once and its signal fanned out to
+    every owning name. Stateful functions (see
+    ``ExecutionFunctionBase.state_fields``) keep each owner's state in a
+    side table swapped in around evaluation.
     """
 
     def __init__(self):
@@ -23,6 +87,11 @@ class ExecutionFunctionRegistry:
         self._lock = asyncio.Lock()  # asyncio.Lock for async-safe synchronization
         self._initialized = True
 
+        # Interned instances by config signature and by instance identity
+        self._shared: Dict[FunctionSignature, SharedFunction] = {}
+        self._shared_by_instance: Dict[int, SharedFunction] = {}
+        self._name_signatures: Dict[str, FunctionSignature] = {}
+
         logger.info("ExecutionFunctionRegistry initialized")
 
     async def register(
@@ -81,7 +150,7 @@ class ExecutionFunctionRegistry:
                     if instance.config.function_type == function_type
                 ]
                 for name in instances_to_remove:
-                    del self._instances[name]
+                    self._release_name(name)
 
                 logger.info(f"Unregistered execution function: {function_type}")
                 return True
@@ -91,15 +160,20 @@ class ExecutionFunctionRegistry:
     async def create_function(self, config: ExecutionFunctionConfig) -> ExecutionFunctionBase:
         """Create and configure an execution function instance.
 
+        A config whose type, timeframe, parameters, enabled flag and lookback
+        match an existing instance's is attached to that instance instead.
+
         Args:
             config: Function configuration
 
         Returns:
-            Configured execution function instance
+            Configured execution function instance, shared with configs of
+            the same signature
 
         Raises:
             ValueError: If function_type not registered
         """
+        signature = self._signature(config)
         async with self._lock:
             if config.function_type not in self._functions:
                 available = ", ".join(self._functions.keys())
@@ -110,19 +184,47 @@ class ExecutionFunctionRegistry:
 
             function_class = self._functions[config.function_type]
 
+            shared = self._live_shared(signature)
+            if shared is not None and self._name_signatures.get(config.name) == signature:
+                return shared.instance
+            if shared is not None:
+                self._release_name(config.name)
+                self._attach_name(config.name, signature, shared)
+                logger.debug(
+                    f"Attached '{config.name}' to shared function instance "
+                    f"'{shared.instance.name}'"
+                )
+                return shared.instance
+
         try:
             instance = function_class(config)
 
             # Store instance for management with lock protection
             async with self._lock:
-                self._instances[config.name] = instance
+                shared = self._live_shared(signature)
+                if shared is None:
+                    # Still the first of its signature once constructed
+                    shared = SharedFunction(
+                        instance=instance,
+                        owners=[],
+                        states=(
+                            FunctionStateTable(instance, config.name)
+                            if function_class.state_fields
+                            else None
+                        ),
+                    )
+                    self._shared[signature] = shared
+                    self._shared_by_instance[id(instance)] = shared
+                if self._name_signatures.get(config.name) != signature:
+                    self._release_name(config.name)
+                    self._attach_name(config.name, signature, shared)
 
             logger.info(
                 f"Created function instance '{config.name}' "
                 f"of type {config.function_type}"
             )
 
-            return instance
+            return shared.instance
 
         except Exception as e:
             logger.error(
@@ -131,6 +233,67 @@ class ExecutionFunctionRegistry:
             )
             raise
 
+    async def remove_function(self, name: str) -> bool:
+        """Detach a named function, dropping its instance when no other name shares it.
+
+        Args:
+            name: Function instance name
+
+        Returns:
+            True if removed, False if not found
+        """
+        async with self._lock:
+            if name not in self._instances:
+                return False
+            self._release_name(name)
+            return True
+
+    async def evaluate_function(
+        self, function: ExecutionFunctionBase, context
+    ) -> List[Tuple[str, ExecutionSignal]]:
+        """Evaluate a function once for every name that shares it.
+
+        Stateless functions are evaluated once and the signal is returned for
+        each owning name; stateful ones are evaluated per owner with that
+        owner's state loaded.
+
+        Args:
+            function: Function instance, e.g. from get_functions_by_timeframe
+            context: Execution context
+
+        Returns:
+            (owner name, signal) pairs
+        """
+        shared = self._shared_by_instance.get(id(function))
+        if shared is None or shared.instance is not function:
+            return [(function.name, await function.evaluate(context))]
+
+        owners = list(shared.owners)
+        if shared.states is None:
+            signal = await function.evaluate(context)
+            return [(owner, signal) for owner in owners]
+
+        results = []
+        async with shared.lock:
+            for owner in owners:
+                shared.states.activate(owner)
+                results.append((owner, await function.evaluate(context)))
+        return results
+
+    def get_owner_names(self, function: ExecutionFunctionBase) -> List[str]:
+        """Get the names sharing a function instance.
+
+        Args:
+            function: Function instance
+
+        Returns:
+            Owning names, or the instance's own name if not registry-created
+        """
+        shared = self._shared_by_instance.get(id(function))
+        if shared is None or shared.instance is not function:
+            return [function.name]
+        return list(shared.owners)
+
     def get_function(self, name: str) -> Optional[ExecutionFunctionBase]:
         """Get an existing function instance by name.
 
@@ -189,7 +352,7 @@ class ExecutionFunctionRegistry:
             return None
 
         return {
-            "name": instance.name,
+            "name": name,
             "type": instance.config.function_type,
             "timeframe": instance.timeframe.value,
             "enabled": instance.enabled,
@@ -198,6 +361,44 @@ class ExecutionFunctionRegistry:
             "lookback_bars": instance.lookback_bars,
         }
 
+    def export_function_state(self) -> Dict[str, Dict[str, Any]]:
+        """Get runtime state of stateful function instances.
+
+        Returns:
+            State by instance name, omitting stateless instances
+        """
+        states = {}
+        for name, instance in self._instances.items():
+            shared = self._shared_by_instance.get(id(instance))
+            if shared is not None and shared.states is not None:
+                shared.states.activate(name)
+            state = instance.get_state()
+            if state:
+                states[name] = state
+        return states
+
+    def restore_function_state(self, states: Dict[str, Dict[str, Any]]) -> int:
+        """Restore runtime state into existing function instances.
+
+        Args:
+            states: State by instance name, as from export_function_state
+
+        Returns:
+            Number of instances restored
+        """
+        restored = 0
+        for name, state in states.items():
+            instance = self._instances.get(name)
+            if instance is None:
+                logger.debug(f"Skipping state for unknown function instance '{name}'")
+                continue
+            shared = self._shared_by_instance.get(id(instance))
+            if shared is not None and shared.states is not None:
+                shared.states.activate(name)
+            instance.restore_state(state)
+            restored += 1
+        return restored
+
     def get_functions_by_timeframe(self, timeframe: str) -> List[ExecutionFunctionBase]:
         """Get all functions for a specific timeframe.
 
@@ -209,7 +410,7 @@ class ExecutionFunctionRegistry:
         """
         return [
             instance
-            for instance in self._instances.values()
+            for instance in self._distinct_instances()
             if instance.timeframe.value == timeframe and instance.enabled
         ]
 
@@ -224,23 +425,90 @@ class ExecutionFunctionRegistry:
         """
         return [
             instance
-            for instance in self._instances.values()
+            for instance in self._distinct_instances()
             if instance.config.function_type == function_type
         ]
 
+    def get_sharing_stats(self) -> Dict[str, int]:
+        """Get how many named functions share instances.
+
+        Returns:
+            Counts of named functions and distinct instances
+        """
+        return {
+            "named_functions": len(self._instances),
+            "distinct_instances": len(self._shared),
+        }
+
     async def clear_instances(self) -> None:
         """Clear all function instances (keeps registrations)."""
         async with self._lock:
-            self._instances.clear()
+            self._clear_shared()
         logger.info("Cleared all function instances")
 
     async def clear_all(self) -> None:
         """Clear all registrations and instances."""
         async with self._lock:
             self._functions.clear()
-            self._instances.clear()
+            self._clear_shared()
         logger.info("Cleared all function registrations and instances")
 
+    @staticmethod
+    def _signature(config: ExecutionFunctionConfig) -> FunctionSignature:
+        """Get the configuration identity of a function, ignoring its name."""
+        return (
+            config.function_type,
+            config.timeframe.value,
+            json.dumps(config.parameters, sort_keys=True, default=str),
+            config.enabled,
+            config.lookback_bars,
+        )
+
+    def _live_shared(self, signature: FunctionSignature) -> Optional[SharedFunction]:
+        """Get the shared instance of a signature unless its names were dropped from _instances."""
+        shared = self._shared.get(signature)
+        if shared is None or self._instances.get(shared.owners[0]) is shared.instance:
+            return shared
+        for owner in shared.owners:
+            if self._name_signatures.get(owner) == signature:
+                del self._name_signatures[owner]
+        del self._shared[signature]
+        del self._shared_by_instance[id(shared.instance)]
+        return None
+
+    def _distinct_instances(self) -> List[ExecutionFunctionBase]:
+        """Get each shared instance once, in creation order."""
+        return [shared.instance for shared in self._shared.values()]
+
+    def _attach_name(
+        self, name: str, signature: FunctionSignature, shared: SharedFunction
+    ) -> None:
+        """Make a name an owner of a shared instance (lock held)."""
+        shared.owners.append(name)
+        self._instances[name] = shared.instance
+        self._name_signatures[name] = signature
+
+    def _release_name(self, name: str) -> None:
+        """Detach a name from its shared instance, dropping unowned instances (lock held)."""
+        self._instances.pop(name, None)
+        signature = self._name_signatures.pop(name, None)
+        shared = self._shared.get(signature) if signature else None
+        if shared is None:
+            return
+        shared.owners.remove(name)
+        if shared.states is not None:
+            shared.states.discard(name)
+        if not shared.owners:
+            del self._shared[signature]
+            del self._shared_by_instance[id(shared.instance)]
+
+    def _clear_shared(self) -> None:
+        """Drop every instance and name (lock held)."""
+        self._instances.clear()
+        self._shared.clear()
+        self._shared_by_instance.clear()
+        self._name_signatures.clear()
+
     def __str__(self) -> str:
         """String representation of registry."""
         return (
@@ -24,6 +24,8 @@ class TrailingStopFunction(ExecutionFunctionBase, ValidationMixin):
     locking in profits while allowing the position to run.
     """
 
+    state_fields = ("_highest_price", "_lowest_price", "_current_stop_level")
+
     def __init__(self, config):
         """Initialize with tracking of highest/lowest prices."""
         super().__init__(config)
@@ -337,6 +339,35 @@ class TrailingStopFunction(ExecutionFunctionBase, ValidationMixin):
                 f"limiting loss to {abs(pnl_pct):.2f}%"
             )
 
+    def get_state(self) -> Dict[str, Any]:
+        """Get trailing extremes and stop level for warm restart.
+
+        Returns:
+            Tracked prices as strings (None when not tracking)
+        """
+        return {
+            key: str(value) if value is not None else None
+            for key, value in (
+                ("highest_price", self._highest_price),
+                ("lowest_price", self._lowest_price),
+                ("current_stop_level", self._current_stop_level),
+            )
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Restore trailing extremes and stop level.
+
+        Args:
+            state: State saved by get_state
+        """
+
+        def to_decimal(value: Optional[str]) -> Optional[Decimal]:
+            return Decimal(value) if value is not None else None
+
+        self._highest_price = to_decimal(state.get("highest_price"))
+        self._lowest_price = to_decimal(state.get("lowest_price"))
+        self._current_stop_level = to_decimal(state.get("current_stop_level"))
+
     def _reset_tracking(self) -> None:
         """Reset tracking variables when no position."""
         self._highest_price = None
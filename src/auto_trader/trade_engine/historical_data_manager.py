@@ -6,10 +6,14 @@ from collections import defaultdict
 
 from loguru import logger
 
+from auto_trader.logging_config import HotPathLogger
 from auto_trader.models.market_data import BarData
 from auto_trader.models.enums import Timeframe
 
 
+_trim_log = HotPathLogger("DEBUG", sample_every=100)
+
+
 class HistoricalDataManager:
     """Manages historical bar data storage and retrieval.
     
@@ -61,8 +65,10 @@ class HistoricalDataManager:
             if len(bars) > self.max_historical_bars:
                 bars[:] = bars[-self.max_historical_bars:]
                 
-                logger.debug(
-                    f"Trimmed historical data for {symbol} {timeframe.value}",
+                _trim_log.log(
+                    "Trimmed historical data for {symbol} {timeframe}",
+                    symbol=symbol,
+                    timeframe=timeframe.value,
                     kept_bars=len(bars),
                 )
     
@@ -169,6 +175,42 @@ class HistoricalDataManager:
         
         logger.debug(f"Cleaned up storage for {symbol}")
     
+    async def export_bars(self) -> Dict[str, List[BarData]]:
+        """Copy all stored bars for snapshotting.
+        
+        Returns:
+            Bars keyed by 'symbol:timeframe'
+        """
+        async with self.historical_data_lock:
+            return {
+                f"{symbol}:{timeframe.value}": list(bars)
+                for symbol, timeframes in self.historical_data.items()
+                for timeframe, bars in timeframes.items()
+            }
+    
+    async def restore_bars(self, bars_by_key: Dict[str, List[BarData]]) -> int:
+        """Restore stored bars from a snapshot.
+        
+        Restored series replace any bars already held for the same
+        symbol/timeframe and are trimmed to the size limit.
+        
+        Args:
+            bars_by_key: Bars keyed by 'symbol:timeframe'
+            
+        Returns:
+            Number of bars restored
+        """
+        restored = 0
+        async with self.historical_data_lock:
+            for key, bars in bars_by_key.items():
+                symbol, timeframe = key.split(":")
+                kept = bars[-self.max_historical_bars:]
+                self.historical_data[symbol][Timeframe(timeframe)] = list(kept)
+                restored += len(kept)
+        
+        logger.debug("Restored historical data", series=len(bars_by_key), bars=restored)
+        return restored
+    
     async def get_stats(self) -> Dict[str, int]:
         """Get historical data statistics.
         
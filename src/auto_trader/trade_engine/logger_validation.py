@@ -5,6 +5,8 @@ from pathlib import Path
 
 from loguru import logger
 
+from auto_trader.models.enums import ExecutionLogTier
+
 
 class LoggerValidationMixin:
     """Mixin class for execution logger parameter validation."""
@@ -93,6 +95,39 @@ class LoggerValidationMixin:
 
         return True
 
+    @staticmethod
+    def validate_tier_settings(
+        log_tier: ExecutionLogTier,
+        snapshot_sample_rate: int,
+        max_snapshot_params: int
+    ) -> bool:
+        """Validate logging tier and snapshot settings.
+
+        Args:
+            log_tier: Logging tier for evaluations
+            snapshot_sample_rate: Materialize every Nth no-action evaluation (0 disables)
+            max_snapshot_params: Maximum trade plan params kept in a snapshot
+
+        Returns:
+            True if all settings are valid
+        """
+        if not isinstance(log_tier, ExecutionLogTier):
+            try:
+                ExecutionLogTier(log_tier)
+            except ValueError:
+                logger.error(f"Invalid log_tier: {log_tier}")
+                return False
+
+        if not isinstance(snapshot_sample_rate, int) or snapshot_sample_rate < 0:
+            logger.error(f"Invalid snapshot_sample_rate: {snapshot_sample_rate}")
+            return False
+
+        if not isinstance(max_snapshot_params, int) or max_snapshot_params <= 0:
+            logger.error(f"Invalid max_snapshot_params: {max_snapshot_params}")
+            return False
+
+        return True
+
     @staticmethod
     def ensure_log_directory_exists(log_dir: Path) -> bool:
         """Ensure log directory exists and is writable.
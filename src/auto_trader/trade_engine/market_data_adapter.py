@@ -5,9 +5,12 @@ from typing import Dict, Optional, Any, List
 
 from loguru import logger
 
+from auto_trader.logging_config import HotPathLogger
 from auto_trader.models.market_data import BarData, BarSizeType
 from auto_trader.models.execution import BarCloseEvent, ExecutionContext
 from auto_trader.models.enums import Timeframe
+from auto_trader.models.plan_diff import PlanDiff, PlanKeyIndex
+from auto_trader.models.plan_loader import TradePlanLoader
 from auto_trader.trade_engine.bar_close_detector import BarCloseDetector
 from auto_trader.trade_engine.function_registry import ExecutionFunctionRegistry
 from auto_trader.trade_engine.execution_logger import ExecutionLogger
@@ -19,6 +22,9 @@ from auto_trader.trade_engine.historical_data_manager import HistoricalDataManag
 from auto_trader.trade_engine.signal_emitter import SignalEmitter
 
 
+_market_data_update_log = HotPathLogger("DEBUG", sample_every=100)
+_bar_close_log = HotPathLogger("DEBUG")
+_no_functions_log = HotPathLogger("DEBUG", min_interval_seconds=60.0)
 
 
 class MarketDataExecutionAdapter:
@@ -72,6 +78,9 @@ class MarketDataExecutionAdapter:
         # Track active execution contexts
         self.active_contexts: Dict[str, ExecutionContext] = {}
         
+        # Symbol/timeframes monitored for plans, maintained from plan diffs
+        self._plan_keys = PlanKeyIndex()
+        
         # Subscribe to bar close events
         self.bar_close_detector.add_callback(self._on_bar_close)
         
@@ -154,10 +163,12 @@ class MarketDataExecutionAdapter:
             # Update bar close detector with latest data
             self.bar_close_detector.update_bar_data(bar.symbol, timeframe, bar)
             
-            logger.debug(
-                f"Updated market data for {bar.symbol} {timeframe.value}",
-                timestamp=bar.timestamp.isoformat(),
-                close=float(bar.close_price),
+            _market_data_update_log.log(
+                "Updated market data for {symbol} {timeframe}",
+                symbol=bar.symbol,
+                timeframe=timeframe.value,
+                timestamp=bar.timestamp.isoformat,
+                close=lambda: float(bar.close_price),
             )
             
         except Exception as e:
@@ -192,6 +203,44 @@ class MarketDataExecutionAdapter:
         
         logger.info(f"Stopped execution monitoring for {symbol}")
     
+    async def apply_plan_diff(self, diff: PlanDiff) -> None:
+        """Start and stop bar close monitoring for the symbol/timeframes a plan diff affects.
+        
+        Monitors of symbol/timeframes still needed by other plans, or by
+        modified plans whose symbol, timeframes and activity are unchanged,
+        are left running.
+        
+        Args:
+            diff: Plan diff from TradePlanLoader diff listeners
+        """
+        acquired, released = self._plan_keys.apply(diff)
+        
+        for symbol, bar_size in sorted(released):
+            timeframe = self._convert_bar_size_to_timeframe(bar_size)
+            if timeframe:
+                await self.stop_monitoring(symbol, timeframe)
+        for symbol, bar_size in sorted(acquired):
+            timeframe = self._convert_bar_size_to_timeframe(bar_size)
+            if timeframe:
+                await self.start_monitoring(symbol, timeframe)
+            else:
+                logger.warning(f"Cannot monitor unsupported timeframe {bar_size} for {symbol}")
+    
+    def attach_plan_loader(self, loader: TradePlanLoader) -> None:
+        """Keep bar close monitoring in step with a plan loader's plans.
+        
+        Starts monitoring for the currently loaded plans, then applies each
+        plan diff on the event loop. Call from the running loop.
+        
+        Args:
+            loader: Plan loader whose changes drive monitoring
+        """
+        loader.add_diff_listener(self.apply_plan_diff, replay=True)
+    
+    def detach_plan_loader(self, loader: TradePlanLoader) -> None:
+        """Stop following a plan loader; running monitors are kept."""
+        loader.remove_diff_listener(self.apply_plan_diff)
+    
     def add_signal_callback(self, callback) -> None:
         """Add callback for execution signals.
         
@@ -218,16 +267,21 @@ class MarketDataExecutionAdapter:
             symbol = event.symbol
             timeframe = event.timeframe
             
-            logger.debug(
-                f"Processing bar close for {symbol} {timeframe.value}",
-                close_time=event.close_time.isoformat(),
+            _bar_close_log.log(
+                "Processing bar close for {symbol} {timeframe}",
+                symbol=symbol,
+                timeframe=timeframe.value,
+                close_time=event.close_time.isoformat,
             )
             
             # Get execution functions for this timeframe
             functions = self.function_registry.get_functions_by_timeframe(timeframe.value)
             
             if not functions:
-                logger.debug(f"No execution functions registered for {timeframe.value}")
+                _no_functions_log.log(
+                    "No execution functions registered for {timeframe}",
+                    timeframe=timeframe.value,
+                )
                 return
             
             # Get historical data for context using manager component
@@ -273,31 +327,37 @@ class MarketDataExecutionAdapter:
         start_time = asyncio.get_event_loop().time()
         
         try:
-            # Evaluate the function
-            signal = await function.evaluate(context)
+            # Evaluate the function once for all configs sharing it
+            results = await self.function_registry.evaluate_function(function, context)
             
             # Calculate duration
             duration_ms = (asyncio.get_event_loop().time() - start_time) * 1000
             
-            # Log the evaluation
-            await self.execution_logger.log_evaluation(
-                function_name=function.name,
-                context=context,
-                signal=signal,
-                duration_ms=duration_ms,
-            )
-            
-            # If signal should execute, notify callbacks using signal emitter
-            if signal.should_execute:
-                await self.signal_emitter.emit_signal(function, context, signal)
-                
-                logger.warning(
-                    f"Execution signal generated: {signal.action.value}",
-                    function=function.name,
-                    symbol=context.symbol,
-                    confidence=signal.confidence,
-                    reasoning=signal.reasoning,
+            for owner, signal in results:
+                # Log the evaluation
+                await self.execution_logger.log_evaluation(
+                    function_name=owner,
+                    context=context,
+                    signal=signal,
+                    duration_ms=duration_ms,
                 )
+                
+                # If signal should execute, notify callbacks using signal emitter
+                if signal.should_execute:
+                    if owner == function.name:
+                        await self.signal_emitter.emit_signal(function, context, signal)
+                    else:
+                        await self.signal_emitter.emit_signal(
+                            function, context, signal, function_name=owner
+                        )
+                    
+                    logger.warning(
+                        f"Execution signal generated: {signal.action.value}",
+                        function=owner,
+                        symbol=context.symbol,
+                        confidence=signal.confidence,
+                        reasoning=signal.reasoning,
+                    )
             
         except Exception as e:
             duration_ms = (asyncio.get_event_loop().time() - start_time) * 1000
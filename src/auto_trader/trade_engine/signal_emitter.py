@@ -1,7 +1,7 @@
 """Signal emission and callback management for execution framework."""
 
 import asyncio
-from typing import List, Callable, Dict, Any
+from typing import List, Callable, Dict, Any, Optional
 
 from loguru import logger
 
@@ -47,6 +47,7 @@ class SignalEmitter:
         function,
         context: ExecutionContext,
         signal: ExecutionSignal,
+        function_name: Optional[str] = None,
     ) -> None:
         """Emit execution signal to registered callbacks.
         
@@ -54,9 +55,11 @@ class SignalEmitter:
             function: Function that generated the signal
             context: Execution context
             signal: Generated execution signal
+            function_name: Name of the config the signal is for, when the
+                           function instance is shared (defaults to its name)
         """
         signal_data = {
-            "function_name": function.name,
+            "function_name": function_name or function.name,
             "symbol": context.symbol,
             "timeframe": context.timeframe,
             "signal": signal,
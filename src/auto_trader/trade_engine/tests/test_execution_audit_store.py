@@ -0,0 +1,272 @@
+"""Tests for the SQLite execution audit store."""
+
+import asyncio
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, UTC, timedelta
+from pathlib import Path
+
+import pytest
+
+from auto_trader.models.execution import ExecutionSignal, ExecutionLogEntry
+from auto_trader.models.enums import ExecutionAction, Timeframe
+from auto_trader.trade_engine.execution_audit_store import ExecutionAuditStore
+from auto_trader.trade_engine.execution_logger import ExecutionLogger
+
+
+@pytest.fixture
+def temp_db_path():
+    """Create temporary database path."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield Path(temp_dir) / "audit.db"
+
+
+@pytest.fixture
+def store(temp_db_path):
+    """Create audit store with a temporary database."""
+    audit_store = ExecutionAuditStore(temp_db_path, batch_size=10)
+    yield audit_store
+    audit_store.close()
+
+
+def make_entry(
+    function_name="close_above",
+    symbol="AAPL",
+    action=ExecutionAction.ENTER_LONG,
+    timestamp=None,
+    duration_ms=10.0,
+    error=None,
+):
+    """Create an execution log entry."""
+    if action == ExecutionAction.NONE:
+        signal = ExecutionSignal.no_action("Below threshold")
+    else:
+        signal = ExecutionSignal(action=action, confidence=0.8, reasoning="Close above")
+    return ExecutionLogEntry(
+        timestamp=timestamp or datetime.now(UTC),
+        function_name=function_name,
+        symbol=symbol,
+        timeframe=Timeframe.ONE_MIN,
+        signal=signal,
+        duration_ms=duration_ms,
+        error=error,
+    )
+
+
+class TestExecutionAuditStore:
+    """Test audit store writes and indexed queries."""
+
+    def test_database_uses_wal_and_indexes(self, store, temp_db_path):
+        """Test database is in WAL mode with the expected indexes."""
+        conn = sqlite3.connect(str(temp_db_path))
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            indexes = {
+                row[1] for row in conn.execute("PRAGMA index_list(evaluations)")
+            }
+        finally:
+            conn.close()
+
+        assert mode == "wal"
+        assert "idx_evaluations_symbol_time" in indexes
+        assert "idx_evaluations_function_time" in indexes
+
+    def test_rows_buffered_until_flush(self, store):
+        """Test rows are written in one batch on flush without an event loop."""
+        for _ in range(3):
+            store.add(make_entry())
+
+        assert store.pending_count == 3
+        assert store.rows_written == 0
+
+        store.flush()
+
+        assert store.pending_count == 0
+        assert store.rows_written == 3
+        assert store.batches_written == 1
+
+    async def test_writer_task_writes_batches(self, temp_db_path):
+        """Test background writer drains rows once the batch size is reached."""
+        audit_store = ExecutionAuditStore(
+            temp_db_path, batch_size=5, flush_interval_seconds=10
+        )
+        for _ in range(5):
+            audit_store.add(make_entry())
+
+        for _ in range(50):
+            if audit_store.rows_written == 5:
+                break
+            await asyncio.sleep(0.01)
+
+        assert audit_store.rows_written == 5
+        await audit_store.aclose()
+
+    async def test_failed_batch_is_retried(self, temp_db_path, monkeypatch):
+        """Test rows from a failed batch write are kept and written on retry."""
+        audit_store = ExecutionAuditStore(
+            temp_db_path, batch_size=2, flush_interval_seconds=0.01
+        )
+        write_batch = audit_store._write_batch
+        failures = []
+
+        def fail_once(rows):
+            if not failures:
+                failures.append(len(rows))
+                raise sqlite3.OperationalError("database is locked")
+            write_batch(rows)
+
+        monkeypatch.setattr(audit_store, "_write_batch", fail_once)
+        for _ in range(2):
+            audit_store.add(make_entry())
+
+        for _ in range(100):
+            if audit_store.rows_written == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert failures == [2]
+        assert audit_store.rows_written == 2
+        await audit_store.aclose()
+
+    def test_read_only_store_leaves_database_unchanged(self, store, temp_db_path):
+        """Test a read-only store queries without creating or writing anything."""
+        store.add(make_entry())
+        store.flush()
+
+        reader = ExecutionAuditStore(temp_db_path, read_only=True)
+        try:
+            assert len(reader.query_entries()) == 1
+            with pytest.raises(ValueError):
+                reader.add(make_entry())
+        finally:
+            reader.close()
+
+        missing = temp_db_path.parent / "missing.db"
+        with pytest.raises(sqlite3.OperationalError):
+            ExecutionAuditStore(missing, read_only=True)
+        assert not missing.exists()
+
+    def test_query_entries_filters(self, store):
+        """Test querying by symbol, function, time and actionability."""
+        now = datetime.now(UTC)
+        store.add(make_entry(symbol="AAPL", timestamp=now - timedelta(days=10)))
+        store.add(make_entry(symbol="AAPL", timestamp=now - timedelta(hours=1)))
+        store.add(make_entry(symbol="MSFT", function_name="close_below"))
+        store.add(make_entry(symbol="AAPL", action=ExecutionAction.NONE))
+
+        recent_aapl = store.query_entries(
+            symbol="AAPL", since=now - timedelta(days=1), actions_only=True
+        )
+        assert len(recent_aapl) == 1
+        assert recent_aapl[0].signal.action == ExecutionAction.ENTER_LONG
+
+        assert len(store.query_entries(symbol="AAPL")) == 3
+        assert len(store.query_entries(function_name="close_below")) == 1
+
+    def test_query_entries_limit_keeps_most_recent(self, store):
+        """Test limit returns the most recent entries in chronological order."""
+        base = datetime(2025, 8, 28, 10, 0, 0, tzinfo=UTC)
+        for i in range(5):
+            store.add(make_entry(timestamp=base + timedelta(minutes=i)))
+
+        entries = store.query_entries(limit=2)
+
+        assert [e.timestamp for e in entries] == [
+            base + timedelta(minutes=3),
+            base + timedelta(minutes=4),
+        ]
+
+    def test_function_statistics(self, store):
+        """Test aggregate statistics include compact records and errors."""
+        store.add(make_entry(duration_ms=10.0))
+        store.add(make_entry(duration_ms=30.0, error="boom", action=ExecutionAction.NONE))
+        store.add_compact(time.time(), "close_above", "AAPL", Timeframe.ONE_MIN, 20.0)
+        store.add(make_entry(function_name="close_below", duration_ms=5.0))
+
+        stats = store.function_statistics()
+
+        assert set(stats) == {"close_above", "close_below"}
+        close_above = stats["close_above"]
+        assert close_above["evaluations"] == 3
+        assert close_above["signals"] == 1
+        assert close_above["errors"] == 1
+        assert close_above["avg_duration_ms"] == 20.0
+        assert close_above["max_duration_ms"] == 30.0
+        assert close_above["min_duration_ms"] == 10.0
+
+        assert store.function_statistics("close_below")["close_below"]["evaluations"] == 1
+        assert store.action_counts() == {"ENTER_LONG": 2, "NONE": 2}
+
+    def test_function_statistics_partial_days(self, store):
+        """Test ranges mixing whole-day rollups and partial-day raw rows."""
+        day_start = datetime(2025, 8, 25, tzinfo=UTC)
+        for hours in (6, 18, 30, 42, 54, 66):
+            store.add(make_entry(timestamp=day_start + timedelta(hours=hours)))
+
+        stats = store.function_statistics(
+            since=day_start + timedelta(hours=12),
+            until=day_start + timedelta(hours=60),
+        )
+        assert stats["close_above"]["evaluations"] == 4
+
+        stats = store.function_statistics(since=day_start + timedelta(hours=40))
+        assert stats["close_above"]["evaluations"] == 3
+
+        stats = store.function_statistics(
+            since=day_start, until=day_start + timedelta(hours=30)
+        )
+        assert stats["close_above"]["evaluations"] == 3
+
+    def test_aggregate_query_performance(self, store):
+        """Benchmark indexed aggregate queries over a large table."""
+        base = time.time() - 86400
+        rows = 200_000
+        for i in range(rows):
+            store.add_compact(
+                base + i * 0.1, f"func_{i % 4}", f"SYM{i % 50}", Timeframe.ONE_MIN, 1.0
+            )
+        store.flush()
+
+        start = time.perf_counter()
+        stats = store.function_statistics("func_1")
+        single_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        entries = store.query_entries(symbol="SYM7", limit=100)
+        history_ms = (time.perf_counter() - start) * 1000
+
+        print(f"Single function statistics over {rows} rows: {single_ms:.1f}ms")
+        print(f"Symbol history over {rows} rows: {history_ms:.1f}ms")
+
+        assert stats["func_1"]["evaluations"] == rows // 4
+        assert entries == []
+        assert single_ms < 500
+        assert history_ms < 500
+
+
+class TestExecutionLoggerAuditStore:
+    """Test ExecutionLogger integration with the audit store."""
+
+    async def test_logger_writes_and_queries_store(self, temp_db_path):
+        """Test audit trail and statistics come from the store when attached."""
+        audit_store = ExecutionAuditStore(temp_db_path)
+        execution_logger = ExecutionLogger(
+            enable_file_logging=False, max_memory_entries=1, audit_store=audit_store
+        )
+
+        for _ in range(3):
+            await execution_logger.log_execution_decision(make_entry())
+
+        # Memory only retains the last entry; the store keeps all of them
+        assert len(execution_logger.entries) == 1
+        trail = await execution_logger.get_audit_trail("AAPL")
+        assert len(trail) == 3
+
+        stats = await execution_logger.get_function_statistics("close_above")
+        assert stats["evaluations"] == 3
+
+        all_stats = await execution_logger.get_function_statistics()
+        assert all_stats["close_above"]["signals"] == 3
+
+        await execution_logger.close()
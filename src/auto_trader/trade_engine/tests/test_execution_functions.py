@@ -89,6 +89,120 @@ class TestExecutionFunctionRegistry:
         assert instance.timeframe == Timeframe.ONE_MIN
 
 
+    @pytest.mark.asyncio
+    async def test_identical_configs_share_instance(self, sample_context):
+        """Test configs differing only by name are evaluated once and fanned out."""
+        registry = ExecutionFunctionRegistry()
+        await registry.register("close_above", CloseAboveFunction)
+        instances = [
+            await registry.create_function(
+                ExecutionFunctionConfig(
+                    name=f"plan_{i}_entry",
+                    function_type="close_above",
+                    timeframe=Timeframe.ONE_MIN,
+                    parameters={"threshold_price": 180.0 if i < 3 else 185.0},
+                )
+            )
+            for i in range(4)
+        ]
+
+        assert instances[0] is instances[1] is instances[2]
+        assert instances[3] is not instances[0]
+        assert registry.get_sharing_stats() == {"named_functions": 4, "distinct_instances": 2}
+        assert registry.get_functions_by_timeframe("1min") == [instances[0], instances[3]]
+        assert registry.get_instance_info("plan_2_entry")["name"] == "plan_2_entry"
+
+        evaluations = []
+        original_evaluate = instances[0].evaluate
+
+        async def counting_evaluate(context):
+            evaluations.append(context.symbol)
+            return await original_evaluate(context)
+
+        instances[0].evaluate = counting_evaluate
+        results = await registry.evaluate_function(instances[0], sample_context)
+
+        assert evaluations == ["AAPL"]
+        assert [owner for owner, _ in results] == ["plan_0_entry", "plan_1_entry", "plan_2_entry"]
+        assert all(signal.action == ExecutionAction.ENTER_LONG for _, signal in results)
+
+        assert await registry.remove_function("plan_3_entry")
+        assert await registry.remove_function("plan_0_entry")
+        assert registry.get_owner_names(instances[0]) == ["plan_1_entry", "plan_2_entry"]
+        assert registry.get_functions_by_timeframe("1min") == [instances[0]]
+
+    @pytest.mark.asyncio
+    async def test_stateful_function_keeps_state_per_owner(self, sample_context):
+        """Test a shared trailing stop keeps each owner's extremes separately."""
+        registry = ExecutionFunctionRegistry()
+        await registry.register("trailing_stop", TrailingStopFunction)
+        for name in ("AAPL_trail", "MSFT_trail"):
+            trail = await registry.create_function(
+                ExecutionFunctionConfig(
+                    name=name,
+                    function_type="trailing_stop",
+                    timeframe=Timeframe.ONE_MIN,
+                    parameters={"trail_percentage": 2.0},
+                )
+            )
+
+        restored = registry.restore_function_state(
+            {
+                "AAPL_trail": {"highest_price": "185.25", "lowest_price": None, "current_stop_level": None},
+                "MSFT_trail": {"highest_price": "410.00", "lowest_price": None, "current_stop_level": None},
+            }
+        )
+        seen = []
+
+        async def recording_evaluate(context):
+            seen.append(trail._highest_price)
+            trail._highest_price += 1
+            return ExecutionSignal.no_action("recorded")
+
+        trail.evaluate = recording_evaluate
+        await registry.evaluate_function(trail, sample_context)
+
+        assert restored == 2
+        assert seen == [Decimal("185.25"), Decimal("410.00")]
+        assert registry.export_function_state() == {
+            "AAPL_trail": {"highest_price": "186.25", "lowest_price": None, "current_stop_level": None},
+            "MSFT_trail": {"highest_price": "411.00", "lowest_price": None, "current_stop_level": None},
+        }
+
+    @pytest.mark.asyncio
+    async def test_interning_benchmark(self, sample_context):
+        """Benchmark a bar close evaluation with 1,000 configs over 10 distinct signatures."""
+        import time
+
+        registry = ExecutionFunctionRegistry()
+        await registry.register("close_above", CloseAboveFunction)
+        for i in range(1000):
+            await registry.create_function(
+                ExecutionFunctionConfig(
+                    name=f"plan_{i}_entry",
+                    function_type="close_above",
+                    timeframe=Timeframe.ONE_MIN,
+                    parameters={"threshold_price": 170.0 + i % 10},
+                )
+            )
+
+        functions = registry.get_functions_by_timeframe("1min")
+        start = time.perf_counter()
+        results = [
+            result
+            for function in functions
+            for result in await registry.evaluate_function(function, sample_context)
+        ]
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        print(
+            f"1000 configs: {len(functions)} evaluations, {len(results)} signals "
+            f"in {elapsed_ms:.1f}ms"
+        )
+        assert len(functions) == 10
+        assert len(results) == 1000
+
+
 class TestCloseAboveFunction:
     """Test the CloseAboveFunction."""
 
@@ -1,5 +1,7 @@
 """Tests for ExecutionLogger audit trail integrity."""
 
+import asyncio
+import dataclasses
 import pytest
 import tempfile
 import json
@@ -14,7 +16,7 @@ from auto_trader.models.execution import (
     ExecutionContext,
     PositionState
 )
-from auto_trader.models.enums import ExecutionAction, Timeframe
+from auto_trader.models.enums import ExecutionAction, ExecutionLogTier, Timeframe
 from auto_trader.models.market_data import BarData
 from auto_trader.trade_engine.execution_logger import ExecutionLogger
 
@@ -476,4 +478,167 @@ class TestExecutionLogger:
         assert len(trail) == 3
         # Should be sorted by timestamp (entries are in chronological order)
         timestamps = [entry.timestamp for entry in trail]
-        assert timestamps == sorted(timestamps)
\ No newline at end of file
+        assert timestamps == sorted(timestamps)
+
+@pytest.fixture
+def sample_context():
+    """Create sample execution context."""
+    bar = BarData(
+        symbol="AAPL",
+        timestamp=datetime(2025, 8, 28, 10, 0, 0, tzinfo=UTC),
+        open_price=Decimal("180.00"),
+        high_price=Decimal("181.00"),
+        low_price=Decimal("179.50"),
+        close_price=Decimal("180.50"),
+        volume=1000000,
+        bar_size="1min",
+    )
+    return ExecutionContext(
+        symbol="AAPL",
+        timeframe=Timeframe.ONE_MIN,
+        current_bar=bar,
+        historical_bars=[bar],
+        trade_plan_params={"threshold_price": 181.0},
+        position_state=None,
+        account_balance=Decimal("10000"),
+        timestamp=datetime(2025, 8, 28, 10, 0, 0, tzinfo=UTC),
+    )
+
+
+@pytest.fixture
+def compact_logger(temp_log_dir):
+    """Create ExecutionLogger using the compact logging tier."""
+    return ExecutionLogger(
+        log_dir=temp_log_dir,
+        max_memory_entries=100,
+        log_tier=ExecutionLogTier.COMPACT,
+    )
+
+
+class TestExecutionLoggerTiers:
+    """Test tiered logging of no-action evaluations."""
+
+    async def test_full_tier_materializes_no_action(self, logger_instance, sample_context):
+        """Test default tier keeps a full entry for every evaluation."""
+        signal = ExecutionSignal.no_action("Below threshold")
+        await logger_instance.log_evaluation("close_above", sample_context, signal, 1.0)
+
+        assert len(logger_instance.entries) == 1
+        assert len(logger_instance.compact_records) == 0
+
+    async def test_compact_tier_records_no_action(self, compact_logger, sample_context):
+        """Test no-action evaluations become compact records and counters."""
+        signal = ExecutionSignal.no_action("Below threshold")
+        for duration in (1.0, 3.0):
+            await compact_logger.log_evaluation("close_above", sample_context, signal, duration)
+
+        assert len(compact_logger.entries) == 0
+        assert len(compact_logger.compact_records) == 2
+        assert not compact_logger.current_log_file.exists()
+
+        decoded = compact_logger.describe_compact_record(compact_logger.compact_records[0])
+        assert decoded["function_name"] == "close_above"
+        assert decoded["symbol"] == "AAPL"
+        assert decoded["timeframe"] == Timeframe.ONE_MIN
+        assert decoded["duration_ms"] == 1.0
+
+        counters = await compact_logger.get_no_action_counters()
+        assert len(counters) == 1
+        assert counters[0]["count"] == 2
+        assert counters[0]["avg_duration_ms"] == 2.0
+        assert counters[0]["max_duration_ms"] == 3.0
+
+        metrics = await compact_logger.get_performance_metrics()
+        assert metrics["total_evaluations"] == 2
+        assert metrics["actions_triggered"] == 0
+
+    async def test_compact_tier_keeps_actionable_signals(
+        self, compact_logger, sample_context, sample_signal
+    ):
+        """Test actionable signals still get full entries with snapshots."""
+        await compact_logger.log_evaluation("close_above", sample_context, sample_signal, 2.0)
+
+        assert len(compact_logger.entries) == 1
+        assert len(compact_logger.compact_records) == 0
+        entry = compact_logger.entries[0]
+        assert entry.context_snapshot["symbol"] == "AAPL"
+        assert entry.context_snapshot["current_bar"]["close"] == 180.5
+
+    async def test_compact_tier_keeps_errors(self, compact_logger, sample_context):
+        """Test failed evaluations are always fully logged."""
+        signal = ExecutionSignal.no_action("Error occurred")
+        await compact_logger.log_evaluation(
+            "close_above", sample_context, signal, 1.0, error="boom"
+        )
+
+        assert len(compact_logger.entries) == 1
+        assert compact_logger.entries[0].error == "boom"
+
+    async def test_compact_tier_sampling(self, temp_log_dir, sample_context):
+        """Test every Nth no-action evaluation is fully logged when sampling."""
+        sampled_logger = ExecutionLogger(
+            log_dir=temp_log_dir,
+            log_tier=ExecutionLogTier.COMPACT,
+            snapshot_sample_rate=5,
+        )
+        signal = ExecutionSignal.no_action("Below threshold")
+        for _ in range(10):
+            await sampled_logger.log_evaluation("close_above", sample_context, signal, 1.0)
+
+        assert len(sampled_logger.entries) == 2
+        assert len(sampled_logger.compact_records) == 8
+
+    async def test_function_statistics_include_compact_records(
+        self, compact_logger, sample_context, sample_signal
+    ):
+        """Test function statistics count both full entries and compact records."""
+        no_action = ExecutionSignal.no_action("Below threshold")
+        for _ in range(3):
+            await compact_logger.log_evaluation("close_above", sample_context, no_action, 1.0)
+        await compact_logger.log_evaluation("close_above", sample_context, sample_signal, 5.0)
+
+        stats = await compact_logger.get_function_statistics("close_above")
+        assert stats["evaluations"] == 4
+        assert stats["signals"] == 1
+        assert stats["signal_rate"] == 0.25
+        assert stats["avg_duration_ms"] == 2.0
+        assert stats["min_duration_ms"] == 1.0
+
+        all_stats = await compact_logger.get_function_statistics()
+        assert all_stats["close_above"]["evaluations"] == 4
+
+    async def test_function_statistics_read_counters_under_lock(
+        self, compact_logger, sample_context
+    ):
+        """Test no-action counters are aggregated only while holding the lock."""
+        no_action = ExecutionSignal.no_action("Below threshold")
+        await compact_logger.log_evaluation("close_above", sample_context, no_action, 1.0)
+
+        async with compact_logger.lock:
+            single = asyncio.create_task(compact_logger.get_function_statistics("close_above"))
+            every = asyncio.create_task(compact_logger.get_function_statistics())
+            await asyncio.sleep(0.01)
+            assert not single.done() and not every.done()
+
+        assert (await single)["evaluations"] == 1
+        assert (await every)["close_above"]["evaluations"] == 1
+
+    async def test_snapshot_params_are_bounded(self, temp_log_dir, sample_context, sample_signal):
+        """Test oversized trade plan params are truncated in snapshots."""
+        bounded_logger = ExecutionLogger(log_dir=temp_log_dir, max_snapshot_params=2)
+        context = dataclasses.replace(
+            sample_context, trade_plan_params={f"param_{i}": i for i in range(5)}
+        )
+
+        await bounded_logger.log_evaluation("close_above", context, sample_signal, 1.0)
+
+        snapshot = bounded_logger.entries[0].context_snapshot
+        assert len(snapshot["trade_plan_params"]) == 2
+        assert snapshot["trade_plan_params_truncated"] == 3
+
+    def test_invalid_tier_settings(self, temp_log_dir):
+        """Test invalid tier settings are rejected."""
+        with pytest.raises(ValueError):
+            ExecutionLogger(log_dir=temp_log_dir, snapshot_sample_rate=-1)
+        with pytest.raises(ValueError):
+            ExecutionLogger(log_dir=temp_log_dir, log_tier="verbose")
@@ -15,7 +15,7 @@ from auto_trader.models.execution import (
     ExecutionLogEntry,
     BarCloseEvent,
 )
-from auto_trader.models.enums import ExecutionAction, Timeframe
+from auto_trader.models.enums import ExecutionAction, ExecutionLogTier, Timeframe
 from auto_trader.models.market_data import BarData
 from auto_trader.trade_engine.function_registry import ExecutionFunctionRegistry
 from auto_trader.trade_engine.execution_logger import ExecutionLogger
@@ -371,6 +371,46 @@ class TestHighFrequencyPerformance:
             assert avg_log_time < 2.0  # Under 2ms average
             assert max_log_time < 10.0  # Max under 10ms
 
+    async def test_execution_logger_tier_overhead(self, high_frequency_data):
+        """Benchmark per-evaluation logging overhead for FULL vs COMPACT tiers."""
+        import tempfile
+        from pathlib import Path
+
+        async def measure(tier: ExecutionLogTier, log_dir: Path) -> float:
+            tier_logger = ExecutionLogger(log_directory=log_dir, log_tier=tier)
+            start = time.perf_counter()
+            for i, bar in enumerate(high_frequency_data):
+                context = ExecutionContext(
+                    symbol="AAPL",
+                    timeframe=Timeframe.ONE_MIN,
+                    current_bar=bar,
+                    historical_bars=[bar],
+                    trade_plan_params={"threshold_price": 181.0},
+                    position_state=None,
+                    account_balance=Decimal("10000"),
+                    timestamp=bar.timestamp,
+                )
+                # Roughly 1 in 50 evaluations produces an actionable signal
+                if i % 50 == 0:
+                    signal = ExecutionSignal(
+                        action=ExecutionAction.ENTER_LONG,
+                        confidence=0.8,
+                        reasoning="Close above threshold",
+                    )
+                else:
+                    signal = ExecutionSignal.no_action("Below threshold")
+                await tier_logger.log_evaluation("close_above", context, signal, 1.0)
+            return (time.perf_counter() - start) / len(high_frequency_data) * 1_000_000
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            full_us = await measure(ExecutionLogTier.FULL, Path(temp_dir) / "full")
+            compact_us = await measure(ExecutionLogTier.COMPACT, Path(temp_dir) / "compact")
+
+        print(f"FULL tier logging overhead: {full_us:.1f}us/evaluation")
+        print(f"COMPACT tier logging overhead: {compact_us:.1f}us/evaluation")
+
+        assert compact_us < full_us
+
     async def test_registry_lookup_performance(self, performance_registry):
         """Test function registry performance under high lookup frequency."""
         # Register many functions
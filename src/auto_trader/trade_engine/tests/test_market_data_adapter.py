@@ -6,6 +6,8 @@ from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime, UTC
 from decimal import Decimal
 
+import yaml
+
 from auto_trader.models.market_data import BarData
 from auto_trader.models.execution import BarCloseEvent, ExecutionSignal, ExecutionContext
 from auto_trader.models.enums import Timeframe, ExecutionAction
@@ -14,6 +16,9 @@ from auto_trader.trade_engine.bar_close_detector import BarCloseDetector
 from auto_trader.trade_engine.function_registry import ExecutionFunctionRegistry
 from auto_trader.trade_engine.execution_logger import ExecutionLogger
 from auto_trader.trade_engine.execution_functions import ExecutionFunctionBase
+from auto_trader.models.plan_diff import diff_plans
+from auto_trader.models.plan_loader import TradePlanLoader
+from auto_trader.models.trade_plan import TradePlanStatus
 
 
 @pytest.fixture
@@ -35,6 +40,11 @@ def mock_function_registry():
     registry = Mock(spec=ExecutionFunctionRegistry)
     registry.get_functions_by_timeframe = Mock(return_value=[])
     registry.list_instances = Mock(return_value=[])
+
+    async def evaluate_function(function, context):
+        return [(function.name, await function.evaluate(context))]
+
+    registry.evaluate_function = AsyncMock(side_effect=evaluate_function)
     return registry
 
 
@@ -151,6 +161,52 @@ class TestMarketDataExecutionAdapter:
         # Should stop bar close monitoring
         market_data_adapter.bar_close_detector.stop_monitoring.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_apply_plan_diff_touches_affected_monitors(self, market_data_adapter, make_plan):
+        """Test plan diffs start and stop only the monitors whose plans changed."""
+        detector = market_data_adapter.bar_close_detector
+        plan = make_plan()
+        await market_data_adapter.apply_plan_diff(diff_plans({}, {plan.plan_id: plan}))
+        assert sorted(c.args for c in detector.monitor_timeframe.call_args_list) == [
+            ("AAPL", Timeframe.FIFTEEN_MIN),
+            ("AAPL", Timeframe.ONE_MIN),
+        ]
+        
+        detector.monitor_timeframe.reset_mock()
+        moved = make_plan(
+            exit_function={"function_type": "stop_loss_take_profit", "timeframe": "5min"}
+        )
+        await market_data_adapter.apply_plan_diff(
+            diff_plans({plan.plan_id: plan}, {plan.plan_id: moved})
+        )
+        
+        detector.monitor_timeframe.assert_called_once_with("AAPL", Timeframe.FIVE_MIN)
+        detector.stop_monitoring.assert_called_once_with("AAPL", Timeframe.ONE_MIN)
+
+    @pytest.mark.asyncio
+    async def test_attach_plan_loader_follows_plan_changes(
+        self, market_data_adapter, make_plan, tmp_path
+    ):
+        """Test an attached loader's plans and later changes drive monitoring."""
+        plan = make_plan()
+        (tmp_path / "plan.yaml").write_text(yaml.safe_dump(plan.model_dump(mode="json")))
+        loader = TradePlanLoader(tmp_path)
+        loader.load_all_plans()
+        detector = market_data_adapter.bar_close_detector
+
+        market_data_adapter.attach_plan_loader(loader)
+        await loader.wait_for_diff_listeners()
+        assert detector.monitor_timeframe.call_count == 2
+
+        loader.update_plan_status(plan.plan_id, TradePlanStatus.COMPLETED)
+        await loader.wait_for_diff_listeners()
+        assert detector.stop_monitoring.call_count == 2
+
+        market_data_adapter.detach_plan_loader(loader)
+        loader.update_plan_status(plan.plan_id, TradePlanStatus.AWAITING_ENTRY)
+        await loader.wait_for_diff_listeners()
+        assert detector.monitor_timeframe.call_count == 2
+
     def test_add_signal_callback(self, market_data_adapter):
         """Test adding signal callback."""
         callback = Mock()
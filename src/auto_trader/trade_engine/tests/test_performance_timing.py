@@ -338,6 +338,48 @@ class TestPerformanceTiming:
         
         print(f"Market data processing: {throughput:.0f} bars/sec")
 
+    async def test_market_data_throughput_debug_on_off(self, market_data_adapter, monkeypatch):
+        """Benchmark ingestion bars/sec with debug logging enabled and disabled."""
+        from auto_trader import logging_config
+        from auto_trader.logging_config import add_sink, remove_sink
+        from auto_trader.models.market_data_cache import MarketDataCache
+        from auto_trader.trade_engine import market_data_adapter as adapter_module
+
+        monkeypatch.setattr(logging_config, "_sink_levels", {})
+        monkeypatch.setattr(logging_config, "_min_sink_level", None)
+        hot_log = adapter_module._market_data_update_log
+
+        num_bars = 5000
+        throughput = {}
+        hot_log_calls = {}
+
+        for level in ("DEBUG", "INFO"):
+            handler_id = add_sink(lambda _: None, level=level)
+            try:
+                cache = MarketDataCache()
+                base_time = datetime.now(UTC) - timedelta(seconds=num_bars)
+                calls_before = hot_log.calls
+
+                start_time = time.perf_counter()
+                for i in range(num_bars):
+                    bar = create_sample_bar(
+                        close_price=180.0 + (i % 100) * 0.01,
+                        timestamp=base_time + timedelta(seconds=i),
+                    )
+                    await cache.update_bar(bar)
+                    await market_data_adapter.on_market_data_update(bar)
+                throughput[level] = num_bars / (time.perf_counter() - start_time)
+                hot_log_calls[level] = hot_log.calls - calls_before
+            finally:
+                remove_sink(handler_id)
+
+        # Debug records are skipped before any formatting when only INFO is enabled
+        assert hot_log_calls["DEBUG"] == num_bars
+        assert hot_log_calls["INFO"] == 0
+
+        assert throughput["INFO"] > 1000
+        assert throughput["DEBUG"] > 1000
+
     @pytest.mark.asyncio
     async def test_memory_cleanup_performance(self, market_data_adapter):
         """Test memory cleanup performance."""
@@ -0,0 +1,319 @@
+"""Thread-safe, coalescing bridge from watchdog events to an asyncio loop."""
+
+import asyncio
+import inspect
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+from loguru import logger
+from watchdog.events import FileSystemEventHandler
+
+
+class FileWatchEventType(Enum):
+    """File watch event types."""
+    CREATED = "created"
+    MODIFIED = "modified"
+    DELETED = "deleted"
+
+
+@dataclass
+class FileChange:
+    """All events for one path within a coalescing window."""
+
+    path: Path
+    event_type: FileWatchEventType
+    # Wall-clock and monotonic time of the first event in the burst
+    first_event_time: float
+    first_event_monotonic: float
+    event_count: int = 1
+
+
+BatchHandler = Callable[[List[FileChange]], Union[None, Awaitable[None]]]
+
+
+class FileEventBridge(FileSystemEventHandler):
+    """
+    Watchdog event handler that hands file changes to an asyncio loop.
+
+    Watchdog calls the handler on its observer thread. Events are passed to
+    the owning loop with ``call_soon_threadsafe`` and coalesced per path:
+    the several events an editor writes per save become one change. When no
+    new event has arrived for ``coalesce_window`` seconds (or
+    ``max_delay`` after the first pending event) all pending paths are
+    delivered to ``on_batch`` together, so a multi-file change is applied
+    as one transaction. Batches never overlap; events arriving while a
+    batch runs form the next one.
+
+    ``start`` uses the running loop, or starts a private loop thread when
+    called outside one (e.g. synchronous CLI commands). With a private loop
+    ``on_batch`` runs on that thread, concurrently with the caller, so it
+    must not mutate state the caller also uses; handlers that do must be
+    started from their owning loop. Latency from the first event of a
+    change to ``on_batch`` completing is recorded.
+    """
+
+    def __init__(
+        self,
+        on_batch: BatchHandler,
+        coalesce_window: float = 0.2,
+        max_delay: Optional[float] = None,
+        path_filter: Optional[Callable[[Path], bool]] = None,
+    ) -> None:
+        """
+        Initialize event bridge.
+
+        Args:
+            on_batch: Called on the loop with the coalesced changes of a
+                      window, in first-event order; may be a coroutine function
+            coalesce_window: Quiet period ending a burst (seconds)
+            max_delay: Longest a change waits for the burst to end (seconds,
+                       defaults to five windows)
+            path_filter: Returns True for paths to deliver
+        """
+        super().__init__()
+        self.on_batch = on_batch
+        self.coalesce_window = coalesce_window
+        self.max_delay = max_delay if max_delay is not None else coalesce_window * 5
+        self.path_filter = path_filter
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._own_loop_thread: Optional[threading.Thread] = None
+        self._pending_events: Dict[Path, FileChange] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._batch_running = False
+
+        # Metrics
+        self.events_received = 0
+        self.changes_delivered = 0
+        self.batches_delivered = 0
+        self.batch_failures = 0
+        self.last_latency_ms: Optional[float] = None
+        self.max_latency_ms = 0.0
+        self._total_latency_ms = 0.0
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """
+        Attach the bridge to the loop that will apply changes.
+
+        Args:
+            loop: Owning loop (defaults to the running loop, or a private
+                  loop thread when there is none)
+        """
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = asyncio.new_event_loop()
+                self._own_loop_thread = threading.Thread(
+                    target=loop.run_forever, name="file-event-bridge", daemon=True
+                )
+                self._own_loop_thread.start()
+        self._loop = loop
+
+    def stop(self) -> None:
+        """Detach from the loop, dropping pending changes."""
+        loop, self._loop = self._loop, None
+        if loop is None or loop.is_closed():
+            return
+
+        if self._own_loop_thread is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            self._own_loop_thread.join(timeout=5.0)
+            self._own_loop_thread = None
+            loop.close()
+        elif self._flush_handle is not None:
+            try:
+                loop.call_soon_threadsafe(self._flush_handle.cancel)
+            except RuntimeError:
+                pass
+        self._flush_handle = None
+        self._pending_events.clear()
+
+    # Watchdog observer thread
+
+    def on_created(self, event) -> None:
+        """Handle file creation events."""
+        if not event.is_directory:
+            self.submit(Path(event.src_path), FileWatchEventType.CREATED)
+
+    def on_modified(self, event) -> None:
+        """Handle file modification events."""
+        if not event.is_directory:
+            self.submit(Path(event.src_path), FileWatchEventType.MODIFIED)
+
+    def on_deleted(self, event) -> None:
+        """Handle file deletion events."""
+        if not event.is_directory:
+            self.submit(Path(event.src_path), FileWatchEventType.DELETED)
+
+    def on_moved(self, event) -> None:
+        """Handle renames, e.g. editors replacing a file with a saved copy."""
+        if not event.is_directory:
+            self.submit(Path(event.src_path), FileWatchEventType.DELETED)
+            self.submit(Path(event.dest_path), FileWatchEventType.CREATED)
+
+    def submit(
+        self,
+        path: Path,
+        event_type: FileWatchEventType,
+        event_time: Optional[float] = None,
+    ) -> None:
+        """
+        Hand one event to the owning loop; safe to call from any thread.
+
+        Without a started loop the change is delivered immediately on the
+        calling thread.
+
+        Args:
+            path: Changed path
+            event_type: Kind of change
+            event_time: Wall-clock time of the event (defaults to now)
+        """
+        if self.path_filter and not self.path_filter(path):
+            return
+
+        change = FileChange(
+            path=path,
+            event_type=event_type,
+            first_event_time=event_time if event_time is not None else time.time(),
+            first_event_monotonic=time.monotonic(),
+        )
+        loop = self._loop
+        if loop is None:
+            self.events_received += 1
+            self._deliver_now([change])
+            return
+
+        try:
+            loop.call_soon_threadsafe(self._enqueue, change)
+        except RuntimeError:
+            # Loop closed while stopping
+            pass
+
+    # Owning loop
+
+    def _enqueue(self, change: FileChange) -> None:
+        """Merge an event into the pending burst and reschedule the flush."""
+        if self._loop is None:
+            return  # Queued before stop()
+        self.events_received += 1
+        pending = self._pending_events.get(change.path)
+        if pending is None:
+            self._pending_events[change.path] = change
+        else:
+            pending.event_type = self._merge_types(pending.event_type, change.event_type)
+            pending.event_count += 1
+
+        if self._batch_running:
+            return
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Flush after the quiet window, but no later than max_delay after the oldest change."""
+        if self._loop is None:
+            return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        oldest = min(change.first_event_monotonic for change in self._pending_events.values())
+        delay = min(self.coalesce_window, oldest + self.max_delay - time.monotonic())
+        self._flush_handle = self._loop.call_later(max(0.0, delay), self._flush)
+
+    def _flush(self) -> None:
+        """Deliver the pending burst as one batch."""
+        self._flush_handle = None
+        if self._loop is None or not self._pending_events or self._batch_running:
+            return
+
+        changes = sorted(self._pending_events.values(), key=lambda c: c.first_event_monotonic)
+        self._pending_events = {}
+        self._batch_running = True
+        self._loop.create_task(self._run_batch(changes))
+
+    async def _run_batch(self, changes: List[FileChange]) -> None:
+        """Run the batch handler, then start the next batch if events arrived meanwhile."""
+        try:
+            result = self.on_batch(changes)
+            if inspect.isawaitable(result):
+                await result
+            self._record_batch(changes)
+        except Exception as e:
+            self.batch_failures += 1
+            logger.error(
+                "File change batch failed",
+                files=[str(change.path) for change in changes],
+                error=str(e),
+            )
+        finally:
+            self._batch_running = False
+            if self._pending_events and self._loop is not None:
+                self._schedule_flush()
+
+    def _deliver_now(self, changes: List[FileChange]) -> None:
+        """Deliver changes synchronously when no loop is attached."""
+        try:
+            result = self.on_batch(changes)
+            if inspect.isawaitable(result):
+                asyncio.run(result)
+            self._record_batch(changes)
+        except Exception as e:
+            self.batch_failures += 1
+            logger.error(
+                "File change batch failed",
+                files=[str(change.path) for change in changes],
+                error=str(e),
+            )
+
+    def _record_batch(self, changes: List[FileChange]) -> None:
+        """Record latency from the first event of each change to the batch being applied."""
+        now = time.monotonic()
+        self.batches_delivered += 1
+        self.changes_delivered += len(changes)
+        for change in changes:
+            latency_ms = (now - change.first_event_monotonic) * 1000
+            self._total_latency_ms += latency_ms
+            self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+            self.last_latency_ms = latency_ms
+
+    @staticmethod
+    def _merge_types(
+        first: FileWatchEventType, second: FileWatchEventType
+    ) -> FileWatchEventType:
+        """Combine two events of one path into the net change."""
+        if second == FileWatchEventType.DELETED:
+            return FileWatchEventType.DELETED
+        if first == FileWatchEventType.DELETED:
+            # Deleted then recreated: the file was replaced
+            return FileWatchEventType.MODIFIED
+        if first == FileWatchEventType.CREATED:
+            return FileWatchEventType.CREATED
+        return second
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get event bridge metrics.
+
+        Returns:
+            Events received, changes and batches delivered, and latency
+            from first event to batch applied
+        """
+        return {
+            "events_received": self.events_received,
+            "changes_delivered": self.changes_delivered,
+            "events_coalesced": (
+                self.events_received - self.changes_delivered - len(self._pending_events)
+            ),
+            "batches_delivered": self.batches_delivered,
+            "batch_failures": self.batch_failures,
+            "pending_changes": len(self._pending_events),
+            "last_latency_ms": self.last_latency_ms,
+            "avg_latency_ms": (
+                self._total_latency_ms / self.changes_delivered
+                if self.changes_delivered
+                else None
+            ),
+            "max_latency_ms": self.max_latency_ms,
+        }
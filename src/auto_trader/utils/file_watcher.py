@@ -1,24 +1,14 @@
 """File system monitoring for automatic trade plan validation."""
 
-import asyncio
 import time
 from pathlib import Path
-from typing import Callable, Optional, Set, Dict
+from typing import Any, Callable, Optional, List, Dict
 from dataclasses import dataclass
-from enum import Enum
 
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileModifiedEvent, FileCreatedEvent, FileDeletedEvent
 from loguru import logger
 
-from ..models import TradePlanLoader, ValidationEngine
-
-
-class FileWatchEventType(Enum):
-    """File watch event types."""
-    CREATED = "created"
-    MODIFIED = "modified"
-    DELETED = "deleted"
+from .file_event_bridge import FileChange, FileEventBridge, FileWatchEventType
 
 
 @dataclass
@@ -29,7 +19,7 @@ class FileWatchEvent:
     timestamp: float
 
 
-class TradeplanFileHandler(FileSystemEventHandler):
+class TradeplanFileHandler(FileEventBridge):
     """File system event handler for trade plan files."""
     
     def __init__(self, callback: Callable[[FileWatchEvent], None], debounce_delay: float = 0.5):
@@ -38,40 +28,16 @@ class TradeplanFileHandler(FileSystemEventHandler):
         
         Args:
             callback: Function to call when file events occur
-            debounce_delay: Minimum time between processing same file events (seconds)
+            debounce_delay: Quiet period after which a file's coalesced
+                            events are processed (seconds)
         """
-        super().__init__()
         self.callback = callback
         self.debounce_delay = debounce_delay
-        self._pending_events: Dict[str, FileWatchEvent] = {}
-        self._debounce_tasks: Dict[str, asyncio.Task] = {}
-        
-    def on_created(self, event):
-        """Handle file creation events."""
-        if not event.is_directory and self._is_yaml_file(event.src_path):
-            self._queue_event(FileWatchEvent(
-                FileWatchEventType.CREATED,
-                Path(event.src_path),
-                time.time()
-            ))
-            
-    def on_modified(self, event):
-        """Handle file modification events.""" 
-        if not event.is_directory and self._is_yaml_file(event.src_path):
-            self._queue_event(FileWatchEvent(
-                FileWatchEventType.MODIFIED,
-                Path(event.src_path),
-                time.time()
-            ))
-            
-    def on_deleted(self, event):
-        """Handle file deletion events."""
-        if not event.is_directory and self._is_yaml_file(event.src_path):
-            self._queue_event(FileWatchEvent(
-                FileWatchEventType.DELETED,
-                Path(event.src_path),
-                time.time()
-            ))
+        super().__init__(
+            self._process_changes,
+            coalesce_window=debounce_delay,
+            path_filter=lambda path: self._is_yaml_file(str(path)),
+        )
             
     def _is_yaml_file(self, file_path: str) -> bool:
         """Check if file is a YAML file we should monitor."""
@@ -89,38 +55,17 @@ class TradeplanFileHandler(FileSystemEventHandler):
         return True
         
     def _queue_event(self, event: FileWatchEvent):
-        """Queue event for debounced processing."""
-        key = str(event.file_path)
+        """Queue event for coalesced processing."""
+        self.submit(event.file_path, event.event_type, event.timestamp)
         
-        # Cancel existing debounce task for this file
-        if key in self._debounce_tasks:
-            self._debounce_tasks[key].cancel()
-            
-        # Store the event
-        self._pending_events[key] = event
-        
-        # Schedule debounced processing
-        try:
-            loop = asyncio.get_running_loop()
-            self._debounce_tasks[key] = loop.call_later(
-                self.debounce_delay,
-                self._process_debounced_event,
-                key
-            )
-        except RuntimeError:
-            # No running loop - process immediately
-            self._process_debounced_event(key)
-        
-    def _process_debounced_event(self, key: str):
-        """Process debounced event after delay."""
-        if key in self._pending_events:
-            event = self._pending_events.pop(key)
-            self._debounce_tasks.pop(key, None)
-            
+    def _process_changes(self, changes: List[FileChange]):
+        """Process the coalesced changes of one window."""
+        for change in changes:
+            event = FileWatchEvent(change.event_type, change.path, change.first_event_time)
             try:
                 self.callback(event)
             except Exception as e:
-                logger.error(f"Error processing file event: {e}", file_path=key)
+                logger.error(f"Error processing file event: {e}", file_path=str(change.path))
 
 
 class FileWatcher:
@@ -144,6 +89,9 @@ class FileWatcher:
         self.validation_callback = validation_callback
         self.debounce_delay = debounce_delay
         
+        # Imported here: the models package imports the event bridge from utils
+        from ..models import TradePlanLoader, ValidationEngine
+        
         # Initialize components
         self.trade_plan_loader = TradePlanLoader(self.watch_directory)
         self.validation_engine = ValidationEngine()
@@ -175,6 +123,7 @@ class FileWatcher:
                 callback=self._handle_file_event,
                 debounce_delay=self.debounce_delay
             )
+            self.event_handler.start()
             
             # Create observer
             self.observer = Observer()
@@ -204,6 +153,8 @@ class FileWatcher:
         if self.observer and self.observer.is_alive():
             self.observer.stop()
             self.observer.join(timeout=5.0)
+        if self.event_handler:
+            self.event_handler.stop()
             
         logger.info("File watcher stopped")
         
@@ -272,6 +223,16 @@ class FileWatcher:
             "debounce_delay": self.debounce_delay,
         }
         
+    def get_event_metrics(self) -> Dict[str, Any]:
+        """
+        Get event coalescing metrics.
+        
+        Returns:
+            Events received and coalesced, and latency from first file event
+            to its processing, or an empty dict before the watcher starts
+        """
+        return self.event_handler.get_metrics() if self.event_handler else {}
+        
     def force_validation(self):
         """Force validation of all files in watch directory."""
         logger.info("Forcing validation of all trade plan files")
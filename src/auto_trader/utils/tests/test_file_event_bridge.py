@@ -0,0 +1,225 @@
+"""Tests for the watchdog to asyncio file event bridge."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from auto_trader.utils.file_event_bridge import FileEventBridge, FileWatchEventType
+
+
+CREATED = FileWatchEventType.CREATED
+MODIFIED = FileWatchEventType.MODIFIED
+DELETED = FileWatchEventType.DELETED
+
+
+class BatchRecorder:
+    """Collect delivered batches and signal each delivery."""
+
+    def __init__(self):
+        self.batches = []
+        self.delivered = asyncio.Event()
+
+    async def __call__(self, changes):
+        self.batches.append([(change.path.name, change.event_type) for change in changes])
+        self.delivered.set()
+
+    async def wait(self, timeout=2.0):
+        await asyncio.wait_for(self.delivered.wait(), timeout)
+        self.delivered.clear()
+
+
+class TestFileEventBridge:
+    """Test coalescing, batching and thread hand-off."""
+
+    async def test_burst_on_one_path_coalesced(self):
+        """Test the several events of one save become one change."""
+        recorder = BatchRecorder()
+        bridge = FileEventBridge(recorder, coalesce_window=0.05)
+        bridge.start()
+
+        for event_type in (CREATED, MODIFIED, MODIFIED, MODIFIED):
+            bridge.submit(Path("plan.yaml"), event_type)
+        await recorder.wait()
+
+        assert recorder.batches == [[("plan.yaml", CREATED)]]
+        metrics = bridge.get_metrics()
+        assert metrics["events_received"] == 4
+        assert metrics["events_coalesced"] == 3
+        assert metrics["batches_delivered"] == 1
+        bridge.stop()
+
+    async def test_multi_file_change_delivered_as_one_batch(self):
+        """Test changes to several files in one window form one batch in event order."""
+        recorder = BatchRecorder()
+        bridge = FileEventBridge(recorder, coalesce_window=0.05)
+        bridge.start()
+
+        bridge.submit(Path("b.yaml"), MODIFIED)
+        bridge.submit(Path("a.yaml"), DELETED)
+        bridge.submit(Path("b.yaml"), MODIFIED)
+        await recorder.wait()
+
+        assert recorder.batches == [[("b.yaml", MODIFIED), ("a.yaml", DELETED)]]
+        bridge.stop()
+
+    async def test_events_submitted_from_other_threads(self):
+        """Test events from observer threads are handed to the owning loop."""
+        loop_thread = threading.get_ident()
+        batch_threads = []
+        delivered = asyncio.Event()
+
+        def on_batch(changes):
+            batch_threads.append(threading.get_ident())
+            if sum(change.event_count for change in changes) == 100:
+                delivered.set()
+
+        bridge = FileEventBridge(on_batch, coalesce_window=0.1)
+        bridge.start()
+        threads = [
+            threading.Thread(
+                target=lambda i=i: [
+                    bridge.submit(Path(f"plan_{i}.yaml"), MODIFIED) for _ in range(25)
+                ]
+            )
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        await asyncio.wait_for(delivered.wait(), 2.0)
+
+        assert batch_threads == [loop_thread]
+        assert bridge.get_metrics()["changes_delivered"] == 4
+        bridge.stop()
+
+    async def test_max_delay_bounds_continuous_bursts(self):
+        """Test a path that never goes quiet is still delivered after max_delay."""
+        recorder = BatchRecorder()
+        bridge = FileEventBridge(recorder, coalesce_window=0.05, max_delay=0.15)
+        bridge.start()
+
+        start = time.monotonic()
+        while not recorder.batches and time.monotonic() - start < 1.0:
+            bridge.submit(Path("busy.yaml"), MODIFIED)
+            await asyncio.sleep(0.01)
+
+        assert recorder.batches
+        assert time.monotonic() - start < 0.5
+        bridge.stop()
+
+    async def test_events_during_batch_form_next_batch(self):
+        """Test batches never overlap and later events are not lost."""
+        release = asyncio.Event()
+        batches = []
+
+        async def on_batch(changes):
+            batches.append([change.path.name for change in changes])
+            if len(batches) == 1:
+                await release.wait()
+
+        bridge = FileEventBridge(on_batch, coalesce_window=0.02)
+        bridge.start()
+        bridge.submit(Path("first.yaml"), MODIFIED)
+        await asyncio.sleep(0.1)
+        bridge.submit(Path("second.yaml"), MODIFIED)
+        await asyncio.sleep(0.1)
+
+        assert batches == [["first.yaml"]]
+        release.set()
+        await asyncio.sleep(0.1)
+        assert batches == [["first.yaml"], ["second.yaml"]]
+        bridge.stop()
+
+    async def test_failed_batch_counted(self):
+        """Test a failing handler is logged and the bridge keeps running."""
+        calls = []
+
+        def on_batch(changes):
+            calls.append(changes)
+            if len(calls) == 1:
+                raise RuntimeError("reload failed")
+
+        bridge = FileEventBridge(on_batch, coalesce_window=0.02)
+        bridge.start()
+        bridge.submit(Path("plan.yaml"), MODIFIED)
+        await asyncio.sleep(0.1)
+        bridge.submit(Path("plan.yaml"), MODIFIED)
+        await asyncio.sleep(0.1)
+
+        metrics = bridge.get_metrics()
+        assert len(calls) == 2
+        assert metrics["batch_failures"] == 1
+        assert metrics["batches_delivered"] == 1
+        bridge.stop()
+
+    async def test_callbacks_queued_before_stop_are_dropped(self):
+        """Test events and flushes already queued on the loop are ignored after stop."""
+        recorder = BatchRecorder()
+        bridge = FileEventBridge(recorder, coalesce_window=0.02)
+        bridge.start()
+        bridge.submit(Path("plan.yaml"), MODIFIED)
+        await asyncio.sleep(0.05)
+        await recorder.wait()
+        recorder.delivered.clear()
+
+        # The observer thread queued an event, then the bridge was stopped
+        bridge.submit(Path("late.yaml"), MODIFIED)
+        bridge.stop()
+        bridge._flush()
+        await asyncio.sleep(0.05)
+
+        assert recorder.batches == [[("plan.yaml", MODIFIED)]]
+        assert bridge.get_metrics()["pending_changes"] == 0
+
+    @pytest.mark.parametrize(
+        "first, second, merged",
+        [
+            (CREATED, MODIFIED, CREATED),
+            (MODIFIED, MODIFIED, MODIFIED),
+            (MODIFIED, DELETED, DELETED),
+            (CREATED, DELETED, DELETED),
+            (DELETED, CREATED, MODIFIED),
+        ],
+    )
+    def test_merge_types(self, first, second, merged):
+        """Test two events of one path merge into the net change."""
+        assert FileEventBridge._merge_types(first, second) == merged
+
+    def test_path_filter_and_immediate_delivery_without_loop(self):
+        """Test filtered paths are dropped and changes delivered at once when not started."""
+        batches = []
+        bridge = FileEventBridge(
+            batches.append, path_filter=lambda path: path.suffix == ".yaml"
+        )
+
+        bridge.submit(Path("notes.txt"), MODIFIED)
+        bridge.submit(Path("plan.yaml"), MODIFIED, event_time=123.0)
+
+        assert len(batches) == 1
+        assert batches[0][0].path == Path("plan.yaml")
+        assert batches[0][0].first_event_time == 123.0
+
+    def test_private_loop_thread_and_latency(self):
+        """Test starting outside a loop runs batches on a private thread and records latency."""
+        delivered = threading.Event()
+        batch_threads = []
+
+        def on_batch(changes):
+            batch_threads.append(threading.current_thread().name)
+            delivered.set()
+
+        bridge = FileEventBridge(on_batch, coalesce_window=0.05)
+        bridge.start()
+        bridge.submit(Path("plan.yaml"), MODIFIED)
+
+        assert delivered.wait(2.0)
+        bridge.stop()
+        metrics = bridge.get_metrics()
+        assert batch_threads == ["file-event-bridge"]
+        assert 50 <= metrics["last_latency_ms"] < 1000
+        assert metrics["avg_latency_ms"] == metrics["last_latency_ms"]
+        assert not any(t.name == "file-event-bridge" for t in threading.enumerate())
@@ -6,7 +6,12 @@ import sys
 from typing import Optional
 
 from config import Settings, ConfigLoader
-from auto_trader.logging_config import LoggerConfig, get_logger, set_service_context
+from auto_trader.logging_config import (
+    LoggerConfig,
+    flush_logs,
+    get_logger,
+    set_service_context,
+)
 
 
 class AutoTraderApp:
@@ -104,6 +109,7 @@ class AutoTraderApp:
                 # await self._shutdown_discord_notifier()
 
                 self.logger.info("Application shutdown completed")
+                flush_logs()
 
             except Exception as e:
                 self.logger.error("Error during shutdown", error=str(e))